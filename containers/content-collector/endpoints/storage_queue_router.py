@@ -2,16 +2,21 @@
 
 import logging
 import re
+import time
 from datetime import datetime, timezone
 from typing import Any, Dict
 
 from fastapi import APIRouter, HTTPException
 
+from libs.processing_metrics import get_processing_metrics
 from libs.queue_client import QueueMessageModel, get_queue_client
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/storage-queue", tags=["storage-queue"])
 
+# Fixed-memory latency quantiles, throughput and error rate for queue messages
+processing_metrics = get_processing_metrics("content-collector")
+
 
 def _sanitize_error_for_response(error: Exception) -> str:
     """Sanitize error message to prevent information disclosure.
@@ -164,7 +169,13 @@ async def process_messages(max_messages: int = 10) -> Dict[str, Any]:
                 async def handler(msg_data: Dict) -> Dict:
                     """Message handler - pure function."""
                     msg = QueueMessageModel(**msg_data)
-                    return await process_queue_message(msg, pq, None)
+                    started = time.perf_counter()
+                    result = await process_queue_message(msg, pq, None)
+                    processing_metrics.record(
+                        (time.perf_counter() - started) * 1000,
+                        success=result.get("status") != "error",
+                    )
+                    return result
 
                 count = await process_queue_messages(
                     queue_name="content-collection-requests",
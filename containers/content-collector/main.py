@@ -29,7 +29,9 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 
 # Application Insights monitoring
 from libs.monitoring import configure_application_insights
+from libs.processing_metrics import get_processing_metrics
 from libs.shared_models import StandardResponse, create_service_dependency
+from libs.standard_endpoints import create_standard_status_endpoint
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -236,14 +238,15 @@ async def lifespan(app: FastAPI):
 
                 # Run streaming pipeline with proper blob client for deduplication
                 # Use permissive quality checking if using default sources (not template)
-                stats = await stream_collection(
-                    collector_fn=collect_from_template(),
-                    collection_id=collection_id,
-                    collection_blob=collection_blob,
-                    blob_client=blob_client,
-                    queue_client=queue_client,
-                    strict_quality_check=using_template,  # Strict only if using template
-                )
+                with get_processing_metrics("content-collector").track():
+                    stats = await stream_collection(
+                        collector_fn=collect_from_template(),
+                        collection_id=collection_id,
+                        collection_blob=collection_blob,
+                        blob_client=blob_client,
+                        queue_client=queue_client,
+                        strict_quality_check=using_template,  # Strict only if using template
+                    )
 
                 rejection_reasons = stats.get("rejection_reasons", {})
                 if isinstance(rejection_reasons, dict):
@@ -410,6 +413,24 @@ async def method_not_allowed_handler(request: Request, exc):
 # API Routes
 # Root, health, and status endpoints are provided by shared library above
 
+
+async def _collection_stats() -> Dict[str, Any]:
+    """Collection run latency percentiles, throughput and error rate."""
+    return {
+        "processing_metrics": get_processing_metrics("content-collector").snapshot()
+    }
+
+
+app.get("/status", response_model=StandardResponse)(
+    create_standard_status_endpoint(
+        service_name="content-womble",
+        version="2.0.1",
+        environment=os.getenv("ENVIRONMENT"),
+        get_stats=_collection_stats,
+        service_metadata_dep=service_metadata,
+    )
+)
+
 # Include routers - Streaming architecture
 # Manual trigger endpoint for ad-hoc collection testing
 app.include_router(trigger_router)
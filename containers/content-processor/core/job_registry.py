@@ -0,0 +1,300 @@
+"""
+Bounded job registry for background processing jobs.
+
+Keeps recent job status records in memory with a maximum size and TTL,
+giving O(1) status lookups without unbounded growth on long-running
+replicas. An optional blob-backed tier persists status records so job
+lookups keep working after KEDA scales a replica down or routes a status
+request to a different replica. Persisted records are deleted once they
+have not been written for the retention period, by a background sweep
+started with ``start_cleanup`` so request paths never pay for it.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime
+from itertools import chain, islice
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_JOBS = 500
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+DEFAULT_JOB_PREFIX = "jobs/"
+DEFAULT_RETENTION_SECONDS = 7 * 24 * 60 * 60
+DEFAULT_CLEANUP_INTERVAL_SECONDS = 60 * 60
+
+# Jobs in any other status are still running and must not be dropped
+TERMINAL_STATUSES = frozenset({"completed", "failed"})
+
+
+class JobRegistry:
+    """
+    Size-bounded, TTL-evicting job store with an optional persistent blob tier.
+
+    Jobs are kept in creation order, so the oldest (and first to expire)
+    records are always at the front: eviction and expiry are amortised O(1)
+    and paging newest-first never touches more than ``offset + limit`` jobs.
+
+    Jobs that are still running when evicted or expired are pinned in a
+    side table until they reach a terminal status, so their final update
+    is never dropped.
+    """
+
+    def __init__(
+        self,
+        max_jobs: int = DEFAULT_MAX_JOBS,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        blob_client: Any = None,
+        container: Optional[str] = None,
+        prefix: str = DEFAULT_JOB_PREFIX,
+        retention_seconds: float = DEFAULT_RETENTION_SECONDS,
+        cleanup_interval_seconds: float = DEFAULT_CLEANUP_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            max_jobs: Maximum number of jobs kept in memory
+            ttl_seconds: Seconds after creation before a job is evicted
+            blob_client: SimplifiedBlobClient for the persistent tier (optional)
+            container: Blob container for persisted jobs (None disables the tier)
+            prefix: Blob name prefix for persisted job records
+            retention_seconds: Seconds after its last write before a
+                persisted record is deleted
+            cleanup_interval_seconds: Seconds between background sweeps
+                of the persistent tier (see ``start_cleanup``)
+            clock: Monotonic time source (injectable for tests)
+            wall_clock: Epoch time source for blob timestamps
+        """
+        self.max_jobs = max(1, max_jobs)
+        self.ttl_seconds = ttl_seconds
+        self.blob_client = blob_client
+        self.container = container
+        self.prefix = prefix
+        self.retention_seconds = retention_seconds
+        self.cleanup_interval_seconds = cleanup_interval_seconds
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._jobs: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._pinned: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._cleanup_task: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def persistent(self) -> bool:
+        """Whether job records are also written to blob storage."""
+        return self.blob_client is not None and bool(self.container)
+
+    def __len__(self) -> int:
+        self._purge_expired()
+        return len(self._jobs) + len(self._pinned)
+
+    def _blob_name(self, job_id: str) -> str:
+        return f"{self.prefix}{job_id}.json"
+
+    def _release(self, job_id: str, job: Dict[str, Any], reason: str) -> None:
+        """Drop a job from the main store, pinning it if still running."""
+        if job.get("status") in TERMINAL_STATUSES:
+            logger.debug(f"Evicted job {job_id} from registry ({reason})")
+            return
+        self._pinned[job_id] = job
+        # Bound the side table too, in case a job never reports completion
+        while len(self._pinned) > self.max_jobs:
+            dropped_id, _ = self._pinned.popitem(last=False)
+            logger.warning(f"Dropped unfinished job {dropped_id} from registry")
+
+    def _purge_expired(self) -> None:
+        """Drop expired jobs from the front of the creation-ordered store."""
+        now = self._clock()
+        while self._jobs:
+            job_id, (expires_at, job) = next(iter(self._jobs.items()))
+            if expires_at > now:
+                break
+            del self._jobs[job_id]
+            self._release(job_id, job, "expired")
+
+    def _store(self, job: Dict[str, Any]) -> None:
+        """Insert a job in memory, evicting the oldest beyond max_jobs."""
+        self._purge_expired()
+        self._pinned.pop(job["job_id"], None)
+        self._jobs[job["job_id"]] = (self._clock() + self.ttl_seconds, job)
+        self._jobs.move_to_end(job["job_id"])
+        while len(self._jobs) > self.max_jobs:
+            evicted_id, (_expires_at, evicted) = self._jobs.popitem(last=False)
+            self._release(evicted_id, evicted, "max size")
+
+    def _local(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Live in-memory record (main store or pinned), if any."""
+        self._purge_expired()
+        entry = self._jobs.get(job_id)
+        if entry is not None:
+            return entry[1]
+        return self._pinned.get(job_id)
+
+    async def _load(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Read a job record from the persistent tier."""
+        if not self.persistent:
+            return None
+        job = await self.blob_client.download_json(
+            self.container, self._blob_name(job_id)
+        )
+        return job if isinstance(job, dict) else None
+
+    async def _persist(self, job: Dict[str, Any]) -> None:
+        """Write the job record to the persistent tier (best effort)."""
+        if not self.persistent:
+            return
+        saved = await self.blob_client.upload_json(
+            self.container, self._blob_name(job["job_id"]), job
+        )
+        if not saved:
+            logger.warning(f"Failed to persist job {job['job_id']}")
+
+    async def create(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Register a new job record.
+
+        Args:
+            job: Job record; must contain a ``job_id`` key
+
+        Returns:
+            The stored job record
+        """
+        self._store(job)
+        await self._persist(job)
+        return job
+
+    async def update(
+        self, job_id: str, persist: bool = True, **fields: Any
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Update fields on an existing job.
+
+        Args:
+            job_id: Job identifier
+            persist: Write the updated record to the persistent tier;
+                pass False for high-frequency progress counters
+            **fields: Fields to set on the job record
+
+        Returns:
+            Updated job record, or None if the job is no longer tracked
+        """
+        job = self._local(job_id)
+        if job is None:
+            # Evicted from memory here, or created on another replica
+            job = await self._load(job_id)
+            if job is None:
+                logger.warning(f"Job {job_id} not found in registry; update dropped")
+                return None
+            persist = True
+        job.update(fields)
+        if job_id in self._pinned and job.get("status") in TERMINAL_STATUSES:
+            self._store(job)
+        if persist:
+            await self._persist(job)
+        return job
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a job by ID, falling back to the persistent tier.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Job record, or None if unknown or expired
+        """
+        job = self._local(job_id)
+        if job is not None:
+            return job
+        # Expired here, created on another replica, or from before a scale-down
+        return await self._load(job_id)
+
+    async def cleanup_persisted(self) -> int:
+        """
+        Delete persisted job records older than the retention period.
+
+        Expired records are removed with one batch delete rather than a
+        request per blob.
+
+        Returns:
+            Number of records deleted
+        """
+        if not self.persistent:
+            return 0
+        cutoff = self._wall_clock() - self.retention_seconds
+        expired: List[str] = []
+        for blob in await self.blob_client.list_blobs(self.container, self.prefix):
+            last_modified = blob.get("last_modified")
+            if isinstance(last_modified, str):
+                last_modified = datetime.fromisoformat(last_modified)
+            if not isinstance(last_modified, datetime):
+                continue
+            if last_modified.timestamp() < cutoff:
+                expired.append(blob["name"])
+        if not expired:
+            return 0
+        deleted = await self.blob_client.delete_blobs(self.container, expired)
+        if deleted:
+            logger.info(f"Deleted {deleted} expired job records from {self.container}")
+        return deleted
+
+    async def _cleanup_loop(self) -> None:
+        """Sweep the persistent tier every cleanup interval until cancelled."""
+        while True:
+            try:
+                await self.cleanup_persisted()
+            except Exception as e:
+                logger.warning(f"Job record cleanup failed: {e}")
+            await asyncio.sleep(self.cleanup_interval_seconds)
+
+    def start_cleanup(self) -> bool:
+        """
+        Start the background retention sweep (no-op without a persistent tier).
+
+        Returns:
+            True if a sweep task is running
+        """
+        if not self.persistent:
+            return False
+        if self._cleanup_task is None or self._cleanup_task.done():
+            self._cleanup_task = asyncio.create_task(self._cleanup_loop())
+        return True
+
+    async def stop_cleanup(self) -> None:
+        """Cancel the background retention sweep, if running."""
+        task, self._cleanup_task = self._cleanup_task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    def list_page(self, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
+        """
+        Return one page of in-memory jobs, newest first.
+
+        Pinned (still running, evicted) jobs are older than everything in
+        the main store, so they follow it.
+
+        Args:
+            limit: Maximum number of jobs to return
+            offset: Number of newest jobs to skip
+
+        Returns:
+            List of job records
+        """
+        self._purge_expired()
+        offset = max(0, offset)
+        limit = max(0, limit)
+        newest_first = chain(
+            (job for _expires_at, job in reversed(self._jobs.values())),
+            reversed(self._pinned.values()),
+        )
+        return list(islice(newest_first, offset, offset + limit))
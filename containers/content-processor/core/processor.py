@@ -10,6 +10,7 @@ Updated: October 2025 - Simplified queue client initialization
 
 import logging
 import os
+from dataclasses import replace
 from typing import Optional
 
 from aiolimiter import AsyncLimiter  # type: ignore[import]
@@ -17,8 +18,9 @@ from azure.identity.aio import DefaultAzureCredential
 from azure.storage.queue.aio import QueueClient
 from core.processor_context import ProcessorContext, create_processor_context
 from operations.openai_operations import create_openai_client
+from queue_operations_pkg.markdown_trigger_batcher import MarkdownTriggerBatcher
 
-from libs.simplified_blob_client import SimplifiedBlobClient
+from libs.simplified_blob_client import create_blob_client
 
 logger = logging.getLogger(__name__)
 
@@ -39,7 +41,7 @@ async def initialize_processor(
     Returns:
         ProcessorContext with all dependencies
     """
-    blob_client = SimplifiedBlobClient()
+    blob_client = create_blob_client()
 
     # Initialize Azure Queue Storage client directly (no wrapper)
     storage_account_name = os.getenv("AZURE_STORAGE_ACCOUNT_NAME")
@@ -78,6 +80,13 @@ async def initialize_processor(
         openai_client=openai_client,
         processor_id=processor_id,
     )
+    # Trigger messages carry the session ID, which the context assigns
+    context = replace(
+        context,
+        markdown_trigger=MarkdownTriggerBatcher(
+            queue_client, correlation_id=context.session_id
+        ),
+    )
 
     logger.info(
         f"Processor initialized: {context.processor_id}, session {context.session_id}"
@@ -95,6 +104,10 @@ async def cleanup_processor(
     Pure function - closes clients, no session tracking.
     """
     try:
+        if context.markdown_trigger:
+            await context.markdown_trigger.close()
+            logger.info("Pending markdown triggers flushed")
+
         if context.openai_client:
             await context.openai_client.close()
             logger.info("OpenAI client closed")
@@ -33,6 +33,7 @@ class ProcessorContext:
     queue_client: Any  # QueueClient
     rate_limiter: Any  # RateLimiter
     openai_client: Any  # AsyncOpenAI client
+    markdown_trigger: Any = None  # MarkdownTriggerBatcher (optional)
 
     # Container names
     input_container: str = "collected-content"
@@ -62,6 +63,7 @@ def create_processor_context(
     max_articles: int = 10,
     min_trigger: int = 5,
     lease_timeout: int = 300,
+    markdown_trigger: Any = None,
 ) -> ProcessorContext:
     """
     Create processor context with all dependencies.
@@ -80,6 +82,7 @@ def create_processor_context(
         max_articles: Maximum articles to process per run
         min_trigger: Minimum articles before triggering next stage
         lease_timeout: Lease timeout in seconds
+        markdown_trigger: Optional batcher for markdown-generation triggers
 
     Returns:
         New ProcessorContext instance
@@ -102,6 +105,7 @@ def create_processor_context(
         queue_client=queue_client,
         rate_limiter=rate_limiter,
         openai_client=openai_client,
+        markdown_trigger=markdown_trigger,
         input_container=input_container,
         output_container=output_container,
         markdown_queue=markdown_queue,
@@ -12,11 +12,13 @@ from typing import Dict, List, Optional, Tuple
 from core.processing_operations import process_topic_to_article
 from core.processor_context import ProcessorContext
 from models import ProcessingResult, ProcessorStatus, TopicMetadata
+from operations.collection_stream import CollectionFormatError, stream_collection_topics
 from operations.openai_operations import create_openai_client
-from operations.topic_operations import collection_item_to_topic_metadata
 from queue_operations_pkg import trigger_markdown_for_article
 from utils.blob_utils import generate_articles_processed_blob_path
 
+from libs.simplified_blob_client import BlobStreamError
+
 logger = logging.getLogger(__name__)
 
 
@@ -83,62 +85,64 @@ async def process_collection_file(
     start_time = datetime.now(timezone.utc)
     processed_topics = []
     failed_topics = []
+    error_messages = []
     total_cost = 0.0
 
     try:
         logger.info(f"Processing collection: {blob_path}")
 
-        # Load collection from blob storage
-        collection_data = await context.blob_client.download_json(
+        # Stream items from blob storage - processing starts on the first
+        # item while the rest of the collection is still downloading
+        chunks = context.blob_client.download_stream(
             container=context.input_container,
             blob_name=blob_path,
         )
+        topics = stream_collection_topics(
+            chunks, blob_path, max_items=context.max_articles_per_run
+        )
 
-        if not collection_data:
-            logger.error(f"Collection file not found: {blob_path}")
-            result = _create_empty_result(
-                success=False,
-                error_msg=f"Collection file not found: {blob_path}",
-                processing_time=(
-                    datetime.now(timezone.utc) - start_time
-                ).total_seconds(),
-            )
-            return result
+        try:
+            async for topic_metadata in topics:
+                try:
+                    # Process the topic directly
+                    result = await _process_single_topic(context, topic_metadata)
 
-        items = collection_data.get("items", [])
-        if not items:
+                    if result:
+                        processed_topics.append(topic_metadata.topic_id)
+                        total_cost += result.get("cost", 0.0)
+                    else:
+                        failed_topics.append(topic_metadata.topic_id)
+
+                except Exception as e:
+                    logger.error(f"Error processing item: {e}")
+                    failed_topics.append(topic_metadata.topic_id)
+        except (CollectionFormatError, BlobStreamError) as e:
+            if processed_topics or failed_topics:
+                # Stream broke part-way through: keep what was processed
+                logger.error(f"Collection stream interrupted: {blob_path} - {e}")
+                error_messages.append(f"Collection stream interrupted: {e}")
+            else:
+                logger.error(f"Collection file not found or unreadable: {blob_path}")
+                return _create_empty_result(
+                    success=False,
+                    error_msg=f"Collection file not found: {blob_path}",
+                    processing_time=(
+                        datetime.now(timezone.utc) - start_time
+                    ).total_seconds(),
+                )
+
+        # Send the final partial batch of markdown triggers now rather than
+        # leaving it for the batcher's wait timer
+        if context.markdown_trigger is not None:
+            await context.markdown_trigger.flush()
+
+        if not processed_topics and not failed_topics:
             logger.info(f"No items in collection: {blob_path}")
-            result = _create_empty_result(
+            return _create_empty_result(
                 processing_time=(
                     datetime.now(timezone.utc) - start_time
                 ).total_seconds(),
             )
-            return result
-
-        logger.info(f"Processing {len(items)} items from {blob_path}")
-
-        # Process each item
-        for item in items[: context.max_articles_per_run]:
-            try:
-                # Convert to TopicMetadata
-                topic_metadata = collection_item_to_topic_metadata(
-                    item, blob_path, collection_data
-                )
-                if not topic_metadata:
-                    continue
-
-                # Process the topic directly
-                result = await _process_single_topic(context, topic_metadata)
-
-                if result:
-                    processed_topics.append(topic_metadata.topic_id)
-                    total_cost += result.get("cost", 0.0)
-                else:
-                    failed_topics.append(topic_metadata.topic_id)
-
-            except Exception as e:
-                logger.error(f"Error processing item: {e}")
-                failed_topics.append(item.get("topic_id", "unknown"))
 
         # Calculate metrics
         processing_time = (datetime.now(timezone.utc) - start_time).total_seconds()
@@ -157,6 +161,7 @@ async def process_collection_file(
             processing_time=processing_time,
             completed_topics=processed_topics,
             failed_topics=failed_topics,
+            error_messages=error_messages,
         )
 
         return result
@@ -257,18 +262,23 @@ async def _process_single_topic(
 
         logger.info(f"Saved article to: {blob_name}")
 
-        # Trigger markdown generation
-        trigger_result = await trigger_markdown_for_article(
-            queue_client=context.queue_client,
-            blob_name=blob_name,
-            correlation_id=context.session_id,
-            force_trigger=True,
-        )
-
-        if trigger_result["status"] == "success":
-            logger.info("Markdown generation request sent")
+        # Trigger markdown generation (batched when a batcher is configured)
+        if context.markdown_trigger is not None:
+            await context.markdown_trigger.add(blob_name)
         else:
-            logger.warning(f"Markdown trigger failed: {trigger_result.get('error')}")
+            trigger_result = await trigger_markdown_for_article(
+                queue_client=context.queue_client,
+                blob_name=blob_name,
+                correlation_id=context.session_id,
+                force_trigger=True,
+            )
+
+            if trigger_result["status"] == "success":
+                logger.info("Markdown generation request sent")
+            else:
+                logger.warning(
+                    f"Markdown trigger failed: {trigger_result.get('error')}"
+                )
 
         # Calculate processing time
         processing_time = (datetime.now(timezone.utc) - start_time).total_seconds()
@@ -4,20 +4,41 @@ Processing Endpoints - Content Processing Operations
 RESTful endpoints for content processing operations.
 """
 
+import logging
 import os
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 from uuid import uuid4
 
-from fastapi import APIRouter, BackgroundTasks, Depends
+from core.job_registry import (
+    DEFAULT_MAX_JOBS,
+    DEFAULT_RETENTION_SECONDS,
+    DEFAULT_TTL_SECONDS,
+    JobRegistry,
+)
+from fastapi import APIRouter, BackgroundTasks, Depends, Query
 from models import WakeUpRequest
+from operations.collection_stream import CollectionFormatError, stream_collection_items
 from pydantic import BaseModel, Field
 
+from libs.processing_metrics import get_processing_metrics
 from libs.queue_client import send_wake_up_message
 from libs.shared_models import ErrorCodes, StandardResponse, create_service_dependency
+from libs.simplified_blob_client import BlobStreamError
+
+logger = logging.getLogger(__name__)
 
 # Configuration from environment variables
 MARKDOWN_QUEUE_NAME = os.getenv("MARKDOWN_QUEUE_NAME", "markdown-generation-requests")
+JOB_REGISTRY_MAX_JOBS = int(os.getenv("JOB_REGISTRY_MAX_JOBS", str(DEFAULT_MAX_JOBS)))
+JOB_REGISTRY_TTL_SECONDS = int(
+    os.getenv("JOB_REGISTRY_TTL_SECONDS", str(DEFAULT_TTL_SECONDS))
+)
+# Blob container for the persistent job tier (empty disables it)
+JOB_STATUS_CONTAINER = os.getenv("JOB_STATUS_CONTAINER", "")
+JOB_STATUS_RETENTION_SECONDS = int(
+    os.getenv("JOB_STATUS_RETENTION_SECONDS", str(DEFAULT_RETENTION_SECONDS))
+)
 
 # Create router for processing
 router = APIRouter(prefix="/process", tags=["processing"])
@@ -25,8 +46,30 @@ router = APIRouter(prefix="/process", tags=["processing"])
 # Create service metadata dependency
 service_metadata = create_service_dependency("content-processor")
 
-# Job tracking (in-memory for now, could use Redis/database for production)
-_processing_jobs: Dict[str, Dict[str, Any]] = {}
+# Job tracking: bounded in-memory registry, optionally backed by blob storage
+_job_registry: Optional[JobRegistry] = None
+
+
+def get_job_registry() -> JobRegistry:
+    """Get (or lazily create) the job registry for this replica."""
+    global _job_registry
+    if _job_registry is None:
+        blob_client = None
+        if JOB_STATUS_CONTAINER:
+            try:
+                from libs.simplified_blob_client import create_blob_client
+
+                blob_client = create_blob_client()
+            except Exception as e:
+                logger.warning(f"Persistent job tier disabled: {e}")
+        _job_registry = JobRegistry(
+            max_jobs=JOB_REGISTRY_MAX_JOBS,
+            ttl_seconds=JOB_REGISTRY_TTL_SECONDS,
+            blob_client=blob_client,
+            container=JOB_STATUS_CONTAINER or None,
+            retention_seconds=JOB_STATUS_RETENTION_SECONDS,
+        )
+    return _job_registry
 
 
 class ProcessRequest(BaseModel):
@@ -133,22 +176,24 @@ async def wake_up_processor(
     job_id = str(uuid4())
 
     # Initialize job tracking
-    _processing_jobs[job_id] = {
-        "job_id": job_id,
-        "status": "accepted",
-        "created_at": datetime.now(timezone.utc).isoformat(),
-        "started_at": None,
-        "completed_at": None,
-        "topics_processed": 0,
-        "articles_generated": 0,
-        "collection_processed": None,
-        "error": None,
-        "request": {
-            "source": request.source,
-            "batch_size": request.batch_size,
-            "priority_threshold": request.priority_threshold,
-        },
-    }
+    await get_job_registry().create(
+        {
+            "job_id": job_id,
+            "status": "accepted",
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "started_at": None,
+            "completed_at": None,
+            "topics_processed": 0,
+            "articles_generated": 0,
+            "collection_processed": None,
+            "error": None,
+            "request": {
+                "source": request.source,
+                "batch_size": request.batch_size,
+                "priority_threshold": request.priority_threshold,
+            },
+        }
+    )
 
     # Queue the processing work
     background_tasks.add_task(
@@ -176,14 +221,18 @@ async def _process_collection_async(job_id: str, request: WakeUpRequest) -> None
     Background task: actually process the collection.
     Updates job status as it progresses.
     """
+    jobs = get_job_registry()
     try:
-        from libs.simplified_blob_client import SimplifiedBlobClient
+        from libs.simplified_blob_client import create_blob_client
 
         # Update job status to processing
-        _processing_jobs[job_id]["status"] = "processing"
-        _processing_jobs[job_id]["started_at"] = datetime.now(timezone.utc).isoformat()
+        await jobs.update(
+            job_id,
+            status="processing",
+            started_at=datetime.now(timezone.utc).isoformat(),
+        )
 
-        blob_client = SimplifiedBlobClient()
+        blob_client = create_blob_client()
 
         # 1. Get collection file to process
         # PRAGMATIC APPROACH: Read from payload.files if available, fall back to discovery
@@ -200,62 +249,76 @@ async def _process_collection_async(job_id: str, request: WakeUpRequest) -> None
                 # Assume collected-content if no container prefix
                 container_name = "collected-content"
                 blob_name = blob_path
-
-            collection_data: Optional[Dict[str, Any]] = await blob_client.download_json(
-                container_name, blob_name
-            )
-            collection_blob_name = blob_name
         else:
             # Fall back to discovery (backwards compatible)
             blobs = await blob_client.list_blobs(
                 "collected-content", prefix="collections/"
             )
             if not blobs:
-                _processing_jobs[job_id]["status"] = "completed"
-                _processing_jobs[job_id]["completed_at"] = datetime.now(
-                    timezone.utc
-                ).isoformat()
-                _processing_jobs[job_id]["message"] = "No collections found"
+                await jobs.update(
+                    job_id,
+                    status="completed",
+                    completed_at=datetime.now(timezone.utc).isoformat(),
+                    message="No collections found",
+                )
                 return
 
             # Get the most recent collection
             latest_blob = sorted(blobs, key=lambda x: x["name"])[-1]
-            collection_data: Optional[Dict[str, Any]] = await blob_client.download_json(
-                "collected-content", latest_blob["name"]
-            )
-            collection_blob_name = latest_blob["name"]
+            container_name = "collected-content"
+            blob_name = latest_blob["name"]
 
-        if not collection_data:
-            _processing_jobs[job_id]["status"] = "failed"
-            _processing_jobs[job_id]["completed_at"] = datetime.now(
-                timezone.utc
-            ).isoformat()
-            _processing_jobs[job_id]["error"] = "Failed to load collection data"
-            return
+        await jobs.update(job_id, persist=False, collection_processed=blob_name)
 
-        items = collection_data.get("items", [])
-        _processing_jobs[job_id]["collection_processed"] = collection_blob_name
-        _processing_jobs[job_id]["total_items"] = len(items)
-
-        # 2. Process items (simplified - just create basic articles)
+        # 2. Stream items (simplified - just create basic articles)
+        # Items are processed as they download instead of after a full read
         articles_generated = 0
-        for item in items[: request.batch_size]:
-            # Simple processing - just create a basic article
-            article = {
-                "title": item.get("title", "Untitled"),
-                "content": item.get("content", item.get("description", "No content")),
-                "url": item.get("url", ""),
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-            }
-
-            # Save to processed-content container
-            article_path = f"articles/{datetime.now().strftime('%Y/%m/%d')}/article_{uuid4().hex[:8]}.json"
-            await blob_client.upload_json("processed-content", article_path, article)
-            articles_generated += 1
-
-            # Update progress
-            _processing_jobs[job_id]["articles_generated"] = articles_generated
-            _processing_jobs[job_id]["topics_processed"] = articles_generated
+        items = stream_collection_items(
+            blob_client.download_stream(container_name, blob_name),
+            max_items=request.batch_size,
+        )
+        try:
+            async for item, _header in items:
+                # Simple processing - just create a basic article
+                article = {
+                    "title": item.get("title", "Untitled"),
+                    "content": item.get(
+                        "content", item.get("description", "No content")
+                    ),
+                    "url": item.get("url", ""),
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                }
+
+                # Save to processed-content container
+                article_path = f"articles/{datetime.now().strftime('%Y/%m/%d')}/article_{uuid4().hex[:8]}.json"
+                await blob_client.upload_json(
+                    "processed-content", article_path, article
+                )
+                articles_generated += 1
+
+                # Update progress (in memory only - persisted on completion)
+                await jobs.update(
+                    job_id,
+                    persist=False,
+                    articles_generated=articles_generated,
+                    topics_processed=articles_generated,
+                )
+        except (CollectionFormatError, BlobStreamError) as e:
+            if articles_generated == 0:
+                await jobs.update(
+                    job_id,
+                    status="failed",
+                    completed_at=datetime.now(timezone.utc).isoformat(),
+                    error="Failed to load collection data",
+                )
+                return
+            # Stream broke part-way through: keep the articles already saved
+            logger.error(f"Collection stream interrupted: {blob_name} - {e}")
+            await jobs.update(
+                job_id, persist=False, error=f"Collection stream interrupted: {e}"
+            )
+
+        await jobs.update(job_id, persist=False, total_items=articles_generated)
 
         # Trigger markdown-generator if we processed articles
         if articles_generated > 0:
@@ -267,28 +330,34 @@ async def _process_collection_async(job_id: str, request: WakeUpRequest) -> None
                         "trigger": "content_processed",
                         "topics_processed": articles_generated,
                         "articles_generated": articles_generated,
-                        "collection": latest_blob["name"],
+                        "collection": blob_name,
                         "timestamp": datetime.now(timezone.utc).isoformat(),
                     },
                 )
-                _processing_jobs[job_id]["site_generator_triggered"] = True
+                await jobs.update(job_id, persist=False, site_generator_triggered=True)
             except Exception as e:
-                _processing_jobs[job_id]["site_generator_triggered"] = False
-                _processing_jobs[job_id]["site_generator_error"] = str(e)
+                await jobs.update(
+                    job_id,
+                    persist=False,
+                    site_generator_triggered=False,
+                    site_generator_error=str(e),
+                )
 
         # Mark as completed
-        _processing_jobs[job_id]["status"] = "completed"
-        _processing_jobs[job_id]["completed_at"] = datetime.now(
-            timezone.utc
-        ).isoformat()
+        await jobs.update(
+            job_id,
+            status="completed",
+            completed_at=datetime.now(timezone.utc).isoformat(),
+        )
 
     except Exception as e:
         # Mark as failed
-        _processing_jobs[job_id]["status"] = "failed"
-        _processing_jobs[job_id]["completed_at"] = datetime.now(
-            timezone.utc
-        ).isoformat()
-        _processing_jobs[job_id]["error"] = str(e)
+        await jobs.update(
+            job_id,
+            status="failed",
+            completed_at=datetime.now(timezone.utc).isoformat(),
+            error=str(e),
+        )
 
 
 @router.get(
@@ -302,7 +371,7 @@ async def get_job_status(
     metadata: Dict[str, Any] = Depends(service_metadata),
 ) -> StandardResponse:
     """Get the status of a processing job."""
-    job_data = _processing_jobs.get(job_id)
+    job_data = await get_job_registry().get(job_id)
 
     if not job_data:
         return StandardResponse(
@@ -325,26 +394,31 @@ async def get_job_status(
 @router.get(
     "/jobs",
     response_model=StandardResponse,
-    summary="List All Jobs",
-    description="Get all processing jobs (recent first)",
+    summary="List Jobs",
+    description="Get one page of processing jobs tracked by this replica (recent first)",
 )
 async def list_jobs(
-    limit: Optional[int] = 50,
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
     metadata: Dict[str, Any] = Depends(service_metadata),
 ) -> StandardResponse:
-    """List all processing jobs."""
-    jobs = sorted(
-        _processing_jobs.values(), key=lambda x: x["created_at"], reverse=True
-    )[:limit]
+    """List processing jobs, one page at a time."""
+    jobs = get_job_registry()
+    page = jobs.list_page(limit=limit, offset=offset)
+    total = len(jobs)
+    next_offset = offset + len(page) if offset + len(page) < total else None
 
     return StandardResponse(
         status="success",
         data={
-            "jobs": jobs,
-            "total": len(_processing_jobs),
-            "showing": len(jobs),
+            "jobs": page,
+            "total": total,
+            "showing": len(page),
+            "offset": offset,
+            "limit": limit,
+            "next_offset": next_offset,
         },
-        message=f"Found {len(jobs)} jobs",
+        message=f"Found {len(page)} jobs",
         errors=None,
         metadata=metadata,
     )
@@ -367,6 +441,9 @@ async def get_processing_status(
             "active_jobs": 0,
             "queue_size": 0,
             "last_processed": datetime.now(timezone.utc).isoformat(),
+            "processing_metrics": get_processing_metrics(
+                "content-processor"
+            ).snapshot(),
             "capabilities": [
                 "content_enhancement",
                 "ai_processing",
@@ -7,6 +7,7 @@ No classes - uses functional processor API (October 2025 refactor).
 
 import logging
 import os
+import time
 from datetime import datetime, timezone
 from typing import Any, Dict
 
@@ -15,6 +16,7 @@ from core.processor import cleanup_processor, initialize_processor
 from core.processor_operations import process_collection_file
 from fastapi import APIRouter
 
+from libs.processing_metrics import get_processing_metrics
 from libs.queue_client import QueueMessageModel
 
 # Configuration
@@ -33,6 +35,9 @@ router = APIRouter(prefix="/storage-queue", tags=["Storage Queue"])
 # Module-level processor context (reused across messages in same container lifecycle)
 _processor_context = None
 
+# Fixed-memory latency quantiles, throughput and error rate for queue messages
+processing_metrics = get_processing_metrics("content-processor")
+
 
 async def get_processor_context():
     """Get or create processor context (module-level singleton)."""
@@ -44,6 +49,25 @@ async def get_processor_context():
 
 
 async def process_storage_queue_message(message: QueueMessageModel) -> Dict[str, Any]:
+    """
+    Process a single Storage Queue message and record its latency.
+
+    Args:
+        message: Storage Queue message with operation and payload
+
+    Returns:
+        Dict with status, operation, result, message_id
+    """
+    start = time.perf_counter()
+    result = await _process_message(message)
+    processing_metrics.record(
+        (time.perf_counter() - start) * 1000,
+        success=result.get("status") != "error",
+    )
+    return result
+
+
+async def _process_message(message: QueueMessageModel) -> Dict[str, Any]:
     """
     Process a single Storage Queue message using functional API.
 
@@ -22,6 +22,7 @@ from endpoints import (
     processing_router,
     storage_queue_router,
 )
+from endpoints.processing import get_job_registry
 from endpoints.storage_queue_router import process_storage_queue_message
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
@@ -225,10 +226,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Start the queue processing task
     asyncio.create_task(startup_queue_processor())
 
+    # Sweep expired persisted job records off the request path
+    job_registry = get_job_registry()
+    if job_registry.start_cleanup():
+        logger.debug("Job record retention sweep started")
+
     try:
         yield
     finally:
         logger.info("Shutting down Content Processor service")
+        await job_registry.stop_cleanup()
 
         try:
             # Clean up processor context using functional API
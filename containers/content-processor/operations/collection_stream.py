@@ -0,0 +1,212 @@
+"""
+Streaming collection-file reader.
+
+Parses collection items incrementally from a blob download stream so
+processing can start on the first item while the rest is still arriving.
+
+Supported layouts:
+- Collection object: {"metadata": {...}, "items": [{...}, ...]}
+- Bare JSON array: [{...}, {...}]
+- JSON Lines: one item object per line
+
+Only the unconsumed tail of the stream is buffered, so peak memory is bounded
+by the largest single item rather than the size of the collection.
+"""
+
+import codecs
+import json
+import logging
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+from models import TopicMetadata
+from operations.topic_operations import collection_item_to_topic_metadata
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = " \t\r\n"
+
+
+class CollectionFormatError(ValueError):
+    """Raised when a collection stream is empty or not valid JSON/JSONL."""
+
+
+class _JsonStreamReader:
+    """Minimal pull parser over an async iterator of byte chunks."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks.__aiter__()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json_decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._exhausted = False
+
+    async def _read_more(self) -> bool:
+        """Append the next chunk to the buffer, dropping consumed text."""
+        if self._exhausted:
+            return False
+        try:
+            chunk = await self._chunks.__anext__()
+            text = self._text_decoder.decode(chunk)
+        except StopAsyncIteration:
+            self._exhausted = True
+            text = self._text_decoder.decode(b"", final=True)
+        self._buffer = self._buffer[self._pos :] + text
+        self._pos = 0
+        return not self._exhausted or bool(text)
+
+    async def peek(self) -> Optional[str]:
+        """Skip whitespace and return the next character (None at end)."""
+        while True:
+            while (
+                self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE
+            ):
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not await self._read_more():
+                return None
+
+    async def expect(self, char: str) -> None:
+        """Consume the next non-whitespace character, which must be ``char``."""
+        found = await self.peek()
+        if found != char:
+            raise CollectionFormatError(f"Expected '{char}', found {found!r}")
+        self._pos += 1
+
+    async def value(self) -> Any:
+        """Decode the next complete JSON value, reading more data as needed."""
+        if await self.peek() is None:
+            raise CollectionFormatError("Unexpected end of collection stream")
+        while True:
+            try:
+                result, end = self._json_decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as e:
+                if not await self._read_more():
+                    raise CollectionFormatError(f"Invalid JSON: {e}") from e
+                continue
+            # A scalar ending exactly at the buffer edge may continue in the
+            # next chunk (e.g. a number split across reads)
+            if end == len(self._buffer) and not self._exhausted:
+                await self._read_more()
+                continue
+            self._pos = end
+            return result
+
+    async def array_values(self) -> AsyncIterator[Any]:
+        """Yield the elements of an array whose '[' was already consumed."""
+        if await self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield await self.value()
+            separator = await self.peek()
+            if separator == "]":
+                self._pos += 1
+                return
+            await self.expect(",")
+
+
+async def stream_collection_items(
+    chunks: AsyncIterator[bytes],
+    max_items: Optional[int] = None,
+) -> AsyncIterator[Tuple[Any, Dict[str, Any]]]:
+    """
+    Yield (item, header) pairs from a collection byte stream as they parse.
+
+    The header holds the top-level collection fields seen before the items
+    array (e.g. ``metadata``); it is empty for bare arrays and JSON Lines.
+    Stops reading the stream once ``max_items`` items have been yielded.
+
+    Args:
+        chunks: Async iterator of raw blob bytes
+        max_items: Optional cap on the number of items to read
+
+    Raises:
+        CollectionFormatError: If the stream is empty or malformed
+    """
+    reader = _JsonStreamReader(chunks)
+    count = 0
+
+    def _limit_reached() -> bool:
+        return max_items is not None and count >= max_items
+
+    if _limit_reached():
+        return
+
+    first = await reader.peek()
+    if first is None:
+        raise CollectionFormatError("Collection stream is empty")
+
+    if first == "[":
+        await reader.expect("[")
+        async for item in reader.array_values():
+            count += 1
+            yield item, {}
+            if _limit_reached():
+                return
+        return
+
+    if first != "{":
+        raise CollectionFormatError(f"Unsupported collection format: {first!r}")
+
+    # Walk the top-level object key by key so the items array is streamed
+    await reader.expect("{")
+    header: Dict[str, Any] = {}
+    found_items = False
+    if await reader.peek() == "}":
+        await reader.expect("}")
+    else:
+        while True:
+            key = await reader.value()
+            await reader.expect(":")
+            if key == "items" and await reader.peek() == "[":
+                found_items = True
+                await reader.expect("[")
+                async for item in reader.array_values():
+                    count += 1
+                    yield item, header
+                    if _limit_reached():
+                        return
+            else:
+                header[key] = await reader.value()
+            if await reader.peek() == "}":
+                await reader.expect("}")
+                break
+            await reader.expect(",")
+
+    if found_items or await reader.peek() is None:
+        # Collection object (a lone object without items holds no items)
+        return
+
+    # More values follow the first object: this is JSON Lines
+    count += 1
+    yield header, {}
+    while not _limit_reached() and await reader.peek() is not None:
+        yield await reader.value(), {}
+        count += 1
+
+
+async def stream_collection_topics(
+    chunks: AsyncIterator[bytes],
+    blob_name: str,
+    max_items: Optional[int] = None,
+) -> AsyncIterator[TopicMetadata]:
+    """
+    Yield TopicMetadata for each collection item as it arrives.
+
+    Items that cannot be converted are skipped (and logged by the
+    converter), but still count towards ``max_items``.
+
+    Args:
+        chunks: Async iterator of raw blob bytes
+        blob_name: Source blob name (used for fallback topic IDs)
+        max_items: Optional cap on the number of items to read
+
+    Raises:
+        CollectionFormatError: If the stream is empty or malformed
+    """
+    async for item, header in stream_collection_items(chunks, max_items):
+        topic_metadata = collection_item_to_topic_metadata(item, blob_name, header)
+        if topic_metadata:
+            yield topic_metadata
@@ -6,6 +6,7 @@ Pure functional wrappers around Azure Queue Storage operations.
 This package provides:
 - Message creation functions (pure)
 - Queue client operations (async)
+- Batched markdown-generation triggers (MarkdownTriggerBatcher)
 - Backward-compatible exports for existing code
 
 For new code, prefer importing directly from:
@@ -13,6 +14,8 @@ For new code, prefer importing directly from:
 - queue_operations_pkg.queue_client_operations
 """
 
+from .markdown_trigger_batcher import MarkdownTriggerBatcher
+
 # Import all functions from queue_operations module for backward compatibility
 from .queue_operations import (
     clear_queue,
@@ -29,6 +32,7 @@ from .queue_operations import (
 )
 
 __all__ = [
+    "MarkdownTriggerBatcher",
     "clear_queue",
     "create_markdown_trigger_message",
     "create_queue_message",
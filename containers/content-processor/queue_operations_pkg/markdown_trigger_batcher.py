@@ -0,0 +1,134 @@
+"""
+Batched markdown-generation triggers.
+
+Collects saved article blob paths and sends one markdown-generation message
+per batch (payload ``files`` list) instead of one queue message per article.
+A batch is flushed when it reaches ``max_batch_size`` files or when the oldest
+pending file has waited ``max_wait_seconds``, whichever comes first.
+"""
+
+import asyncio
+import logging
+import os
+from typing import Any, Dict, List, Optional
+
+from queue_operations_pkg.queue_client_operations import send_queue_message
+from queue_operations_pkg.queue_message_builder import create_markdown_trigger_message
+
+logger = logging.getLogger(__name__)
+
+# Storage Queue messages are limited to 64 KiB; blob paths are ~100 bytes,
+# so batches stay well under the limit at these sizes.
+DEFAULT_MAX_BATCH_SIZE = int(os.getenv("MARKDOWN_TRIGGER_BATCH_SIZE", "10"))
+DEFAULT_MAX_WAIT_SECONDS = float(os.getenv("MARKDOWN_TRIGGER_MAX_WAIT_SECONDS", "5"))
+
+
+class MarkdownTriggerBatcher:
+    """Aggregates processed-article paths into batched markdown triggers."""
+
+    def __init__(
+        self,
+        queue_client: Any,
+        correlation_id: Optional[str] = None,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_seconds: float = DEFAULT_MAX_WAIT_SECONDS,
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            queue_client: Azure QueueClient for the markdown-generation queue
+            correlation_id: Correlation ID attached to every trigger message
+            max_batch_size: Flush once this many files are pending
+            max_wait_seconds: Flush once the oldest pending file is this old
+        """
+        self.queue_client = queue_client
+        self.correlation_id = correlation_id
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_seconds = max_wait_seconds
+        self._pending: List[str] = []
+        self._lock = asyncio.Lock()
+        self._timer: Optional[asyncio.Task] = None
+        self.messages_sent = 0
+        self.files_sent = 0
+        self.files_failed = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of files waiting to be sent."""
+        return len(self._pending)
+
+    async def add(self, blob_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Queue a processed article for markdown generation.
+
+        Args:
+            blob_name: Processed article blob name
+
+        Returns:
+            Send result if this call flushed a batch, otherwise None
+        """
+        self._pending.append(blob_name)
+        if len(self._pending) >= self.max_batch_size:
+            return await self.flush()
+        if self._timer is None or self._timer.done():
+            self._timer = asyncio.create_task(self._flush_after_wait())
+        return None
+
+    async def _flush_after_wait(self) -> None:
+        """Flush whatever is pending once max_wait_seconds has elapsed."""
+        await asyncio.sleep(self.max_wait_seconds)
+        self._timer = None
+        await self.flush()
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None and not self._timer.done():
+            if self._timer is not asyncio.current_task():
+                self._timer.cancel()
+        self._timer = None
+
+    async def flush(self) -> Optional[Dict[str, Any]]:
+        """
+        Send all pending files as a single markdown trigger message.
+
+        Returns:
+            Send result dict (status, message_id, files), or None if nothing
+            was pending
+        """
+        async with self._lock:
+            self._cancel_timer()
+            if not self._pending:
+                return None
+            files, self._pending = self._pending, []
+
+            message = create_markdown_trigger_message(
+                processed_files=files,
+                correlation_id=self.correlation_id,
+            )
+            result = await send_queue_message(self.queue_client, message)
+            result["files"] = files
+
+            if result["status"] == "success":
+                self.messages_sent += 1
+                self.files_sent += len(files)
+                logger.info(f"✅ Markdown trigger sent for {len(files)} articles")
+            else:
+                self.files_failed += len(files)
+                logger.warning(
+                    f"⚠️  Markdown trigger failed for {len(files)} articles: "
+                    f"{result.get('error')}"
+                )
+            return result
+
+    async def close(self) -> Optional[Dict[str, Any]]:
+        """Flush remaining files and stop the wait timer."""
+        return await self.flush()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return trigger counters for monitoring."""
+        return {
+            "messages_sent": self.messages_sent,
+            "files_sent": self.files_sent,
+            "files_failed": self.files_failed,
+            "files_pending": len(self._pending),
+        }
@@ -0,0 +1,144 @@
+"""
+Tests for the streaming collection-file reader.
+
+Verifies that collection items are parsed incrementally from byte chunks
+for all supported layouts (collection object, bare array, JSON Lines),
+independent of where chunk boundaries fall.
+"""
+
+import json
+from typing import Any, AsyncIterator, Dict, List, Tuple
+
+import pytest
+from models import TopicMetadata
+from operations.collection_stream import (
+    CollectionFormatError,
+    stream_collection_items,
+    stream_collection_topics,
+)
+
+ITEMS: List[Dict[str, Any]] = [
+    {"id": "reddit_1", "title": "Rust async runtimes", "source": "reddit"},
+    {"id": "reddit_2", "title": "Python 3.13 — free threading", "source": "reddit"},
+    {"id": "mastodon_3", "title": "Zero-copy I/O", "source": "mastodon", "score": 42},
+]
+
+
+async def _chunked(text: str, size: int) -> AsyncIterator[bytes]:
+    """Yield text as UTF-8 byte chunks of a fixed size."""
+    data = text.encode("utf-8")
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+async def _collect(
+    text: str, size: int = 7, **kwargs: Any
+) -> List[Tuple[Any, Dict[str, Any]]]:
+    """Parse a collection from chunks and return all (item, header) pairs."""
+    return [
+        pair async for pair in stream_collection_items(_chunked(text, size), **kwargs)
+    ]
+
+
+class TestStreamCollectionItems:
+    """Test incremental item parsing across supported layouts."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("chunk_size", [1, 3, 16, 4096])
+    async def test_collection_object(self, chunk_size: int) -> None:
+        """Items are streamed from the items array with header fields."""
+        text = json.dumps(
+            {"metadata": {"timestamp": "2025-10-15T10:00:00Z"}, "items": ITEMS},
+            indent=2,
+        )
+
+        pairs = await _collect(text, chunk_size)
+
+        assert [item for item, _ in pairs] == ITEMS
+        assert pairs[0][1]["metadata"]["timestamp"] == "2025-10-15T10:00:00Z"
+
+    @pytest.mark.asyncio
+    async def test_bare_array(self) -> None:
+        """A top-level JSON array is treated as the item list."""
+        pairs = await _collect(json.dumps(ITEMS))
+
+        assert [item for item, _ in pairs] == ITEMS
+        assert all(header == {} for _, header in pairs)
+
+    @pytest.mark.asyncio
+    async def test_json_lines(self) -> None:
+        """One JSON object per line is treated as JSON Lines."""
+        text = "\n".join(json.dumps(item) for item in ITEMS) + "\n"
+
+        pairs = await _collect(text)
+
+        assert [item for item, _ in pairs] == ITEMS
+
+    @pytest.mark.asyncio
+    async def test_max_items_stops_early(self) -> None:
+        """Reading stops once max_items have been yielded."""
+        text = json.dumps({"items": ITEMS})
+
+        pairs = await _collect(text, max_items=2)
+
+        assert [item for item, _ in pairs] == ITEMS[:2]
+
+    @pytest.mark.asyncio
+    async def test_collection_without_items(self) -> None:
+        """A collection object without items yields nothing."""
+        pairs = await _collect(json.dumps({"metadata": {}, "topics": ITEMS}))
+
+        assert pairs == []
+
+    @pytest.mark.asyncio
+    async def test_empty_stream_raises(self) -> None:
+        """An empty stream (missing blob) raises CollectionFormatError."""
+        with pytest.raises(CollectionFormatError):
+            await _collect("")
+
+    @pytest.mark.asyncio
+    async def test_truncated_stream_raises(self) -> None:
+        """A stream that ends mid-item raises after the complete items."""
+        text = json.dumps({"items": ITEMS})[:-20]
+        received = []
+
+        with pytest.raises(CollectionFormatError):
+            async for item, _ in stream_collection_items(_chunked(text, 5)):
+                received.append(item)
+
+        assert received == ITEMS[:2]
+
+
+class TestStreamCollectionTopics:
+    """Test conversion of streamed items to TopicMetadata."""
+
+    @pytest.mark.asyncio
+    async def test_yields_topic_metadata(self) -> None:
+        """Each item is converted to TopicMetadata as it arrives."""
+        text = json.dumps(
+            {"metadata": {"timestamp": "2025-10-15T10:00:00Z"}, "items": ITEMS}
+        )
+
+        topics = [
+            topic
+            async for topic in stream_collection_topics(
+                _chunked(text, 11), "collections/test.json"
+            )
+        ]
+
+        assert all(isinstance(topic, TopicMetadata) for topic in topics)
+        assert [topic.topic_id for topic in topics] == [i["id"] for i in ITEMS]
+
+    @pytest.mark.asyncio
+    async def test_skips_unconvertible_items(self) -> None:
+        """Non-dict items are skipped but still count towards the limit."""
+        text = json.dumps({"items": ["not-a-dict", ITEMS[0], ITEMS[1]]})
+
+        topics = [
+            topic
+            async for topic in stream_collection_topics(
+                _chunked(text, 11), "collections/test.json", max_items=2
+            )
+        ]
+
+        assert [topic.topic_id for topic in topics] == ["reddit_1"]
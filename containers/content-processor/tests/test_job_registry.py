@@ -0,0 +1,285 @@
+"""
+Tests for the bounded job registry used by /process wake-up jobs.
+
+Covers size-bounded eviction, TTL expiry, newest-first paging and the
+optional blob-backed persistent tier (read-through and retention).
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock
+
+import pytest
+from core.job_registry import JobRegistry
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _job(job_id: str, status: str = "accepted") -> Dict[str, Any]:
+    return {"job_id": job_id, "status": status}
+
+
+class TestJobRegistryMemoryTier:
+    """Test in-memory bounds, expiry and paging."""
+
+    @pytest.mark.asyncio
+    async def test_create_and_get(self) -> None:
+        """Created jobs are returned by ID."""
+        registry = JobRegistry()
+        await registry.create(_job("a"))
+
+        assert (await registry.get("a"))["status"] == "accepted"
+        assert await registry.get("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_update_fields(self) -> None:
+        """Updates are applied to the stored record."""
+        registry = JobRegistry()
+        await registry.create(_job("a"))
+
+        await registry.update("a", status="completed", articles_generated=3)
+
+        job = await registry.get("a")
+        assert job["status"] == "completed"
+        assert job["articles_generated"] == 3
+        assert await registry.update("missing", status="failed") is None
+
+    @pytest.mark.asyncio
+    async def test_max_size_evicts_oldest(self) -> None:
+        """The oldest jobs are evicted once max_jobs is exceeded."""
+        registry = JobRegistry(max_jobs=3)
+        for job_id in "abcde":
+            await registry.create(_job(job_id, "completed"))
+
+        assert len(registry) == 3
+        assert await registry.get("a") is None
+        assert await registry.get("b") is None
+        assert await registry.get("e") is not None
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry(self) -> None:
+        """Jobs older than the TTL are no longer returned."""
+        clock = FakeClock()
+        registry = JobRegistry(ttl_seconds=60, clock=clock)
+        await registry.create(_job("old", "completed"))
+        clock.now += 30
+        await registry.create(_job("new", "completed"))
+        clock.now += 45
+
+        assert await registry.get("old") is None
+        assert await registry.get("new") is not None
+        assert len(registry) == 1
+
+    @pytest.mark.asyncio
+    async def test_list_page_newest_first(self) -> None:
+        """Pages are returned newest first with offset/limit."""
+        registry = JobRegistry()
+        for job_id in "abcdef":
+            await registry.create(_job(job_id))
+
+        first = registry.list_page(limit=4)
+        second = registry.list_page(limit=4, offset=4)
+
+        assert [job["job_id"] for job in first] == ["f", "e", "d", "c"]
+        assert [job["job_id"] for job in second] == ["b", "a"]
+
+    @pytest.mark.asyncio
+    async def test_running_jobs_are_pinned(self) -> None:
+        """Evicted or expired running jobs still receive their final update."""
+        clock = FakeClock()
+        registry = JobRegistry(max_jobs=2, ttl_seconds=60, clock=clock)
+        await registry.create(_job("running", "processing"))
+        for job_id in "abc":
+            await registry.create(_job(job_id, "completed"))
+
+        assert (await registry.get("running"))["status"] == "processing"
+        assert [job["job_id"] for job in registry.list_page()] == [
+            "c",
+            "b",
+            "running",
+        ]
+
+        clock.now += 120
+        assert await registry.update("running", status="completed") is not None
+        assert (await registry.get("running"))["status"] == "completed"
+        assert len(registry) == 1
+
+
+class TestJobRegistryPersistentTier:
+    """Test the optional blob-backed tier."""
+
+    @pytest.fixture
+    def blob_client(self) -> AsyncMock:
+        store: Dict[str, Any] = {}
+        modified: Dict[str, datetime] = {}
+        client = AsyncMock()
+
+        async def upload_json(container: str, blob_name: str, data: Any) -> bool:
+            store[f"{container}/{blob_name}"] = dict(data)
+            modified[f"{container}/{blob_name}"] = datetime.now(timezone.utc)
+            return True
+
+        async def download_json(container: str, blob_name: str) -> Any:
+            data = store.get(f"{container}/{blob_name}")
+            return dict(data) if data is not None else None
+
+        async def list_blobs(container: str, prefix: str = "") -> List[Any]:
+            return [
+                {"name": key.split("/", 1)[1], "last_modified": modified[key]}
+                for key in store
+                if key.startswith(f"{container}/{prefix}")
+            ]
+
+        async def delete_blob(container: str, blob_name: str) -> bool:
+            return store.pop(f"{container}/{blob_name}", None) is not None
+
+        async def delete_blobs(container: str, blob_names: List[str]) -> int:
+            removed = [store.pop(f"{container}/{name}", None) for name in blob_names]
+            return sum(1 for data in removed if data is not None)
+
+        client.upload_json.side_effect = upload_json
+        client.download_json.side_effect = download_json
+        client.list_blobs.side_effect = list_blobs
+        client.delete_blob.side_effect = delete_blob
+        client.delete_blobs.side_effect = delete_blobs
+        client.modified = modified
+        client.store = store
+        return client
+
+    @pytest.mark.asyncio
+    async def test_lookup_across_replicas(self, blob_client: AsyncMock) -> None:
+        """A job created on one replica can be read from another."""
+        replica_a = JobRegistry(blob_client=blob_client, container="jobs")
+        replica_b = JobRegistry(blob_client=blob_client, container="jobs")
+
+        await replica_a.create(_job("shared"))
+        await replica_a.update("shared", status="completed")
+
+        job = await replica_b.get("shared")
+        assert job is not None
+        assert job["status"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_progress_updates_skip_persistence(
+        self, blob_client: AsyncMock
+    ) -> None:
+        """persist=False updates stay in memory only."""
+        registry = JobRegistry(blob_client=blob_client, container="jobs")
+        await registry.create(_job("a"))
+        writes: List[Any] = list(blob_client.upload_json.call_args_list)
+
+        await registry.update("a", persist=False, articles_generated=1)
+
+        assert blob_client.upload_json.call_args_list == writes
+        assert blob_client.store["jobs/jobs/a.json"].get("articles_generated") is None
+
+    @pytest.mark.asyncio
+    async def test_no_container_disables_tier(self, blob_client: AsyncMock) -> None:
+        """Without a container the registry is memory-only."""
+        registry = JobRegistry(blob_client=blob_client, container=None)
+        await registry.create(_job("a"))
+
+        assert registry.persistent is False
+        blob_client.upload_json.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_reads_through_after_local_expiry(
+        self, blob_client: AsyncMock
+    ) -> None:
+        """An expired local entry falls back to the persisted record."""
+        clock = FakeClock()
+        registry = JobRegistry(
+            ttl_seconds=60, blob_client=blob_client, container="jobs", clock=clock
+        )
+        await registry.create(_job("a", "completed"))
+        clock.now += 120
+
+        job = await registry.get("a")
+        assert job is not None
+        assert job["status"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_update_reaches_record_from_another_replica(
+        self, blob_client: AsyncMock
+    ) -> None:
+        """Updates for jobs not held in memory are applied to the blob record."""
+        await JobRegistry(blob_client=blob_client, container="jobs").create(_job("a"))
+        replica_b = JobRegistry(blob_client=blob_client, container="jobs")
+
+        updated = await replica_b.update("a", persist=False, status="completed")
+
+        assert updated is not None
+        assert blob_client.store["jobs/jobs/a.json"]["status"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_cleanup_deletes_records_past_retention(
+        self, blob_client: AsyncMock
+    ) -> None:
+        """Records not written within the retention period are deleted."""
+        registry = JobRegistry(
+            blob_client=blob_client,
+            container="jobs",
+            retention_seconds=7 * 24 * 60 * 60,
+            cleanup_interval_seconds=3600,
+        )
+        await registry.create(_job("old", "completed"))
+        blob_client.modified["jobs/jobs/old.json"] = datetime.now(
+            timezone.utc
+        ) - timedelta(days=8)
+        await registry.create(_job("new"))
+        blob_client.modified["jobs/jobs/new.json"] = datetime.now(timezone.utc)
+
+        assert await registry.cleanup_persisted() == 1
+        assert set(blob_client.store) == {"jobs/jobs/new.json"}
+
+    @pytest.mark.asyncio
+    async def test_cleanup_uses_one_batch_delete(self, blob_client: AsyncMock) -> None:
+        """Expired records are removed in a single batch call."""
+        registry = JobRegistry(blob_client=blob_client, container="jobs")
+        for job_id in "abc":
+            await registry.create(_job(job_id, "completed"))
+            blob_client.modified[f"jobs/jobs/{job_id}.json"] = datetime.now(
+                timezone.utc
+            ) - timedelta(days=8)
+
+        assert await registry.cleanup_persisted() == 3
+        blob_client.delete_blobs.assert_awaited_once()
+        blob_client.delete_blob.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_does_not_sweep(self, blob_client: AsyncMock) -> None:
+        """Creating jobs never lists or deletes persisted records."""
+        registry = JobRegistry(blob_client=blob_client, container="jobs")
+        for job_id in "abc":
+            await registry.create(_job(job_id))
+
+        blob_client.list_blobs.assert_not_called()
+        blob_client.delete_blobs.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_background_cleanup_sweeps_until_stopped(
+        self, blob_client: AsyncMock
+    ) -> None:
+        """start_cleanup sweeps in the background; stop_cleanup cancels it."""
+        registry = JobRegistry(
+            blob_client=blob_client, container="jobs", cleanup_interval_seconds=0
+        )
+
+        assert registry.start_cleanup() is True
+        await asyncio.sleep(0.01)
+        await registry.stop_cleanup()
+        sweeps = blob_client.list_blobs.await_count
+        await asyncio.sleep(0.01)
+
+        assert sweeps >= 2
+        assert blob_client.list_blobs.await_count == sweeps
+        assert JobRegistry().start_cleanup() is False
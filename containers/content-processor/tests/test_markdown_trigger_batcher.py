@@ -0,0 +1,108 @@
+"""
+Tests for batched markdown-generation triggers.
+
+Verifies that processed-article paths are sent as one message per batch,
+flushed by count, by time and on close.
+"""
+
+import asyncio
+import json
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from queue_operations_pkg import MarkdownTriggerBatcher
+
+
+@pytest.fixture
+def mock_queue_client() -> Mock:
+    """Queue client that records sent message bodies."""
+    client = Mock()
+    client.queue_name = "markdown-generation-requests"
+    client.send_message = AsyncMock(return_value=Mock(id="msg-1"))
+    return client
+
+
+def _sent_files(client: Mock) -> List[List[str]]:
+    """Extract the files list from each sent message."""
+    messages: List[Dict[str, Any]] = [
+        json.loads(call.args[0]) for call in client.send_message.call_args_list
+    ]
+    return [message["payload"]["files"] for message in messages]
+
+
+class TestMarkdownTriggerBatcher:
+    """Test count, time and close based flushing."""
+
+    @pytest.mark.asyncio
+    async def test_flushes_when_batch_full(self, mock_queue_client: Mock) -> None:
+        """A message is sent as soon as max_batch_size files are pending."""
+        batcher = MarkdownTriggerBatcher(
+            mock_queue_client, max_batch_size=3, max_wait_seconds=60
+        )
+
+        for i in range(7):
+            await batcher.add(f"articles/2025-10-15/article-{i}.json")
+
+        assert _sent_files(mock_queue_client) == [
+            [f"articles/2025-10-15/article-{i}.json" for i in range(3)],
+            [f"articles/2025-10-15/article-{i}.json" for i in range(3, 6)],
+        ]
+        assert batcher.pending == 1
+
+        await batcher.close()
+        assert _sent_files(mock_queue_client)[-1] == [
+            "articles/2025-10-15/article-6.json"
+        ]
+        assert batcher.get_stats()["files_sent"] == 7
+
+    @pytest.mark.asyncio
+    async def test_flushes_after_max_wait(self, mock_queue_client: Mock) -> None:
+        """A partial batch is sent once the oldest file has waited max_wait."""
+        batcher = MarkdownTriggerBatcher(
+            mock_queue_client, max_batch_size=10, max_wait_seconds=0.01
+        )
+
+        await batcher.add("articles/2025-10-15/a.json")
+        await batcher.add("articles/2025-10-15/b.json")
+        await asyncio.sleep(0.05)
+
+        assert _sent_files(mock_queue_client) == [
+            ["articles/2025-10-15/a.json", "articles/2025-10-15/b.json"]
+        ]
+        assert batcher.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_message_format(self, mock_queue_client: Mock) -> None:
+        """Batched messages keep the markdown trigger contract."""
+        batcher = MarkdownTriggerBatcher(mock_queue_client, correlation_id="session")
+
+        await batcher.add("articles/2025-10-15/a.json")
+        await batcher.flush()
+
+        message = json.loads(mock_queue_client.send_message.call_args.args[0])
+        assert message["operation"] == "wake_up"
+        assert message["correlation_id"] == "session"
+        assert message["payload"]["files_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_send_is_counted(self, mock_queue_client: Mock) -> None:
+        """Send failures are reported and counted, not raised."""
+        mock_queue_client.send_message.side_effect = Exception("queue down")
+        batcher = MarkdownTriggerBatcher(mock_queue_client, max_batch_size=2)
+
+        await batcher.add("a.json")
+        result = await batcher.add("b.json")
+
+        assert result is not None
+        assert result["status"] == "error"
+        assert result["files"] == ["a.json", "b.json"]
+        assert batcher.get_stats()["files_failed"] == 2
+
+    @pytest.mark.asyncio
+    async def test_flush_with_nothing_pending(self, mock_queue_client: Mock) -> None:
+        """Flushing an empty batcher sends nothing."""
+        batcher = MarkdownTriggerBatcher(mock_queue_client)
+
+        assert await batcher.flush() is None
+        mock_queue_client.send_message.assert_not_called()
@@ -329,3 +329,26 @@ class TestProcessorContextConfiguration:
 
         # Assert
         assert context.markdown_queue == "my-queue"
+
+
+class TestInitializeProcessor:
+    """Test context wiring done by initialize_processor."""
+
+    @pytest.mark.asyncio
+    async def test_markdown_trigger_uses_session_id(self, monkeypatch):
+        """Markdown trigger messages are correlated with the session ID."""
+        # Arrange
+        from core import processor
+
+        monkeypatch.setenv("AZURE_STORAGE_ACCOUNT_NAME", "teststorage")
+        monkeypatch.delenv("AZURE_OPENAI_ENDPOINT", raising=False)
+        monkeypatch.setattr(processor, "create_blob_client", Mock())
+        monkeypatch.setattr(processor, "DefaultAzureCredential", Mock())
+        monkeypatch.setattr(processor, "QueueClient", Mock())
+
+        # Act
+        context = await processor.initialize_processor(processor_id="test")
+
+        # Assert
+        assert context.markdown_trigger.correlation_id == context.session_id
+        assert context.markdown_trigger.queue_client is context.queue_client
@@ -48,6 +48,12 @@ def mock_blob_client():
     }
     client.download_json.return_value = collection_data
 
+    # Mock streamed collection download (used by process_collection_file)
+    async def _stream(*args, **kwargs):
+        yield json.dumps(collection_data).encode("utf-8")
+
+    client.download_stream = Mock(side_effect=_stream)
+
     # Mock blob upload (output)
     client.upload_json.return_value = True
 
@@ -235,6 +241,12 @@ class TestProcessorIntegration:
         mock_blob.download_json.return_value = None
         mock_blob.list_blobs.return_value = []
 
+        async def _missing_blob_stream(*args, **kwargs):
+            return
+            yield  # pragma: no cover - makes this an async generator
+
+        mock_blob.download_stream = Mock(side_effect=_missing_blob_stream)
+
         with patch(
             "endpoints.storage_queue_router.get_processor_context"
         ) as mock_context:
@@ -5,6 +5,7 @@ Tests pure functional processor operations including health checks,
 topic processing, and batch processing workflows.
 """
 
+import json
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
@@ -17,6 +18,14 @@ from core.processor_operations import (
 )
 from models import ProcessingResult, ProcessorStatus, TopicMetadata
 
+from libs.simplified_blob_client import BlobStreamError
+
+
+async def _stream(*parts: str):
+    """Yield text parts as encoded blob chunks."""
+    for part in parts:
+        yield part.encode("utf-8")
+
 
 class TestCheckProcessorHealth:
     """Test processor health check functionality."""
@@ -131,6 +140,7 @@ class TestProcessBatch:
         context.blob_client = AsyncMock()
         context.openai_client = Mock()
         context.queue_client = AsyncMock()
+        context.markdown_trigger = AsyncMock()
         context.rate_limiter = AsyncMock()
         context.processor_id = "test-processor"
         context.session_id = "test-session"
@@ -143,7 +153,7 @@ class TestProcessBatch:
     async def test_process_collection_file_not_found(self, mock_context):
         """Test processing when collection file not found."""
         # Arrange
-        mock_context.blob_client.download_json = AsyncMock(return_value=None)
+        mock_context.blob_client.download_stream = Mock(return_value=_stream())
         blob_path = "test/missing.json"
 
         # Act
@@ -151,18 +161,20 @@ class TestProcessBatch:
 
         # Assert
         assert result.success is False
-        mock_context.blob_client.download_json.assert_called_once()
+        mock_context.blob_client.download_stream.assert_called_once()
 
     @pytest.mark.asyncio
-    @patch("core.processor_operations.collection_item_to_topic_metadata")
+    @patch("operations.collection_stream.collection_item_to_topic_metadata")
     @patch("core.processor_operations.process_topic_to_article")
     async def test_process_collection_file_success(
         self, mock_process_topic, mock_item_to_metadata, mock_context
     ):
         """Test successful collection file processing."""
         # Arrange
-        mock_context.blob_client.download_json = AsyncMock(
-            return_value={"items": [{"title": "Test", "content": "Sample"}]}
+        mock_context.blob_client.download_stream = Mock(
+            return_value=_stream(
+                json.dumps({"items": [{"title": "Test", "content": "Sample"}]})
+            )
         )
         mock_item_to_metadata.return_value = Mock(spec=TopicMetadata)
         mock_process_topic.return_value = {
@@ -177,7 +189,55 @@ class TestProcessBatch:
 
         # Assert
         assert isinstance(result, ProcessingResult)
-        mock_context.blob_client.download_json.assert_called_once()
+        mock_context.blob_client.download_stream.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch("core.processor_operations._process_single_topic")
+    async def test_process_collection_file_respects_article_limit(
+        self, mock_process_single, mock_context
+    ):
+        """Test that only max_articles_per_run items are read and processed."""
+        # Arrange
+        items = [{"id": f"topic_{i}", "title": f"Topic {i}"} for i in range(25)]
+        mock_context.blob_client.download_stream = Mock(
+            return_value=_stream(json.dumps({"items": items}))
+        )
+        mock_process_single.return_value = {"cost": 0.01}
+
+        # Act
+        result = await process_collection_file(mock_context, "test/collection.json")
+
+        # Assert
+        assert result.success is True
+        assert result.topics_processed == mock_context.max_articles_per_run
+        assert mock_process_single.call_count == mock_context.max_articles_per_run
+        mock_context.markdown_trigger.flush.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch("core.processor_operations._process_single_topic")
+    async def test_process_collection_file_keeps_results_when_interrupted(
+        self, mock_process_single, mock_context
+    ):
+        """Test a stream that breaks mid-way keeps the topics already processed."""
+
+        # Arrange
+        async def _interrupted_stream():
+            yield b'{"items": [{"id": "topic_1", "title": "Topic 1"}, '
+            raise BlobStreamError("Connection reset")
+
+        mock_context.blob_client.download_stream = Mock(
+            return_value=_interrupted_stream()
+        )
+        mock_process_single.return_value = {"cost": 0.01}
+
+        # Act
+        result = await process_collection_file(mock_context, "test/collection.json")
+
+        # Assert
+        assert result.success is True
+        assert result.topics_processed == 1
+        assert "Connection reset" in result.error_messages[0]
+        mock_context.markdown_trigger.flush.assert_awaited_once()
 
 
 class TestProcessingErrorHandling:
@@ -7,17 +7,26 @@ writing data to Azure Blob Storage.
 
 import json
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
+from azure.core import MatchConditions
+from azure.core.exceptions import ResourceExistsError, ResourceNotFoundError
 from azure.storage.blob.aio import BlobServiceClient
 
 logger = logging.getLogger(__name__)
 
 __all__ = [
+    "CONTENT_HASH_METADATA_KEY",
     "read_json_from_blob",
+    "get_markdown_blob_state",
+    "read_blob_bytes",
+    "set_content_hash_metadata",
     "write_markdown_to_blob",
 ]
 
+# Blob metadata key holding the SHA-256 of the markdown content
+CONTENT_HASH_METADATA_KEY = "content_sha256"
+
 
 async def read_json_from_blob(
     blob_service_client: BlobServiceClient, container_name: str, blob_name: str
@@ -52,46 +61,155 @@ async def read_json_from_blob(
     return parsed_data
 
 
+async def get_markdown_blob_state(
+    blob_service_client: BlobServiceClient, container_name: str, blob_name: str
+) -> Optional[Dict[str, Optional[str]]]:
+    """
+    Fetch the ETag and stored content hash of an existing markdown blob.
+
+    I/O function with explicit side effects (single Azure properties call).
+
+    Args:
+        blob_service_client: Azure Blob Service client
+        container_name: Container to check
+        blob_name: Name of markdown blob
+
+    Returns:
+        Dict with ``etag`` and ``content_hash`` (None for blobs written
+        without hash metadata), or None if the blob does not exist
+
+    Examples:
+        >>> # See tests/test_blob_operations.py
+        >>> pass
+    """
+    container_client = blob_service_client.get_container_client(container_name)
+    blob_client = container_client.get_blob_client(blob_name)
+
+    try:
+        properties = await blob_client.get_blob_properties()
+    except ResourceNotFoundError:
+        return None
+
+    metadata = properties.metadata or {}
+    return {
+        "etag": properties.etag,
+        "content_hash": metadata.get(CONTENT_HASH_METADATA_KEY),
+    }
+
+
+async def read_blob_bytes(
+    blob_service_client: BlobServiceClient, container_name: str, blob_name: str
+) -> bytes:
+    """
+    Download a blob's raw content.
+
+    I/O function with explicit side effects (Azure read operation).
+
+    Args:
+        blob_service_client: Azure Blob Service client
+        container_name: Container to read from
+        blob_name: Name of blob to read
+
+    Returns:
+        Blob content as bytes
+
+    Raises:
+        ResourceNotFoundError: If blob doesn't exist
+    """
+    container_client = blob_service_client.get_container_client(container_name)
+    blob_client = container_client.get_blob_client(blob_name)
+
+    downloader = await blob_client.download_blob()
+    return await downloader.readall()
+
+
+async def set_content_hash_metadata(
+    blob_service_client: BlobServiceClient,
+    container_name: str,
+    blob_name: str,
+    content_hash: str,
+    etag: Optional[str] = None,
+) -> None:
+    """
+    Record a content hash on an existing blob without rewriting it.
+
+    Used to backfill hash metadata on markdown written before hashes were
+    stored, so later runs can skip the download.
+
+    Args:
+        blob_service_client: Azure Blob Service client
+        container_name: Container holding the blob
+        blob_name: Name of blob to tag
+        content_hash: SHA-256 hex digest of the blob content
+        etag: Only update if the blob still has this ETag
+    """
+    container_client = blob_service_client.get_container_client(container_name)
+    blob_client = container_client.get_blob_client(blob_name)
+
+    kwargs: Dict[str, Any] = {}
+    if etag:
+        kwargs.update(etag=etag, match_condition=MatchConditions.IfNotModified)
+    await blob_client.set_blob_metadata(
+        {CONTENT_HASH_METADATA_KEY: content_hash}, **kwargs
+    )
+
+
 async def write_markdown_to_blob(
     blob_service_client: BlobServiceClient,
     container_name: str,
     blob_name: str,
     markdown_content: str,
     overwrite: bool,
+    content_hash: Optional[str] = None,
+    etag: Optional[str] = None,
 ) -> str:
     """
     Write markdown content to blob storage.
 
     I/O function with explicit side effects (Azure write operation).
 
+    Writes are conditional rather than check-then-write: with
+    ``overwrite=False`` the upload only succeeds if the blob does not exist
+    (If-None-Match: *), and with an ``etag`` it only succeeds if the blob is
+    unchanged since that ETag was read (If-Match).
+
     Args:
         blob_service_client: Azure Blob Service client
         container_name: Container to write to
         blob_name: Name of blob to create
         markdown_content: Markdown content to write
         overwrite: Whether to overwrite existing blob
+        content_hash: SHA-256 of the content, stored in blob metadata
+        etag: Only replace the blob if it still has this ETag
 
     Returns:
         Name of created blob
 
     Raises:
         ValueError: If blob exists and overwrite is False
+        ResourceModifiedError: If etag is given and the blob has changed
 
     Examples:
-        >>> # See integration tests
+        >>> # See tests/test_blob_operations.py
         >>> pass
     """
     container_client = blob_service_client.get_container_client(container_name)
     blob_client = container_client.get_blob_client(blob_name)
 
-    # Check if exists
-    exists = await blob_client.exists()
-    if not overwrite and exists:
+    kwargs: Dict[str, Any] = {}
+    if content_hash:
+        kwargs["metadata"] = {CONTENT_HASH_METADATA_KEY: content_hash}
+    if overwrite and etag:
+        kwargs.update(etag=etag, match_condition=MatchConditions.IfNotModified)
+
+    try:
+        await blob_client.upload_blob(
+            markdown_content,
+            overwrite=overwrite,
+            content_type="text/markdown",
+            **kwargs,
+        )
+    except ResourceExistsError:
         raise ValueError(f"Markdown file already exists: {blob_name}")
 
-    # Upload markdown
-    await blob_client.upload_blob(
-        markdown_content, overwrite=overwrite, content_type="text/markdown"
-    )
-
     return blob_name
@@ -7,7 +7,7 @@ logging, and processing parameters.
 
 import logging
 from functools import lru_cache
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -43,6 +43,26 @@ class Settings(BaseSettings):
     enable_stock_images: bool = Field(
         default=True, description="Enable automatic stock image fetching"
     )
+    image_cache_container: str = Field(
+        default="image-cache",
+        description="Container for the Unsplash query cache (empty = memory only)",
+    )
+    image_cache_ttl_seconds: int = Field(
+        default=14 * 24 * 60 * 60, description="Lifetime of cached image searches"
+    )
+    enable_responsive_images: bool = Field(
+        default=True,
+        description="Host resized WebP/AVIF hero variants instead of hotlinking",
+    )
+    image_output_container: str = Field(
+        default="$web", description="Static site container for image variants"
+    )
+    image_variant_widths: List[int] = Field(
+        default=[480, 800, 1200], description="Hero image variant widths (px)"
+    )
+    image_workers: Optional[int] = Field(
+        None, description="Image encoding processes (default: CPU count)"
+    )
 
     # Azure Storage settings
     azure_storage_account_name: str = Field(
@@ -73,6 +93,10 @@ class Settings(BaseSettings):
         default=300, description="Message visibility timeout (5 minutes)"
     )
     max_dequeue_count: int = Field(default=3, description="Max retry attempts")
+    failed_file_retry_delay_seconds: int = Field(
+        default=60,
+        description="Delay before files that failed in a batch are re-queued",
+    )
 
     # Processing settings
     max_batch_size: int = Field(default=10, description="Maximum batch processing size")
@@ -82,6 +106,22 @@ class Settings(BaseSettings):
     enable_overwrite: bool = Field(
         default=False, description="Allow overwriting existing files"
     )
+    render_concurrency: int = Field(
+        default=8, description="Articles rendered concurrently per message"
+    )
+    message_concurrency: int = Field(
+        default=4, description="Queue messages handled concurrently per batch"
+    )
+    blob_io_concurrency: int = Field(
+        default=16, description="Maximum concurrent blob reads/writes"
+    )
+    unsplash_concurrency: int = Field(
+        default=2, description="Maximum concurrent Unsplash API calls"
+    )
+    template_bytecode_cache_dir: Optional[str] = Field(
+        default="/tmp/markdown-generator-jinja",
+        description="Jinja2 bytecode cache directory (empty to disable)",
+    )
 
     # Monitoring settings
     enable_metrics: bool = Field(default=True, description="Enable metrics collection")
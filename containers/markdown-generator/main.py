@@ -18,6 +18,7 @@ from typing import Any, AsyncGenerator, Dict, Union
 from azure.identity.aio import DefaultAzureCredential
 from azure.storage.blob.aio import BlobServiceClient
 from fastapi import FastAPI, HTTPException, status
+from markdown_generator import precompile_templates
 from markdown_processor import (
     create_jinja_environment,
     load_unsplash_key,
@@ -33,12 +34,15 @@ from models import (
     ProcessingStatus,
 )
 from queue_processor import create_message_handler, startup_queue_processor
+from render_pool import RenderPool
+from services.image_cache import configure_image_cache, get_image_cache
 from services.unsplash_client import get_unsplash_limiter
 
 from config import configure_logging, get_settings  # type: ignore[import]
 
 # Application Insights monitoring
 from libs.monitoring import configure_application_insights
+from libs.processing_metrics import get_processing_metrics
 
 # Initialize logging
 configure_logging()
@@ -53,7 +57,8 @@ app_state: Dict[str, Any] = {
     "total_processed": 0,  # Total messages processed
     "total_files_generated": 0,  # Total NEW files created (not duplicates)
     "total_failed": 0,
-    "processing_times": [],
+    # Fixed-memory latency quantiles, throughput and error rate
+    "processing_metrics": get_processing_metrics("markdown-generator"),
     "last_processed": None,
 }
 
@@ -85,10 +90,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         app.state.settings = settings
 
         # Initialize reusable resources (avoid recreating on every request)
-        app.state.jinja_env = create_jinja_environment()
+        app.state.jinja_env = create_jinja_environment(
+            bytecode_cache_dir=settings.template_bytecode_cache_dir
+        )
+        precompile_templates(app.state.jinja_env)
         app.state.unsplash_key = (
             await load_unsplash_key(settings) if settings.enable_stock_images else None
         )
+        app.state.render_pool = RenderPool.from_settings(settings)
+        if settings.enable_stock_images:
+            configure_image_cache(
+                blob_service_client,
+                settings.image_cache_container,
+                ttl_seconds=settings.image_cache_ttl_seconds,
+            )
 
         logger.info("Azure clients initialized successfully")
 
@@ -103,6 +118,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         jinja_env=app.state.jinja_env,
         unsplash_key=app.state.unsplash_key,
         app_state=app_state,
+        render_pool=app.state.render_pool,
     )
 
     # Start the queue processing task
@@ -113,6 +129,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             max_batch_size=settings.max_batch_size,
             output_container=settings.output_container,
             app_state=app_state,
+            max_concurrency=settings.message_concurrency,
+            visibility_timeout=settings.queue_visibility_timeout_seconds,
+            max_dequeue_count=settings.max_dequeue_count,
         )
     )
 
@@ -121,6 +140,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Cleanup
     logger.info("Shutting down markdown-generator container")
 
+    # Stop image encoding workers
+    from services.responsive_images import shutdown_image_executor
+
+    shutdown_image_executor()
+
     # Close HTTP session first (aiohttp)
     try:
         from libs.http_client import close_http_session
@@ -201,23 +225,23 @@ async def get_status() -> MetricsResponse:
     Get processing metrics and statistics.
 
     Includes:
-    - Article processing count and times
+    - Article processing count, latency percentiles (P50/P90/P99),
+      throughput per minute and error rate
     - Uptime and last processed timestamp
     - Unsplash API rate limit status (if stock images enabled)
+    - Unsplash query cache hit rate and API calls saved
+    - Render throughput and concurrency limits
 
     Returns:
         MetricsResponse: Current metrics with rate limit info
     """
     uptime = (datetime.utcnow() - app_state["start_time"]).total_seconds()
 
-    avg_time = 0.0
-    if app_state["processing_times"]:
-        avg_time = sum(app_state["processing_times"]) / len(
-            app_state["processing_times"]
-        )
+    processing = app_state["processing_metrics"].snapshot()
 
-    # Get Unsplash rate limit status for monitoring
+    # Get Unsplash rate limit and cache status for monitoring
     rate_limit_info = None
+    image_cache_info = None
     settings = get_settings()
     if settings.enable_stock_images:
         try:
@@ -226,14 +250,21 @@ async def get_status() -> MetricsResponse:
             logger.debug(f"Rate limit status: {rate_limit_info}")
         except Exception as e:
             logger.warning(f"Failed to get rate limit status: {e}")
+        image_cache_info = get_image_cache().get_stats()
+
+    render_pool = getattr(app.state, "render_pool", None)
+    throughput = render_pool.get_stats() if render_pool else None
 
     return MetricsResponse(
         total_processed=app_state["total_processed"],
         total_failed=app_state["total_failed"],
-        average_processing_time_ms=avg_time,
+        average_processing_time_ms=processing["mean_ms"] or 0.0,
         uptime_seconds=uptime,
         last_processed=app_state["last_processed"],
         rate_limit_status=rate_limit_info,  # Include for monitoring
+        image_cache_status=image_cache_info,
+        throughput=throughput,
+        processing_metrics=processing,
     )
 
 
@@ -260,18 +291,18 @@ async def generate_markdown(
             template_name=request.template_name,
             jinja_env=app.state.jinja_env,
             unsplash_access_key=app.state.unsplash_key,
+            limits=app.state.render_pool.limits,
         )
 
         # Update metrics
         if result.status == ProcessingStatus.COMPLETED:
             app_state["total_processed"] += 1
-            if result.processing_time_ms:
-                app_state["processing_times"].append(result.processing_time_ms)
-                # Keep only last 100 times
-                if len(app_state["processing_times"]) > 100:
-                    app_state["processing_times"].pop(0)
         else:
             app_state["total_failed"] += 1
+        app_state["processing_metrics"].record(
+            result.processing_time_ms,
+            success=result.status == ProcessingStatus.COMPLETED,
+        )
 
         app_state["last_processed"] = datetime.utcnow()
 
@@ -295,6 +326,7 @@ async def generate_markdown(
     except Exception as e:
         logger.error(f"Markdown generation failed: {e}", exc_info=True)
         app_state["total_failed"] += 1
+        app_state["processing_metrics"].record(success=False)
 
         return MarkdownGenerationResponse(
             status="error",
@@ -361,9 +393,10 @@ async def generate_markdown_batch(
         MarkdownGenerationResponse: Batch processing results
     """
     try:
-        # Process articles concurrently using functional API
-        tasks = [
-            process_article(
+        render_pool: RenderPool = app.state.render_pool
+
+        async def render(blob_name: str) -> MarkdownGenerationResult:
+            return await process_article(
                 blob_service_client=app.state.blob_service_client,
                 settings=app.state.settings,
                 blob_name=blob_name,
@@ -371,12 +404,12 @@ async def generate_markdown_batch(
                 template_name=request.template_name,
                 jinja_env=app.state.jinja_env,
                 unsplash_access_key=app.state.unsplash_key,
+                limits=render_pool.limits,
             )
-            for blob_name in request.blob_names
-        ]
 
+        # Process articles concurrently with bounded parallelism
         results: list[Union[MarkdownGenerationResult, BaseException]] = (
-            await asyncio.gather(*tasks, return_exceptions=True)
+            await render_pool.run(request.blob_names, render)
         )
 
         # Aggregate results
@@ -388,17 +421,20 @@ async def generate_markdown_batch(
                 # Handle exceptions (includes Exception and other BaseException)
                 failed.append(str(result))
                 app_state["total_failed"] += 1
+                app_state["processing_metrics"].record(success=False)
             else:
                 # Type narrowed: result is MarkdownGenerationResult
                 if result.status == ProcessingStatus.COMPLETED:
                     if result.markdown_blob_name:
                         successful.append(result.markdown_blob_name)
                     app_state["total_processed"] += 1
-                    if result.processing_time_ms:
-                        app_state["processing_times"].append(result.processing_time_ms)
                 else:
                     failed.append(result.error_message or "Unknown error")
                     app_state["total_failed"] += 1
+                app_state["processing_metrics"].record(
+                    result.processing_time_ms,
+                    success=result.status == ProcessingStatus.COMPLETED,
+                )
 
         app_state["last_processed"] = datetime.utcnow()
 
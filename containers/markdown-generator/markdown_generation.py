@@ -229,6 +229,7 @@ def prepare_frontmatter(
     image_alt: Optional[str] = None,
     image_credit: Optional[str] = None,
     image_color: Optional[str] = None,
+    hero_srcset: Optional[Dict[str, Any]] = None,
     source_url: Optional[str] = None,
     source_platform: Optional[str] = None,
     **additional_params: Any,
@@ -255,6 +256,7 @@ def prepare_frontmatter(
         image_alt: Image alt text (optional)
         image_credit: Image credit/attribution (optional)
         image_color: Dominant color hex code (optional)
+        hero_srcset: Responsive hero variants for <picture> (optional)
         source_url: URL of the original social media post (optional)
         source_platform: Platform name (mastodon, reddit, rss, etc.) (optional)
         **additional_params: Any additional custom parameters
@@ -295,6 +297,7 @@ def prepare_frontmatter(
             image_alt=image_alt,
             image_credit=image_credit,
             image_color=image_color,
+            hero_srcset=hero_srcset,
             source_url=source_url,
             source_platform=source_platform,
             **additional_params,
@@ -319,6 +322,7 @@ def _prepare_hugo_frontmatter(
     image_alt: Optional[str] = None,
     image_credit: Optional[str] = None,
     image_color: Optional[str] = None,
+    hero_srcset: Optional[Dict[str, Any]] = None,
     source_url: Optional[str] = None,
     source_platform: Optional[str] = None,
     **additional_params: Any,
@@ -344,6 +348,7 @@ def _prepare_hugo_frontmatter(
         image_alt: Image alt text (optional)
         image_credit: Image credit/attribution (optional)
         image_color: Dominant color hex code (optional)
+        hero_srcset: Responsive hero variants for <picture> (optional)
         source_url: URL of original social media post (optional)
         source_platform: Platform name (mastodon, reddit, etc.) (optional)
         **additional_params: Additional custom parameters
@@ -358,7 +363,7 @@ def _prepare_hugo_frontmatter(
         date = datetime.now(timezone.utc)
 
     # Build custom params dict with all custom fields
-    custom_params = {
+    custom_params: Dict[str, Any] = {
         "source": source,
         "original_url": original_url,
         "generated_at": generated_at,
@@ -387,6 +392,9 @@ def _prepare_hugo_frontmatter(
     if image_color:
         custom_params["image_color"] = image_color
 
+    if hero_srcset:
+        custom_params["hero_srcset"] = hero_srcset
+
     # Add any additional custom parameters
     custom_params.update(additional_params)
 
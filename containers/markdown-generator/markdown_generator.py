@@ -7,9 +7,10 @@ data using Jinja2 templates.
 
 import logging
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Union
+from weakref import WeakKeyDictionary
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
 from jinja2.exceptions import TemplateNotFound
 from markdown_generation import prepare_frontmatter
 from models import ArticleMetadata
@@ -18,19 +19,37 @@ logger = logging.getLogger(__name__)
 
 __all__ = [
     "create_jinja_environment",
+    "get_compiled_template",
+    "precompile_templates",
     "generate_markdown_content",
     "generate_markdown_blob_name",
 ]
 
 
-def create_jinja_environment(template_dir: Optional[Path] = None) -> Environment:
+# Compiled templates per environment (see get_compiled_template)
+_compiled_templates: "WeakKeyDictionary[Environment, Dict[str, Template]]" = (
+    WeakKeyDictionary()
+)
+
+
+def create_jinja_environment(
+    template_dir: Optional[Path] = None,
+    bytecode_cache_dir: Optional[Union[str, Path]] = None,
+) -> Environment:
     """
     Create configured Jinja2 environment.
 
     Mostly pure function (filesystem access for template loading).
 
+    Templates ship inside the container image and never change at runtime,
+    so auto-reload is disabled. With a bytecode cache directory, compiled
+    templates are stored on disk and reused by later cold starts instead
+    of being re-parsed; the Dockerfile pre-populates this directory.
+
     Args:
         template_dir: Template directory path (uses default if None)
+        bytecode_cache_dir: Directory for compiled template bytecode
+            (no bytecode cache if None or not writable)
 
     Returns:
         Configured Jinja2 Environment
@@ -43,15 +62,75 @@ def create_jinja_environment(template_dir: Optional[Path] = None) -> Environment
     if template_dir is None:
         template_dir = Path(__file__).parent / "templates"
 
+    bytecode_cache = None
+    if bytecode_cache_dir:
+        try:
+            Path(bytecode_cache_dir).mkdir(parents=True, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(str(bytecode_cache_dir))
+        except OSError as e:
+            logger.warning(
+                f"Template bytecode cache disabled ({bytecode_cache_dir}): {e}"
+            )
+
     env = Environment(
         loader=FileSystemLoader(str(template_dir)),
         trim_blocks=True,
         lstrip_blocks=True,
+        auto_reload=False,
+        bytecode_cache=bytecode_cache,
+    )
+    logger.info(
+        f"Initialized Jinja2 templates from: {template_dir} "
+        f"(bytecode cache: {bytecode_cache_dir if bytecode_cache else 'disabled'})"
     )
-    logger.info(f"Initialized Jinja2 templates from: {template_dir}")
     return env
 
 
+def get_compiled_template(jinja_env: Environment, template_name: str) -> Template:
+    """
+    Get a compiled template, compiling it at most once per environment.
+
+    Unlike Environment.get_template, this never re-checks the loader or
+    evicts entries, so per-article rendering is a dictionary lookup.
+
+    Args:
+        jinja_env: Configured Jinja2 environment
+        template_name: Name of template file
+
+    Returns:
+        Compiled Template
+
+    Raises:
+        TemplateNotFound: If the template does not exist
+    """
+    templates = _compiled_templates.setdefault(jinja_env, {})
+    template = templates.get(template_name)
+    if template is None:
+        template = jinja_env.get_template(template_name)
+        templates[template_name] = template
+    return template
+
+
+def precompile_templates(jinja_env: Environment) -> List[str]:
+    """
+    Compile every markdown template up front.
+
+    Called at startup so the first article does not pay the compile cost,
+    and at image build time to populate the bytecode cache.
+
+    Args:
+        jinja_env: Configured Jinja2 environment
+
+    Returns:
+        Names of the compiled templates
+    """
+    names = sorted(jinja_env.list_templates(filter_func=lambda x: x.endswith(".j2")))
+    for name in names:
+        get_compiled_template(jinja_env, name)
+    logger.info(f"Precompiled {len(names)} templates")
+    return names
+
+
 def generate_markdown_content(
     article_data: Dict[str, Any],
     metadata: ArticleMetadata,
@@ -80,7 +159,7 @@ def generate_markdown_content(
         >>> pass
     """
     try:
-        template = jinja_env.get_template(template_name)
+        template = get_compiled_template(jinja_env, template_name)
     except TemplateNotFound:
         logger.error(f"Template not found: {template_name}")
         raise ValueError(f"Template not found: {template_name}")
@@ -112,6 +191,7 @@ def generate_markdown_content(
         image_alt=metadata.image_alt,
         image_credit=metadata.image_credit,
         image_color=metadata.image_color,
+        hero_srcset=metadata.hero_srcset,
         # Add source attribution fields
         source_url=source_url,  # The actual social media post URL from source_metadata
         source_platform=metadata.source,  # mastodon, reddit, rss, etc.
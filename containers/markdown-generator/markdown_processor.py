@@ -16,11 +16,17 @@ import logging
 from datetime import UTC, datetime
 from typing import Any, Dict, Optional
 
-from azure.core.exceptions import ResourceNotFoundError
+from azure.core.exceptions import ResourceModifiedError, ResourceNotFoundError
 from azure.identity.aio import DefaultAzureCredential
 from azure.keyvault.secrets.aio import SecretClient
 from azure.storage.blob.aio import BlobServiceClient
-from blob_operations import read_json_from_blob, write_markdown_to_blob
+from blob_operations import (
+    get_markdown_blob_state,
+    read_blob_bytes,
+    read_json_from_blob,
+    set_content_hash_metadata,
+    write_markdown_to_blob,
+)
 from jinja2 import Environment
 from markdown_generator import (
     create_jinja_environment,
@@ -31,7 +37,14 @@ from markdown_generator import (
 # Import from specialized modules
 from metadata_utils import extract_metadata_from_article
 from models import MarkdownGenerationResult, ProcessingStatus
+from render_pool import RenderLimits, blob_io_slot, unsplash_slot
+from services.image_cache import get_image_cache
 from services.image_service import fetch_image_for_article
+from services.responsive_images import (
+    get_image_executor,
+    process_hero_image,
+    source_image_url,
+)
 
 from config import Settings  # type: ignore[import]
 
@@ -50,6 +63,8 @@ __all__ = [
     # Local functions
     "load_unsplash_key",
     "fetch_article_image",
+    "attach_responsive_variants",
+    "write_markdown_if_changed",
     # Main orchestration
     "process_article",
 ]
@@ -112,16 +127,24 @@ async def load_unsplash_key(
 
 
 async def fetch_article_image(
-    article_data: Dict[str, Any], unsplash_access_key: str
+    article_data: Dict[str, Any],
+    unsplash_access_key: str,
+    article_key: Optional[str] = None,
+    limits: Optional[RenderLimits] = None,
 ) -> Optional[Dict[str, Any]]:
     """
     Fetch stock image for article from Unsplash.
 
-    Async I/O function - calls external Unsplash API.
+    Async I/O function - calls external Unsplash API unless the query is
+    already in the shared image cache.
 
     Args:
         article_data: Article data with title/tags
         unsplash_access_key: Unsplash API key
+        article_key: Stable article identifier (blob name) so re-renders
+            pick the same cached photo
+        limits: Shared limits; an Unsplash slot is held only for API calls,
+            not for cache hits
 
     Returns:
         Image metadata dict or None if not found
@@ -141,6 +164,9 @@ async def fetch_article_image(
             title=title,
             content=content,
             tags=tags,
+            cache=get_image_cache(),
+            article_key=article_key,
+            api_slot=unsplash_slot(limits),
         )
 
         if image_data:
@@ -155,6 +181,167 @@ async def fetch_article_image(
         return None
 
 
+async def attach_responsive_variants(
+    image_data: Dict[str, Any],
+    blob_service_client: BlobServiceClient,
+    settings: Settings,
+    limits: Optional[RenderLimits] = None,
+) -> Dict[str, Any]:
+    """
+    Attach locally hosted responsive variants to stock image data.
+
+    Async I/O function - downloads the photo once, encodes variants in the
+    image process pool and uploads them (reused if already processed).
+
+    Args:
+        image_data: Parsed Unsplash photo
+        blob_service_client: Azure Blob Service client
+        settings: Application settings
+        limits: Shared blob I/O concurrency limits
+
+    Returns:
+        image_data with a ``responsive`` key added, or unchanged (hotlinked)
+        if the variants could not be produced
+    """
+    widths = settings.image_variant_widths
+    source_url = source_image_url(image_data, max(widths))
+    if not source_url:
+        return image_data
+
+    try:
+        responsive = await process_hero_image(
+            source_url,
+            blob_service_client,
+            settings.image_output_container,
+            widths=widths,
+            executor=get_image_executor(settings.image_workers),
+            limits=limits,
+        )
+    except Exception as e:
+        logger.warning(f"Responsive image pipeline failed, hotlinking: {e}")
+        return image_data
+
+    if not responsive:
+        return image_data
+    return {**image_data, "responsive": responsive}
+
+
+async def write_markdown_if_changed(
+    blob_service_client: BlobServiceClient,
+    container_name: str,
+    markdown_blob_name: str,
+    markdown_content: str,
+    content_hash: str,
+    overwrite: bool = False,
+    limits: Optional[RenderLimits] = None,
+) -> bool:
+    """
+    Write markdown unless an identical copy is already stored.
+
+    The existing blob's content hash is read from its metadata with a single
+    properties call, so unchanged articles cost one HEAD and no download.
+    Writes are conditional: new blobs use If-None-Match: * and updates use
+    the ETag from that HEAD, so a concurrent writer (e.g. a duplicate queue
+    message on another replica) is detected instead of silently clobbered.
+    Blobs written before hashes were stored are hashed once and backfilled.
+
+    Args:
+        blob_service_client: Azure Blob Service client
+        container_name: Output container
+        markdown_blob_name: Markdown blob name
+        markdown_content: Rendered markdown
+        content_hash: SHA-256 hex digest of markdown_content
+        overwrite: Rewrite even when the content is unchanged
+        limits: Shared blob I/O concurrency limits (None = unlimited)
+
+    Returns:
+        True if the blob was written, False if skipped as a duplicate
+    """
+
+    async def state() -> Optional[Dict[str, Optional[str]]]:
+        async with blob_io_slot(limits):
+            return await get_markdown_blob_state(
+                blob_service_client, container_name, markdown_blob_name
+            )
+
+    async def write(allow_overwrite: bool, etag: Optional[str] = None) -> None:
+        async with blob_io_slot(limits):
+            await write_markdown_to_blob(
+                blob_service_client,
+                container_name,
+                markdown_blob_name,
+                markdown_content,
+                overwrite=allow_overwrite,
+                content_hash=content_hash,
+                etag=etag,
+            )
+
+    try:
+        existing = await state()
+    except Exception as e:
+        # If we can't check, assume it's new
+        logger.debug(f"Could not check existing blob: {e}, assuming new")
+        await write(allow_overwrite=True)
+        return True
+
+    if existing is None:
+        try:
+            await write(allow_overwrite=False)
+            logger.info(f"Successfully created markdown: {markdown_blob_name}")
+            return True
+        except ValueError:
+            # Created concurrently by another writer - compare against that
+            existing = await state()
+            if existing is None:
+                await write(allow_overwrite=True)
+                return True
+
+    stored_hash = existing["content_hash"]
+    if stored_hash is None:
+        # Legacy blob without hash metadata: hash it once, then backfill
+        async with blob_io_slot(limits):
+            existing_content = await read_blob_bytes(
+                blob_service_client, container_name, markdown_blob_name
+            )
+        stored_hash = hashlib.sha256(existing_content).hexdigest()
+        if stored_hash == content_hash and not overwrite:
+            try:
+                async with blob_io_slot(limits):
+                    await set_content_hash_metadata(
+                        blob_service_client,
+                        container_name,
+                        markdown_blob_name,
+                        content_hash,
+                        etag=existing["etag"],
+                    )
+            except Exception as e:
+                logger.debug(f"Could not backfill hash on {markdown_blob_name}: {e}")
+
+    if stored_hash == content_hash and not overwrite:
+        logger.info(
+            f"Markdown file already exists with same content: {markdown_blob_name}. "
+            "Skipping (duplicate detection)"
+        )
+        return False
+
+    try:
+        await write(allow_overwrite=True, etag=existing["etag"])
+    except ResourceModifiedError:
+        # Changed since our HEAD; skip if it now holds our content
+        latest = await state()
+        if latest and latest["content_hash"] == content_hash and not overwrite:
+            logger.info(
+                f"Markdown written concurrently, skipping: {markdown_blob_name}"
+            )
+            return False
+        await write(allow_overwrite=True)
+
+    logger.info(
+        f"Updated existing markdown file: {markdown_blob_name} (overwrite={overwrite})"
+    )
+    return True
+
+
 # =============================================================================
 # ORCHESTRATION FUNCTIONS (Compose pure + I/O functions)
 # =============================================================================
@@ -168,6 +355,7 @@ async def process_article(
     template_name: str = "default.md.j2",
     jinja_env: Optional[Environment] = None,
     unsplash_access_key: Optional[str] = None,
+    limits: Optional[RenderLimits] = None,
 ) -> MarkdownGenerationResult:
     """
     Process single article from JSON to markdown.
@@ -185,6 +373,7 @@ async def process_article(
         template_name: Jinja2 template to use
         jinja_env: Jinja2 environment (created if None)
         unsplash_access_key: Unsplash API key (loaded if None and enabled)
+        limits: Shared blob I/O / Unsplash concurrency limits (None = unlimited)
 
     Returns:
         MarkdownGenerationResult: Processing result with status, timing, and file_created flag
@@ -201,14 +390,23 @@ async def process_article(
             jinja_env = create_jinja_environment()
 
         # Read JSON from input container (I/O)
-        article_data = await read_json_from_blob(
-            blob_service_client, settings.input_container, blob_name
-        )
+        async with blob_io_slot(limits):
+            article_data = await read_json_from_blob(
+                blob_service_client, settings.input_container, blob_name
+            )
 
         # Fetch stock image if enabled (async I/O)
         image_data = None
         if settings.enable_stock_images and unsplash_access_key:
-            image_data = await fetch_article_image(article_data, unsplash_access_key)
+            image_data = await fetch_article_image(
+                article_data, unsplash_access_key, article_key=blob_name, limits=limits
+            )
+
+        # Host resized variants of the hero image (async I/O + process pool)
+        if image_data and settings.enable_responsive_images:
+            image_data = await attach_responsive_variants(
+                image_data, blob_service_client, settings, limits
+            )
 
         # Extract metadata (pure function)
         metadata = extract_metadata_from_article(article_data, image_data)
@@ -224,56 +422,16 @@ async def process_article(
         # Calculate hash of generated markdown (for duplicate detection)
         new_content_hash = hashlib.sha256(markdown_content.encode()).hexdigest()
 
-        # Check if file exists with same content (duplicate detection)
-        files_created = True
-        existing_hash = None
-
-        try:
-            container_client = blob_service_client.get_container_client(
-                settings.output_container
-            )
-            blob_client = container_client.get_blob_client(markdown_blob_name)
-
-            if await blob_client.exists():
-                # File exists - check if content is same
-                downloader = await blob_client.download_blob()
-                existing_content = await downloader.readall()
-                existing_hash = hashlib.sha256(existing_content).hexdigest()
-
-                if existing_hash == new_content_hash and not overwrite:
-                    # File exists with identical content - skip (duplicate)
-                    logger.info(
-                        f"Markdown file already exists with same content: {markdown_blob_name}. "
-                        "Skipping (duplicate detection)"
-                    )
-                    files_created = False
-                else:
-                    # File exists but content is different (or overwrite=True)
-                    logger.info(
-                        f"Updating existing markdown file: {markdown_blob_name} "
-                        f"(overwrite={overwrite})"
-                    )
-                    files_created = True
-        except Exception as e:
-            # If we can't check, assume it's new
-            logger.debug(f"Could not check existing blob: {e}, assuming new")
-            files_created = True
-
-        # Write markdown to output container (I/O)
-        # Only write if file doesn't exist or overwrite is True
-        if files_created or overwrite:
-            await write_markdown_to_blob(
-                blob_service_client,
-                settings.output_container,
-                markdown_blob_name,
-                markdown_content,
-                overwrite=True,  # Force overwrite since we checked above
-            )
-            logger.info(
-                f"Successfully {'created' if files_created else 'updated'} markdown: {markdown_blob_name}"
-            )
-        else:
-            logger.info(f"Skipped writing markdown (duplicate): {markdown_blob_name}")
+        # Write only if content changed (hash compared via blob metadata)
+        files_created = await write_markdown_if_changed(
+            blob_service_client,
+            settings.output_container,
+            markdown_blob_name,
+            markdown_content,
+            new_content_hash,
+            overwrite=overwrite,
+            limits=limits,
+        )
 
         processing_time = (datetime.now(UTC) - start_time).total_seconds() * 1000
 
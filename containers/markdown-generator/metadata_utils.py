@@ -52,7 +52,7 @@ def parse_date_string(date_value: Any) -> Optional[datetime]:
 
 def extract_image_fields_from_unsplash(
     image_data: Dict[str, Any], article_title: str
-) -> Dict[str, str]:
+) -> Dict[str, Any]:
     """
     Extract and format image metadata from Unsplash response.
 
@@ -63,7 +63,10 @@ def extract_image_fields_from_unsplash(
         article_title: Article title for alt text fallback
 
     Returns:
-        Dict with formatted image fields (hero_image, thumbnail, etc.)
+        Dict with formatted image fields (hero_image, thumbnail, etc.).
+        When locally generated variants are attached under ``responsive``,
+        hero_image/thumbnail point at them and hero_srcset carries the
+        srcset data.
 
     Examples:
         >>> image_data = {
@@ -88,12 +91,25 @@ def extract_image_fields_from_unsplash(
     photographer_url = image_data.get("photographer_url", "")
     image_credit = f"Photo by [{photographer}]({photographer_url}) on Unsplash"
 
+    # Prefer locally hosted responsive variants over hotlinked URLs
+    responsive = image_data.get("responsive")
+    hero_srcset = None
+    if responsive:
+        hero_image = responsive["src"]
+        thumbnail = responsive["thumbnail"]
+        hero_srcset = {
+            "sources": responsive["sources"],
+            "width": responsive["width"],
+            "height": responsive["height"],
+        }
+
     return {
         "hero_image": hero_image or "",
         "thumbnail": thumbnail or "",
         "image_alt": image_alt or "",
         "image_credit": image_credit or "",
         "image_color": image_color or "",
+        "hero_srcset": hero_srcset,
     }
 
 
@@ -142,4 +158,5 @@ def extract_metadata_from_article(
         image_alt=image_fields.get("image_alt"),
         image_credit=image_fields.get("image_credit"),
         image_color=image_fields.get("image_color"),
+        hero_srcset=image_fields.get("hero_srcset"),
     )
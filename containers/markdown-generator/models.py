@@ -53,6 +53,9 @@ class ArticleMetadata(BaseModel):
         None, description="Photographer credit and link"
     )
     image_color: Optional[str] = Field(None, description="Dominant image color (hex)")
+    hero_srcset: Optional[Dict[str, Any]] = Field(
+        None, description="Responsive hero variants (sources, width, height)"
+    )
 
     @field_validator("tags", mode="before")
     @classmethod
@@ -179,3 +182,15 @@ class MetricsResponse(BaseModel):
     rate_limit_status: Optional[Dict[str, Any]] = Field(
         None, description="Unsplash API rate limit status (if stock images enabled)"
     )
+    image_cache_status: Optional[Dict[str, Any]] = Field(
+        None,
+        description="Unsplash query cache hit rate and API calls saved",
+    )
+    throughput: Optional[Dict[str, Any]] = Field(
+        None,
+        description="Render throughput (articles/minute) and concurrency limits",
+    )
+    processing_metrics: Optional[Dict[str, Any]] = Field(
+        None,
+        description="Latency percentiles (ms), throughput/minute and error rate",
+    )
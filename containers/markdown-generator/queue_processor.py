@@ -8,13 +8,15 @@ import asyncio
 import logging
 import os
 from datetime import datetime
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from azure.storage.blob.aio import BlobServiceClient
 from jinja2 import Environment
 from markdown_processor import process_article
-from models import ProcessingStatus
+from models import MarkdownGenerationResult, ProcessingStatus
+from render_pool import RenderPool
 
+from libs.processing_metrics import ProcessingMetrics
 from libs.queue_client import (
     get_queue_client,
     process_queue_messages,
@@ -29,6 +31,7 @@ async def create_message_handler(
     jinja_env: Environment,
     unsplash_key: Optional[str],
     app_state: Dict[str, Any],
+    render_pool: Optional[RenderPool] = None,
 ) -> Callable:
     """
     Create message handler for queue processing.
@@ -38,20 +41,75 @@ async def create_message_handler(
         settings: Application settings
         jinja_env: Jinja2 environment (reusable)
         unsplash_key: Optional Unsplash API key
-        app_state: Application state dictionary (includes file tracking)
+        app_state: Application state dictionary (includes file tracking and
+            the ``processing_metrics`` latency/throughput tracker)
+        render_pool: Worker pool bounding concurrent renders (default pool if None)
 
     Returns:
         Async message handler function that returns file creation count
     """
+    if render_pool is None:
+        render_pool = RenderPool()
+    metrics: ProcessingMetrics = app_state.setdefault(
+        "processing_metrics", ProcessingMetrics()
+    )
+
+    async def render(blob_name: str) -> MarkdownGenerationResult:
+        logger.info(f"Processing markdown generation for {blob_name}")
+        return await process_article(
+            blob_service_client=blob_service_client,
+            settings=settings,
+            blob_name=blob_name,
+            overwrite=False,
+            template_name="default.md.j2",
+            jinja_env=jinja_env,
+            unsplash_access_key=unsplash_key,
+            limits=render_pool.limits,
+        )
+
+    async def retry_failed_files(queue_message, failed_files: List[str]) -> None:
+        """Re-queue only the failed files of a batch, delayed, up to the retry cap."""
+        payload = queue_message.payload
+        attempt = int(payload.get("attempt", 1))
+        if attempt >= settings.max_dequeue_count:
+            logger.error(
+                f"Giving up on {len(failed_files)} file(s) after {attempt} attempts: "
+                f"{failed_files}"
+            )
+            return
+
+        retry_message = {
+            "service_name": queue_message.service_name,
+            "operation": queue_message.operation,
+            "correlation_id": queue_message.correlation_id,
+            "payload": {**payload, "files": failed_files, "attempt": attempt + 1},
+        }
+        async with get_queue_client(settings.queue_name) as client:
+            await client.send_message(
+                retry_message,
+                visibility_timeout=settings.failed_file_retry_delay_seconds,
+            )
+        logger.warning(
+            f"Re-queued {len(failed_files)} failed file(s) from message "
+            f"{queue_message.message_id} (attempt {attempt + 1})"
+        )
 
     async def message_handler(queue_message, message) -> Dict[str, Any]:
         """
-        Process a single markdown generation request from the queue.
+        Process a markdown generation request from the queue.
+
+        Messages carry a ``files`` list; every file in it is rendered (the
+        processor batches several articles into one trigger message) through
+        the render pool, so files are rendered concurrently. Files that fail
+        are re-queued as a new message (up to ``max_dequeue_count``
+        attempts); if that fails the handler raises so the whole message is
+        redelivered.
 
         Returns information about whether NEW FILES were created (not just messages processed).
         """
+        failed_files: List[str] = []
         try:
-            # Extract the processed file path from the queue_message (QueueMessageModel)
+            # Extract the processed file paths from the queue_message (QueueMessageModel)
             payload = queue_message.payload
             files = payload.get("files", [])
 
@@ -60,62 +118,80 @@ async def create_message_handler(
                     f"No files in message {queue_message.message_id}, payload: {payload}"
                 )
                 app_state["total_failed"] += 1
+                metrics.record(success=False)
                 return {
                     "status": "error",
                     "error": "No files in message",
                     "files_created": 0,
                 }
 
-            # Process the first file (we expect one file per message)
-            blob_name = files[0]
-            logger.info(f"Processing markdown generation for {blob_name}")
-
-            # Call functional API directly
-            result = await process_article(
-                blob_service_client=blob_service_client,
-                settings=settings,
-                blob_name=blob_name,
-                overwrite=False,
-                template_name="default.md.j2",
-                jinja_env=jinja_env,
-                unsplash_access_key=unsplash_key,
-            )
-
-            if result.status == ProcessingStatus.COMPLETED:
-                # Track: did we CREATE a new file, or was it a duplicate?
-                files_created_count = 1 if result.files_created else 0
-
-                logger.info(
-                    f"Successfully processed markdown: {result.markdown_blob_name} "
-                    f"(new_file={result.files_created})"
-                )
-                app_state["total_processed"] += 1
-                app_state["total_files_generated"] = (
-                    app_state.get("total_files_generated", 0) + files_created_count
-                )
-
-                if result.processing_time_ms:
-                    app_state["processing_times"].append(result.processing_time_ms)
-
-                return {
-                    "status": "success",
-                    "files_created": files_created_count,
-                    "result": result.model_dump(),
-                }
+            files_created_count = 0
+            results = []
+            errors = []
+
+            rendered = await render_pool.run(files, render)
+
+            for blob_name, result in zip(files, rendered):
+                if isinstance(result, BaseException):
+                    app_state["total_failed"] += 1
+                    metrics.record(success=False)
+                    errors.append(f"{blob_name}: {result}")
+                    failed_files.append(blob_name)
+                elif result.status == ProcessingStatus.COMPLETED:
+                    # Track: did we CREATE a new file, or was it a duplicate?
+                    created = 1 if result.files_created else 0
+                    files_created_count += created
+
+                    logger.info(
+                        f"Successfully processed markdown: {result.markdown_blob_name} "
+                        f"(new_file={result.files_created})"
+                    )
+                    app_state["total_processed"] += 1
+                    app_state["total_files_generated"] = (
+                        app_state.get("total_files_generated", 0) + created
+                    )
+
+                    metrics.record(result.processing_time_ms, success=True)
+
+                    results.append(result.model_dump())
+                else:
+                    logger.warning(
+                        f"Markdown generation failed for {blob_name}: "
+                        f"{result.error_message}"
+                    )
+                    app_state["total_failed"] += 1
+                    metrics.record(result.processing_time_ms, success=False)
+                    errors.append(f"{blob_name}: {result.error_message}")
+                    failed_files.append(blob_name)
+
+            if errors and not results:
+                status = "error"
+            elif errors:
+                status = "partial"
             else:
-                logger.warning(f"Markdown generation failed: {result.error_message}")
-                app_state["total_failed"] += 1
-                return {
-                    "status": "error",
-                    "error": result.error_message,
-                    "files_created": 0,
-                }
+                status = "success"
+
+            response: Dict[str, Any] = {
+                "status": status,
+                "files_created": files_created_count,
+                "files_processed": len(results),
+                "results": results,
+            }
+            if errors:
+                response["error"] = "; ".join(errors)
+                response["failed_files"] = failed_files
 
         except Exception as e:
             logger.error(f"Error processing message: {e}", exc_info=True)
             app_state["total_failed"] += 1
+            metrics.record(success=False)
             return {"status": "error", "error": str(e), "files_created": 0}
 
+        if failed_files:
+            # Raises if re-queueing fails, leaving this message to be retried
+            await retry_failed_files(queue_message, failed_files)
+        return response
+
     return message_handler
 
 
@@ -128,21 +204,24 @@ async def signal_site_publisher(total_processed: int, output_container: str) ->
         output_container: Container name where markdown files are stored
     """
     try:
-        # Create publish request message in correct format for site-publisher
+        # Create publish request message in correct format for site-publisher.
+        # site-publisher reads operation and content_summary from the payload
+        # (top-level extras are dropped by QueueMessageModel on send)
         batch_id = f"collection-{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}"
         publish_message = {
             "service_name": "markdown-generator",
             "operation": "markdown_generated",
             "payload": {
+                "operation": "markdown_generated",
                 "batch_id": batch_id,
                 "markdown_container": output_container,
                 "trigger": "queue_empty",
                 "timestamp": datetime.utcnow().isoformat(),
-            },
-            "content_summary": {
-                "files_created": total_processed,
-                "files_failed": 0,
-                "force_rebuild": False,
+                "content_summary": {
+                    "files_created": total_processed,
+                    "files_failed": 0,
+                    "force_rebuild": False,
+                },
             },
         }
 
@@ -169,6 +248,9 @@ async def startup_queue_processor(
     max_batch_size: int,
     output_container: str,
     app_state: Dict[str, Any],
+    max_concurrency: int = 1,
+    visibility_timeout: Optional[int] = None,
+    max_dequeue_count: Optional[int] = None,
 ) -> None:
     """
     Process queue messages continuously with graceful self-termination.
@@ -189,6 +271,11 @@ async def startup_queue_processor(
         max_batch_size: Maximum messages to process per batch
         output_container: Container name for markdown output
         app_state: Application state dict (includes total_files_generated counter)
+        max_concurrency: Maximum messages handled concurrently per batch
+        visibility_timeout: Seconds a received message stays hidden; must
+            cover rendering a whole batched message
+        max_dequeue_count: Deliveries before a failing message is moved to
+            the poison queue
     """
     from datetime import datetime, timezone
 
@@ -214,7 +301,7 @@ async def startup_queue_processor(
                     f"This commonly happens when: "
                     f"1) Previous container crashed during processing, 2) Visibility timeout too long, "
                     f"3) Messages failed to complete/delete. "
-                    f"Waiting for visibility timeout to expire (~60s)..."
+                    "Waiting for visibility timeout to expire..."
                 )
     except Exception as diag_err:
         logger.warning(f"Could not get queue diagnostics on startup: {diag_err}")
@@ -238,6 +325,9 @@ async def startup_queue_processor(
             queue_name=queue_name,
             message_handler=message_handler,
             max_messages=max_batch_size,
+            max_concurrency=max_concurrency,
+            visibility_timeout=visibility_timeout,
+            max_dequeue_count=max_dequeue_count,
         )
 
         current_time = datetime.now(timezone.utc)
@@ -0,0 +1,202 @@
+"""
+Bounded-concurrency article rendering.
+
+Renders many articles at once with a fixed number of workers, while separate
+semaphores cap concurrent blob I/O and concurrent Unsplash calls across every
+render in the process. Completions are recorded in a sliding window so the
+status endpoint can report throughput.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    AsyncContextManager,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "RenderLimits",
+    "RenderPool",
+    "blob_io_slot",
+    "unsplash_slot",
+]
+
+T = TypeVar("T")
+
+DEFAULT_RENDER_WORKERS = 8
+DEFAULT_BLOB_IO_LIMIT = 16
+DEFAULT_UNSPLASH_LIMIT = 2
+DEFAULT_THROUGHPUT_WINDOW_SECONDS = 300.0
+
+
+@dataclass
+class RenderLimits:
+    """Process-wide limits on concurrent blob I/O and Unsplash calls."""
+
+    blob_io_limit: int = DEFAULT_BLOB_IO_LIMIT
+    unsplash_limit: int = DEFAULT_UNSPLASH_LIMIT
+    blob_io: asyncio.Semaphore = field(init=False)
+    unsplash: asyncio.Semaphore = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.blob_io_limit = max(1, self.blob_io_limit)
+        self.unsplash_limit = max(1, self.unsplash_limit)
+        self.blob_io = asyncio.Semaphore(self.blob_io_limit)
+        self.unsplash = asyncio.Semaphore(self.unsplash_limit)
+
+
+def blob_io_slot(limits: Optional[RenderLimits]) -> AsyncContextManager[Any]:
+    """
+    Return a context manager holding one blob I/O slot.
+
+    Args:
+        limits: Shared render limits (None means unlimited)
+
+    Returns:
+        Semaphore or no-op async context manager
+    """
+    return limits.blob_io if limits is not None else nullcontext()
+
+
+def unsplash_slot(limits: Optional[RenderLimits]) -> AsyncContextManager[Any]:
+    """
+    Return a context manager holding one Unsplash call slot.
+
+    Args:
+        limits: Shared render limits (None means unlimited)
+
+    Returns:
+        Semaphore or no-op async context manager
+    """
+    return limits.unsplash if limits is not None else nullcontext()
+
+
+class RenderPool:
+    """
+    Worker pool for rendering batches of articles concurrently.
+
+    Each ``run`` call starts at most ``max_workers`` workers pulling from a
+    shared queue; blob and Unsplash access inside a render is further bounded
+    by ``limits``, which is shared across all concurrent ``run`` calls.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_RENDER_WORKERS,
+        blob_io_limit: int = DEFAULT_BLOB_IO_LIMIT,
+        unsplash_limit: int = DEFAULT_UNSPLASH_LIMIT,
+        window_seconds: float = DEFAULT_THROUGHPUT_WINDOW_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            max_workers: Maximum articles rendered concurrently per batch
+            blob_io_limit: Maximum concurrent blob operations
+            unsplash_limit: Maximum concurrent Unsplash API calls
+            window_seconds: Sliding window for throughput reporting
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.max_workers = max(1, max_workers)
+        self.limits = RenderLimits(
+            blob_io_limit=blob_io_limit, unsplash_limit=unsplash_limit
+        )
+        self.window_seconds = window_seconds
+        self._clock = clock
+        self._started_at = clock()
+        self._completions: Deque[float] = deque()
+        self.in_flight = 0
+        self.total_rendered = 0
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> "RenderPool":
+        """Create a pool using the concurrency limits from Settings."""
+        return cls(
+            max_workers=settings.render_concurrency,
+            blob_io_limit=settings.blob_io_concurrency,
+            unsplash_limit=settings.unsplash_concurrency,
+        )
+
+    def _record_completion(self) -> None:
+        now = self._clock()
+        self.total_rendered += 1
+        self._completions.append(now)
+        self._trim(now)
+
+    def _trim(self, now: float) -> None:
+        cutoff = now - self.window_seconds
+        while self._completions and self._completions[0] <= cutoff:
+            self._completions.popleft()
+
+    async def run(
+        self,
+        items: Sequence[str],
+        render: Callable[[str], Awaitable[T]],
+    ) -> List[Union[T, BaseException]]:
+        """
+        Render all items with bounded parallelism.
+
+        Args:
+            items: Blob names to render
+            render: Async function rendering one blob name
+
+        Returns:
+            Results in input order; a render that raised is returned as its
+            exception (like ``asyncio.gather(..., return_exceptions=True)``)
+        """
+        results: List[Union[T, BaseException]] = [None] * len(items)  # type: ignore[list-item]
+        queue: "asyncio.Queue[int]" = asyncio.Queue()
+        for index in range(len(items)):
+            queue.put_nowait(index)
+
+        async def worker() -> None:
+            while True:
+                try:
+                    index = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                self.in_flight += 1
+                try:
+                    results[index] = await render(items[index])
+                except Exception as e:
+                    logger.error(f"Render failed for {items[index]}: {e}")
+                    results[index] = e
+                finally:
+                    self.in_flight -= 1
+                    self._record_completion()
+
+        workers = min(self.max_workers, len(items))
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        return results
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return throughput and concurrency stats for the status endpoint."""
+        now = self._clock()
+        self._trim(now)
+        window = min(self.window_seconds, max(now - self._started_at, 1e-9))
+        return {
+            "articles_per_minute": round(len(self._completions) * 60 / window, 2),
+            "window_seconds": self.window_seconds,
+            "rendered_in_window": len(self._completions),
+            "total_rendered": self.total_rendered,
+            "in_flight": self.in_flight,
+            "max_workers": self.max_workers,
+            "blob_io_limit": self.limits.blob_io_limit,
+            "unsplash_limit": self.limits.unsplash_limit,
+        }
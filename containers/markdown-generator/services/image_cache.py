@@ -0,0 +1,303 @@
+"""
+Persistent Unsplash query → photo cache.
+
+Unsplash's free tier allows 50 requests/hour, so a burst of articles either
+waits for hours or goes without images. Search results are cached per
+normalized keyword query in two tiers:
+
+- In-memory LRU for instant hits within a replica
+- JSON blobs with a TTL so results survive scale-to-zero and are shared
+  across replicas
+
+Each cache entry holds several photos from a single search request. An
+article's photo is chosen by a stable hash of its key (blob name), so
+articles with the same tags get different images while re-rendering an
+article keeps its photo (and its markdown hash and image variants).
+"""
+
+import hashlib
+import json
+import logging
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from azure.core.exceptions import ResourceNotFoundError
+from azure.storage.blob.aio import BlobServiceClient
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "UnsplashImageCache",
+    "normalize_query",
+    "pick_photo",
+    "configure_image_cache",
+    "get_image_cache",
+]
+
+DEFAULT_CACHE_PREFIX = "unsplash/"
+DEFAULT_TTL_SECONDS = 14 * 24 * 60 * 60
+DEFAULT_NEGATIVE_TTL_SECONDS = 24 * 60 * 60
+DEFAULT_MAX_ENTRIES = 512
+
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+
+def pick_photo(
+    photos: List[Dict[str, Any]], article_key: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Choose an article's photo from a search result.
+
+    Pure function - the same article always gets the same photo, in every
+    replica and process.
+
+    Args:
+        photos: Parsed photos from one search
+        article_key: Stable article identifier (e.g. its blob name)
+
+    Returns:
+        Photo for the article, or None if there are no photos
+    """
+    if not photos:
+        return None
+    digest = hashlib.sha256(article_key.encode()).digest()
+    return photos[int.from_bytes(digest[:8], "big") % len(photos)]
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalize a search query into a cache key.
+
+    Pure function - lowercases, strips punctuation, de-duplicates and sorts
+    words so equivalent tag sets share an entry.
+
+    Args:
+        query: Raw search query
+
+    Returns:
+        Normalized cache key ("" if the query has no words)
+
+    Examples:
+        >>> normalize_query("Machine-Learning  AI")
+        'ai learning machine'
+        >>> normalize_query("AI machine learning")
+        'ai learning machine'
+    """
+    words = {word for word in _NON_WORD.split(query.lower()) if word}
+    return " ".join(sorted(words))
+
+
+class UnsplashImageCache:
+    """
+    Two-tier (memory LRU + blob) cache of parsed Unsplash search results.
+
+    Entries store a list of parsed photos plus when they were fetched. An
+    empty list is a cached "no results" answer and uses a shorter TTL.
+    """
+
+    def __init__(
+        self,
+        blob_service_client: Optional[BlobServiceClient] = None,
+        container: Optional[str] = None,
+        prefix: str = DEFAULT_CACHE_PREFIX,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        negative_ttl_seconds: float = DEFAULT_NEGATIVE_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            blob_service_client: Azure Blob Service client (None = memory only)
+            container: Container for cache blobs (None = memory only)
+            prefix: Blob name prefix for cache entries
+            ttl_seconds: Lifetime of entries with photos
+            negative_ttl_seconds: Lifetime of "no results" entries
+            max_entries: Maximum entries kept in memory
+            clock: Wall-clock time source (entries are shared across replicas)
+        """
+        self.blob_service_client = blob_service_client
+        self.container = container
+        self.prefix = prefix
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self._clock = clock
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.memory_hits = 0
+        self.blob_hits = 0
+        self.misses = 0
+
+    @property
+    def persistent(self) -> bool:
+        """Whether entries are also stored in blob storage."""
+        return self.blob_service_client is not None and bool(self.container)
+
+    def _blob_name(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode()).hexdigest()[:32]
+        return f"{self.prefix}{digest}.json"
+
+    def _is_fresh(self, entry: Dict[str, Any]) -> bool:
+        ttl = self.ttl_seconds if entry.get("photos") else self.negative_ttl_seconds
+        return self._clock() - entry.get("fetched_at", 0) < ttl
+
+    def _remember(self, key: str, entry: Dict[str, Any]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def _read_blob(self, key: str) -> Optional[Dict[str, Any]]:
+        if not self.persistent:
+            return None
+        try:
+            container_client = self.blob_service_client.get_container_client(  # type: ignore[union-attr]
+                self.container  # type: ignore[arg-type]
+            )
+            blob_client = container_client.get_blob_client(self._blob_name(key))
+            downloader = await blob_client.download_blob()
+            entry = json.loads(await downloader.readall())
+        except ResourceNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to read image cache entry for '{key}': {e}")
+            return None
+        if not isinstance(entry, dict) or entry.get("query") != key:
+            return None
+        return entry
+
+    async def _write_blob(self, key: str, entry: Dict[str, Any]) -> None:
+        if not self.persistent:
+            return
+        try:
+            container_client = self.blob_service_client.get_container_client(  # type: ignore[union-attr]
+                self.container  # type: ignore[arg-type]
+            )
+            blob_client = container_client.get_blob_client(self._blob_name(key))
+            await blob_client.upload_blob(
+                json.dumps(entry), overwrite=True, content_type="application/json"
+            )
+        except Exception as e:
+            logger.warning(f"Failed to write image cache entry for '{key}': {e}")
+
+    async def lookup(
+        self, query: str, article_key: str = ""
+    ) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        Look up a query, picking the article's photo on a hit.
+
+        Args:
+            query: Raw search query
+            article_key: Stable article identifier the photo is chosen by
+
+        Returns:
+            (hit, photo) - hit is False on a miss; on a hit, photo may be
+            None for a cached "no results" answer
+        """
+        key = normalize_query(query)
+        if not key:
+            return False, None
+
+        entry = self._entries.get(key)
+        if entry is not None and self._is_fresh(entry):
+            self._entries.move_to_end(key)
+            self.memory_hits += 1
+            return True, pick_photo(entry["photos"], article_key)
+
+        entry = await self._read_blob(key)
+        if entry is not None and self._is_fresh(entry):
+            self._remember(key, entry)
+            self.blob_hits += 1
+            return True, pick_photo(entry["photos"], article_key)
+
+        self._entries.pop(key, None)
+        self.misses += 1
+        return False, None
+
+    async def store(
+        self, query: str, photos: List[Dict[str, Any]], article_key: str = ""
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Cache search results and return the article's photo.
+
+        Args:
+            query: Raw search query
+            photos: Parsed photos from one search (empty = no results)
+            article_key: Stable article identifier the photo is chosen by
+
+        Returns:
+            Photo to use for the current article, or None if no photos
+        """
+        key = normalize_query(query)
+        entry = {"query": key, "fetched_at": self._clock(), "photos": photos}
+        if key:
+            self._remember(key, entry)
+            await self._write_blob(key, entry)
+        return pick_photo(photos, article_key)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hit-rate and quota-saving stats for the status endpoint."""
+        hits = self.memory_hits + self.blob_hits
+        lookups = hits + self.misses
+        return {
+            "lookups": lookups,
+            "memory_hits": self.memory_hits,
+            "blob_hits": self.blob_hits,
+            "misses": self.misses,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "api_calls_saved": hits,
+            "entries_in_memory": len(self._entries),
+            "persistent": self.persistent,
+        }
+
+
+# Singleton cache instance (shared across all requests)
+_image_cache: Optional[UnsplashImageCache] = None
+
+
+def configure_image_cache(
+    blob_service_client: Optional[BlobServiceClient],
+    container: Optional[str],
+    ttl_seconds: float = DEFAULT_TTL_SECONDS,
+) -> UnsplashImageCache:
+    """
+    Create the singleton image cache, backed by blob storage if configured.
+
+    Args:
+        blob_service_client: Azure Blob Service client
+        container: Container for cache blobs (None/empty = memory only)
+        ttl_seconds: Lifetime of cached search results
+
+    Returns:
+        Configured UnsplashImageCache
+    """
+    global _image_cache
+
+    _image_cache = UnsplashImageCache(
+        blob_service_client=blob_service_client,
+        container=container or None,
+        ttl_seconds=ttl_seconds,
+    )
+    logger.info(
+        f"Configured Unsplash image cache (persistent={_image_cache.persistent}, "
+        f"ttl={ttl_seconds}s)"
+    )
+    return _image_cache
+
+
+def get_image_cache() -> UnsplashImageCache:
+    """
+    Get the singleton image cache, creating a memory-only one if needed.
+
+    Returns:
+        UnsplashImageCache instance
+    """
+    global _image_cache
+
+    if _image_cache is None:
+        _image_cache = UnsplashImageCache()
+
+    return _image_cache
@@ -8,14 +8,17 @@ All functions are stateless and side-effect free (except for HTTP calls).
 import logging
 import re
 from collections import Counter
-from typing import Any, Dict, List, Optional
+from contextlib import nullcontext
+from typing import Any, AsyncContextManager, Dict, List, Optional
 
 import aiohttp
+from services.image_cache import UnsplashImageCache
 from services.unsplash_client import (
     UnsplashError,
     UnsplashRateLimitError,
     get_unsplash_limiter,
     search_unsplash_photo,
+    search_unsplash_photos,
 )
 
 from libs.http_client import close_http_session, get_http_session
@@ -427,12 +430,66 @@ async def search_unsplash_image(
         return None
 
 
+async def search_unsplash_images(
+    access_key: str,
+    query: str,
+    orientation: str = "landscape",
+    per_page: int = 10,
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Search Unsplash for several images with a single rate-limited request.
+
+    Args:
+        access_key: Unsplash API access key
+        query: Search query (article topic, keywords)
+        orientation: "landscape" (hero), "portrait", "squarish" (thumbnail)
+        per_page: Number of photos to fetch (shared by articles with this query)
+
+    Returns:
+        List of parsed image dicts (empty if no results), or None if the
+        search failed (rate limit, API or network error) and should not be
+        cached
+    """
+    clean_query = query.strip()[:100]
+
+    if not clean_query:
+        logger.warning("Empty search query provided")
+        return None
+
+    try:
+        photos = await search_unsplash_photos(
+            access_key=access_key,
+            query=clean_query,
+            orientation=orientation,
+            per_page=per_page,
+        )
+        return [parse_unsplash_photo(photo) for photo in photos]
+
+    except UnsplashRateLimitError:
+        logger.error(
+            f"Unsplash rate limit exceeded: {get_unsplash_limiter().get_stats()}. "
+            f"Skipping image for '{clean_query}' to preserve quota"
+        )
+        return None
+
+    except (UnsplashError, aiohttp.ClientError) as e:
+        logger.error(f"Error fetching images for '{clean_query}': {e}")
+        return None
+
+    except Exception as e:
+        logger.error(f"Unexpected error fetching images: {e}", exc_info=True)
+        return None
+
+
 async def fetch_image_for_article(
     access_key: str,
     title: str,
     content: str = "",
     tags: Optional[List[str]] = None,
     category: Optional[str] = None,
+    cache: Optional[UnsplashImageCache] = None,
+    article_key: Optional[str] = None,
+    api_slot: Optional[AsyncContextManager[Any]] = None,
 ) -> Optional[Dict[str, Any]]:
     """
     Fetch appropriate stock image for an article.
@@ -446,6 +503,11 @@ async def fetch_image_for_article(
         content: Article content preview
         tags: Article tags
         category: Article category
+        cache: Query → photo cache; hits skip the Unsplash API entirely
+        article_key: Stable article identifier choosing among cached photos
+            (defaults to the title)
+        api_slot: Held only around Unsplash API calls (e.g. a shared
+            semaphore), so cache hits never wait for it
 
     Returns:
         Image metadata dict or None if skipped/not found
@@ -473,12 +535,31 @@ async def fetch_image_for_article(
         logger.info(f"Skipping image search for article: {title[:50]}")
         return None
 
+    slot = api_slot if api_slot is not None else nullcontext()
+
+    if cache is not None:
+        article_key = article_key or title
+        hit, image = await cache.lookup(query, article_key)
+        if hit:
+            logger.info(f"Image cache hit for query: {query}")
+            return image
+
+        # One API call fetches several photos shared by articles with this query
+        async with slot:
+            images = await search_unsplash_images(
+                access_key=access_key, query=query, orientation="landscape"
+            )
+        if images is None:
+            return None
+        return await cache.store(query, images, article_key)
+
     # Search for landscape image (async HTTP call)
-    return await search_unsplash_image(
-        access_key=access_key,
-        query=query,
-        orientation="landscape",
-    )
+    async with slot:
+        return await search_unsplash_image(
+            access_key=access_key,
+            query=query,
+            orientation="landscape",
+        )
 
 
 async def download_image_from_url(image_url: str, output_path: str) -> bool:
@@ -0,0 +1,397 @@
+"""
+Responsive hero-image pipeline.
+
+Instead of hotlinking full-size Unsplash URLs, each chosen photo is
+downloaded once, resized into WebP/AVIF variants at a few widths with
+Pillow (in a process pool, since encoding is CPU-bound), and uploaded to
+the static website container with long-lived immutable cache headers.
+The resulting srcset data is carried in article frontmatter so the theme
+can emit a <picture> element.
+
+Variants live under ``images/<key>/`` where ``key`` is derived from the
+source URL, so a photo reused by several articles is processed only once.
+A small manifest.json alongside the variants records the srcset data.
+"""
+
+import asyncio
+import hashlib
+import io
+import json
+import logging
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from azure.core.exceptions import ResourceNotFoundError
+from azure.storage.blob import ContentSettings
+from azure.storage.blob.aio import BlobServiceClient
+from PIL import Image, features
+from render_pool import RenderLimits, blob_io_slot
+
+from libs.http_client import get_http_session
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "DEFAULT_WIDTHS",
+    "DEFAULT_FORMATS",
+    "IMMUTABLE_CACHE_CONTROL",
+    "image_key",
+    "source_image_url",
+    "supported_formats",
+    "generate_variants",
+    "build_srcset",
+    "download_image_bytes",
+    "process_hero_image",
+    "get_image_executor",
+    "shutdown_image_executor",
+]
+
+DEFAULT_WIDTHS = (480, 800, 1200)
+DEFAULT_FORMATS = ("avif", "webp")
+DEFAULT_QUALITY = 70
+DEFAULT_PATH_PREFIX = "images/"
+MAX_SOURCE_BYTES = 15 * 1024 * 1024
+
+# Variant URLs are content-addressed, so they never change once uploaded
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+_MIME_TYPES = {"avif": "image/avif", "webp": "image/webp"}
+
+# Singleton process pool for image encoding
+_image_executor: Optional[ProcessPoolExecutor] = None
+
+
+def image_key(source_url: str) -> str:
+    """
+    Derive a stable storage key for a source image URL.
+
+    Pure function.
+
+    Args:
+        source_url: Original image URL
+
+    Returns:
+        16-character hex key
+
+    Examples:
+        >>> len(image_key("https://images.unsplash.com/photo-1"))
+        16
+    """
+    return hashlib.sha256(source_url.encode()).hexdigest()[:16]
+
+
+def source_image_url(image_data: Dict[str, Any], max_width: int) -> Optional[str]:
+    """
+    Choose the URL to download the source image from.
+
+    Pure function. Unsplash raw URLs accept imgix parameters, so the source
+    is requested at the largest needed width instead of full resolution.
+
+    Args:
+        image_data: Parsed Unsplash photo (url_raw, url_regular)
+        max_width: Largest variant width that will be generated
+
+    Returns:
+        Source URL, or None if the photo has no usable URL
+
+    Examples:
+        >>> source_image_url({"url_raw": "https://images.unsplash.com/p?ixid=1"}, 1200)
+        'https://images.unsplash.com/p?ixid=1&w=1200&fm=jpg&q=85'
+    """
+    raw = image_data.get("url_raw")
+    if raw:
+        separator = "&" if "?" in raw else "?"
+        return f"{raw}{separator}w={max_width}&fm=jpg&q=85"
+    return image_data.get("url_regular")
+
+
+def supported_formats(formats: Sequence[str] = DEFAULT_FORMATS) -> List[str]:
+    """
+    Filter requested formats to those this Pillow build can encode.
+
+    Args:
+        formats: Requested output formats (e.g. "avif", "webp")
+
+    Returns:
+        Supported formats in requested order
+    """
+    supported = []
+    for fmt in formats:
+        fmt = fmt.lower()
+        if fmt not in _MIME_TYPES:
+            continue
+        try:
+            if features.check(fmt):
+                supported.append(fmt)
+        except ValueError:
+            # Unknown feature name on older Pillow versions
+            continue
+    return supported
+
+
+def generate_variants(
+    image_bytes: bytes,
+    widths: Sequence[int] = DEFAULT_WIDTHS,
+    formats: Sequence[str] = DEFAULT_FORMATS,
+    quality: int = DEFAULT_QUALITY,
+) -> List[Dict[str, Any]]:
+    """
+    Resize and encode an image into responsive variants.
+
+    CPU-bound and free of shared state so it can run in a process pool.
+    Widths larger than the source are skipped (no upscaling); if every
+    width is larger, a single variant at the source width is produced.
+
+    Args:
+        image_bytes: Source image (any format Pillow can read)
+        widths: Target widths in pixels
+        formats: Output formats ("avif", "webp")
+        quality: Encoder quality (0-100)
+
+    Returns:
+        List of dicts with width, height, format, content_type and data
+
+    Raises:
+        PIL.UnidentifiedImageError: If the bytes are not a readable image
+    """
+    with Image.open(io.BytesIO(image_bytes)) as source:
+        source.load()
+        image = source.convert("RGB")
+
+    targets = sorted({w for w in widths if 0 < w <= image.width}) or [image.width]
+    variants: List[Dict[str, Any]] = []
+
+    for width in targets:
+        height = max(1, round(image.height * width / image.width))
+        resized = (
+            image
+            if width == image.width
+            else image.resize((width, height), Image.Resampling.LANCZOS)
+        )
+        for fmt in supported_formats(formats):
+            buffer = io.BytesIO()
+            resized.save(buffer, format=fmt.upper(), quality=quality)
+            variants.append(
+                {
+                    "width": width,
+                    "height": height,
+                    "format": fmt,
+                    "content_type": _MIME_TYPES[fmt],
+                    "data": buffer.getvalue(),
+                }
+            )
+
+    return variants
+
+
+def build_srcset(
+    variants: List[Dict[str, Any]], base_path: str, source_url: str
+) -> Dict[str, Any]:
+    """
+    Build srcset data for frontmatter from generated variants.
+
+    Pure function.
+
+    Args:
+        variants: Variant dicts from generate_variants (data not required)
+        base_path: Site-relative directory of the variants (e.g. "/images/k/")
+        source_url: Original image URL
+
+    Returns:
+        Dict with ``sources`` (one srcset per MIME type, best format first),
+        ``src`` (largest variant of the last format, used as fallback),
+        ``thumbnail`` (smallest variant), ``width``, ``height`` and ``original``
+    """
+    by_format: Dict[str, List[Dict[str, Any]]] = {}
+    for variant in variants:
+        by_format.setdefault(variant["format"], []).append(variant)
+
+    sources = []
+    for fmt, items in by_format.items():
+        items = sorted(items, key=lambda v: v["width"])
+        sources.append(
+            {
+                "type": _MIME_TYPES[fmt],
+                "srcset": ", ".join(
+                    f"{base_path}{v['width']}.{fmt} {v['width']}w" for v in items
+                ),
+            }
+        )
+
+    fallback_format = list(by_format)[-1]
+    fallback_items = sorted(by_format[fallback_format], key=lambda v: v["width"])
+    largest, smallest = fallback_items[-1], fallback_items[0]
+    return {
+        "sources": sources,
+        "src": f"{base_path}{largest['width']}.{fallback_format}",
+        "thumbnail": f"{base_path}{smallest['width']}.{fallback_format}",
+        "width": largest["width"],
+        "height": largest["height"],
+        "original": source_url,
+    }
+
+
+async def download_image_bytes(image_url: str) -> Optional[bytes]:
+    """
+    Download an image into memory.
+
+    Args:
+        image_url: Image URL
+
+    Returns:
+        Image bytes, or None on error or if larger than MAX_SOURCE_BYTES
+    """
+    try:
+        session = await get_http_session()
+        async with session.get(image_url) as resp:
+            if resp.status != 200:
+                logger.error(f"Failed to download image: {resp.status} - {image_url}")
+                return None
+            content = await resp.read()
+    except Exception as e:
+        logger.error(f"Failed to download image: {e}")
+        return None
+
+    if len(content) > MAX_SOURCE_BYTES:
+        logger.warning(f"Image too large ({len(content)} bytes): {image_url}")
+        return None
+    return content
+
+
+def get_image_executor(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    Get or create the singleton process pool used for image encoding.
+
+    Args:
+        max_workers: Pool size (defaults to CPU count)
+
+    Returns:
+        ProcessPoolExecutor instance
+    """
+    global _image_executor
+
+    if _image_executor is None:
+        _image_executor = ProcessPoolExecutor(max_workers=max_workers)
+        logger.info(f"Created image processing pool (max_workers={max_workers})")
+
+    return _image_executor
+
+
+def shutdown_image_executor() -> None:
+    """Shut down the image process pool if it was started."""
+    global _image_executor
+
+    if _image_executor is not None:
+        _image_executor.shutdown(wait=False, cancel_futures=True)
+        _image_executor = None
+
+
+async def _read_manifest(container_client: Any, blob_name: str) -> Optional[Dict]:
+    try:
+        downloader = await container_client.get_blob_client(blob_name).download_blob()
+        manifest = json.loads(await downloader.readall())
+    except ResourceNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug(f"Unreadable image manifest {blob_name}: {e}")
+        return None
+    return manifest if isinstance(manifest, dict) else None
+
+
+async def process_hero_image(
+    source_url: str,
+    blob_service_client: BlobServiceClient,
+    container: str,
+    path_prefix: str = DEFAULT_PATH_PREFIX,
+    widths: Sequence[int] = DEFAULT_WIDTHS,
+    formats: Sequence[str] = DEFAULT_FORMATS,
+    executor: Optional[Executor] = None,
+    fetch: Callable[[str], Awaitable[Optional[bytes]]] = download_image_bytes,
+    limits: Optional[RenderLimits] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Produce (or reuse) responsive variants of a hero image.
+
+    Args:
+        source_url: Original image URL (e.g. Unsplash url_raw/url_regular)
+        blob_service_client: Azure Blob Service client
+        container: Container served by the static site (usually "$web")
+        path_prefix: Blob/URL prefix for image variants
+        widths: Target widths in pixels
+        formats: Output formats
+        executor: Executor for encoding (process pool if None)
+        fetch: Coroutine returning source image bytes (injectable for tests)
+        limits: Shared blob I/O concurrency limits
+
+    Returns:
+        srcset data from build_srcset, or None if the image could not be
+        processed (callers fall back to the hotlinked URL)
+    """
+    key = image_key(source_url)
+    blob_dir = f"{path_prefix}{key}/"
+    container_client = blob_service_client.get_container_client(container)
+
+    async with blob_io_slot(limits):
+        manifest = await _read_manifest(container_client, f"{blob_dir}manifest.json")
+    if manifest is not None:
+        logger.debug(f"Reusing responsive variants for {source_url}")
+        return manifest
+
+    image_bytes = await fetch(source_url)
+    if not image_bytes:
+        return None
+
+    loop = asyncio.get_running_loop()
+    try:
+        variants = await loop.run_in_executor(
+            executor or get_image_executor(),
+            generate_variants,
+            image_bytes,
+            tuple(widths),
+            tuple(formats),
+        )
+    except Exception as e:
+        logger.warning(f"Failed to generate variants for {source_url}: {e}")
+        return None
+    if not variants:
+        return None
+
+    async def upload(name: str, data: bytes, content_type: str) -> None:
+        async with blob_io_slot(limits):
+            await container_client.get_blob_client(name).upload_blob(
+                data,
+                overwrite=True,
+                content_settings=ContentSettings(
+                    content_type=content_type,
+                    cache_control=IMMUTABLE_CACHE_CONTROL,
+                ),
+            )
+
+    try:
+        await asyncio.gather(
+            *(
+                upload(
+                    f"{blob_dir}{v['width']}.{v['format']}",
+                    v["data"],
+                    v["content_type"],
+                )
+                for v in variants
+            )
+        )
+        srcset = build_srcset(variants, f"/{blob_dir}", source_url)
+        # Manifest last: its presence means every variant is uploaded
+        await upload(
+            f"{blob_dir}manifest.json",
+            json.dumps(srcset).encode(),
+            "application/json",
+        )
+    except Exception as e:
+        logger.warning(f"Failed to upload variants for {source_url}: {e}")
+        return None
+
+    largest = max(len(v["data"]) for v in variants)
+    logger.info(
+        f"Generated {len(variants)} responsive variants for {source_url} "
+        f"(source {len(image_bytes)} bytes, largest variant {largest} bytes)"
+    )
+    return srcset
@@ -17,7 +17,7 @@ Strategy:
 """
 
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import aiohttp
 
@@ -114,6 +114,45 @@ async def search_unsplash_photo(
         >>> photo["photographer"]  # if found
         'Jane Photographer'
     """
+    photos = await search_unsplash_photos(
+        access_key=access_key,
+        query=query,
+        orientation=orientation,
+        per_page=1,
+        max_retries=max_retries,
+    )
+    return photos[0] if photos else None
+
+
+async def search_unsplash_photos(
+    access_key: str,
+    query: str,
+    orientation: str = "landscape",
+    per_page: int = 10,
+    max_retries: int = 3,
+) -> List[Dict[str, Any]]:
+    """
+    Search Unsplash API for up to ``per_page`` photos in one request.
+
+    Costs a single request against the hourly quota regardless of
+    ``per_page``, so callers that cache results get several photos to
+    choose from per API call.
+
+    Args:
+        access_key: Unsplash API access key
+        query: Search query (article topic)
+        orientation: "landscape", "portrait", or "squarish"
+        per_page: Number of results to request (Unsplash max 30)
+        max_retries: Maximum retry attempts on rate limit error
+
+    Returns:
+        List of raw photo data dicts (empty if none found)
+
+    Raises:
+        UnsplashRateLimitError: If rate limit exceeded after all retries
+        UnsplashError: For other API errors
+        aiohttp.ClientError: For network errors
+    """
     limiter = get_unsplash_limiter()
     attempt = 0
     retry_wait = 1  # Initial retry wait: 1 second
@@ -122,7 +161,7 @@ async def search_unsplash_photo(
 
     if not clean_query:
         logger.warning("Empty search query provided to Unsplash")
-        return None
+        return []
 
     while attempt <= max_retries:
         try:
@@ -138,7 +177,7 @@ async def search_unsplash_photo(
                 try:
                     params = {
                         "query": clean_query,
-                        "per_page": 1,
+                        "per_page": max(1, min(per_page, 30)),
                         "orientation": orientation,
                         "content_filter": "high",
                     }
@@ -165,11 +204,10 @@ async def search_unsplash_photo(
                                 f"(reset={reset})"
                             )
 
-                            if data.get("results"):
-                                return data["results"][0]
-                            else:
+                            results: List[Dict[str, Any]] = data.get("results") or []
+                            if not results:
                                 logger.warning(f"No images found for: {clean_query}")
-                                return None
+                            return results
 
                         elif resp.status == 403:
                             # Rate limit exceeded
@@ -223,3 +261,5 @@ async def search_unsplash_photo(
         except Exception as e:
             logger.error(f"Unexpected error in Unsplash search: {e}", exc_info=True)
             raise
+
+    return []
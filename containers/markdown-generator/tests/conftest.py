@@ -184,3 +184,11 @@ def create_metadata() -> Any:
         return ArticleMetadata(**defaults)
 
     return _create
+
+
+# Pytest configuration
+def pytest_configure(config):
+    """Configure pytest with custom markers."""
+    config.addinivalue_line(
+        "markers", "performance: marks benchmark tests (timings printed with -s)"
+    )
@@ -0,0 +1,228 @@
+"""
+Tests for metadata-based change detection on markdown writes.
+
+Uses an in-memory blob stand-in that honours ETags, metadata and
+conditional uploads, and counts calls so the number of round-trips per
+article can be asserted.
+"""
+
+import hashlib
+from collections import Counter
+from types import SimpleNamespace
+from typing import Any, Dict, Optional
+
+import pytest
+from azure.core import MatchConditions
+from azure.core.exceptions import (
+    ResourceExistsError,
+    ResourceModifiedError,
+    ResourceNotFoundError,
+)
+from blob_operations import CONTENT_HASH_METADATA_KEY, write_markdown_to_blob
+from markdown_processor import write_markdown_if_changed
+
+CONTAINER = "markdown-content"
+BLOB = "articles/2025-10-15-test.md"
+
+
+def _sha(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class FakeBlobStore:
+    """In-memory container with ETags, metadata and call counting."""
+
+    def __init__(self) -> None:
+        self.blobs: Dict[str, Dict[str, Any]] = {}
+        self.calls: Counter = Counter()
+        self._version = 0
+
+    def put(self, name: str, data: str, metadata: Optional[Dict] = None) -> None:
+        self._version += 1
+        self.blobs[name] = {
+            "data": data.encode(),
+            "metadata": dict(metadata or {}),
+            "etag": f'"0x{self._version}"',
+        }
+
+    def get_container_client(self, container: str) -> Any:
+        return SimpleNamespace(get_blob_client=lambda name: FakeBlobClient(self, name))
+
+
+class FakeBlobClient:
+    """Async blob client backed by FakeBlobStore."""
+
+    def __init__(self, store: FakeBlobStore, name: str) -> None:
+        self.store = store
+        self.name = name
+
+    def _check(self, etag: Optional[str], match_condition: Any) -> None:
+        blob = self.store.blobs.get(self.name)
+        if match_condition == MatchConditions.IfNotModified:
+            if blob is None or blob["etag"] != etag:
+                raise ResourceModifiedError("ETag mismatch")
+
+    async def get_blob_properties(self) -> Any:
+        self.store.calls["head"] += 1
+        blob = self.store.blobs.get(self.name)
+        if blob is None:
+            raise ResourceNotFoundError("not found")
+        return SimpleNamespace(etag=blob["etag"], metadata=dict(blob["metadata"]))
+
+    async def download_blob(self) -> Any:
+        self.store.calls["download"] += 1
+        data = self.store.blobs[self.name]["data"]
+
+        async def readall() -> bytes:
+            return data
+
+        return SimpleNamespace(readall=readall)
+
+    async def upload_blob(
+        self,
+        data: str,
+        overwrite: bool = False,
+        content_type: Optional[str] = None,
+        metadata: Optional[Dict[str, str]] = None,
+        etag: Optional[str] = None,
+        match_condition: Any = None,
+    ) -> None:
+        self.store.calls["upload"] += 1
+        if not overwrite and self.name in self.store.blobs:
+            raise ResourceExistsError("exists")
+        self._check(etag, match_condition)
+        self.store.put(self.name, data, metadata)
+
+    async def set_blob_metadata(
+        self,
+        metadata: Dict[str, str],
+        etag: Optional[str] = None,
+        match_condition: Any = None,
+    ) -> None:
+        self.store.calls["set_metadata"] += 1
+        self._check(etag, match_condition)
+        self.store.blobs[self.name]["metadata"] = dict(metadata)
+
+
+@pytest.fixture
+def store() -> FakeBlobStore:
+    return FakeBlobStore()
+
+
+async def _write(store: FakeBlobStore, content: str, **kwargs: Any) -> bool:
+    return await write_markdown_if_changed(
+        store, CONTAINER, BLOB, content, _sha(content), **kwargs  # type: ignore[arg-type]
+    )
+
+
+class TestWriteMarkdownIfChanged:
+    """Test change detection via stored content hashes."""
+
+    @pytest.mark.asyncio
+    async def test_new_blob_written_with_hash(self, store: FakeBlobStore) -> None:
+        """New markdown is written with its hash in metadata."""
+        assert await _write(store, "# Hello") is True
+
+        blob = store.blobs[BLOB]
+        assert blob["metadata"][CONTENT_HASH_METADATA_KEY] == _sha("# Hello")
+        assert store.calls == Counter(head=1, upload=1)
+
+    @pytest.mark.asyncio
+    async def test_unchanged_costs_one_head(self, store: FakeBlobStore) -> None:
+        """Unchanged content is detected from metadata without downloading."""
+        await _write(store, "# Hello")
+        store.calls.clear()
+
+        assert await _write(store, "# Hello") is False
+        assert store.calls == Counter(head=1)
+
+    @pytest.mark.asyncio
+    async def test_changed_content_rewritten(self, store: FakeBlobStore) -> None:
+        """Changed content replaces the blob and updates the stored hash."""
+        await _write(store, "# Hello")
+        store.calls.clear()
+
+        assert await _write(store, "# Hello, world") is True
+        assert store.blobs[BLOB]["data"] == b"# Hello, world"
+        assert store.calls == Counter(head=1, upload=1)
+
+    @pytest.mark.asyncio
+    async def test_overwrite_forces_write(self, store: FakeBlobStore) -> None:
+        """overwrite=True rewrites identical content."""
+        await _write(store, "# Hello")
+
+        assert await _write(store, "# Hello", overwrite=True) is True
+
+    @pytest.mark.asyncio
+    async def test_legacy_blob_hashed_once_and_backfilled(
+        self, store: FakeBlobStore
+    ) -> None:
+        """Blobs without hash metadata are downloaded once, then tagged."""
+        store.put(BLOB, "# Hello")
+
+        assert await _write(store, "# Hello") is False
+        assert store.calls == Counter(head=1, download=1, set_metadata=1)
+        assert store.blobs[BLOB]["metadata"][CONTENT_HASH_METADATA_KEY] == _sha(
+            "# Hello"
+        )
+
+        store.calls.clear()
+        assert await _write(store, "# Hello") is False
+        assert store.calls == Counter(head=1)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_write_skipped(
+        self, store: FakeBlobStore
+    ) -> None:
+        """A writer that loses the ETag race to identical content skips."""
+        store.put(BLOB, "# Old", {CONTENT_HASH_METADATA_KEY: _sha("# Old")})
+        original_head = FakeBlobClient.get_blob_properties
+        raced = False
+
+        async def head_then_race(self: FakeBlobClient) -> Any:
+            nonlocal raced
+            properties = await original_head(self)
+            if not raced:
+                raced = True
+                store.put(BLOB, "# New", {CONTENT_HASH_METADATA_KEY: _sha("# New")})
+            return properties
+
+        FakeBlobClient.get_blob_properties = head_then_race  # type: ignore[method-assign]
+        try:
+            assert await _write(store, "# New") is False
+        finally:
+            FakeBlobClient.get_blob_properties = original_head  # type: ignore[method-assign]
+
+        assert store.blobs[BLOB]["data"] == b"# New"
+
+
+class TestWriteMarkdownToBlob:
+    """Test conditional uploads."""
+
+    @pytest.mark.asyncio
+    async def test_no_overwrite_uses_if_none_match(self, store: FakeBlobStore) -> None:
+        """overwrite=False fails on an existing blob without an exists() call."""
+        store.put(BLOB, "# Existing")
+
+        with pytest.raises(ValueError):
+            await write_markdown_to_blob(
+                store, CONTAINER, BLOB, "# New", overwrite=False  # type: ignore[arg-type]
+            )
+        assert store.blobs[BLOB]["data"] == b"# Existing"
+
+    @pytest.mark.asyncio
+    async def test_stale_etag_rejected(self, store: FakeBlobStore) -> None:
+        """An update with an outdated ETag is rejected."""
+        store.put(BLOB, "# One")
+        stale = store.blobs[BLOB]["etag"]
+        store.put(BLOB, "# Two")
+
+        with pytest.raises(ResourceModifiedError):
+            await write_markdown_to_blob(
+                store,  # type: ignore[arg-type]
+                CONTAINER,
+                BLOB,
+                "# Three",
+                overwrite=True,
+                etag=stale,
+            )
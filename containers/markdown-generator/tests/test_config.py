@@ -32,6 +32,7 @@ class TestSettings:
         assert settings.log_level == "INFO"
         assert settings.input_container == "processed-content"
         assert settings.output_container == "markdown-content"
+        assert settings.image_cache_container == "image-cache"
         assert settings.queue_name == "markdown-generation-requests"
         assert settings.max_batch_size == 10
         assert settings.enable_metrics is True
@@ -0,0 +1,269 @@
+"""
+Tests for the persistent Unsplash query cache.
+
+Covers query normalization, per-article photo choice, TTL expiry, the blob-backed
+tier shared across instances, and the cached path through
+fetch_image_for_article.
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from azure.core.exceptions import ResourceNotFoundError
+from services.image_cache import UnsplashImageCache, normalize_query, pick_photo
+from services.image_service import fetch_image_for_article
+
+
+class FakeClock:
+    """Manually advanced wall clock."""
+
+    def __init__(self) -> None:
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeBlobServiceClient:
+    """Minimal async blob service storing uploads in a dict."""
+
+    def __init__(self) -> None:
+        self.blobs: Dict[str, bytes] = {}
+
+    def get_container_client(self, container: str) -> Any:
+        return SimpleNamespace(
+            get_blob_client=lambda name: self._blob_client(f"{container}/{name}")
+        )
+
+    def _blob_client(self, path: str) -> Any:
+        store = self.blobs
+
+        async def upload_blob(data: str, **kwargs: Any) -> None:
+            store[path] = data.encode()
+
+        async def download_blob() -> Any:
+            if path not in store:
+                raise ResourceNotFoundError("not found")
+            return SimpleNamespace(readall=AsyncMock(return_value=store[path]))
+
+        return SimpleNamespace(upload_blob=upload_blob, download_blob=download_blob)
+
+
+def _photos(count: int) -> List[Dict[str, Any]]:
+    return [
+        {"url_regular": f"https://img/{i}", "photographer": f"P{i}"}
+        for i in range(count)
+    ]
+
+
+class TestNormalizeQuery:
+    """Test cache key normalization."""
+
+    def test_order_case_and_punctuation_insensitive(self) -> None:
+        """Equivalent keyword sets share a key."""
+        assert normalize_query("Machine-Learning AI") == normalize_query(
+            "ai  machine learning"
+        )
+
+    def test_empty_query(self) -> None:
+        """Queries without words normalize to an empty key."""
+        assert normalize_query(" -- ") == ""
+
+
+class TestUnsplashImageCache:
+    """Test lookup, photo choice and expiry."""
+
+    @pytest.mark.asyncio
+    async def test_hits_keep_each_articles_photo(self) -> None:
+        """An article gets the same photo on every lookup; others spread out."""
+        cache = UnsplashImageCache()
+        photos = _photos(3)
+
+        assert await cache.lookup("AI healthcare", "a.json") == (False, None)
+        first = await cache.store("AI healthcare", photos, "a.json")
+        hits = [await cache.lookup("healthcare ai", "a.json") for _ in range(3)]
+
+        assert all(hit and photo == first for hit, photo in hits)
+        assert first == pick_photo(photos, "a.json")
+        chosen = {pick_photo(photos, f"{i}.json")["photographer"] for i in range(20)}
+        assert chosen == {"P0", "P1", "P2"}
+
+    @pytest.mark.asyncio
+    async def test_negative_result_cached_with_short_ttl(self) -> None:
+        """'No results' is cached, but expires sooner than photos."""
+        clock = FakeClock()
+        cache = UnsplashImageCache(
+            ttl_seconds=1000, negative_ttl_seconds=100, clock=clock
+        )
+        await cache.store("obscure topic", [])
+
+        assert await cache.lookup("obscure topic") == (True, None)
+        clock.now += 101
+        assert await cache.lookup("obscure topic") == (False, None)
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry(self) -> None:
+        """Entries older than the TTL are misses."""
+        clock = FakeClock()
+        cache = UnsplashImageCache(ttl_seconds=60, clock=clock)
+        await cache.store("rust", _photos(1))
+
+        clock.now += 61
+
+        assert await cache.lookup("rust") == (False, None)
+
+    @pytest.mark.asyncio
+    async def test_memory_lru_bound(self) -> None:
+        """The in-memory tier keeps at most max_entries queries."""
+        cache = UnsplashImageCache(max_entries=2)
+        for query in ("one", "two", "three"):
+            await cache.store(query, _photos(1))
+
+        assert cache.get_stats()["entries_in_memory"] == 2
+        assert (await cache.lookup("one"))[0] is False
+
+    @pytest.mark.asyncio
+    async def test_blob_tier_shared_across_instances(self) -> None:
+        """A result cached by one replica is a blob hit on another."""
+        blob_service = FakeBlobServiceClient()
+        writer = UnsplashImageCache(blob_service, "image-cache")
+        reader = UnsplashImageCache(blob_service, "image-cache")
+
+        stored_photo = await writer.store("kubernetes", _photos(2), "k.json")
+        hit, photo = await reader.lookup("Kubernetes", "k.json")
+
+        assert hit is True
+        assert photo == stored_photo
+        assert reader.get_stats()["blob_hits"] == 1
+        stored = json.loads(next(iter(blob_service.blobs.values())))
+        assert stored["query"] == "kubernetes"
+
+    @pytest.mark.asyncio
+    async def test_stats(self) -> None:
+        """Hit rate and API calls saved are reported."""
+        cache = UnsplashImageCache()
+        await cache.lookup("python")
+        await cache.store("python", _photos(2))
+        await cache.lookup("python")
+        await cache.lookup("python")
+
+        stats = cache.get_stats()
+
+        assert stats["misses"] == 1
+        assert stats["api_calls_saved"] == 2
+        assert stats["hit_rate"] == pytest.approx(0.667, abs=1e-3)
+
+
+class TestFetchImageWithCache:
+    """Test the cached path through fetch_image_for_article."""
+
+    @pytest.mark.asyncio
+    async def test_same_tags_use_one_api_call(self) -> None:
+        """Articles with the same tags share one search but get different photos."""
+        cache = UnsplashImageCache()
+        photographers = []
+
+        with patch(
+            "services.image_service.search_unsplash_images",
+            AsyncMock(return_value=_photos(3)),
+        ) as mock_search:
+            for i in range(10):
+                image = await fetch_image_for_article(
+                    access_key="key",
+                    title=f"Cloud Native Security Practices Part {i}",
+                    tags=["security", "cloud"],
+                    cache=cache,
+                    article_key=f"articles/{i}.json",
+                )
+                photographers.append(image["photographer"])
+
+        assert mock_search.await_count == 1
+        assert len(set(photographers)) > 1
+
+    @pytest.mark.asyncio
+    async def test_rerender_keeps_photo(self) -> None:
+        """Re-rendering an article (any replica) picks the same photo."""
+        blob_service = FakeBlobServiceClient()
+        photos = []
+
+        with patch(
+            "services.image_service.search_unsplash_images",
+            AsyncMock(return_value=_photos(5)),
+        ):
+            for _ in range(3):
+                # A fresh cache per render, as after a restart or on another replica
+                cache = UnsplashImageCache(blob_service, "image-cache")
+                for _ in range(2):
+                    photos.append(
+                        await fetch_image_for_article(
+                            access_key="key",
+                            title="Cloud Native Security Practices",
+                            tags=["security", "cloud"],
+                            cache=cache,
+                            article_key="articles/security.json",
+                        )
+                    )
+
+        assert all(photo == photos[0] for photo in photos)
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_does_not_wait_for_api_slot(self) -> None:
+        """Only real searches take the Unsplash slot; hits skip the queue."""
+        cache = UnsplashImageCache()
+        await cache.store("cloud security", _photos(2))
+        api_slot = asyncio.Semaphore(1)
+        await api_slot.acquire()  # Every slot busy with other searches
+
+        with patch(
+            "services.image_service.search_unsplash_images",
+            AsyncMock(return_value=_photos(1)),
+        ) as mock_search:
+            image = await asyncio.wait_for(
+                fetch_image_for_article(
+                    access_key="key",
+                    title="Cloud Native Security Practices",
+                    tags=["security", "cloud"],
+                    cache=cache,
+                    api_slot=api_slot,
+                ),
+                timeout=1,
+            )
+            miss = asyncio.create_task(
+                fetch_image_for_article(
+                    access_key="key",
+                    title="Quantum Computing Breakthroughs Announced",
+                    tags=["quantum"],
+                    cache=cache,
+                    api_slot=api_slot,
+                )
+            )
+            await asyncio.sleep(0.01)
+            assert not miss.done()  # A miss waits for the slot
+            api_slot.release()
+            await miss
+
+        assert image is not None
+        assert mock_search.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_search_not_cached(self) -> None:
+        """Errors (None) are not cached so the next article retries."""
+        cache = UnsplashImageCache()
+
+        with patch(
+            "services.image_service.search_unsplash_images",
+            AsyncMock(return_value=None),
+        ) as mock_search:
+            for _ in range(2):
+                await fetch_image_for_article(
+                    access_key="key",
+                    title="Cloud Native Security Practices",
+                    tags=["security"],
+                    cache=cache,
+                )
+
+        assert mock_search.await_count == 2
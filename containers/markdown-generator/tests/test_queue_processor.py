@@ -0,0 +1,189 @@
+"""
+Tests for the markdown-generator queue message handler.
+
+Verifies that every file in a batched trigger message is rendered, that
+per-file outcomes are aggregated into the handler result and app state,
+that only failed files are re-queued, and that the site-publisher signal
+survives QueueMessageModel parsing.
+"""
+
+from typing import Any, Dict
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+from models import MarkdownGenerationResult, ProcessingStatus
+from queue_processor import create_message_handler, signal_site_publisher
+
+from libs.queue_client import QueueMessageModel
+
+
+def _result(blob_name: str, created: bool = True) -> MarkdownGenerationResult:
+    return MarkdownGenerationResult(
+        blob_name=blob_name,
+        status=ProcessingStatus.COMPLETED,
+        markdown_blob_name=blob_name.replace(".json", ".md"),
+        files_created=created,
+        processing_time_ms=12,
+    )
+
+
+def _failed(blob_name: str) -> MarkdownGenerationResult:
+    return MarkdownGenerationResult(
+        blob_name=blob_name,
+        status=ProcessingStatus.FAILED,
+        error_message="Article not found",
+    )
+
+
+@pytest.fixture
+def app_state() -> Dict[str, Any]:
+    return {
+        "total_processed": 0,
+        "total_files_generated": 0,
+        "total_failed": 0,
+    }
+
+
+async def _handler(app_state: Dict[str, Any]):
+    settings = Mock(
+        queue_name="markdown-generation-requests",
+        max_dequeue_count=3,
+        failed_file_retry_delay_seconds=60,
+    )
+    return await create_message_handler(
+        blob_service_client=Mock(),
+        settings=settings,
+        jinja_env=Mock(),
+        unsplash_key=None,
+        app_state=app_state,
+    )
+
+
+def _message(files: list, **payload: Any) -> QueueMessageModel:
+    return QueueMessageModel(
+        message_id="msg-1",
+        service_name="content-processor",
+        operation="wake_up",
+        payload={"files": files, **payload},
+    )
+
+
+def _queue_client() -> MagicMock:
+    queue_client = MagicMock()
+    queue_client.__aenter__.return_value = queue_client
+    queue_client.send_message = AsyncMock(return_value={"message_id": "m-2"})
+    return queue_client
+
+
+class TestMessageHandler:
+    """Test batched message handling."""
+
+    @pytest.mark.asyncio
+    async def test_processes_every_file(self, app_state: Dict[str, Any]) -> None:
+        """All files in payload['files'] are rendered, not just the first."""
+        files = [f"articles/2025-10-15/a{i}.json" for i in range(3)]
+        handler = await _handler(app_state)
+
+        with patch("queue_processor.process_article") as mock_process:
+            mock_process.side_effect = [
+                _result(files[0]),
+                _result(files[1], created=False),
+                _result(files[2]),
+            ]
+            response = await handler(_message(files), Mock())
+
+        rendered = [call.kwargs["blob_name"] for call in mock_process.call_args_list]
+        assert rendered == files
+        assert response["status"] == "success"
+        assert response["files_created"] == 2
+        assert response["files_processed"] == 3
+        assert app_state["total_processed"] == 3
+        assert app_state["total_files_generated"] == 2
+
+    @pytest.mark.asyncio
+    async def test_partial_failure(self, app_state: Dict[str, Any]) -> None:
+        """A failing file does not stop the rest of the batch and is re-queued."""
+        files = ["articles/2025-10-15/ok.json", "articles/2025-10-15/missing.json"]
+        handler = await _handler(app_state)
+        queue_client = _queue_client()
+
+        with (
+            patch("queue_processor.process_article") as mock_process,
+            patch("queue_processor.get_queue_client", return_value=queue_client),
+        ):
+            mock_process.side_effect = [_result(files[0]), _failed(files[1])]
+            response = await handler(_message(files), Mock())
+
+        retry = QueueMessageModel(**queue_client.send_message.call_args.args[0])
+        assert retry.payload["files"] == [files[1]]
+        assert retry.payload["attempt"] == 2
+        assert queue_client.send_message.call_args.kwargs["visibility_timeout"] == 60
+        assert response["status"] == "partial"
+        assert response["files_created"] == 1
+        assert "missing.json" in response["error"]
+        assert app_state["total_failed"] == 1
+        processing = app_state["processing_metrics"].snapshot()
+        assert (processing["successes"], processing["failures"]) == (1, 1)
+        assert processing["error_rate"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_failed_files_dropped_at_retry_cap(
+        self, app_state: Dict[str, Any]
+    ) -> None:
+        """Files that failed max_dequeue_count times are not re-queued again."""
+        files = ["articles/2025-10-15/missing.json"]
+        handler = await _handler(app_state)
+        queue_client = _queue_client()
+
+        with (
+            patch("queue_processor.process_article", return_value=_failed(files[0])),
+            patch("queue_processor.get_queue_client", return_value=queue_client),
+        ):
+            response = await handler(_message(files, attempt=3), Mock())
+
+        assert response["status"] == "error"
+        queue_client.send_message.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_requeue_failure_raises(self, app_state: Dict[str, Any]) -> None:
+        """If failed files can't be re-queued, the whole message is retried."""
+        files = ["articles/2025-10-15/missing.json"]
+        handler = await _handler(app_state)
+        queue_client = _queue_client()
+        queue_client.send_message.side_effect = RuntimeError("queue down")
+
+        with (
+            patch("queue_processor.process_article", return_value=_failed(files[0])),
+            patch("queue_processor.get_queue_client", return_value=queue_client),
+            pytest.raises(RuntimeError, match="queue down"),
+        ):
+            await handler(_message(files), Mock())
+
+    @pytest.mark.asyncio
+    async def test_empty_files(self, app_state: Dict[str, Any]) -> None:
+        """Messages without files are rejected."""
+        handler = await _handler(app_state)
+
+        response = await handler(_message([]), Mock())
+
+        assert response["status"] == "error"
+        assert app_state["total_failed"] == 1
+
+
+class TestSignalSitePublisher:
+    """Test the completion signal sent to site-publisher."""
+
+    @pytest.mark.asyncio
+    async def test_signal_fields_survive_queue_message_model(self) -> None:
+        """site-publisher reads operation and content_summary from the payload."""
+        queue_client = MagicMock()
+        queue_client.__aenter__.return_value = queue_client
+        queue_client.send_message = AsyncMock(return_value={"message_id": "m-1"})
+
+        with patch("queue_processor.get_queue_client", return_value=queue_client):
+            await signal_site_publisher(7, "markdown-content")
+
+        sent = queue_client.send_message.call_args.args[0]
+        received = QueueMessageModel(**sent)  # what StorageQueueClient sends
+        assert received.payload["operation"] == "markdown_generated"
+        assert received.payload["content_summary"]["files_created"] == 7
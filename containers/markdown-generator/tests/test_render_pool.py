@@ -0,0 +1,178 @@
+"""
+Tests for the bounded-concurrency render pool.
+
+Verifies that articles are rendered concurrently up to the worker limit,
+that blob I/O and Unsplash slots are bounded independently, and that
+throughput is reported over a sliding window.
+"""
+
+import asyncio
+
+import pytest
+from render_pool import RenderLimits, RenderPool, blob_io_slot, unsplash_slot
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRenderPool:
+    """Test worker pool scheduling."""
+
+    @pytest.mark.asyncio
+    async def test_results_in_input_order(self) -> None:
+        """Results line up with inputs even when renders finish out of order."""
+        pool = RenderPool(max_workers=4)
+        items = [f"a{i}.json" for i in range(6)]
+
+        async def render(name: str) -> str:
+            await asyncio.sleep(0.001 * (6 - int(name[1])))
+            return name.upper()
+
+        results = await pool.run(items, render)
+
+        assert results == [name.upper() for name in items]
+
+    @pytest.mark.asyncio
+    async def test_worker_limit(self) -> None:
+        """No more than max_workers renders run at once."""
+        pool = RenderPool(max_workers=3)
+        active = 0
+        peak = 0
+
+        async def render(name: str) -> str:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.005)
+            active -= 1
+            return name
+
+        await pool.run([f"a{i}" for i in range(10)], render)
+
+        assert peak == 3
+        assert pool.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_exceptions_are_returned(self) -> None:
+        """A failing render is reported without cancelling the others."""
+        pool = RenderPool(max_workers=2)
+
+        async def render(name: str) -> str:
+            if name == "bad":
+                raise RuntimeError("boom")
+            return name
+
+        results = await pool.run(["ok1", "bad", "ok2"], render)
+
+        assert results[0] == "ok1"
+        assert isinstance(results[1], RuntimeError)
+        assert results[2] == "ok2"
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self) -> None:
+        """An empty batch returns no results."""
+        pool = RenderPool()
+
+        async def render(name: str) -> str:
+            return name
+
+        assert await pool.run([], render) == []
+
+
+class TestRenderLimits:
+    """Test separate blob I/O and Unsplash bounds."""
+
+    @pytest.mark.asyncio
+    async def test_blob_and_unsplash_limits_are_independent(self) -> None:
+        """Unsplash calls are capped separately from blob operations."""
+        pool = RenderPool(max_workers=8, blob_io_limit=4, unsplash_limit=1)
+        counters = {"blob": 0, "unsplash": 0}
+        peaks = {"blob": 0, "unsplash": 0}
+
+        async def use(kind: str, slot) -> None:
+            async with slot:
+                counters[kind] += 1
+                peaks[kind] = max(peaks[kind], counters[kind])
+                await asyncio.sleep(0.002)
+                counters[kind] -= 1
+
+        async def render(name: str) -> str:
+            await use("blob", blob_io_slot(pool.limits))
+            await use("unsplash", unsplash_slot(pool.limits))
+            await use("blob", blob_io_slot(pool.limits))
+            return name
+
+        await pool.run([f"a{i}" for i in range(8)], render)
+
+        assert peaks["blob"] == 4
+        assert peaks["unsplash"] == 1
+
+    @pytest.mark.asyncio
+    async def test_no_limits_is_unbounded(self) -> None:
+        """Slots are no-ops when no limits are supplied."""
+        async with blob_io_slot(None):
+            async with unsplash_slot(None):
+                pass
+
+    def test_limits_are_at_least_one(self) -> None:
+        """Zero or negative limits are clamped to one."""
+        limits = RenderLimits(blob_io_limit=0, unsplash_limit=-3)
+
+        assert limits.blob_io_limit == 1
+        assert limits.unsplash_limit == 1
+
+
+class TestThroughput:
+    """Test throughput reporting."""
+
+    @pytest.mark.asyncio
+    async def test_articles_per_minute_sliding_window(self) -> None:
+        """Only completions inside the window count towards throughput."""
+        clock = FakeClock()
+        pool = RenderPool(window_seconds=60, clock=clock)
+
+        async def render(name: str) -> str:
+            return name
+
+        await pool.run([f"a{i}" for i in range(30)], render)
+        clock.now = 30.0
+        stats = pool.get_stats()
+        assert stats["rendered_in_window"] == 30
+        assert stats["articles_per_minute"] == 60.0
+
+        clock.now = 120.0
+        await pool.run([f"b{i}" for i in range(6)], render)
+        stats = pool.get_stats()
+        assert stats["rendered_in_window"] == 6
+        assert stats["articles_per_minute"] == 6.0
+        assert stats["total_rendered"] == 36
+
+    def test_stats_report_limits(self) -> None:
+        """Stats include the configured concurrency limits."""
+        pool = RenderPool(max_workers=5, blob_io_limit=7, unsplash_limit=3)
+
+        stats = pool.get_stats()
+
+        assert (stats["max_workers"], stats["blob_io_limit"]) == (5, 7)
+        assert stats["unsplash_limit"] == 3
+        assert stats["in_flight"] == 0
+
+
+def test_from_settings(mock_settings) -> None:
+    """Pool limits come from Settings."""
+    mock_settings.render_concurrency = 12
+    mock_settings.blob_io_concurrency = 20
+    mock_settings.unsplash_concurrency = 1
+
+    pool = RenderPool.from_settings(mock_settings)
+
+    assert pool.max_workers == 12
+    assert pool.limits.blob_io_limit == 20
+    assert pool.limits.unsplash_limit == 1
@@ -0,0 +1,287 @@
+"""
+Tests for the responsive hero-image pipeline.
+
+Uses a locally generated JPEG fixture and an in-memory blob container, so
+no network or Azure access is needed.
+"""
+
+import io
+import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, Optional
+from unittest.mock import AsyncMock
+
+import pytest
+import yaml
+from azure.core.exceptions import ResourceNotFoundError
+from metadata_utils import extract_metadata_from_article
+from PIL import Image
+from services.responsive_images import (
+    IMMUTABLE_CACHE_CONTROL,
+    build_srcset,
+    generate_variants,
+    image_key,
+    process_hero_image,
+    source_image_url,
+    supported_formats,
+)
+
+SOURCE_URL = "https://images.unsplash.com/photo-123?ixid=abc&w=1200&fm=jpg&q=85"
+
+
+@pytest.fixture
+def hero_jpeg(tmp_path: Path) -> Path:
+    """Write a 1600x900 gradient JPEG fixture to disk."""
+    image = Image.new("RGB", (1600, 900))
+    image.putdata(
+        [
+            (x * 255 // 1600, y * 255 // 900, 128)
+            for y in range(900)
+            for x in range(1600)
+        ]
+    )
+    path = tmp_path / "hero.jpg"
+    image.save(path, format="JPEG", quality=90)
+    return path
+
+
+class FakeContainer:
+    """In-memory container recording uploads and their content settings."""
+
+    def __init__(self) -> None:
+        self.blobs: Dict[str, Dict[str, Any]] = {}
+
+    def get_blob_client(self, name: str) -> Any:
+        async def upload_blob(data: bytes, overwrite: bool, content_settings: Any):
+            self.blobs[name] = {"data": data, "settings": content_settings}
+
+        async def download_blob() -> Any:
+            if name not in self.blobs:
+                raise ResourceNotFoundError("not found")
+            return SimpleNamespace(
+                readall=AsyncMock(return_value=self.blobs[name]["data"])
+            )
+
+        return SimpleNamespace(upload_blob=upload_blob, download_blob=download_blob)
+
+
+@pytest.fixture
+def web_container() -> FakeContainer:
+    return FakeContainer()
+
+
+@pytest.fixture
+def blob_service(web_container: FakeContainer) -> Any:
+    return SimpleNamespace(get_container_client=lambda name: web_container)
+
+
+def _local_fetch(path: Path):
+    calls = []
+
+    async def fetch(url: str) -> Optional[bytes]:
+        calls.append(url)
+        return path.read_bytes()
+
+    fetch.calls = calls  # type: ignore[attr-defined]
+    return fetch
+
+
+class TestGenerateVariants:
+    """Test Pillow resizing and encoding."""
+
+    def test_widths_and_formats(self, hero_jpeg: Path) -> None:
+        """One variant per width and supported format, preserving aspect."""
+        variants = generate_variants(hero_jpeg.read_bytes(), (480, 800), ("webp",))
+
+        assert [(v["width"], v["height"]) for v in variants] == [(480, 270), (800, 450)]
+        for variant in variants:
+            assert variant["content_type"] == "image/webp"
+            with Image.open(io.BytesIO(variant["data"])) as decoded:
+                assert decoded.format == "WEBP"
+                assert decoded.width == variant["width"]
+
+    def test_no_upscaling(self, hero_jpeg: Path) -> None:
+        """Widths above the source width are skipped."""
+        variants = generate_variants(hero_jpeg.read_bytes(), (800, 3000), ("webp",))
+
+        assert [v["width"] for v in variants] == [800]
+
+    def test_small_source_kept_at_native_width(self, tmp_path: Path) -> None:
+        """A source narrower than every width yields one native-size variant."""
+        path = tmp_path / "small.png"
+        Image.new("RGB", (300, 200), "red").save(path)
+
+        variants = generate_variants(path.read_bytes(), (480, 800), ("webp",))
+
+        assert [(v["width"], v["height"]) for v in variants] == [(300, 200)]
+
+    def test_variants_smaller_than_source(self, hero_jpeg: Path) -> None:
+        """Resized WebP variants are smaller than the source JPEG."""
+        source = hero_jpeg.read_bytes()
+        variants = generate_variants(source, (1200,), ("webp",))
+
+        assert len(variants[0]["data"]) < len(source)
+
+    def test_unsupported_formats_filtered(self) -> None:
+        """Unknown formats are ignored."""
+        assert supported_formats(("gif", "webp")) == ["webp"]
+
+
+class TestBuildSrcset:
+    """Test srcset construction."""
+
+    def test_sources_per_format(self) -> None:
+        """Each format gets a srcset ordered by width; fallback is the largest."""
+        variants = [
+            {"width": w, "height": w // 2, "format": fmt}
+            for fmt in ("avif", "webp")
+            for w in (800, 480)
+        ]
+
+        srcset = build_srcset(variants, "/images/k/", SOURCE_URL)
+
+        assert srcset["sources"] == [
+            {
+                "type": "image/avif",
+                "srcset": "/images/k/480.avif 480w, /images/k/800.avif 800w",
+            },
+            {
+                "type": "image/webp",
+                "srcset": "/images/k/480.webp 480w, /images/k/800.webp 800w",
+            },
+        ]
+        assert srcset["src"] == "/images/k/800.webp"
+        assert srcset["thumbnail"] == "/images/k/480.webp"
+        assert (srcset["width"], srcset["height"]) == (800, 400)
+
+
+class TestProcessHeroImage:
+    """Test download, encode and upload with a local blob stand-in."""
+
+    @pytest.mark.asyncio
+    async def test_uploads_variants_with_cache_headers(
+        self, hero_jpeg: Path, blob_service: Any, web_container: FakeContainer
+    ) -> None:
+        """Variants and manifest are uploaded with immutable cache headers."""
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            srcset = await process_hero_image(
+                SOURCE_URL,
+                blob_service,
+                "$web",
+                widths=(480, 800),
+                formats=("webp",),
+                executor=executor,
+                fetch=_local_fetch(hero_jpeg),
+            )
+
+        key = image_key(SOURCE_URL)
+        assert set(web_container.blobs) == {
+            f"images/{key}/480.webp",
+            f"images/{key}/800.webp",
+            f"images/{key}/manifest.json",
+        }
+        settings = web_container.blobs[f"images/{key}/800.webp"]["settings"]
+        assert settings.cache_control == IMMUTABLE_CACHE_CONTROL
+        assert settings.content_type == "image/webp"
+        assert srcset["src"] == f"/images/{key}/800.webp"
+
+    @pytest.mark.asyncio
+    async def test_photo_processed_once(
+        self, hero_jpeg: Path, blob_service: Any
+    ) -> None:
+        """A second article using the same photo reuses the manifest."""
+        fetch = _local_fetch(hero_jpeg)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            first = await process_hero_image(
+                SOURCE_URL,
+                blob_service,
+                "$web",
+                formats=("webp",),
+                executor=executor,
+                fetch=fetch,
+            )
+            second = await process_hero_image(
+                SOURCE_URL,
+                blob_service,
+                "$web",
+                formats=("webp",),
+                executor=executor,
+                fetch=fetch,
+            )
+
+        assert first == second
+        assert len(fetch.calls) == 1  # type: ignore[attr-defined]
+
+    @pytest.mark.asyncio
+    async def test_process_pool(self, hero_jpeg: Path, blob_service: Any) -> None:
+        """Encoding runs in a separate process."""
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            srcset = await process_hero_image(
+                SOURCE_URL,
+                blob_service,
+                "$web",
+                widths=(480,),
+                formats=("avif", "webp"),
+                executor=executor,
+                fetch=_local_fetch(hero_jpeg),
+            )
+
+        assert srcset is not None
+        assert srcset["sources"][-1]["type"] == "image/webp"
+
+    @pytest.mark.asyncio
+    async def test_download_failure_returns_none(
+        self, blob_service: Any, web_container: FakeContainer
+    ) -> None:
+        """If the photo cannot be fetched, nothing is uploaded."""
+        result = await process_hero_image(
+            SOURCE_URL,
+            blob_service,
+            "$web",
+            fetch=AsyncMock(return_value=None),
+        )
+
+        assert result is None
+        assert web_container.blobs == {}
+
+
+class TestFrontmatterIntegration:
+    """Test srcset data flowing into article metadata and frontmatter."""
+
+    def test_source_image_url_requests_needed_width(self) -> None:
+        """Raw Unsplash URLs are resized by the CDN before download."""
+        url = source_image_url({"url_raw": "https://images.unsplash.com/p"}, 1200)
+
+        assert url == "https://images.unsplash.com/p?w=1200&fm=jpg&q=85"
+
+    def test_responsive_fields_in_frontmatter(
+        self, sample_article_data: Dict[str, Any], jinja_env: Any
+    ) -> None:
+        """hero_image points at the local variant and srcset is in params."""
+        from markdown_generator import generate_markdown_content
+
+        srcset = build_srcset(
+            [{"width": 800, "height": 450, "format": "webp"}],
+            "/images/k/",
+            SOURCE_URL,
+        )
+        image_data = {
+            "url_regular": "https://images.unsplash.com/photo-123",
+            "url_small": "https://images.unsplash.com/photo-123-small",
+            "photographer": "Jane",
+            "photographer_url": "https://unsplash.com/@jane",
+            "description": "Gradient",
+            "responsive": srcset,
+        }
+
+        metadata = extract_metadata_from_article(sample_article_data, image_data)
+        markdown = generate_markdown_content(sample_article_data, metadata, jinja_env)
+        frontmatter = yaml.safe_load(markdown.split("---")[1])
+
+        assert frontmatter["cover"]["image"] == "/images/k/800.webp"
+        assert frontmatter["params"]["thumbnail"] == "/images/k/800.webp"
+        hero_srcset = frontmatter["params"]["hero_srcset"]
+        assert hero_srcset["sources"][0]["type"] == "image/webp"
+        assert json.dumps(hero_srcset)  # serialisable for Hugo
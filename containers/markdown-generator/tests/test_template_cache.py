@@ -0,0 +1,147 @@
+"""
+Tests for template compilation caching.
+
+Covers the per-environment compiled-template cache, the on-disk bytecode
+cache used across cold starts, and a render benchmark across the three
+shipped templates.
+"""
+
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+from jinja2 import Environment
+from markdown_generator import (
+    create_jinja_environment,
+    generate_markdown_content,
+    get_compiled_template,
+    precompile_templates,
+)
+from metadata_utils import extract_metadata_from_article
+
+TEMPLATES = ["default.md.j2", "with-toc.md.j2", "minimal.md.j2"]
+
+
+def _count_compiles(env: Environment) -> List[str]:
+    """Record template names each time the environment compiles source."""
+    compiled: List[str] = []
+    original = env.compile
+
+    def compile(source: Any, name: Any = None, *args: Any, **kwargs: Any) -> Any:
+        compiled.append(name)
+        return original(source, name, *args, **kwargs)
+
+    env.compile = compile  # type: ignore[method-assign]
+    return compiled
+
+
+class TestCompiledTemplateCache:
+    """Test compiled-template reuse within a process."""
+
+    def test_template_compiled_once(self) -> None:
+        """Repeated lookups return the same compiled template."""
+        env = create_jinja_environment()
+        compiled = _count_compiles(env)
+
+        first = get_compiled_template(env, "default.md.j2")
+        second = get_compiled_template(env, "default.md.j2")
+
+        assert first is second
+        assert compiled == ["default.md.j2"]
+
+    def test_precompile_loads_all_templates(self) -> None:
+        """Startup precompilation covers every shipped template."""
+        env = create_jinja_environment()
+
+        names = precompile_templates(env)
+        compiled = _count_compiles(env)
+        for name in TEMPLATES:
+            get_compiled_template(env, name)
+
+        assert set(TEMPLATES) <= set(names)
+        assert compiled == []
+
+    def test_environments_cached_separately(self, tmp_path: Path) -> None:
+        """Each environment keeps its own templates."""
+        (tmp_path / "default.md.j2").write_text("custom {{ metadata.title }}")
+        default_env = create_jinja_environment()
+        custom_env = create_jinja_environment(template_dir=tmp_path)
+
+        assert get_compiled_template(custom_env, "default.md.j2") is not (
+            get_compiled_template(default_env, "default.md.j2")
+        )
+
+
+class TestBytecodeCache:
+    """Test the on-disk bytecode cache shared across cold starts."""
+
+    def test_second_environment_skips_compilation(self, tmp_path: Path) -> None:
+        """A fresh environment loads bytecode written by a previous one."""
+        cache_dir = tmp_path / "jinja"
+        precompile_templates(create_jinja_environment(bytecode_cache_dir=cache_dir))
+
+        cold_start = create_jinja_environment(bytecode_cache_dir=cache_dir)
+        compiled = _count_compiles(cold_start)
+        precompile_templates(cold_start)
+
+        assert list(cache_dir.iterdir())
+        assert compiled == []
+
+    def test_unwritable_directory_disables_cache(self, tmp_path: Path) -> None:
+        """A cache path that cannot be created falls back to no cache."""
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+
+        env = create_jinja_environment(bytecode_cache_dir=blocker / "jinja")
+
+        assert env.bytecode_cache is None
+        assert get_compiled_template(env, "minimal.md.j2") is not None
+
+
+@pytest.mark.performance
+class TestRenderBenchmark:
+    """Benchmark cold-start and per-article render time per template."""
+
+    ARTICLES = 200
+
+    def test_render_benchmark(
+        self, tmp_path: Path, sample_article_data: Dict[str, Any]
+    ) -> None:
+        """Bytecode cache speeds cold start; cached renders stay fast."""
+        metadata = extract_metadata_from_article(sample_article_data)
+        cache_dir = tmp_path / "jinja"
+        precompile_templates(create_jinja_environment(bytecode_cache_dir=cache_dir))
+
+        results = {}
+        for name in TEMPLATES:
+            start = time.perf_counter()
+            get_compiled_template(create_jinja_environment(), name)
+            cold_compile = time.perf_counter() - start
+
+            start = time.perf_counter()
+            get_compiled_template(
+                create_jinja_environment(bytecode_cache_dir=cache_dir), name
+            )
+            cold_bytecode = time.perf_counter() - start
+
+            env = create_jinja_environment()
+            renders = []
+            for _ in range(self.ARTICLES):
+                start = time.perf_counter()
+                generate_markdown_content(sample_article_data, metadata, env, name)
+                renders.append(time.perf_counter() - start)
+
+            results[name] = (cold_compile, cold_bytecode, statistics.median(renders))
+
+        print("\ntemplate            cold(compile)  cold(bytecode)  render p50")
+        for name, (compile_s, bytecode_s, render_s) in results.items():
+            print(
+                f"{name:<18}  {compile_s * 1000:>10.2f}ms  {bytecode_s * 1000:>11.2f}ms"
+                f"  {render_s * 1000:>8.3f}ms"
+            )
+
+        for compile_s, bytecode_s, render_s in results.values():
+            assert bytecode_s < compile_s
+            assert render_s < 0.05
@@ -19,7 +19,8 @@ import logging
 import os
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
-from typing import Any, AsyncGenerator, Dict
+from typing import Any, AsyncGenerator, Dict, Optional
+from uuid import uuid4
 
 from azure.identity.aio import DefaultAzureCredential
 from azure.storage.blob.aio import BlobServiceClient
@@ -28,18 +29,22 @@ from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.responses import JSONResponse
 from logging_config import configure_secure_logging
 from models import (
+    DeploymentResult,
     HealthCheckResponse,
     MetricsResponse,
     ProcessingStatus,
     PublishRequest,
     PublishResponse,
+    PublishSignal,
 )
+from publish_scheduler import PublishScheduler
 from site_builder import build_and_deploy_site
 
 from config import get_settings  # type: ignore[attr-defined]
 
 # Application Insights monitoring
 from libs.monitoring import configure_application_insights
+from libs.processing_metrics import get_processing_metrics
 from libs.secure_error_handler import ErrorSeverity
 
 # Configure logging first
@@ -57,9 +62,70 @@ app_metrics: Dict[str, Any] = {
     "failed_builds": 0,
     "last_build_time": None,
     "last_build_duration": None,
+    # Fixed-memory build latency quantiles, throughput and error rate
+    "build_metrics": get_processing_metrics("site-publisher"),
+    # Per-phase durations (sync, organize, hugo, validate, deploy, ...)
+    "last_build_phases": {},
+    "phase_metrics": {},
 }
 
 
+def _record_build_phases(phase_timings: Dict[str, float]) -> None:
+    """Record one build's phase durations in per-phase metrics."""
+    app_metrics["last_build_phases"] = dict(phase_timings)
+    for phase, seconds in phase_timings.items():
+        metrics = app_metrics["phase_metrics"].get(phase)
+        if metrics is None:
+            metrics = app_metrics["phase_metrics"][phase] = get_processing_metrics(
+                f"site-publisher.{phase}"
+            )
+        metrics.record(seconds * 1000)
+
+
+def _build_phases() -> Dict[str, Any]:
+    """Phase timing breakdown for /metrics."""
+    return {
+        "last_build_seconds": app_metrics["last_build_phases"],
+        "phases": {
+            phase: metrics.snapshot()
+            for phase, metrics in app_metrics["phase_metrics"].items()
+        },
+    }
+
+
+async def _build_and_record(
+    blob_client: BlobServiceClient, settings: Any, force_rebuild: bool = False
+) -> DeploymentResult:
+    """
+    Run one full build and deploy and update app metrics.
+
+    Only called by the PublishScheduler, so builds never overlap.
+    """
+    app_metrics["total_builds"] += 1
+    try:
+        result = await build_and_deploy_site(
+            blob_client=blob_client, config=settings, force_rebuild=force_rebuild
+        )
+    except Exception:
+        app_metrics["failed_builds"] += 1
+        app_metrics["build_metrics"].record(success=False)
+        raise
+
+    if result.errors:
+        app_metrics["failed_builds"] += 1
+        logger.warning(f"Build had errors: {result.errors}")
+    else:
+        app_metrics["successful_builds"] += 1
+        logger.info(f"Successfully built site ({result.files_uploaded} files)")
+    app_metrics["last_build_time"] = datetime.now(timezone.utc)
+    app_metrics["last_build_duration"] = result.duration_seconds
+    app_metrics["build_metrics"].record(
+        result.duration_seconds * 1000, success=not result.errors
+    )
+    _record_build_phases(result.phase_timings)
+    return result
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Manage application lifecycle with secure initialization."""
@@ -83,6 +149,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         app.state.blob_client = blob_service_client
         app.state.settings = settings
 
+        async def run_build(force_rebuild: bool) -> DeploymentResult:
+            return await _build_and_record(
+                blob_service_client, settings, force_rebuild=force_rebuild
+            )
+
+        publish_scheduler = PublishScheduler(
+            build=run_build, debounce_seconds=settings.publish_debounce_seconds
+        )
+        app.state.publish_scheduler = publish_scheduler
+
         logger.info(
             f"Initialized with storage account: {settings.azure_storage_account_name}"
         )
@@ -99,6 +175,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
             Validates that markdown files were actually generated before triggering build.
             This prevents false builds when no new content was produced.
+
+            Returns only once the coalesced build that satisfies the signal
+            has finished, so the message is completed after the site is
+            published. A build that did not deploy raises, leaving the
+            message on the queue to be retried (up to
+            QUEUE_MAX_DEQUEUE_COUNT deliveries, then it is poisoned);
+            non-fatal errors such as quarantined articles do not.
             """
             try:
                 logger.info(f"Processing queue message {queue_message.message_id}")
@@ -139,53 +222,29 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
                         "files_created": markdown_count,
                     }
 
-                if force_rebuild:
-                    logger.info(
-                        "Force rebuild requested - performing full site rebuild"
-                    )
-                else:
-                    logger.info(
-                        f"Building site: {markdown_count} markdown files ready "
-                        f"({markdown_failed} had issues)"
-                    )
-
-                # Call the build and deploy function
-                result = await build_and_deploy_site(
-                    blob_client=blob_service_client,
-                    config=settings,
-                )
-
-                if len(result.errors) == 0:
-                    app_metrics["successful_builds"] += 1
-                    app_metrics["last_build_time"] = datetime.now(
-                        timezone.utc
-                    ).isoformat()
-                    app_metrics["last_build_duration"] = result.duration_seconds
-                    logger.info(
-                        f"Successfully built site ({result.files_uploaded} files, "
-                        f"{markdown_count} markdown sources)"
-                    )
-                    return {
-                        "status": "success",
-                        "files_uploaded": result.files_uploaded,
-                        "duration": result.duration_seconds,
-                        "markdown_count": markdown_count,
-                    }
-                else:
-                    app_metrics["failed_builds"] += 1
-                    logger.warning(f"Build had errors: {result.errors}")
-                    return {
-                        "status": "error",
-                        "errors": result.errors,
-                        "files_uploaded": result.files_uploaded,
-                        "markdown_count": markdown_count,
-                    }
-
             except Exception as e:
                 logger.error(f"Error processing message: {e}", exc_info=True)
-                app_metrics["failed_builds"] += 1
                 return {"status": "error", "error": str(e)}
 
+            # Coalesce with other pending signals; the scheduler runs at
+            # most one build per debounce window
+            record = await publish_scheduler.submit(
+                PublishSignal(
+                    signal_id=str(queue_message.message_id),
+                    source=queue_message.service_name,
+                    files_created=markdown_count,
+                    force_rebuild=force_rebuild,
+                )
+            )
+            if not record.success:
+                raise RuntimeError(f"Build #{record.build_id} failed: {record.errors}")
+            return {
+                "status": "published",
+                "build_id": record.build_id,
+                "files_created": markdown_count,
+                "force_rebuild": force_rebuild,
+            }
+
         async def startup_queue_processor():
             """
             Process queue messages continuously with graceful self-termination.
@@ -205,14 +264,23 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             empty_checks = 0
 
             while True:
-                # Process one message at a time (Hugo builds are resource-intensive)
+                # Drain pending signals concurrently so the scheduler
+                # coalesces them into a single build (builds never overlap);
+                # each message is completed once its build has finished
                 messages_processed = await process_queue_messages(
                     queue_name=settings.queue_name,
                     message_handler=message_handler,
-                    max_messages=1,
+                    max_messages=settings.queue_drain_batch_size,
+                    max_concurrency=settings.queue_drain_batch_size,
+                    visibility_timeout=settings.queue_visibility_timeout_seconds,
+                    max_dequeue_count=settings.queue_max_dequeue_count,
                 )
 
-                if messages_processed == 0:
+                if messages_processed == 0 and not publish_scheduler.idle:
+                    # A build is pending or running - not idle
+                    last_activity_time = datetime.now(timezone.utc)
+                    await asyncio.sleep(2)
+                elif messages_processed == 0:
                     empty_checks += 1
 
                     # Check if we should gracefully terminate
@@ -263,6 +331,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
         # Cleanup
         logger.info("Shutting down site-publisher container")
+        await publish_scheduler.wait_idle()
         await blob_service_client.close()
         await credential.close()
         logger.info("Site-publisher shutdown complete")
@@ -322,6 +391,11 @@ async def health_check() -> HealthCheckResponse:
     )
 
 
+def _scheduler_stats() -> Optional[Dict[str, Any]]:
+    scheduler = getattr(app.state, "publish_scheduler", None)
+    return scheduler.get_stats() if scheduler else None
+
+
 @app.get("/metrics", response_model=MetricsResponse)
 async def get_metrics() -> MetricsResponse:
     """
@@ -339,6 +413,9 @@ async def get_metrics() -> MetricsResponse:
         last_build_time=app_metrics["last_build_time"],
         last_build_duration=app_metrics["last_build_duration"],
         uptime_seconds=uptime,
+        build_metrics=app_metrics["build_metrics"].snapshot(),
+        build_phases=_build_phases(),
+        publish_scheduler=_scheduler_stats(),
     )
 
 
@@ -361,29 +438,26 @@ async def publish_site(request: PublishRequest) -> PublishResponse:
     try:
         logger.info("Manual publish triggered")
 
-        # Call pure function
-        result = await build_and_deploy_site(
-            blob_client=app.state.blob_client, config=app.state.settings
+        # Coalesced with any pending queue signals; waits for the build
+        # that satisfies this request
+        record = await app.state.publish_scheduler.submit(
+            PublishSignal(
+                signal_id=f"manual-{uuid4().hex[:8]}",
+                source=request.trigger_source,
+                force_rebuild=request.force_rebuild,
+            )
         )
 
-        # Update metrics (immutable style)
-        app_metrics["total_builds"] += 1
-        if len(result.errors) == 0:
-            app_metrics["successful_builds"] += 1
-            response_status = ProcessingStatus.COMPLETED
-        else:
-            app_metrics["failed_builds"] += 1
-            response_status = ProcessingStatus.FAILED
-
-        app_metrics["last_build_time"] = datetime.now(timezone.utc)
-        app_metrics["last_build_duration"] = result.duration_seconds
-
         return PublishResponse(
-            status=response_status,
-            message="Site published" if len(result.errors) == 0 else "Publish failed",
-            files_uploaded=result.files_uploaded,
-            duration_seconds=result.duration_seconds,
-            errors=result.errors,
+            status=(
+                ProcessingStatus.COMPLETED
+                if record.success
+                else ProcessingStatus.FAILED
+            ),
+            message="Site published" if record.success else "Publish failed",
+            files_uploaded=record.files_uploaded,
+            duration_seconds=record.duration_seconds,
+            errors=record.errors,
         )
 
     except Exception as e:
@@ -408,12 +482,14 @@ async def get_status() -> Dict[str, Any]:
     Get current build status.
 
     Returns:
-        Dict with current status and build count
+        Dict with current status, build count and build latency percentiles
     """
     return {
         "status": "idle" if app_metrics["total_builds"] == 0 else "ready",
         "last_build": app_metrics["last_build_time"],
         "builds_today": app_metrics["total_builds"],
+        "build_metrics": app_metrics["build_metrics"].snapshot(),
+        "publish_scheduler": _scheduler_stats(),
     }
 
 
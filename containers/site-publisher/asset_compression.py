@@ -0,0 +1,130 @@
+"""
+Precompression of text assets for site-publisher deploys.
+
+The static website endpoint serves blobs as stored, so text assets are
+compressed once at deploy time and uploaded with a Content-Encoding
+header. There is no Accept-Encoding negotiation: every client receives
+the stored encoding. gzip is understood by all browsers; brotli ("br")
+is smaller but only sent by browsers over HTTPS.
+
+brotli is optional; without it "br" falls back to gzip.
+"""
+
+import gzip
+import logging
+from typing import Any, Dict, Optional
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_ENCODINGS = ("gzip", "br")
+
+COMPRESSIBLE_CONTENT_TYPES = frozenset(
+    {
+        "application/atom+xml",
+        "application/javascript",
+        "application/json",
+        "application/manifest+json",
+        "application/rss+xml",
+        "application/xml",
+        "image/svg+xml",
+        "text/css",
+        "text/html",
+        "text/javascript",
+        "text/plain",
+        "text/xml",
+    }
+)
+
+MIN_COMPRESS_SIZE = 1024  # Smaller files rarely benefit
+MIN_SAVING_RATIO = 0.1  # Keep compressed output only if it saves >= 10%
+
+
+def resolve_encoding(name: Optional[str]) -> Optional[str]:
+    """
+    Turn the DEPLOY_COMPRESSION setting into an encoding.
+
+    Args:
+        name: "none", "gzip" or "br" (case-insensitive; empty means none)
+
+    Returns:
+        Content-Encoding to apply, or None to upload uncompressed
+
+    Raises:
+        ValueError: If the name is not a supported encoding
+    """
+    encoding = (name or "none").strip().lower()
+    if encoding == "none":
+        return None
+    if encoding not in SUPPORTED_ENCODINGS:
+        raise ValueError(f"Unsupported deploy compression: {name}")
+    if encoding == "br" and brotli is None:
+        logger.warning("brotli is not installed, compressing with gzip instead")
+        return "gzip"
+    return encoding
+
+
+def compression_for(entry: Dict[str, Any], encoding: Optional[str]) -> Optional[str]:
+    """
+    Choose the encoding for one manifest entry.
+
+    Args:
+        entry: Manifest entry ({"size", "content_type", ...})
+        encoding: Encoding configured for the deploy (None for none)
+
+    Returns:
+        encoding if the file is a text asset worth compressing, else None
+    """
+    if encoding is None or entry.get("size", 0) < MIN_COMPRESS_SIZE:
+        return None
+    content_type = str(entry.get("content_type") or "").split(";")[0].strip()
+    return encoding if content_type in COMPRESSIBLE_CONTENT_TYPES else None
+
+
+def compress_content(data: bytes, encoding: str) -> bytes:
+    """
+    Compress bytes (CPU-bound; run in a worker pool).
+
+    Output is deterministic so unchanged files compress identically.
+
+    Args:
+        data: Uncompressed file contents
+        encoding: "gzip" or "br"
+
+    Returns:
+        Compressed bytes
+    """
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    if encoding == "br" and brotli is not None:
+        return brotli.compress(data, quality=11)
+    raise ValueError(f"Unsupported content encoding: {encoding}")
+
+
+def decompress_content(data: bytes, encoding: Optional[str]) -> bytes:
+    """
+    Undo compress_content (e.g. when snapshotting a compressed blob).
+
+    Args:
+        data: Stored blob contents
+        encoding: Content-Encoding the blob was stored with (None if plain)
+
+    Returns:
+        Uncompressed bytes
+    """
+    if not encoding:
+        return data
+    if encoding == "gzip":
+        return gzip.decompress(data)
+    if encoding == "br" and brotli is not None:
+        return brotli.decompress(data)
+    raise ValueError(f"Unsupported content encoding: {encoding}")
+
+
+def worth_compressing(original_size: int, compressed_size: int) -> bool:
+    """True if compression saves at least MIN_SAVING_RATIO of the size."""
+    return compressed_size <= original_size * (1 - MIN_SAVING_RATIO)
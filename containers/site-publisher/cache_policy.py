@@ -0,0 +1,130 @@
+"""
+Cache-Control policy for deployed site assets.
+
+Maps each deployed file to a Cache-Control header by path pattern and
+content type. Rules are checked in order and the first match wins;
+custom rules (CACHE_POLICY, JSON) are checked before the defaults:
+
+- Fingerprinted Hugo assets (``stylesheet.<hash>.css``) never change
+  under the same name: cached for a year as immutable
+- Feeds, sitemaps and search indexes (``index.json``, the sharded
+  index manifest): one hour
+- HTML: five minutes, so new articles show up quickly
+- Other static files (images, fonts): one day
+
+Example CACHE_POLICY:
+    [{"pattern": "^images/", "cache_control": "public, max-age=604800"},
+     {"content_types": ["application/pdf"], "cache_control": "no-cache"}]
+"""
+
+import json
+import re
+from functools import lru_cache
+from typing import List, Optional, Pattern
+
+from models import CacheRule
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+MEDIUM_TTL = "public, max-age=3600"
+SHORT_TTL = "public, max-age=300"
+STATIC_TTL = "public, max-age=86400"
+
+DEFAULT_CACHE_RULES: List[CacheRule] = [
+    # Hugo fingerprints are hex digests (md5: 32, sha256: 64, sha512: 128)
+    CacheRule(pattern=r"\.[0-9a-f]{32,128}\.[A-Za-z0-9]+$", cache_control=IMMUTABLE),
+    CacheRule(pattern=r"(^|/)(index|search/manifest)\.json$", cache_control=MEDIUM_TTL),
+    CacheRule(pattern=r"\.xml$", cache_control=MEDIUM_TTL),
+    CacheRule(
+        content_types=[
+            "application/rss+xml",
+            "application/atom+xml",
+            "application/feed+json",
+        ],
+        cache_control=MEDIUM_TTL,
+    ),
+    CacheRule(content_types=["text/html"], cache_control=SHORT_TTL),
+    CacheRule(
+        content_types=["text/css", "application/javascript", "text/javascript"],
+        cache_control=MEDIUM_TTL,
+    ),
+    CacheRule(
+        content_types=["image/", "font/", "video/", "audio/"],
+        cache_control=STATIC_TTL,
+    ),
+]
+
+
+@lru_cache(maxsize=None)
+def _compile(pattern: str) -> Pattern[str]:
+    return re.compile(pattern)
+
+
+def _matches(rule: CacheRule, path: str, content_type: str) -> bool:
+    if rule.pattern is not None and not _compile(rule.pattern).search(path):
+        return False
+    if rule.content_types is not None and not any(
+        content_type.startswith(prefix) for prefix in rule.content_types
+    ):
+        return False
+    return True
+
+
+def cache_control_for(
+    path: str, content_type: str, rules: Optional[List[CacheRule]] = None
+) -> Optional[str]:
+    """
+    Choose the Cache-Control header for a deployed file.
+
+    Args:
+        path: Blob name (relative path, forward slashes)
+        content_type: MIME type the blob is uploaded with
+        rules: Rules to check in order (defaults to DEFAULT_CACHE_RULES)
+
+    Returns:
+        Cache-Control value, or None to leave the header unset
+
+    Examples:
+        >>> cache_control_for("css/main.d41d8cd98f00b204e9800998ecf8427e.css", "text/css")
+        'public, max-age=31536000, immutable'
+        >>> cache_control_for("posts/hello/index.html", "text/html")
+        'public, max-age=300'
+    """
+    content_type = content_type.split(";")[0].strip().lower()
+    for rule in DEFAULT_CACHE_RULES if rules is None else rules:
+        if _matches(rule, path, content_type):
+            return rule.cache_control or None
+    return None
+
+
+def load_cache_rules(policy: Optional[str]) -> List[CacheRule]:
+    """
+    Build the rule list from the CACHE_POLICY setting.
+
+    Args:
+        policy: JSON list of rules ({"pattern", "content_types",
+            "cache_control"}); empty for defaults only
+
+    Returns:
+        Custom rules followed by DEFAULT_CACHE_RULES
+
+    Raises:
+        ValueError: If the policy is not a JSON list of valid rules
+    """
+    if not policy or not policy.strip():
+        return list(DEFAULT_CACHE_RULES)
+
+    try:
+        data = json.loads(policy)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"CACHE_POLICY is not valid JSON: {e}") from e
+    if not isinstance(data, list):
+        raise ValueError("CACHE_POLICY must be a JSON list of rules")
+
+    custom = [CacheRule.model_validate(item) for item in data]
+    for rule in custom:
+        if rule.pattern is not None:
+            try:
+                _compile(rule.pattern)
+            except re.error as e:
+                raise ValueError(f"Invalid CACHE_POLICY pattern {rule.pattern!r}: {e}")
+    return custom + list(DEFAULT_CACHE_RULES)
@@ -22,10 +22,19 @@ class Settings(BaseSettings):
     markdown_container: str = "markdown-content"
     output_container: str = "$web"
     backup_container: str = "$web-backup"
+    backup_snapshot_retention: int = 10  # Snapshots kept for rollback (0 = all)
 
     # Queue Configuration
     queue_name: str = "site-publishing-requests"
     queue_polling_interval_seconds: int = 30
+    queue_drain_batch_size: int = 32  # Signals drained per poll (max 32)
+    publish_debounce_seconds: float = 15.0  # At most one build per window
+    # Signals stay hidden on the queue until their build finishes, so this
+    # must cover the debounce window plus a full build
+    queue_visibility_timeout_seconds: int = 900
+    # Deliveries before a signal whose build keeps failing is moved to
+    # <queue_name>-poison instead of rebuilding forever
+    queue_max_dequeue_count: int = 5
 
     # Hugo Configuration
     hugo_version: str = "0.151.0"
@@ -35,7 +44,14 @@ class Settings(BaseSettings):
     # Build Configuration
     max_markdown_files: int = 10000  # DOS prevention
     max_file_size_mb: int = 10  # Max size per file
+    download_concurrency: int = 16  # Simultaneous markdown blob downloads
+    deploy_concurrency: int = 16  # Simultaneous uploads to $web
+    deploy_compression: str = "none"  # Precompress text assets: none, gzip, br
+    search_index_enabled: bool = True  # Shard index.json for client search
+    cache_policy: str = ""  # JSON Cache-Control rules checked before defaults
+    validation_workers: int = 0  # Frontmatter validation processes (0 = CPU count)
     build_timeout_seconds: int = 300  # 5 minutes
+    workspace_dir: str = "/tmp/site-builder"  # Persistent build workspace
 
     # Logging
     log_level: str = "INFO"
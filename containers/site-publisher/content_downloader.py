@@ -4,16 +4,25 @@ Content downloader for site-publisher.
 Pure functions for downloading and organizing markdown files from blob storage.
 """
 
+import asyncio
+import json
 import logging
+import os
 import re
+import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import List, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-import yaml
 from azure.core.exceptions import ResourceNotFoundError
 from azure.storage.blob.aio import BlobServiceClient
 from error_handling import handle_error
+from frontmatter_validation import (
+    FRONTMATTER_CACHE_NAME,
+    ValidationOutcome,
+    validate_frontmatter_files,
+    validate_frontmatter_text,
+)
 from models import DownloadResult, ValidationResult
 from security import (
     sanitize_error_message,
@@ -23,6 +32,10 @@ from security import (
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_DOWNLOAD_CONCURRENCY = 16
+SYNC_MANIFEST_NAME = ".sync-manifest.json"
+SYNC_MANIFEST_VERSION = 1
+
 
 async def download_markdown_files(
     blob_client: BlobServiceClient,
@@ -30,51 +43,65 @@ async def download_markdown_files(
     output_dir: Path,
     max_files: int = 10000,
     max_file_size: int = 10_485_760,  # 10MB
+    max_concurrency: int = DEFAULT_DOWNLOAD_CONCURRENCY,
 ) -> DownloadResult:
     """
-    Download markdown files from blob storage.
+    Sync markdown files from blob storage into a local mirror.
 
-    Pure function with explicit dependencies and limits.
+    output_dir is a persistent mirror of the container. A manifest
+    (blob name -> ETag/last-modified/size) records what is on disk, so only
+    new or changed blobs are downloaded, concurrently, and local files whose
+    blobs disappeared are deleted.
 
     Args:
         blob_client: Azure blob service client (injected dependency)
         container_name: Name of container with markdown files
-        output_dir: Local directory to download files to
+        output_dir: Local mirror directory (kept between builds)
         max_files: Maximum number of files to download (DOS prevention)
         max_file_size: Maximum size per file in bytes (DOS prevention)
+        max_concurrency: Maximum simultaneous blob downloads
 
     Returns:
-        DownloadResult with list of downloaded files and errors
+        DownloadResult with files/bytes downloaded vs skipped, files
+        deleted, and errors
 
     Raises:
         ValueError: If parameters are invalid
     """
     start_time = datetime.now()
-    logger.info(f"Downloading markdown files from {container_name}")
+    logger.info(f"Syncing markdown files from {container_name} to {output_dir}")
 
-    downloaded_files: List[str] = []
     errors: List[str] = []
 
     try:
         # Validate output directory
         output_dir.mkdir(parents=True, exist_ok=True)
+        manifest_path = output_dir / SYNC_MANIFEST_NAME
+        manifest = load_sync_manifest(manifest_path)
 
         # Get container client
         container_client = blob_client.get_container_client(container_name)
 
         # List all blobs
         blob_list = []
+        listing_complete = True
         async for blob in container_client.list_blobs():
-            blob_list.append(blob)
-
             # DOS prevention: check file count
-            if len(blob_list) > max_files:
+            if len(blob_list) >= max_files:
                 error_msg = f"Too many files in container (max {max_files})"
                 logger.error(error_msg)
                 errors.append(error_msg)
+                listing_complete = False
                 break
 
-        # Download each blob
+            blob_list.append(blob)
+
+        # Decide what needs downloading
+        remote_names: Set[str] = set()
+        to_download: List[Tuple[str, Path, Dict[str, Any]]] = []
+        files_skipped = 0
+        bytes_skipped = 0
+
         for blob in blob_list:
             blob_name = blob.name
 
@@ -92,49 +119,87 @@ async def download_markdown_files(
                 errors.append(error_msg)
                 continue
 
-            # Download blob
-            try:
-                blob_client_obj = container_client.get_blob_client(blob_name)
-                file_path = output_dir / blob_name
+            file_path = output_dir / blob_name
+
+            # Validate file path (prevent directory traversal)
+            path_validation = validate_path(file_path, output_dir)
+            if not path_validation.is_valid:
+                logger.error(f"Invalid path: {file_path} - {path_validation.errors}")
+                errors.extend(path_validation.errors)
+                continue
+
+            remote_names.add(blob_name)
+            entry = _manifest_entry(blob)
+            if _is_unchanged(manifest.get(blob_name), entry, file_path):
+                files_skipped += 1
+                bytes_skipped += entry["size"]
+                continue
 
-                # Ensure parent directory exists
-                file_path.parent.mkdir(parents=True, exist_ok=True)
+            to_download.append((blob_name, file_path, entry))
 
-                # Validate file path (prevent directory traversal)
-                path_validation = validate_path(file_path, output_dir)
-                if not path_validation.is_valid:
-                    logger.error(
-                        f"Invalid path: {file_path} - {path_validation.errors}"
-                    )
-                    errors.extend(path_validation.errors)
-                    continue
+        # Download new and changed blobs concurrently
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
 
-                # Download blob content
+        async def _download(
+            blob_name: str, file_path: Path, entry: Dict[str, Any]
+        ) -> int:
+            async with semaphore:
+                blob_client_obj = container_client.get_blob_client(blob_name)
                 download_stream = await blob_client_obj.download_blob()
                 content = await download_stream.readall()
 
-                # Write to file
-                file_path.write_bytes(content)
-                downloaded_files.append(str(file_path))
-                logger.debug(f"Downloaded: {blob_name}")
+            # Write to a new file and rename, so hardlinks in the Hugo
+            # content tree keep the previous version until re-organized
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = file_path.with_name(f".{file_path.name}.download")
+            tmp_path.write_bytes(content)
+            os.replace(tmp_path, file_path)
+            entry["size"] = len(content)
+            manifest[blob_name] = entry
+            logger.debug(f"Downloaded: {blob_name}")
+            return len(content)
+
+        outcomes = await asyncio.gather(
+            *(_download(*item) for item in to_download), return_exceptions=True
+        )
 
-            except ResourceNotFoundError:
+        files_downloaded = 0
+        bytes_downloaded = 0
+        for (blob_name, _, _), outcome in zip(to_download, outcomes):
+            if isinstance(outcome, ResourceNotFoundError):
                 error_msg = f"Blob not found: {blob_name}"
                 logger.warning(error_msg)
                 errors.append(error_msg)
-            except Exception as e:
+            elif isinstance(outcome, BaseException):
                 error_info = handle_error(
-                    e, error_type="download", context={"blob": blob_name}
+                    outcome, error_type="download", context={"blob": blob_name}
                 )
-                errors.append(sanitize_error_message(e))
+                errors.append(sanitize_error_message(outcome))
+            else:
+                files_downloaded += 1
+                bytes_downloaded += outcome
+
+        # Delete local files whose blobs disappeared (only when the listing
+        # is complete, otherwise unlisted blobs would look deleted)
+        files_deleted = 0
+        if listing_complete:
+            files_deleted = _delete_removed_files(output_dir, manifest, remote_names)
+
+        save_sync_manifest(manifest_path, manifest)
 
         duration = (datetime.now() - start_time).total_seconds()
         logger.info(
-            f"Downloaded {len(downloaded_files)} files with {len(errors)} errors in {duration:.2f}s"
+            f"Downloaded {files_downloaded} files ({bytes_downloaded} bytes), "
+            f"skipped {files_skipped} unchanged ({bytes_skipped} bytes), "
+            f"deleted {files_deleted}, {len(errors)} errors in {duration:.2f}s"
         )
 
         return DownloadResult(
-            files_downloaded=len(downloaded_files),
+            files_downloaded=files_downloaded,
+            files_skipped=files_skipped,
+            files_deleted=files_deleted,
+            bytes_downloaded=bytes_downloaded,
+            bytes_skipped=bytes_skipped,
             duration_seconds=duration,
             errors=errors,
         )
@@ -151,6 +216,100 @@ async def download_markdown_files(
         )
 
 
+def load_sync_manifest(manifest_path: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Load the local mirror manifest.
+
+    Args:
+        manifest_path: Path to the manifest JSON file
+
+    Returns:
+        Mapping of blob name to {etag, last_modified, size}; empty if the
+        manifest is missing or unreadable (forces a full sync)
+    """
+    try:
+        data = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable sync manifest {manifest_path}: {e}")
+        return {}
+
+    if not isinstance(data, dict) or data.get("version") != SYNC_MANIFEST_VERSION:
+        return {}
+    blobs = data.get("blobs")
+    return blobs if isinstance(blobs, dict) else {}
+
+
+def save_sync_manifest(
+    manifest_path: Path, manifest: Dict[str, Dict[str, Any]]
+) -> None:
+    """
+    Atomically write the local mirror manifest.
+
+    Args:
+        manifest_path: Path to the manifest JSON file
+        manifest: Mapping of blob name to {etag, last_modified, size}
+    """
+    tmp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+    tmp_path.write_text(
+        json.dumps({"version": SYNC_MANIFEST_VERSION, "blobs": manifest}),
+        encoding="utf-8",
+    )
+    os.replace(tmp_path, manifest_path)
+
+
+def _manifest_entry(blob: Any) -> Dict[str, Any]:
+    """Build a manifest entry from blob listing properties."""
+    etag = getattr(blob, "etag", None)
+    last_modified = getattr(blob, "last_modified", None)
+    return {
+        "etag": etag if isinstance(etag, str) else None,
+        "last_modified": (
+            last_modified.isoformat() if isinstance(last_modified, datetime) else None
+        ),
+        "size": blob.size if isinstance(blob.size, int) else 0,
+    }
+
+
+def _is_unchanged(
+    previous: Optional[Dict[str, Any]], current: Dict[str, Any], file_path: Path
+) -> bool:
+    """True if the mirrored file matches the blob's current version."""
+    if not previous or (current["etag"] is None and current["last_modified"] is None):
+        return False
+    if (previous.get("etag"), previous.get("last_modified")) != (
+        current["etag"],
+        current["last_modified"],
+    ):
+        return False
+    try:
+        return file_path.stat().st_size == previous.get("size")
+    except OSError:
+        return False
+
+
+def _delete_removed_files(
+    output_dir: Path, manifest: Dict[str, Dict[str, Any]], remote_names: Set[str]
+) -> int:
+    """Remove mirrored files (and manifest entries) for deleted blobs."""
+    for blob_name in [name for name in manifest if name not in remote_names]:
+        manifest.pop(blob_name)
+
+    # Sweep the mirror rather than trusting the manifest alone, so files
+    # left by an interrupted sync or an older non-incremental build go too
+    deleted = 0
+    for file_path in output_dir.rglob("*"):
+        blob_name = file_path.relative_to(output_dir).as_posix()
+        if blob_name.startswith(SYNC_MANIFEST_NAME) or not file_path.is_file():
+            continue
+        if blob_name not in remote_names:
+            file_path.unlink(missing_ok=True)
+            logger.debug(f"Deleted removed blob from mirror: {blob_name}")
+            deleted += 1
+    return deleted
+
+
 def validate_markdown_frontmatter(file_path: Path) -> Tuple[bool, List[str]]:
     """
     Validate that a markdown file has valid YAML frontmatter.
@@ -166,89 +325,189 @@ def validate_markdown_frontmatter(file_path: Path) -> Tuple[bool, List[str]]:
     Returns:
         Tuple of (is_valid, errors) where is_valid is True if frontmatter is valid
     """
-    errors = []
-
     try:
         content = file_path.read_text(encoding="utf-8")
+    except Exception as e:
+        return False, [f"Failed to read file: {str(e)}"]
 
-        # Check for frontmatter delimiters
-        if not content.startswith("---"):
-            errors.append(f"Missing frontmatter opening delimiter (---)")
-            return False, errors
+    return validate_frontmatter_text(content)
 
-        # Extract frontmatter (between first two --- markers)
-        parts = content.split("---", 2)
-        if len(parts) < 3:
-            errors.append(f"Missing frontmatter closing delimiter (---)")
-            return False, errors
 
-        frontmatter_text = parts[1].strip()
+def _same_file(left: Path, right: Path) -> bool:
+    """True if both paths exist and are hardlinks to the same file."""
+    try:
+        return os.path.samefile(left, right)
+    except OSError:
+        return False
 
-        if not frontmatter_text:
-            errors.append(f"Empty frontmatter")
-            return False, errors
 
-        # Try to parse YAML
-        try:
-            frontmatter = yaml.safe_load(frontmatter_text)
+def link_or_copy(source: Path, target: Path) -> bool:
+    """
+    Place source at target as a hardlink, copying only across filesystems.
+
+    The target is replaced atomically (link to a temporary name, then
+    rename), so Hugo never sees a partially written file.
 
-            if not isinstance(frontmatter, dict):
-                errors.append(f"Frontmatter is not a dictionary")
-                return False, errors
+    Args:
+        source: File in the content mirror
+        target: Path in the Hugo content tree
 
-            # Check for Hugo required fields (per Hugo specification)
-            # Hugo requires: title, date (can have default)
-            # Custom fields like url/source should be under params
-            if "title" not in frontmatter:
-                errors.append(f"Missing required field: title")
+    Returns:
+        True if hardlinked, False if it had to be copied
+    """
+    tmp_path = target.with_name(f".{target.name}.tmp")
+    tmp_path.unlink(missing_ok=True)
+    try:
+        os.link(source, tmp_path)
+        linked = True
+    except OSError:
+        # Cross-device (EXDEV) or filesystem without hardlinks
+        shutil.copy2(source, tmp_path)
+        linked = False
+    os.replace(tmp_path, target)
+    return linked
+
+
+def _scan_content(
+    content_dir: Path, hugo_content_dir: Path, quarantine_dir: Path
+) -> Tuple[List[Path], List[Path]]:
+    """
+    List mirrored markdown files and those not yet linked into Hugo.
 
-            if "date" not in frontmatter:
-                errors.append(f"Missing required field: date")
+    Creates the Hugo content and quarantine directories. Blocking; run
+    via asyncio.to_thread.
+
+    Returns:
+        (all markdown files, files changed since the previous build)
+    """
+    hugo_content_dir.mkdir(parents=True, exist_ok=True)
+    quarantine_dir.mkdir(parents=True, exist_ok=True)
+
+    md_files = list(content_dir.rglob("*.md"))
+    # Files still linked from the previous build were already validated
+    changed_files = [
+        md_file
+        for md_file in md_files
+        if not _same_file(md_file, hugo_content_dir / md_file.relative_to(content_dir))
+    ]
+    return md_files, changed_files
+
+
+def _organize_files(
+    md_files: List[Path],
+    validation_results: Dict[Path, ValidationOutcome],
+    content_dir: Path,
+    hugo_content_dir: Path,
+    quarantine_dir: Path,
+    errors: List[str],
+    quarantined_files: List[str],
+) -> Dict[str, int]:
+    """
+    Link valid files into Hugo, quarantine invalid ones, drop stale content.
 
-            # Validate title type
-            if "title" in frontmatter and not isinstance(frontmatter["title"], str):
-                errors.append(f"Field 'title' must be string")
+    Blocking; run via asyncio.to_thread. Errors and quarantined paths are
+    appended to the given lists.
 
-            # Validate date type (should be string in ISO8601 format)
-            if "date" in frontmatter and not isinstance(frontmatter["date"], str):
-                errors.append(f"Field 'date' must be string (ISO8601)")
+    Returns:
+        Counts of valid, unchanged, linked, copied and removed files
+    """
+    valid_count = 0
+    linked_count = 0
+    copied_count = 0
+    unchanged_count = 0
+    organized: Set[Path] = set()
+    for md_file in md_files:
+        try:
+            # Calculate relative path
+            rel_path = md_file.relative_to(content_dir)
+            target_path = hugo_content_dir / rel_path
 
-            # Validate params structure if present (Hugo custom fields)
-            if "params" in frontmatter:
-                if not isinstance(frontmatter["params"], dict):
-                    errors.append(f"Field 'params' must be dictionary")
-                # Optionally check for expected params (url, source)
-                elif "original_url" not in frontmatter["params"]:
-                    # Note: This is a warning-level issue, not critical
-                    logger.debug(f"Params missing 'original_url' field (non-critical)")
+            if md_file not in validation_results:
+                organized.add(rel_path)
+                valid_count += 1
+                unchanged_count += 1
+                continue
 
-            if errors:
-                return False, errors
+            is_valid, validation_errors = validation_results[md_file]
 
-            return True, []
+            if not is_valid:
+                # Quarantine malformed file instead of failing entire build
+                quarantine_path = quarantine_dir / rel_path
+                quarantine_path.parent.mkdir(parents=True, exist_ok=True)
 
-        except yaml.YAMLError as e:
-            errors.append(f"Invalid YAML syntax: {str(e)}")
-            return False, errors
+                # Copy to quarantine (the content dir is a persistent
+                # mirror; moving would force a re-download next build)
+                shutil.copy2(md_file, quarantine_path)
 
-    except Exception as e:
-        errors.append(f"Failed to read file: {str(e)}")
-        return False, errors
+                error_msg = f"Quarantined malformed file {md_file.name}: {', '.join(validation_errors)}"
+                logger.warning(error_msg)
+                errors.append(error_msg)
+                quarantined_files.append(str(rel_path))
+                continue
+
+            # Validate target path
+            path_validation = validate_path(target_path, hugo_content_dir)
+            if not path_validation.is_valid:
+                errors.extend(path_validation.errors)
+                continue
+
+            # Create parent directory
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Hardlink (or copy across filesystems)
+            if link_or_copy(md_file, target_path):
+                linked_count += 1
+            else:
+                copied_count += 1
+            organized.add(rel_path)
+            logger.debug(f"Organized: {rel_path}")
+            valid_count += 1
+
+        except Exception as e:
+            error_info = handle_error(
+                e, error_type="organize", context={"file": str(md_file)}
+            )
+            errors.append(
+                f"Failed to organize {md_file.name}: {sanitize_error_message(e)}"
+            )
+
+    # Remove content that was deleted from the mirror or became invalid
+    removed_count = 0
+    for existing in list(hugo_content_dir.rglob("*.md")):
+        if existing.relative_to(hugo_content_dir) not in organized:
+            existing.unlink()
+            removed_count += 1
+
+    return {
+        "valid": valid_count,
+        "unchanged": unchanged_count,
+        "linked": linked_count,
+        "copied": copied_count,
+        "removed": removed_count,
+    }
 
 
 async def organize_content_for_hugo(
     content_dir: Path,
     hugo_content_dir: Path,
+    max_workers: Optional[int] = None,
 ) -> ValidationResult:
     """
     Organize downloaded markdown files for Hugo.
 
     Validates YAML frontmatter and quarantines malformed files to prevent
-    Hugo build failures. Only valid files are copied to Hugo content directory.
+    Hugo build failures. Valid files are hardlinked into the Hugo content
+    directory (copied only across filesystems), so no file contents are
+    read or written. Files still linked from the previous build are left
+    in place without re-validation, and files no longer valid or present
+    in the mirror are removed, making repeat builds metadata-only work.
+    Changed files are validated in a process pool, reusing results cached
+    by content hash in the workspace.
 
     Args:
         content_dir: Directory with downloaded markdown files
         hugo_content_dir: Hugo content directory (usually hugo-site/content)
+        max_workers: Validation process pool size (None for CPU count)
 
     Returns:
         ValidationResult with any errors (non-blocking - malformed files are quarantined)
@@ -267,66 +526,41 @@ async def organize_content_for_hugo(
                 is_valid=False, errors=[f"Content directory not found: {content_dir}"]
             )
 
-        # Create Hugo content directory
-        hugo_content_dir.mkdir(parents=True, exist_ok=True)
-
-        # Create quarantine directory for malformed files
+        # Directory scans, links, copies and deletes are blocking
+        # filesystem work, so they run off the event loop
         quarantine_dir = content_dir.parent / "quarantined"
-        quarantine_dir.mkdir(parents=True, exist_ok=True)
-
-        # Copy markdown files to Hugo content directory
-        md_files = list(content_dir.rglob("*.md"))
+        md_files, changed_files = await asyncio.to_thread(
+            _scan_content, content_dir, hugo_content_dir, quarantine_dir
+        )
         logger.info(f"Found {len(md_files)} markdown files to organize")
 
-        valid_count = 0
-        for md_file in md_files:
-            try:
-                # Validate YAML frontmatter before organizing
-                is_valid, validation_errors = validate_markdown_frontmatter(md_file)
-
-                if not is_valid:
-                    # Quarantine malformed file instead of failing entire build
-                    rel_path = md_file.relative_to(content_dir)
-                    quarantine_path = quarantine_dir / rel_path
-                    quarantine_path.parent.mkdir(parents=True, exist_ok=True)
-
-                    # Move to quarantine
-                    md_file.rename(quarantine_path)
-
-                    error_msg = f"Quarantined malformed file {md_file.name}: {', '.join(validation_errors)}"
-                    logger.warning(error_msg)
-                    errors.append(error_msg)
-                    quarantined_files.append(str(rel_path))
-                    continue
-
-                # Calculate relative path
-                rel_path = md_file.relative_to(content_dir)
-                target_path = hugo_content_dir / rel_path
-
-                # Validate target path
-                path_validation = validate_path(target_path, hugo_content_dir)
-                if not path_validation.is_valid:
-                    errors.extend(path_validation.errors)
-                    continue
-
-                # Create parent directory
-                target_path.parent.mkdir(parents=True, exist_ok=True)
-
-                # Copy file
-                target_path.write_bytes(md_file.read_bytes())
-                logger.debug(f"Organized: {rel_path}")
-                valid_count += 1
+        # Validate YAML frontmatter before organizing (parallel, cached by
+        # hash). Only changed files are passed, so entries for unchanged
+        # articles must survive in the cache.
+        validation_results, _ = await validate_frontmatter_files(
+            changed_files,
+            cache_path=content_dir.parent / FRONTMATTER_CACHE_NAME,
+            max_workers=max_workers,
+            prune=False,
+        )
 
-            except Exception as e:
-                error_info = handle_error(
-                    e, error_type="organize", context={"file": str(md_file)}
-                )
-                errors.append(
-                    f"Failed to organize {md_file.name}: {sanitize_error_message(e)}"
-                )
+        counts = await asyncio.to_thread(
+            _organize_files,
+            md_files,
+            validation_results,
+            content_dir,
+            hugo_content_dir,
+            quarantine_dir,
+            errors,
+            quarantined_files,
+        )
+        valid_count = counts["valid"]
 
         logger.info(
-            f"Organized {valid_count} valid files, quarantined {len(quarantined_files)} malformed files, "
+            f"Organized {valid_count} valid files ({counts['unchanged']} unchanged, "
+            f"{counts['linked']} linked, {counts['copied']} copied, "
+            f"{counts['removed']} removed), "
+            f"quarantined {len(quarantined_files)} malformed files, "
             f"{len(errors) - len(quarantined_files)} other errors"
         )
 
@@ -0,0 +1,386 @@
+"""
+Content-hash deploy manifest and snapshot store for site-publisher.
+
+Pure functions for diffing Hugo output (hashed by output_scanner) against
+the previously deployed manifest, and storing the manifest in the private
+backup container (never in the public site container). Deploys
+upload only changed files and delete removed files using the previous
+manifest instead of listing the whole container.
+
+Backups are versioned snapshots in the backup container:
+
+- ``objects/<aa>/<sha256>``: file contents, stored once per content hash
+- ``snapshots/<id>.json``: manifest (path -> content hash) of a deployed site
+- ``snapshots/latest.json``: pointer to the most recent snapshot
+
+Rollback re-deploys a snapshot manifest with the same diff engine. Only
+the newest snapshots are retained; objects no retained snapshot refers
+to are garbage-collected after each backup.
+"""
+
+import asyncio
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from azure.core.exceptions import ResourceNotFoundError
+from azure.storage.blob import ContentSettings
+from models import ManifestDiff
+
+from libs.blob_batch import delete_blobs_batched
+
+logger = logging.getLogger(__name__)
+
+# Deploy manifests live in the private backup container, one per site
+# container, so they are never served from the public website endpoint
+DEPLOY_MANIFEST_PREFIX = "deploys/"
+DEPLOY_MANIFEST_VERSION = 1
+# Manifest name formerly written into the site container; deploys now
+# remove it as a stale file and backups never snapshot it
+LEGACY_DEPLOY_MANIFEST_BLOB = ".deploy-manifest.json"
+
+# Snapshot store layout in the backup container
+OBJECT_PREFIX = "objects/"
+SNAPSHOT_PREFIX = "snapshots/"
+SNAPSHOT_POINTER_BLOB = "snapshots/latest.json"
+
+# Snapshots kept after each backup (0 keeps every snapshot)
+DEFAULT_SNAPSHOT_RETENTION = 10
+# Objects younger than this are never collected: they may belong to a
+# snapshot another publisher is still writing
+OBJECT_GC_GRACE = timedelta(hours=1)
+
+# blob name -> {"sha256": hex digest, "size": bytes, "content_type": MIME type}
+# plus "compression" (requested encoding), "content_encoding" (stored
+# encoding, when compression paid off) and "cache_control"; sha256 and size
+# are uncompressed
+ManifestFiles = Dict[str, Dict[str, Any]]
+
+# Entry fields whose change requires re-uploading the blob
+DIFF_KEYS = ("sha256", "compression", "cache_control")
+
+
+def diff_manifests(
+    previous: Optional[ManifestFiles], current: ManifestFiles
+) -> ManifestDiff:
+    """
+    Compare the deployed manifest with a new build.
+
+    Args:
+        previous: Manifest of the deployed site (None if unknown)
+        current: Manifest of the new build
+
+    Returns:
+        ManifestDiff listing changed (new or modified, including changed
+        compression or cache headers), unchanged and deleted blob names
+    """
+    previous = previous or {}
+    changed = []
+    unchanged = []
+    for blob_name, entry in current.items():
+        old = previous.get(blob_name)
+        if old is not None and all(old.get(key) == entry.get(key) for key in DIFF_KEYS):
+            unchanged.append(blob_name)
+        else:
+            changed.append(blob_name)
+
+    deleted = [name for name in previous if name not in current]
+    return ManifestDiff(changed=changed, unchanged=unchanged, deleted=deleted)
+
+
+async def read_json_blob(container_client: Any, blob_name: str) -> Optional[Any]:
+    """
+    Download and parse a JSON blob.
+
+    Args:
+        container_client: Container client holding the blob
+        blob_name: Name of the JSON blob
+
+    Returns:
+        Parsed JSON, or None if the blob is missing or unreadable
+    """
+    try:
+        blob = container_client.get_blob_client(blob_name)
+        stream = await blob.download_blob()
+        return json.loads(await stream.readall())
+    except ResourceNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable {blob_name}: {e}")
+        return None
+
+
+async def write_json_blob(container_client: Any, blob_name: str, data: Any) -> None:
+    """
+    Serialize and upload a JSON blob (overwriting).
+
+    Args:
+        container_client: Container client to write to
+        blob_name: Name of the JSON blob
+        data: JSON-serializable data
+    """
+    blob = container_client.get_blob_client(blob_name)
+    await blob.upload_blob(
+        json.dumps(data).encode("utf-8"),
+        overwrite=True,
+        content_settings=ContentSettings(content_type="application/json"),
+    )
+
+
+def _manifest_files(data: Any) -> Optional[ManifestFiles]:
+    if not isinstance(data, dict) or data.get("version") != DEPLOY_MANIFEST_VERSION:
+        return None
+    files = data.get("files")
+    return files if isinstance(files, dict) else None
+
+
+def deploy_manifest_blob(site_container: str) -> str:
+    """
+    Name of the deploy manifest for a site container.
+
+    Args:
+        site_container: Site container the manifest describes (e.g. "$web")
+
+    Returns:
+        Blob name in the manifest (backup) container
+    """
+    return f"{DEPLOY_MANIFEST_PREFIX}{site_container}.json"
+
+
+async def load_deploy_manifest(
+    manifest_client: Any, site_container: str
+) -> Optional[ManifestFiles]:
+    """
+    Load the manifest of the currently deployed site.
+
+    Args:
+        manifest_client: Container client for the private manifest container
+        site_container: Site container the manifest describes
+
+    Returns:
+        Manifest files mapping, or None if there is no usable manifest
+        (first deploy, site cleared, or unreadable manifest)
+    """
+    files = _manifest_files(
+        await read_json_blob(manifest_client, deploy_manifest_blob(site_container))
+    )
+    if files is None:
+        logger.info("No usable deploy manifest found, deploying all files")
+    return files
+
+
+async def save_deploy_manifest(
+    manifest_client: Any, site_container: str, files: ManifestFiles
+) -> None:
+    """
+    Store the manifest of the deployed site.
+
+    Written after all uploads and deletions, so an interrupted deploy
+    leaves the previous manifest in place and the next deploy re-diffs.
+
+    Args:
+        manifest_client: Container client for the private manifest container
+        site_container: Site container the manifest describes
+        files: Manifest files mapping of what is now deployed
+    """
+    await write_json_blob(
+        manifest_client,
+        deploy_manifest_blob(site_container),
+        {
+            "version": DEPLOY_MANIFEST_VERSION,
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "files": files,
+        },
+    )
+
+
+def object_blob_name(sha256: str) -> str:
+    """
+    Name of the content-addressed object for a hash.
+
+    Args:
+        sha256: Content hex digest
+
+    Returns:
+        Blob name in the backup container (e.g. "objects/ab/ab12...")
+    """
+    return f"{OBJECT_PREFIX}{sha256[:2]}/{sha256}"
+
+
+def new_snapshot_id() -> str:
+    """
+    Create a sortable snapshot id from the current UTC time.
+
+    Returns:
+        Snapshot id (e.g. "20251018T120000123456Z")
+    """
+    return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+
+
+def same_content(left: Optional[ManifestFiles], right: Optional[ManifestFiles]) -> bool:
+    """True if two manifests map the same paths to the same hashes."""
+    if left is None or right is None:
+        return False
+    return {name: entry.get("sha256") for name, entry in left.items()} == {
+        name: entry.get("sha256") for name, entry in right.items()
+    }
+
+
+async def load_snapshot(
+    backup_client: Any, snapshot_id: Optional[str] = None
+) -> Optional[Tuple[str, ManifestFiles]]:
+    """
+    Load a snapshot manifest from the backup container.
+
+    Args:
+        backup_client: Container client for the backup container
+        snapshot_id: Snapshot to load (None for the latest)
+
+    Returns:
+        (snapshot id, manifest files), or None if not found
+    """
+    if snapshot_id is None:
+        pointer = await read_json_blob(backup_client, SNAPSHOT_POINTER_BLOB)
+        if not isinstance(pointer, dict) or not pointer.get("snapshot_id"):
+            return None
+        snapshot_id = str(pointer["snapshot_id"])
+
+    files = _manifest_files(
+        await read_json_blob(backup_client, f"{SNAPSHOT_PREFIX}{snapshot_id}.json")
+    )
+    return (snapshot_id, files) if files is not None else None
+
+
+async def save_snapshot(
+    backup_client: Any,
+    snapshot_id: str,
+    files: ManifestFiles,
+    previous_snapshot_id: Optional[str] = None,
+) -> None:
+    """
+    Store a snapshot manifest and point "latest" at it.
+
+    Objects must already be stored; the pointer is written last so a
+    partially written snapshot is never used for rollback.
+
+    Args:
+        backup_client: Container client for the backup container
+        snapshot_id: Id of the new snapshot
+        files: Manifest files of the snapshotted site
+        previous_snapshot_id: Snapshot this one supersedes
+    """
+    await write_json_blob(
+        backup_client,
+        f"{SNAPSHOT_PREFIX}{snapshot_id}.json",
+        {
+            "version": DEPLOY_MANIFEST_VERSION,
+            "snapshot_id": snapshot_id,
+            "previous_snapshot_id": previous_snapshot_id,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "files": files,
+        },
+    )
+    await write_json_blob(
+        backup_client,
+        SNAPSHOT_POINTER_BLOB,
+        {"snapshot_id": snapshot_id, "previous_snapshot_id": previous_snapshot_id},
+    )
+
+
+def snapshots_to_prune(
+    snapshot_ids: List[str], keep: int, latest_id: Optional[str] = None
+) -> List[str]:
+    """
+    Select the snapshots that fall outside the retention window.
+
+    Snapshot ids sort chronologically, so the newest ``keep`` ids are
+    retained. The snapshot "latest" points at is always retained.
+
+    Args:
+        snapshot_ids: Ids of all stored snapshots
+        keep: Number of newest snapshots to retain (0 retains all)
+        latest_id: Id the "latest" pointer refers to
+
+    Returns:
+        Ids to delete, oldest first
+    """
+    if keep <= 0:
+        return []
+    ordered = sorted(snapshot_ids)
+    return [sid for sid in ordered[: max(0, len(ordered) - keep)] if sid != latest_id]
+
+
+def _is_recent(blob: Any, cutoff: datetime) -> bool:
+    last_modified = getattr(blob, "last_modified", None)
+    return isinstance(last_modified, datetime) and last_modified >= cutoff
+
+
+async def prune_snapshots(
+    backup_client: Any,
+    keep: int = DEFAULT_SNAPSHOT_RETENTION,
+    latest_id: Optional[str] = None,
+) -> Tuple[int, int]:
+    """
+    Delete snapshots beyond the retention window and unreferenced objects.
+
+    Objects are only collected once every retained snapshot manifest has
+    been read, so an unreadable manifest never loses the objects it needs.
+
+    Args:
+        backup_client: Container client for the backup container
+        keep: Number of newest snapshots to retain (0 retains all)
+        latest_id: Id the "latest" pointer refers to (always retained)
+
+    Returns:
+        (snapshots deleted, objects deleted)
+    """
+    snapshot_ids = [
+        blob.name[len(SNAPSHOT_PREFIX) : -len(".json")]
+        async for blob in backup_client.list_blobs(name_starts_with=SNAPSHOT_PREFIX)
+        if blob.name.endswith(".json") and blob.name != SNAPSHOT_POINTER_BLOB
+    ]
+    expired = snapshots_to_prune(snapshot_ids, keep, latest_id)
+    if not expired:
+        return 0, 0
+
+    expired_set = set(expired)
+    retained = [sid for sid in snapshot_ids if sid not in expired_set]
+    snapshots = await asyncio.gather(
+        *(load_snapshot(backup_client, sid) for sid in retained)
+    )
+    referenced: Set[str] = set()
+    for snapshot_id, snapshot in zip(retained, snapshots):
+        if snapshot is None:
+            logger.warning(
+                f"Snapshot {snapshot_id} unreadable, skipping backup retention"
+            )
+            return 0, 0
+        referenced.update(str(entry.get("sha256")) for entry in snapshot[1].values())
+
+    snapshots_result = await delete_blobs_batched(
+        backup_client, [f"{SNAPSHOT_PREFIX}{sid}.json" for sid in expired]
+    )
+    if snapshots_result.failed:
+        # Objects of a snapshot that is still stored must not be collected
+        logger.warning(
+            f"Failed to delete {len(snapshots_result.failed)} snapshots, "
+            "skipping object collection"
+        )
+        return snapshots_result.deleted, 0
+
+    cutoff = datetime.now(timezone.utc) - OBJECT_GC_GRACE
+    unreferenced = [
+        blob.name
+        async for blob in backup_client.list_blobs(name_starts_with=OBJECT_PREFIX)
+        if blob.name.rsplit("/", 1)[-1] not in referenced
+        and not _is_recent(blob, cutoff)
+    ]
+    objects_result = await delete_blobs_batched(backup_client, unreferenced)
+
+    logger.info(
+        f"Pruned {snapshots_result.deleted} snapshots and "
+        f"{objects_result.deleted} unreferenced objects "
+        f"({len(retained)} snapshots retained)"
+    )
+    return snapshots_result.deleted, objects_result.deleted
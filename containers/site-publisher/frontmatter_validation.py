@@ -0,0 +1,279 @@
+"""
+Parallel, cached frontmatter validation for site-publisher.
+
+Parsing YAML frontmatter is CPU-bound, so it runs in a process pool off
+the event loop. Results are cached by content hash in the workspace
+(``.frontmatter-cache.json``) across builds, so only new or changed
+articles are parsed.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import yaml
+from models import FrontmatterValidationStats
+
+logger = logging.getLogger(__name__)
+
+FRONTMATTER_CACHE_NAME = ".frontmatter-cache.json"
+FRONTMATTER_CACHE_VERSION = 1
+# Bound on cached hashes when callers validate only a subset of the site
+FRONTMATTER_CACHE_MAX_ENTRIES = 50000
+
+# Below this many files to parse, a process pool costs more than it saves
+PROCESS_POOL_MIN_FILES = 64
+VALIDATION_CHUNK_SIZE = 100
+
+# (is_valid, errors)
+ValidationOutcome = Tuple[bool, List[str]]
+
+
+def validate_frontmatter_text(content: str) -> ValidationOutcome:
+    """
+    Validate the YAML frontmatter of markdown text.
+
+    Uses strict validation rules matching Hugo's requirements:
+    - All string values should be properly quoted
+    - URLs must be quoted to avoid YAML parser ambiguity
+    - Required fields must be present
+
+    Args:
+        content: Markdown file contents
+
+    Returns:
+        Tuple of (is_valid, errors) where is_valid is True if frontmatter is valid
+    """
+    errors = []
+
+    # Check for frontmatter delimiters
+    if not content.startswith("---"):
+        errors.append(f"Missing frontmatter opening delimiter (---)")
+        return False, errors
+
+    # Extract frontmatter (between first two --- markers)
+    parts = content.split("---", 2)
+    if len(parts) < 3:
+        errors.append(f"Missing frontmatter closing delimiter (---)")
+        return False, errors
+
+    frontmatter_text = parts[1].strip()
+
+    if not frontmatter_text:
+        errors.append(f"Empty frontmatter")
+        return False, errors
+
+    # Try to parse YAML
+    try:
+        frontmatter = yaml.safe_load(frontmatter_text)
+
+        if not isinstance(frontmatter, dict):
+            errors.append(f"Frontmatter is not a dictionary")
+            return False, errors
+
+        # Check for Hugo required fields (per Hugo specification)
+        # Hugo requires: title, date (can have default)
+        # Custom fields like url/source should be under params
+        if "title" not in frontmatter:
+            errors.append(f"Missing required field: title")
+
+        if "date" not in frontmatter:
+            errors.append(f"Missing required field: date")
+
+        # Validate title type
+        if "title" in frontmatter and not isinstance(frontmatter["title"], str):
+            errors.append(f"Field 'title' must be string")
+
+        # Validate date type (should be string in ISO8601 format)
+        if "date" in frontmatter and not isinstance(frontmatter["date"], str):
+            errors.append(f"Field 'date' must be string (ISO8601)")
+
+        # Validate params structure if present (Hugo custom fields)
+        if "params" in frontmatter:
+            if not isinstance(frontmatter["params"], dict):
+                errors.append(f"Field 'params' must be dictionary")
+            # Optionally check for expected params (url, source)
+            elif "original_url" not in frontmatter["params"]:
+                # Note: This is a warning-level issue, not critical
+                logger.debug(f"Params missing 'original_url' field (non-critical)")
+
+        if errors:
+            return False, errors
+
+        return True, []
+
+    except yaml.YAMLError as e:
+        errors.append(f"Invalid YAML syntax: {str(e)}")
+        return False, errors
+
+
+def _validate_batch(contents: List[str]) -> List[ValidationOutcome]:
+    """Process pool worker: validate a chunk of files in one round trip."""
+    return [validate_frontmatter_text(content) for content in contents]
+
+
+def _read_and_hash(
+    paths: List[Path],
+) -> Tuple[Dict[Path, Tuple[str, str]], Dict[Path, ValidationOutcome]]:
+    """Read files, returning (path -> (sha256, text)) and read failures."""
+    contents: Dict[Path, Tuple[str, str]] = {}
+    failures: Dict[Path, ValidationOutcome] = {}
+    for path in paths:
+        try:
+            data = path.read_bytes()
+            contents[path] = (hashlib.sha256(data).hexdigest(), data.decode("utf-8"))
+        except Exception as e:
+            failures[path] = (False, [f"Failed to read file: {str(e)}"])
+    return contents, failures
+
+
+def load_frontmatter_cache(cache_path: Path) -> Dict[str, ValidationOutcome]:
+    """
+    Load cached validation results.
+
+    Args:
+        cache_path: Cache file in the workspace
+
+    Returns:
+        Mapping of content sha256 to (is_valid, errors); empty if the
+        cache is missing, unreadable or from another version
+    """
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+        if data.get("version") != FRONTMATTER_CACHE_VERSION:
+            return {}
+        return {
+            sha: (bool(entry["valid"]), list(entry["errors"]))
+            for sha, entry in data["entries"].items()
+        }
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable frontmatter cache: {e}")
+        return {}
+
+
+def save_frontmatter_cache(
+    cache_path: Path, entries: Dict[str, ValidationOutcome]
+) -> None:
+    """
+    Store validation results atomically.
+
+    Args:
+        cache_path: Cache file in the workspace
+        entries: Mapping of content sha256 to (is_valid, errors)
+    """
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.tmp")
+    tmp_path.write_text(
+        json.dumps(
+            {
+                "version": FRONTMATTER_CACHE_VERSION,
+                "entries": {
+                    sha: {"valid": valid, "errors": errors}
+                    for sha, (valid, errors) in entries.items()
+                },
+            }
+        ),
+        encoding="utf-8",
+    )
+    os.replace(tmp_path, cache_path)
+
+
+async def _parse_all(
+    contents: List[str], max_workers: Optional[int]
+) -> List[ValidationOutcome]:
+    chunks = [
+        contents[i : i + VALIDATION_CHUNK_SIZE]
+        for i in range(0, len(contents), VALIDATION_CHUNK_SIZE)
+    ]
+    if len(contents) >= PROCESS_POOL_MIN_FILES and max_workers != 1:
+        try:
+            loop = asyncio.get_running_loop()
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                results = await asyncio.gather(
+                    *(
+                        loop.run_in_executor(pool, _validate_batch, chunk)
+                        for chunk in chunks
+                    )
+                )
+            return [outcome for chunk in results for outcome in chunk]
+        except Exception as e:
+            # e.g. no /dev/shm in a locked-down container
+            logger.warning(f"Process pool unavailable ({e}), validating in a thread")
+
+    return await asyncio.to_thread(_validate_batch, contents)
+
+
+async def validate_frontmatter_files(
+    paths: List[Path],
+    cache_path: Optional[Path] = None,
+    max_workers: Optional[int] = None,
+    prune: bool = True,
+) -> Tuple[Dict[Path, ValidationOutcome], FrontmatterValidationStats]:
+    """
+    Validate frontmatter of many files in parallel, reusing cached results.
+
+    Args:
+        paths: Markdown files to validate
+        cache_path: Cache file (None disables caching)
+        max_workers: Process pool size (None for CPU count, 1 to stay
+            in-process)
+        prune: Drop cached entries for content not in ``paths``; pass
+            False when ``paths`` is only part of the site (older entries
+            are then kept, up to FRONTMATTER_CACHE_MAX_ENTRIES)
+
+    Returns:
+        Tuple of (path -> (is_valid, errors), stats)
+
+    Examples:
+        >>> results, stats = await validate_frontmatter_files(files, cache_path)
+        >>> stats.parsed  # unchanged rebuild: everything served from cache
+        0
+    """
+    contents, results = await asyncio.to_thread(_read_and_hash, paths)
+    cache = load_frontmatter_cache(cache_path) if cache_path else {}
+
+    # Parse each distinct uncached content once
+    to_parse: Dict[str, str] = {}
+    for sha, text in contents.values():
+        if sha not in cache and sha not in to_parse:
+            to_parse[sha] = text
+    outcomes = await _parse_all(list(to_parse.values()), max_workers)
+    cache.update(zip(to_parse.keys(), outcomes))
+
+    for path, (sha, _) in contents.items():
+        results[path] = cache[sha]
+
+    if cache_path:
+        seen = {sha: cache[sha] for sha, _ in contents.values()}
+        if prune:
+            # paths is the whole site: keep only entries for content seen now
+            entries = seen
+        else:
+            # Most recently seen last, so trimming drops the stalest entries
+            entries = {sha: cache[sha] for sha in cache if sha not in seen}
+            entries.update(seen)
+            excess = len(entries) - FRONTMATTER_CACHE_MAX_ENTRIES
+            if excess > 0:
+                entries = dict(list(entries.items())[excess:])
+        try:
+            save_frontmatter_cache(cache_path, entries)
+        except OSError as e:
+            logger.warning(f"Failed to save frontmatter cache: {e}")
+
+    stats = FrontmatterValidationStats(
+        files=len(paths),
+        cache_hits=sum(1 for sha, _ in contents.values() if sha not in to_parse),
+        parsed=len(to_parse),
+    )
+    logger.info(
+        f"Validated frontmatter of {stats.files} files "
+        f"({stats.cache_hits} cached, {stats.parsed} parsed)"
+    )
+    return results, stats
@@ -0,0 +1,164 @@
+/**
+ * Sharded client-side search
+ *
+ * Replaces the theme's monolithic index.json search. Reads the index
+ * written by site-publisher (search_index.py) under /search/:
+ * - manifest.json: shard fingerprints and tokenizer settings
+ * - terms-<prefix>.<md5>.json: {term: [docId, score, docId, score, ...]}
+ * - docs-<n>.<md5>.json: [[title, permalink, summary], ...]
+ *
+ * Only the manifest, the term shards for the typed words and the doc
+ * shards holding the top results are downloaded. The last word is
+ * matched as a prefix so results update while typing.
+ */
+
+(function () {
+    const MAX_RESULTS = 10;
+    const DEBOUNCE_MS = 150;
+
+    const script = document.currentScript;
+    const input = document.getElementById("searchInput");
+    const list = document.getElementById("searchResults");
+    if (!script || !input || !list) {
+        return;
+    }
+
+    const baseUrl = script.dataset.index || "/search/";
+    const cache = new Map();
+    let manifestPromise = null;
+    let latestQuery = 0;
+
+    function fetchJson(name) {
+        if (!cache.has(name)) {
+            cache.set(
+                name,
+                fetch(baseUrl + name).then((response) => {
+                    if (!response.ok) {
+                        throw new Error(`Search shard ${name}: HTTP ${response.status}`);
+                    }
+                    return response.json();
+                })
+            );
+        }
+        return cache.get(name);
+    }
+
+    function loadManifest() {
+        if (!manifestPromise) {
+            manifestPromise = fetchJson("manifest.json");
+        }
+        return manifestPromise;
+    }
+
+    // Same rules as search_index.tokenize
+    function queryTerms(text, manifest) {
+        const stopwords = new Set(manifest.stopwords);
+        const words = text
+            .normalize("NFKD")
+            .replace(/[^\x00-\x7F]/g, "")
+            .toLowerCase()
+            .match(/[a-z0-9]+/g) || [];
+        return words.filter(
+            (term) => term.length >= manifest.minTermLength && !stopwords.has(term)
+        );
+    }
+
+    async function termScores(term, isPrefix, manifest) {
+        const prefix = term.slice(0, manifest.prefixLength);
+        const digest = manifest.terms[prefix];
+        const scores = new Map();
+        if (!digest) {
+            return scores;
+        }
+        const shard = await fetchJson(`terms-${prefix}.${digest}.json`);
+        const matching = isPrefix
+            ? Object.keys(shard).filter((candidate) => candidate.startsWith(term))
+            : shard[term] ? [term] : [];
+        for (const candidate of matching) {
+            const postings = shard[candidate];
+            for (let i = 0; i < postings.length; i += 2) {
+                const docId = postings[i];
+                scores.set(docId, Math.max(scores.get(docId) || 0, postings[i + 1]));
+            }
+        }
+        return scores;
+    }
+
+    async function search(text) {
+        const manifest = await loadManifest();
+        const terms = queryTerms(text, manifest);
+        if (terms.length === 0) {
+            return [];
+        }
+
+        const perTerm = await Promise.all(
+            terms.map((term, index) => termScores(term, index === terms.length - 1, manifest))
+        );
+
+        // Documents matching every term, ranked by summed score
+        const [first, ...rest] = perTerm;
+        const ranked = [];
+        for (const [docId, score] of first) {
+            let total = score;
+            let matchesAll = true;
+            for (const scores of rest) {
+                if (!scores.has(docId)) {
+                    matchesAll = false;
+                    break;
+                }
+                total += scores.get(docId);
+            }
+            if (matchesAll) {
+                ranked.push([docId, total]);
+            }
+        }
+        ranked.sort((a, b) => b[1] - a[1] || b[0] - a[0]);
+        const top = ranked.slice(0, MAX_RESULTS);
+
+        return Promise.all(
+            top.map(async ([docId]) => {
+                const shardIndex = Math.floor(docId / manifest.docShardSize);
+                const docs = await fetchJson(
+                    `docs-${shardIndex}.${manifest.docs[shardIndex]}.json`
+                );
+                return docs[docId % manifest.docShardSize];
+            })
+        );
+    }
+
+    function escapeHtml(text) {
+        const div = document.createElement("div");
+        div.textContent = text;
+        return div.innerHTML;
+    }
+
+    function render(results) {
+        list.innerHTML = results
+            .map(
+                ([title, permalink, summary]) =>
+                    `<li class="post-entry"><header class="entry-header">${escapeHtml(title)}&nbsp;»</header>` +
+                    `<div class="entry-content"><p>${escapeHtml(summary)}</p></div>` +
+                    `<a href="${encodeURI(permalink)}" aria-label="${escapeHtml(title)}"></a></li>`
+            )
+            .join("");
+    }
+
+    let timer = null;
+    input.addEventListener("input", () => {
+        clearTimeout(timer);
+        timer = setTimeout(async () => {
+            const queryId = ++latestQuery;
+            try {
+                const results = await search(input.value);
+                if (queryId === latestQuery) {
+                    render(results);
+                }
+            } catch (error) {
+                console.error("Search failed:", error);
+            }
+        }, DEBOUNCE_MS);
+    });
+
+    // Start loading the manifest as soon as the search box is used
+    input.addEventListener("focus", loadManifest, { once: true });
+})();
@@ -1,31 +1,66 @@
 """
 Hugo builder for site-publisher.
 
-Async functions for building static sites with Hugo and deploying to blob storage.
+Async functions for building static sites with Hugo, deploying to blob storage,
+and snapshot-based backup and rollback.
 Uses asyncio for non-blocking subprocess execution.
 """
 
 import asyncio
+import hashlib
 import logging
-import mimetypes
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
-
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from asset_compression import (
+    compress_content,
+    compression_for,
+    decompress_content,
+    resolve_encoding,
+    worth_compressing,
+)
+from azure.core.exceptions import ResourceExistsError
 from azure.storage.blob import ContentSettings
 from azure.storage.blob.aio import BlobServiceClient
+from cache_policy import cache_control_for
+from deploy_manifest import (
+    DEFAULT_SNAPSHOT_RETENTION,
+    LEGACY_DEPLOY_MANIFEST_BLOB,
+    ManifestFiles,
+    diff_manifests,
+    load_deploy_manifest,
+    load_snapshot,
+    new_snapshot_id,
+    object_blob_name,
+    prune_snapshots,
+    same_content,
+    save_deploy_manifest,
+    save_snapshot,
+)
 from error_handling import handle_error
-from models import BuildResult, DeploymentResult
+from models import BuildResult, CacheRule, DeploymentResult, OutputScan
+from output_scanner import get_content_type, scan_output
 from security import (
     sanitize_error_message,
     validate_hugo_output,
 )
 
+from libs.blob_batch import delete_blobs_batched
+
 logger = logging.getLogger(__name__)
 
 # Constants
+DEFAULT_MANIFEST_CONTAINER = "$web-backup"  # Private home of deploy manifests
 MAX_ERROR_OUTPUT_LENGTH = 1000  # Maximum characters to log from Hugo error output
+DEFAULT_DEPLOY_CONCURRENCY = 16  # Simultaneous uploads to $web
+COMPRESSION_WORKERS = 4  # Threads compressing text assets during deploy
+
+# $web prefixes managed outside Hugo output (never removed as stale):
+# images/ holds responsive hero variants uploaded by markdown-generator
+PRESERVED_WEB_PREFIXES = ("images/",)
 
 
 async def build_site_with_hugo(
@@ -34,6 +69,7 @@ async def build_site_with_hugo(
     base_url: str,
     timeout_seconds: int = 300,
     themes_dir: Optional[Path] = None,
+    cache_dir: Optional[Path] = None,
 ) -> BuildResult:
     """
     Build static site with Hugo (async).
@@ -47,6 +83,7 @@ async def build_site_with_hugo(
         base_url: Base URL for the site
         timeout_seconds: Maximum build time (DOS prevention)
         themes_dir: Optional custom themes directory (defaults to /app/themes)
+        cache_dir: Optional persistent Hugo cache directory (--cacheDir)
 
     Returns:
         BuildResult with output file count and any errors
@@ -94,8 +131,13 @@ async def build_site_with_hugo(
             str(hugo_dir / "public"),
             "--themesDir",
             str(themes_dir),
+            # Removes only files Hugo no longer produces; public/ and
+            # resources/_gen otherwise persist between builds
             "--cleanDestinationDir",
         ]
+        if cache_dir is not None:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            cmd.extend(["--cacheDir", str(cache_dir)])
 
         logger.info(f"Running Hugo: {' '.join(cmd)}")
 
@@ -184,26 +226,191 @@ async def build_site_with_hugo(
         )
 
 
-def get_content_type(file_path: Path) -> str:
+def _with_encoding(
+    entry: Dict[str, Any], content_encoding: Optional[str]
+) -> Dict[str, Any]:
+    """Manifest entry recording the Content-Encoding the blob was stored with."""
+    deployed = {k: v for k, v in entry.items() if k != "content_encoding"}
+    if content_encoding:
+        deployed["content_encoding"] = content_encoding
+    return deployed
+
+
+async def _apply_manifest(
+    container_client: Any,
+    site_container: str,
+    manifest_client: Any,
+    current: ManifestFiles,
+    previous: Optional[ManifestFiles],
+    read_content: Callable[[str, Dict[str, Any]], Awaitable[bytes]],
+    max_concurrency: int,
+    error_type: str,
+) -> DeploymentResult:
     """
-    Get MIME content type for a file.
+    Make a site container match a manifest (the incremental diff engine).
 
-    Pure function for determining content type.
+    Uploads changed files with bounded concurrency (compressing entries
+    with a "compression" encoding, see asset_compression.py), deletes files removed
+    since ``previous`` (listing the container only when there is no
+    previous manifest), then stores what was deployed as the deploy
+    manifest in the private manifest container.
+    Used by deploys (content from Hugo output) and rollbacks (content from
+    snapshot objects).
 
     Args:
-        file_path: Path to file
+        container_client: Container client for the site container
+        site_container: Name of the site container
+        manifest_client: Container client holding the deploy manifest
+        current: Manifest the container should match
+        previous: Manifest currently deployed (None if unknown)
+        read_content: Coroutine returning the bytes for (blob name, entry)
+        max_concurrency: Maximum simultaneous uploads
+        error_type: Error category for handle_error ("upload", "rollback")
 
     Returns:
-        MIME type string (e.g., "text/html", "application/octet-stream")
+        DeploymentResult with changed/unchanged/deleted counts, bytes
+        uploaded and saved, and errors (duration is left to the caller)
     """
-    # Use mimetypes library
-    content_type, _ = mimetypes.guess_type(str(file_path))
+    errors: List[str] = []
+    diff = diff_manifests(previous, current)
+    logger.info(
+        f"Deploy diff: {len(diff.changed)} changed, "
+        f"{len(diff.unchanged)} unchanged, {len(diff.deleted)} removed"
+    )
 
-    # Default to octet-stream if unknown
-    if content_type is None:
-        return "application/octet-stream"
+    # What the container holds afterwards (failed uploads keep their
+    # previous entry so the next deploy retries them)
+    deployed = {
+        name: _with_encoding(
+            current[name], (previous or {})[name].get("content_encoding")
+        )
+        for name in diff.unchanged
+    }
+    for name in diff.changed:
+        if previous and name in previous:
+            deployed[name] = previous[name]
+
+    # Upload changed files (text assets compressed in a worker pool when
+    # the entry asks for it; zlib and brotli release the GIL)
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    loop = asyncio.get_running_loop()
+    compression_pool = (
+        ThreadPoolExecutor(max_workers=COMPRESSION_WORKERS)
+        if any(current[name].get("compression") for name in diff.changed)
+        else None
+    )
+    uploaded_files = 0
+    bytes_uploaded = 0
+    bytes_compression_saved = 0
+
+    async def _upload(blob_name: str) -> None:
+        nonlocal uploaded_files, bytes_uploaded, bytes_compression_saved
+        entry = current[blob_name]
+        content_encoding = None
+        try:
+            async with semaphore:
+                content = await read_content(blob_name, entry)
+                raw_size = len(content)
+                if entry.get("compression"):
+                    compressed = await loop.run_in_executor(
+                        compression_pool,
+                        compress_content,
+                        content,
+                        entry["compression"],
+                    )
+                    # Skip files where compression doesn't pay
+                    if worth_compressing(raw_size, len(compressed)):
+                        content = compressed
+                        content_encoding = entry["compression"]
+                blob_client_obj = container_client.get_blob_client(blob_name)
+                await blob_client_obj.upload_blob(
+                    content,
+                    overwrite=True,
+                    content_settings=ContentSettings(
+                        content_type=entry.get("content_type")
+                        or get_content_type(Path(blob_name)),
+                        content_encoding=content_encoding,
+                        cache_control=entry.get("cache_control"),
+                    ),
+                )
+        except asyncio.CancelledError:
+            # Gracefully handle shutdown during upload
+            logger.warning(
+                f"Upload cancelled during shutdown after {uploaded_files}/{len(diff.changed)} files"
+            )
+            raise  # Re-raise to propagate cancellation
+        except Exception as e:
+            error_info = handle_error(
+                e, error_type=error_type, context={"file": blob_name}
+            )
+            errors.append(
+                f"Failed to upload {Path(blob_name).name}: {sanitize_error_message(e)}"
+            )
+            return
 
-    return content_type
+        deployed[blob_name] = _with_encoding(entry, content_encoding)
+        uploaded_files += 1
+        bytes_uploaded += len(content)
+        bytes_compression_saved += raw_size - len(content)
+
+        # Log progress every 500 files to track long-running operations
+        if uploaded_files % 500 == 0:
+            logger.info(f"Upload progress: {uploaded_files}/{len(diff.changed)} files")
+
+    try:
+        await asyncio.gather(*(_upload(name) for name in diff.changed))
+    finally:
+        if compression_pool is not None:
+            compression_pool.shutdown(wait=False)
+
+    # Clean up stale files: the previous manifest says what to remove;
+    # without one, fall back to listing the container
+    logger.info("Removing stale files from deployed site...")
+    stale_count = 0
+    try:
+        if previous is not None:
+            stale_names = diff.deleted
+        else:
+            stale_names = [
+                blob.name
+                async for blob in container_client.list_blobs()
+                if blob.name not in current
+            ]
+
+        stale_names = [
+            name for name in stale_names if not name.startswith(PRESERVED_WEB_PREFIXES)
+        ]
+        delete_result = await delete_blobs_batched(container_client, stale_names)
+        stale_count = delete_result.deleted
+        for blob_name, error in delete_result.failed.items():
+            logger.warning(f"Failed to delete stale file {blob_name}: {error}")
+            # Keep it in the manifest so the next deploy retries
+            if previous and blob_name in previous:
+                deployed[blob_name] = previous[blob_name]
+
+        if stale_count > 0:
+            logger.info(f"Removed {stale_count} stale files")
+
+    except Exception as e:
+        # Log but don't fail on cleanup errors
+        logger.warning(f"Error during stale file cleanup: {e}")
+
+    try:
+        await save_deploy_manifest(manifest_client, site_container, deployed)
+    except Exception as e:
+        # Next deploy falls back to a full upload; the site itself is fine
+        logger.warning(f"Failed to save deploy manifest: {e}")
+
+    return DeploymentResult(
+        files_uploaded=uploaded_files,
+        files_unchanged=len(diff.unchanged),
+        files_deleted=stale_count,
+        bytes_uploaded=bytes_uploaded,
+        bytes_saved=sum(current[name]["size"] for name in diff.unchanged),
+        bytes_compression_saved=bytes_compression_saved,
+        duration_seconds=0.0,
+        errors=errors,
+    )
 
 
 async def deploy_to_web_container(
@@ -212,11 +419,20 @@ async def deploy_to_web_container(
     container_name: str,
     max_files: int = 10000,
     max_file_size: int = 10_485_760,  # 10MB
+    max_concurrency: int = DEFAULT_DEPLOY_CONCURRENCY,
+    scan: Optional[OutputScan] = None,
+    compression: Optional[str] = None,
+    cache_rules: Optional[List[CacheRule]] = None,
+    manifest_container: str = DEFAULT_MANIFEST_CONTAINER,
 ) -> DeploymentResult:
     """
-    Deploy built site to $web container.
+    Deploy built site to $web container incrementally.
 
-    Pure function with explicit dependencies and limits.
+    Diffs the output scan (path, hash, content type per file) against the
+    deploy manifest stored in the private manifest container. Only changed files are uploaded (with bounded
+    concurrency); files removed since the last deploy are deleted using the
+    previous manifest. Without a previous manifest everything is uploaded
+    and stale files are found by listing the container.
 
     Note: Hugo output validation should be performed by the caller (site_builder.py)
     before calling this function. This function only performs basic directory checks.
@@ -227,9 +443,17 @@ async def deploy_to_web_container(
         container_name: Target container name (usually "$web")
         max_files: Maximum files to upload (DOS prevention)
         max_file_size: Maximum size per file (DOS prevention)
+        max_concurrency: Maximum simultaneous uploads
+        scan: Single-pass scan of source_dir shared with validation
+            (scanned here if not given)
+        compression: Precompress text assets ("gzip", "br", or None/"none")
+        cache_rules: Cache-Control rules (defaults to DEFAULT_CACHE_RULES)
+        manifest_container: Private container for the deploy manifest
+            (usually the backup container)
 
     Returns:
-        DeploymentResult with upload metrics and errors
+        DeploymentResult with changed/unchanged/deleted counts, bytes
+        uploaded, bytes saved (unchanged files and compression), and errors
 
     Raises:
         ValueError: If parameters are invalid
@@ -237,9 +461,6 @@ async def deploy_to_web_container(
     start_time = datetime.now()
     logger.info(f"Deploying site to {container_name}")
 
-    uploaded_files = 0
-    errors: List[str] = []
-
     try:
         # Validate source directory exists (basic check only)
         # Note: Full Hugo output validation happens in site_builder.py before calling this function
@@ -250,92 +471,52 @@ async def deploy_to_web_container(
                 errors=[f"Source directory not found: {source_dir}"],
             )
 
-        # Get container client
+        # Get container clients
         container_client = blob_client.get_container_client(container_name)
-
-        # Upload all files
-        files_to_upload = [f for f in source_dir.rglob("*") if f.is_file()]
-        logger.info(f"Uploading {len(files_to_upload)} files")
-
-        for idx, file_path in enumerate(files_to_upload):
-            try:
-                # Calculate blob name (relative path)
-                rel_path = file_path.relative_to(source_dir)
-                blob_name = str(rel_path).replace(
-                    "\\", "/"
-                )  # Normalize path separators
-
-                # Get content type
-                content_type = get_content_type(file_path)
-
-                # Upload file
-                blob_client_obj = container_client.get_blob_client(blob_name)
-
-                with open(file_path, "rb") as data:
-                    await blob_client_obj.upload_blob(
-                        data,
-                        overwrite=True,
-                        content_settings=ContentSettings(content_type=content_type),
-                    )
-
-                uploaded_files += 1
-
-                # Log progress every 500 files to track long-running operations
-                if (idx + 1) % 500 == 0:
-                    logger.info(
-                        f"Upload progress: {idx + 1}/{len(files_to_upload)} files"
-                    )
-
-            except asyncio.CancelledError:
-                # Gracefully handle shutdown during upload
-                logger.warning(
-                    f"Upload cancelled during shutdown after {uploaded_files}/{len(files_to_upload)} files"
-                )
-                raise  # Re-raise to propagate cancellation
-            except Exception as e:
-                error_info = handle_error(
-                    e, error_type="upload", context={"file": str(file_path)}
-                )
-                errors.append(
-                    f"Failed to upload {file_path.name}: {sanitize_error_message(e)}"
-                )
-
-        # Clean up stale files: delete any files in the container that don't exist in Hugo output
-        logger.info("Removing stale files from deployed site...")
-        stale_count = 0
-        try:
-            # Get set of deployed file names
-            deployed_names = set()
-            for file_path in files_to_upload:
-                rel_path = file_path.relative_to(source_dir)
-                blob_name = str(rel_path).replace("\\", "/")
-                deployed_names.add(blob_name)
-
-            # List all files currently in container and delete those not in Hugo output
-            async for blob in container_client.list_blobs():
-                if blob.name not in deployed_names:
-                    try:
-                        await container_client.delete_blob(blob.name)
-                        stale_count += 1
-                        logger.debug(f"Deleted stale file: {blob.name}")
-                    except Exception as e:
-                        logger.warning(f"Failed to delete stale file {blob.name}: {e}")
-
-            if stale_count > 0:
-                logger.info(f"Removed {stale_count} stale files")
-
-        except Exception as e:
-            # Log but don't fail on cleanup errors
-            logger.warning(f"Error during stale file cleanup: {e}")
+        manifest_client = blob_client.get_container_client(manifest_container)
+
+        # Hash the build and diff against what is deployed
+        if scan is None:
+            scan = await asyncio.to_thread(scan_output, source_dir)
+        current = scan.manifest()
+
+        # Mark text assets for compression and attach cache headers; the
+        # diff treats changed settings as a change so blobs are re-uploaded
+        # with the new headers
+        encoding = resolve_encoding(compression)
+        for blob_name, entry in current.items():
+            entry_compression = compression_for(entry, encoding)
+            if entry_compression:
+                entry["compression"] = entry_compression
+            cache_control = cache_control_for(
+                blob_name, entry["content_type"], cache_rules
+            )
+            if cache_control:
+                entry["cache_control"] = cache_control
+        previous = await load_deploy_manifest(manifest_client, container_name)
+
+        async def _read_local(blob_name: str, entry: Dict[str, Any]) -> bytes:
+            return (source_dir / blob_name).read_bytes()
+
+        result = await _apply_manifest(
+            container_client,
+            container_name,
+            manifest_client,
+            current,
+            previous,
+            _read_local,
+            max_concurrency,
+            error_type="upload",
+        )
 
         duration = (datetime.now() - start_time).total_seconds()
         logger.info(
-            f"Deployed {uploaded_files} files (removed {stale_count} stale) with {len(errors)} errors in {duration:.2f}s"
-        )
-
-        return DeploymentResult(
-            files_uploaded=uploaded_files, duration_seconds=duration, errors=errors
+            f"Deployed {result.files_uploaded} changed files ({result.bytes_uploaded} bytes), "
+            f"{result.files_unchanged} unchanged ({result.bytes_saved} bytes saved), "
+            f"compression saved {result.bytes_compression_saved} bytes, "
+            f"removed {result.files_deleted} stale, {len(result.errors)} errors in {duration:.2f}s"
         )
+        return result.model_copy(update={"duration_seconds": duration})
 
     except Exception as e:
         duration = (datetime.now() - start_time).total_seconds()
@@ -353,31 +534,36 @@ async def backup_current_site(
     blob_client: BlobServiceClient,
     source_container: str,
     backup_container: str,
+    max_concurrency: int = DEFAULT_DEPLOY_CONCURRENCY,
+    keep_snapshots: int = DEFAULT_SNAPSHOT_RETENTION,
 ) -> DeploymentResult:
     """
-    Incremental backup: Only backs up files that don't exist in backup container.
+    Snapshot the live site before a deploy.
 
-    This creates a cumulative backup over time, only copying new/changed files.
-    Much faster than full backup on every deployment.
+    Records the site's manifest (path -> content hash) as a versioned
+    snapshot and stores each content hash once under objects/. Cost is
+    O(files changed since the previous snapshot): unchanged hashes are
+    already stored, and when the site matches the latest snapshot nothing
+    is written. A site without a deploy manifest (never deployed
+    incrementally) is bootstrapped by listing and hashing it once.
 
-    First deployment: Full backup (~83s for 4,400 files)
-    Subsequent deployments: Only new files (~5-10s for ~100 new files)
+    After a new snapshot is recorded, snapshots beyond ``keep_snapshots``
+    are deleted along with objects no retained snapshot refers to.
 
     Args:
         blob_client: Azure blob service client (injected dependency)
         source_container: Source container (usually "$web")
         backup_container: Backup container (usually "$web-backup")
+        max_concurrency: Maximum simultaneous object copies
+        keep_snapshots: Newest snapshots to retain (0 retains all)
 
     Returns:
-        DeploymentResult with backup metrics and errors
+        DeploymentResult with objects stored (files_uploaded), objects
+        already present (files_unchanged) and errors
     """
     start_time = datetime.now()
-    logger.info(
-        f"Starting incremental backup from {source_container} to {backup_container}"
-    )
+    logger.info(f"Snapshotting {source_container} into {backup_container}")
 
-    backed_up_files = 0
-    skipped_files = 0
     errors: List[str] = []
 
     try:
@@ -385,68 +571,99 @@ async def backup_current_site(
         source_client = blob_client.get_container_client(source_container)
         backup_client = blob_client.get_container_client(backup_container)
 
-        # Get set of existing backup files for fast lookup
-        existing_backups = set()
-        async for blob in backup_client.list_blobs():
-            existing_backups.add(blob.name)
-
-        logger.info(f"Found {len(existing_backups)} existing backup files")
-
-        # List all blobs in source container
-        source_blobs = []
-        async for blob in source_client.list_blobs():
-            source_blobs.append(blob)
-
-        files_to_backup = [b for b in source_blobs if b.name not in existing_backups]
-        skipped_files = len(source_blobs) - len(files_to_backup)
-
-        logger.info(
-            f"Backing up {len(files_to_backup)} new files (skipping {skipped_files} existing)"
-        )
+        latest = await load_snapshot(backup_client)
+        latest_id, latest_files = latest if latest else (None, None)
+        site_files = await load_deploy_manifest(backup_client, source_container)
+
+        if site_files is None:
+            # Bootstrap: hash whatever is deployed (one-time)
+            names = [
+                blob.name
+                async for blob in source_client.list_blobs()
+                if blob.name != LEGACY_DEPLOY_MANIFEST_BLOB
+                and not blob.name.startswith(PRESERVED_WEB_PREFIXES)
+            ]
+            site_files = {name: {"sha256": None, "size": 0} for name in names}
+        elif same_content(site_files, latest_files):
+            duration = (datetime.now() - start_time).total_seconds()
+            logger.info(
+                f"Site unchanged since snapshot {latest_id}, nothing to back up"
+            )
+            return DeploymentResult(
+                files_uploaded=0,
+                files_unchanged=len(site_files),
+                duration_seconds=duration,
+            )
 
-        logger.info(
-            f"Backing up {len(files_to_backup)} new files (skipping {skipped_files} existing)"
-        )
+        known_hashes = {entry.get("sha256") for entry in (latest_files or {}).values()}
+        snapshot_files: ManifestFiles = {}
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        stored = 0
 
-        # Copy each new/changed blob to backup container
-        for idx, blob in enumerate(files_to_backup):
+        async def _store(name: str, entry: Dict[str, Any]) -> None:
+            nonlocal stored
+            if entry.get("sha256") in known_hashes:
+                snapshot_files[name] = entry
+                return
             try:
-                source_blob = source_client.get_blob_client(blob.name)
-                backup_blob = backup_client.get_blob_client(blob.name)
-
-                # Copy blob (async)
-                source_url = source_blob.url
-                await backup_blob.start_copy_from_url(source_url)
-
-                backed_up_files += 1
-
-                # Log progress every 500 files to track long-running operations
-                if (idx + 1) % 500 == 0:
-                    logger.info(
-                        f"Backup progress: {idx + 1}/{len(files_to_backup)} files"
+                async with semaphore:
+                    stream = await source_client.get_blob_client(name).download_blob()
+                    # Objects are stored uncompressed so hashes match the
+                    # deploy manifest and rollbacks can re-compress
+                    content = decompress_content(
+                        await stream.readall(), entry.get("content_encoding")
                     )
-
+                    digest = hashlib.sha256(content).hexdigest()
+                    object_blob = backup_client.get_blob_client(
+                        object_blob_name(digest)
+                    )
+                    try:
+                        await object_blob.upload_blob(content, overwrite=False)
+                        stored += 1
+                    except ResourceExistsError:
+                        pass  # Stored by an older snapshot
+                snapshot_files[name] = {
+                    **entry,
+                    "sha256": digest,
+                    "size": len(content),
+                }
             except asyncio.CancelledError:
-                # Gracefully handle shutdown during backup
-                logger.warning(
-                    f"Backup cancelled during shutdown after {backed_up_files}/{len(files_to_backup)} files"
-                )
+                logger.warning("Backup cancelled during shutdown")
                 raise  # Re-raise to propagate cancellation
             except Exception as e:
                 error_info = handle_error(
-                    e, error_type="backup", context={"blob": blob.name}
-                )
-                errors.append(
-                    f"Failed to backup {blob.name}: {sanitize_error_message(e)}"
+                    e, error_type="backup", context={"blob": name}
                 )
+                errors.append(f"Failed to backup {name}: {sanitize_error_message(e)}")
+
+        await asyncio.gather(*(_store(n, e) for n, e in site_files.items()))
+
+        if errors:
+            # An incomplete snapshot must never become the rollback target
+            logger.warning("Snapshot incomplete, keeping previous snapshot pointer")
+        else:
+            snapshot_id = new_snapshot_id()
+            await save_snapshot(backup_client, snapshot_id, snapshot_files, latest_id)
+            logger.info(
+                f"Recorded snapshot {snapshot_id} ({len(snapshot_files)} files)"
+            )
+            try:
+                await prune_snapshots(backup_client, keep_snapshots, snapshot_id)
+            except Exception as e:
+                # Retention is housekeeping: the new snapshot is already safe
+                logger.warning(f"Backup retention failed: {sanitize_error_message(e)}")
 
         duration = (datetime.now() - start_time).total_seconds()
         logger.info(
-            f"Backed up {backed_up_files} files with {len(errors)} errors in {duration:.2f}s"
+            f"Stored {stored} new objects ({len(snapshot_files) - stored} already "
+            f"stored) with {len(errors)} errors in {duration:.2f}s"
         )
 
         return DeploymentResult(
-            files_uploaded=backed_up_files, duration_seconds=duration, errors=errors
+            files_uploaded=stored,
+            files_unchanged=len(snapshot_files) - stored,
+            duration_seconds=duration,
+            errors=errors,
         )
 
     except Exception as e:
@@ -467,92 +684,73 @@ async def rollback_deployment(
     blob_client: BlobServiceClient,
     backup_container: str,
     target_container: str,
+    snapshot_id: Optional[str] = None,
+    max_concurrency: int = DEFAULT_DEPLOY_CONCURRENCY,
 ) -> DeploymentResult:
     """
-    Rollback deployment by restoring from backup.
+    Rollback deployment by re-deploying a snapshot manifest.
 
-    Copies all files from $web-backup to $web container.
+    Uses the same incremental diff engine as deploys: only files whose
+    content differs from the snapshot are restored (from snapshot
+    objects), and files added since are deleted.
 
     Args:
         blob_client: Azure blob service client (injected dependency)
         backup_container: Backup container (usually "$web-backup")
         target_container: Target container (usually "$web")
+        snapshot_id: Snapshot to restore (None for the latest)
+        max_concurrency: Maximum simultaneous uploads
 
     Returns:
         DeploymentResult with rollback metrics and errors
     """
     start_time = datetime.now()
-    logger.warning(f"Rolling back site from {backup_container} to {target_container}")
-
-    restored_files = 0
-    errors: List[str] = []
+    logger.warning(
+        f"Rolling back {target_container} to snapshot "
+        f"{snapshot_id or 'latest'} from {backup_container}"
+    )
 
     try:
         # Get container clients
         backup_client = blob_client.get_container_client(backup_container)
         target_client = blob_client.get_container_client(target_container)
 
-        # List all blobs in backup container
-        blob_list = []
-        async for blob in backup_client.list_blobs():
-            blob_list.append(blob)
-
-        if len(blob_list) == 0:
+        snapshot = await load_snapshot(backup_client, snapshot_id)
+        if snapshot is None:
             return DeploymentResult(
                 files_uploaded=0,
                 duration_seconds=0.0,
-                errors=["No backup files found - cannot rollback"],
+                errors=["No backup snapshot found - cannot rollback"],
             )
 
-        logger.info(f"Found {len(blob_list)} backup files to restore")
-
-        # Delete current files in target container
-        try:
-            async for blob in target_client.list_blobs():
-                await target_client.delete_blob(blob.name)
-                logger.debug(f"Deleted current file: {blob.name}")
-        except Exception as e:
-            logger.warning(f"Failed to delete some current files: {e}")
-            # Continue with restore even if delete fails
+        restored_id, snapshot_files = snapshot
+        previous = await load_deploy_manifest(backup_client, target_container)
 
-        # Copy each blob from backup to target
-        for idx, blob in enumerate(blob_list):
-            try:
-                backup_blob = backup_client.get_blob_client(blob.name)
-                target_blob = target_client.get_blob_client(blob.name)
-
-                # Copy blob (async)
-                backup_url = backup_blob.url
-                await target_blob.start_copy_from_url(backup_url)
-
-                restored_files += 1
-
-                # Log progress every 500 files to track long-running operations
-                if (idx + 1) % 500 == 0:
-                    logger.info(f"Rollback progress: {idx + 1}/{len(blob_list)} files")
-
-            except asyncio.CancelledError:
-                # Gracefully handle shutdown during rollback
-                logger.warning(
-                    f"Rollback cancelled during shutdown after {restored_files}/{len(blob_list)} files"
-                )
-                raise  # Re-raise to propagate cancellation
-            except Exception as e:
-                error_info = handle_error(
-                    e, error_type="rollback", context={"blob": blob.name}
-                )
-                errors.append(
-                    f"Failed to restore {blob.name}: {sanitize_error_message(e)}"
-                )
+        async def _read_object(blob_name: str, entry: Dict[str, Any]) -> bytes:
+            object_blob = backup_client.get_blob_client(
+                object_blob_name(entry["sha256"])
+            )
+            stream = await object_blob.download_blob()
+            return await stream.readall()
+
+        result = await _apply_manifest(
+            target_client,
+            target_container,
+            backup_client,
+            snapshot_files,
+            previous,
+            _read_object,
+            max_concurrency,
+            error_type="rollback",
+        )
 
         duration = (datetime.now() - start_time).total_seconds()
         logger.warning(
-            f"Rollback complete: {restored_files} files restored with {len(errors)} errors in {duration:.2f}s"
-        )
-
-        return DeploymentResult(
-            files_uploaded=restored_files, duration_seconds=duration, errors=errors
+            f"Rollback to snapshot {restored_id} complete: {result.files_uploaded} "
+            f"files restored, {result.files_unchanged} unchanged, "
+            f"{result.files_deleted} removed, {len(result.errors)} errors in {duration:.2f}s"
         )
+        return result.model_copy(update={"duration_seconds": duration})
 
     except Exception as e:
         duration = (datetime.now() - start_time).total_seconds()
@@ -566,66 +764,3 @@ async def rollback_deployment(
             duration_seconds=duration,
             errors=[sanitize_error_message(e)],
         )
-
-
-async def clear_backup(
-    blob_client: BlobServiceClient,
-    backup_container: str,
-) -> DeploymentResult:
-    """
-    Clear backup container after successful deployment.
-
-    This makes the backup idempotent: after a successful deployment,
-    we clear the old backup so the next deployment will create a fresh
-    backup of the newly deployed content.
-
-    Args:
-        blob_client: Azure blob service client (injected dependency)
-        backup_container: Backup container to clear (usually "$web-backup")
-
-    Returns:
-        DeploymentResult with deletion metrics and errors
-    """
-    start_time = datetime.now()
-    logger.info(f"Clearing backup container: {backup_container}")
-
-    deleted_files = 0
-    errors: List[str] = []
-
-    try:
-        backup_client = blob_client.get_container_client(backup_container)
-
-        # Delete all blobs in backup container
-        async for blob in backup_client.list_blobs():
-            try:
-                await backup_client.delete_blob(blob.name)
-                deleted_files += 1
-
-                # Log progress every 500 files
-                if deleted_files % 500 == 0:
-                    logger.info(f"Cleared {deleted_files} backup files...")
-
-            except Exception as e:
-                errors.append(
-                    f"Failed to delete {blob.name}: {sanitize_error_message(e)}"
-                )
-
-        duration = (datetime.now() - start_time).total_seconds()
-        logger.info(
-            f"Cleared {deleted_files} backup files with {len(errors)} errors in {duration:.2f}s"
-        )
-
-        return DeploymentResult(
-            files_uploaded=deleted_files, duration_seconds=duration, errors=errors
-        )
-
-    except Exception as e:
-        duration = (datetime.now() - start_time).total_seconds()
-        error_info = handle_error(
-            e, error_type="backup_clear", context={"backup": backup_container}
-        )
-        return DeploymentResult(
-            files_uploaded=0,
-            duration_seconds=duration,
-            errors=[sanitize_error_message(e)],
-        )
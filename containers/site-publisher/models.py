@@ -6,7 +6,7 @@ All data structures for requests, responses, and internal data.
 
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from pydantic import BaseModel, Field
 
@@ -38,6 +38,9 @@ class MetricsResponse(BaseModel):
     last_build_time: Optional[datetime] = None
     last_build_duration: Optional[float] = None
     uptime_seconds: float
+    build_metrics: Optional[Dict[str, Any]] = None
+    build_phases: Optional[Dict[str, Any]] = None
+    publish_scheduler: Optional[Dict[str, Any]] = None
 
 
 class PublishRequest(BaseModel):
@@ -65,10 +68,14 @@ class ValidationResult(BaseModel):
 
 
 class DownloadResult(BaseModel):
-    """Result from downloading markdown files."""
+    """Result from syncing markdown files into the local mirror."""
 
     files_downloaded: int
     duration_seconds: float
+    files_skipped: int = 0  # Unchanged since the last sync
+    files_deleted: int = 0  # Removed locally because the blob disappeared
+    bytes_downloaded: int = 0
+    bytes_skipped: int = 0
     errors: List[str] = Field(default_factory=list)
 
 
@@ -86,4 +93,113 @@ class DeploymentResult(BaseModel):
 
     files_uploaded: int
     duration_seconds: float
+    files_unchanged: int = 0  # Skipped: same content hash as deployed
+    files_deleted: int = 0
+    bytes_uploaded: int = 0
+    bytes_saved: int = 0  # Size of unchanged files not re-uploaded
+    bytes_compression_saved: int = 0  # Saved by Content-Encoding on uploads
+    errors: List[str] = Field(default_factory=list)
+    phase_timings: Dict[str, float] = Field(default_factory=dict)  # Seconds
+    fatal: bool = False  # Site not deployed (errors alone may be warnings)
+
+
+class DirectorySyncResult(BaseModel):
+    """Result from syncing a directory into the build workspace."""
+
+    files_copied: int = 0
+    files_unchanged: int = 0
+    files_deleted: int = 0
+
+
+class FrontmatterValidationStats(BaseModel):
+    """How frontmatter validation results were obtained."""
+
+    files: int = 0
+    cache_hits: int = 0  # Served from the content-hash cache
+    parsed: int = 0  # Distinct contents parsed this build
+
+
+class OutputFile(BaseModel):
+    """One file in the Hugo output."""
+
+    path: str  # Relative, forward slashes (the blob name)
+    size: int
+    extension: str  # Lower-case, including the dot ("" if none)
+    content_type: str
+    sha256: str
+
+
+class OutputScan(BaseModel):
+    """Result of a single pass over the Hugo output directory."""
+
+    files: List[OutputFile] = Field(default_factory=list)
+    total_size: int = 0
+
+    @property
+    def file_count(self) -> int:
+        return len(self.files)
+
+    @property
+    def extensions(self) -> Set[str]:
+        return {f.extension for f in self.files}
+
+    def manifest(self) -> Dict[str, Dict[str, Any]]:
+        """Deploy manifest entries: blob name -> {sha256, size, content_type}."""
+        return {
+            f.path: {"sha256": f.sha256, "size": f.size, "content_type": f.content_type}
+            for f in self.files
+        }
+
+
+class SearchIndexResult(BaseModel):
+    """Result from building the sharded search index."""
+
+    documents: int = 0
+    terms: int = 0
+    term_shards: int = 0
+    doc_shards: int = 0
+    manifest_bytes: int = 0
+    largest_shard_bytes: int = 0
+    bytes_written: int = 0  # All shards plus manifest
+    source_bytes: int = 0  # Monolithic index.json it replaces
+    duration_seconds: float = 0.0
+
+
+class CacheRule(BaseModel):
+    """Cache-Control header for files matching a path pattern and content type."""
+
+    pattern: Optional[str] = None  # Regex searched in the blob name
+    content_types: Optional[List[str]] = None  # MIME type prefixes
+    cache_control: str  # Empty string leaves the header unset
+
+
+class ManifestDiff(BaseModel):
+    """Difference between the deployed manifest and a new build."""
+
+    changed: List[str] = Field(default_factory=list)  # New or modified
+    unchanged: List[str] = Field(default_factory=list)
+    deleted: List[str] = Field(default_factory=list)
+
+
+class PublishSignal(BaseModel):
+    """A request to publish the site (queue message or manual trigger)."""
+
+    signal_id: str
+    source: str = "queue"
+    files_created: int = 0
+    force_rebuild: bool = False
+    received_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class PublishBuildRecord(BaseModel):
+    """One coalesced build and the signals it satisfied."""
+
+    build_id: int
+    signal_ids: List[str]
+    files_created: int = 0
+    force_rebuild: bool = False
+    started_at: datetime
+    duration_seconds: float = 0.0
+    files_uploaded: int = 0
+    success: bool = False
     errors: List[str] = Field(default_factory=list)
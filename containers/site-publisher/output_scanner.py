@@ -0,0 +1,97 @@
+"""
+Single-pass scanner for Hugo output.
+
+Walks public/ once and records path, size, extension, content type and
+content hash for every file. Output validation, deploy upload selection
+and stale detection all consume the same scan instead of walking the
+directory again.
+"""
+
+import hashlib
+import mimetypes
+import os
+from pathlib import Path
+from typing import List
+
+from models import OutputFile, OutputScan
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def get_content_type(file_path: Path) -> str:
+    """
+    Get MIME content type for a file.
+
+    Pure function for determining content type.
+
+    Args:
+        file_path: Path to file
+
+    Returns:
+        MIME type string (e.g., "text/html", "application/octet-stream")
+    """
+    # Use mimetypes library
+    content_type, _ = mimetypes.guess_type(str(file_path))
+
+    # Default to octet-stream if unknown
+    if content_type is None:
+        return "application/octet-stream"
+
+    return content_type
+
+
+def hash_file(file_path: Path) -> str:
+    """
+    Compute the SHA-256 hex digest of a file.
+
+    Args:
+        file_path: File to hash
+
+    Returns:
+        Hex digest of the file contents
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def scan_output(output_dir: Path) -> OutputScan:
+    """
+    Scan a built site in one directory traversal.
+
+    Args:
+        output_dir: Hugo public/ directory
+
+    Returns:
+        OutputScan with one OutputFile per regular file, sorted by path
+        (relative, forward slashes - the blob name); empty if output_dir
+        does not exist
+
+    Examples:
+        >>> scan = scan_output(Path("public"))
+        >>> scan.manifest()["index.html"]["content_type"]
+        'text/html'
+    """
+    files: List[OutputFile] = []
+    pending = [output_dir] if output_dir.is_dir() else []
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(Path(entry.path))
+                elif entry.is_file(follow_symlinks=False):
+                    path = Path(entry.path)
+                    files.append(
+                        OutputFile(
+                            path=path.relative_to(output_dir).as_posix(),
+                            size=entry.stat(follow_symlinks=False).st_size,
+                            extension=path.suffix.lower(),
+                            content_type=get_content_type(path),
+                            sha256=hash_file(path),
+                        )
+                    )
+
+    files.sort(key=lambda f: f.path)
+    return OutputScan(files=files, total_size=sum(f.size for f in files))
@@ -0,0 +1,179 @@
+"""
+Coalescing publish scheduler for site-publisher.
+
+Every publish signal used to run a full build_and_deploy_site (download,
+Hugo, backup, deploy), so a burst of generator signals plus a manual
+trigger meant several identical builds back-to-back. The scheduler
+collects pending signals and satisfies all of them with one build:
+
+- A single runner task executes builds, so two builds never overlap
+- A build starts no sooner than ``debounce_seconds`` after the first
+  pending signal, and no sooner than ``debounce_seconds`` after the
+  previous build started (at most one build per window)
+- Signals arriving during a build are queued for the next build
+- Each build records which signals it satisfied, and is a forced
+  (from-scratch) rebuild if any of them asked for one
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+from models import DeploymentResult, PublishBuildRecord, PublishSignal
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DEBOUNCE_SECONDS = 15.0
+DEFAULT_HISTORY_SIZE = 20
+
+BuildFunction = Callable[[bool], Awaitable[DeploymentResult]]
+
+
+class PublishScheduler:
+    """Coalesce publish signals into debounced, non-overlapping builds."""
+
+    def __init__(
+        self,
+        build: BuildFunction,
+        debounce_seconds: float = DEFAULT_DEBOUNCE_SECONDS,
+        history_size: int = DEFAULT_HISTORY_SIZE,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            build: Coroutine function running one full build and deploy,
+                called with ``force_rebuild``
+            debounce_seconds: Minimum spacing between builds, and how long
+                to wait for more signals after the first pending one
+            history_size: Number of recent builds kept for status
+            clock: Monotonic time source (injectable for tests)
+            sleep: Sleep coroutine (injectable for tests)
+        """
+        self._build = build
+        self.debounce_seconds = max(0.0, debounce_seconds)
+        self._clock = clock
+        self._sleep = sleep
+        self._pending: List[Tuple[PublishSignal, float, asyncio.Future]] = []
+        self._runner: Optional[asyncio.Task] = None
+        self._building = False
+        self._last_build_started: Optional[float] = None
+        self._next_build_id = 1
+        self.history: Deque[PublishBuildRecord] = deque(maxlen=history_size)
+        self.signals_received = 0
+        self.signals_built = 0
+        self.builds_run = 0
+
+    @property
+    def idle(self) -> bool:
+        """True when no build is running or waiting to run."""
+        return not self._pending and (self._runner is None or self._runner.done())
+
+    def submit(self, signal: PublishSignal) -> "asyncio.Future[PublishBuildRecord]":
+        """
+        Queue a publish signal.
+
+        Args:
+            signal: Publish signal to satisfy
+
+        Returns:
+            Future resolved with the build that satisfied the signal
+            (queue handlers need not await it; manual triggers do)
+        """
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending.append((signal, self._clock(), future))
+        self.signals_received += 1
+        logger.info(
+            f"Publish signal {signal.signal_id} queued "
+            f"({len(self._pending)} pending, building={self._building})"
+        )
+
+        if self._runner is None or self._runner.done():
+            self._runner = asyncio.create_task(self._run())
+        return future
+
+    async def wait_idle(self) -> None:
+        """Wait until all pending signals have been built."""
+        while self._runner is not None and not self._runner.done():
+            await asyncio.shield(self._runner)
+
+    async def _run(self) -> None:
+        while self._pending:
+            await self._wait_for_window()
+            batch, self._pending = self._pending, []
+            record = await self._run_build([signal for signal, _, _ in batch])
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_result(record)
+
+    async def _wait_for_window(self) -> None:
+        """Sleep until the debounce window allows the next build."""
+        ready_at = self._pending[0][1] + self.debounce_seconds
+        if self._last_build_started is not None:
+            ready_at = max(ready_at, self._last_build_started + self.debounce_seconds)
+        delay = ready_at - self._clock()
+        if delay > 0:
+            await self._sleep(delay)
+
+    async def _run_build(self, signals: List[PublishSignal]) -> PublishBuildRecord:
+        build_id = self._next_build_id
+        self._next_build_id += 1
+        force_rebuild = any(signal.force_rebuild for signal in signals)
+        self._last_build_started = self._clock()
+        self._building = True
+        started_at = datetime.now(timezone.utc)
+        start = time.perf_counter()
+
+        logger.info(
+            f"Starting {'forced ' if force_rebuild else ''}build #{build_id} "
+            f"for {len(signals)} coalesced signal(s)"
+        )
+        try:
+            result = await self._build(force_rebuild)
+            files_uploaded, errors = result.files_uploaded, list(result.errors)
+            duration, success = result.duration_seconds, not result.fatal
+        except Exception as e:
+            logger.error(f"Build #{build_id} failed: {e}", exc_info=True)
+            files_uploaded, errors = 0, [str(e)]
+            duration, success = time.perf_counter() - start, False
+        finally:
+            self._building = False
+
+        record = PublishBuildRecord(
+            build_id=build_id,
+            signal_ids=[signal.signal_id for signal in signals],
+            files_created=sum(signal.files_created for signal in signals),
+            force_rebuild=force_rebuild,
+            started_at=started_at,
+            duration_seconds=duration,
+            files_uploaded=files_uploaded,
+            success=success,
+            errors=errors,
+        )
+        self.builds_run += 1
+        self.signals_built += len(signals)
+        self.history.append(record)
+        logger.info(
+            f"Build #{build_id} {'succeeded' if record.success else 'failed'} "
+            f"in {duration:.1f}s, satisfied signals: {record.signal_ids}"
+        )
+        return record
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return coalescing stats and recent builds for status endpoints."""
+        return {
+            "debounce_seconds": self.debounce_seconds,
+            "pending_signals": len(self._pending),
+            "building": self._building,
+            "signals_received": self.signals_received,
+            "builds_run": self.builds_run,
+            "builds_saved": self.signals_built - self.builds_run,
+            "recent_builds": [
+                record.model_dump(mode="json") for record in self.history
+            ],
+        }
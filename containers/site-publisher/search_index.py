@@ -0,0 +1,303 @@
+"""
+Sharded client-side search index for site-publisher.
+
+Hugo's home JSON output (``public/index.json``, PaperMod format: a list of
+{title, content, permalink, summary}) holds every article, and the theme's
+search page downloads all of it. After the Hugo build this module turns it
+into a term-partitioned index under ``public/search/``:
+
+- ``manifest.json``: shard fingerprints, tokenizer settings (small)
+- ``terms-<prefix>.<md5>.json``: postings for terms starting with
+  ``<prefix>`` ({term: [doc id, score, doc id, score, ...]})
+- ``docs-<n>.<md5>.json``: [title, permalink, summary] per document,
+  ``doc_shard_size`` documents per shard
+
+``static/js/sharded-search.js`` fetches the manifest, then only the term
+shards for the typed words and the doc shards for the top hits. Shard
+names carry a content hash, so unchanged shards are not re-deployed and
+can be cached as immutable.
+
+Doc ids are kept stable across builds by a permalink -> id map stored in
+the build workspace. New articles take freed ids or are appended, so a new
+article only changes the last doc shard and the term shards of its own
+terms (index.json order is newest first, and shifts on every publish).
+"""
+
+import hashlib
+import json
+import logging
+import re
+import time
+import unicodedata
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from models import SearchIndexResult
+
+logger = logging.getLogger(__name__)
+
+SEARCH_INDEX_VERSION = 1
+SEARCH_DIR = "search"
+SOURCE_INDEX = "index.json"
+
+PREFIX_LENGTH = 2  # Term shard key: first characters of the term
+DEFAULT_DOC_SHARD_SIZE = 500
+DEFAULT_MAX_POSTINGS = 500  # Highest-scoring documents kept per term
+SUMMARY_LENGTH = 160
+TITLE_WEIGHT = 5  # A title occurrence counts as this many body occurrences
+MIN_TERM_LENGTH = 2
+
+STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have in into is it its of on "
+    "or that the their this to was were will with".split()
+)
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into index terms (same rules as sharded-search.js).
+
+    Args:
+        text: Title, summary or plain-text content
+
+    Returns:
+        Lower-case ASCII terms without stopwords or single characters
+
+    Examples:
+        >>> tokenize("The Café's AI-powered Search")
+        ['cafe', 'ai', 'powered', 'search']
+    """
+    folded = (
+        unicodedata.normalize("NFKD", text)
+        .encode("ascii", "ignore")
+        .decode("ascii")
+        .lower()
+    )
+    return [
+        term
+        for term in _TOKEN_RE.findall(folded)
+        if len(term) >= MIN_TERM_LENGTH and term not in STOPWORDS
+    ]
+
+
+def _compact_json(data: Any) -> bytes:
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _write_shard(search_dir: Path, stem: str, data: Any) -> Tuple[str, int]:
+    """Write a fingerprinted shard; returns (md5, bytes written)."""
+    payload = _compact_json(data)
+    digest = hashlib.md5(payload).hexdigest()
+    (search_dir / f"{stem}.{digest}.json").write_bytes(payload)
+    return digest, len(payload)
+
+
+def _summary(entry: Dict[str, Any]) -> str:
+    summary = " ".join(str(entry.get("summary") or entry.get("content") or "").split())
+    if len(summary) <= SUMMARY_LENGTH:
+        return summary
+    return summary[:SUMMARY_LENGTH].rsplit(" ", 1)[0] + "…"
+
+
+def load_doc_ids(path: Path) -> Dict[str, int]:
+    """
+    Load the permalink -> doc id map from a previous build.
+
+    Args:
+        path: Map file in the build workspace
+
+    Returns:
+        Mapping of permalink to doc id (empty if missing or unreadable)
+    """
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("version") != SEARCH_INDEX_VERSION:
+            return {}
+        return {str(link): int(doc_id) for link, doc_id in data["ids"].items()}
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable search doc id map: {e}")
+        return {}
+
+
+def assign_doc_ids(permalinks: List[str], previous: Dict[str, int]) -> List[int]:
+    """
+    Give each document a doc id, reusing ids from the previous build.
+
+    Pure function. Known permalinks keep their id; new ones (taken oldest
+    first, as index.json lists newest first) fill ids freed by removed
+    articles, lowest first, and then append.
+
+    Args:
+        permalinks: Permalink of each index.json entry, in order
+        previous: Permalink -> doc id map from the previous build
+
+    Returns:
+        Doc id for each entry
+
+    Examples:
+        >>> assign_doc_ids(["/new/", "/b/", "/a/"], {"/a/": 0, "/b/": 1})
+        [2, 1, 0]
+        >>> assign_doc_ids(["/new/", "/a/"], {"/a/": 0, "/gone/": 1})
+        [1, 0]
+    """
+    ids: List[Optional[int]] = [None] * len(permalinks)
+    used = set()
+    for index, link in enumerate(permalinks):
+        doc_id = previous.get(link)
+        if doc_id is not None and doc_id >= 0 and doc_id not in used:
+            ids[index] = doc_id
+            used.add(doc_id)
+
+    next_id = 0
+    for index in reversed(range(len(permalinks))):
+        if ids[index] is None:
+            while next_id in used:
+                next_id += 1
+            ids[index] = next_id
+            used.add(next_id)
+    return [doc_id for doc_id in ids if doc_id is not None]
+
+
+def build_search_index(
+    public_dir: Path,
+    doc_shard_size: int = DEFAULT_DOC_SHARD_SIZE,
+    max_postings: int = DEFAULT_MAX_POSTINGS,
+    remove_source: bool = True,
+    doc_ids_path: Optional[Path] = None,
+) -> SearchIndexResult:
+    """
+    Build the sharded search index from Hugo's index.json.
+
+    CPU-bound; call via asyncio.to_thread from async code.
+
+    Args:
+        public_dir: Hugo public/ directory
+        doc_shard_size: Documents per doc shard
+        max_postings: Maximum documents kept per term (highest scores)
+        remove_source: Delete the monolithic index.json afterwards so
+            visitors never download it
+        doc_ids_path: Permalink -> doc id map kept between builds (None
+            numbers documents afresh, oldest first)
+
+    Returns:
+        SearchIndexResult with document/term/shard counts and sizes
+        (documents=0 if there is no index.json)
+
+    Raises:
+        ValueError: If index.json is not a JSON list
+    """
+    start = time.perf_counter()
+    source = public_dir / SOURCE_INDEX
+    if not source.exists():
+        logger.info("No index.json in Hugo output, skipping search index")
+        return SearchIndexResult()
+
+    source_bytes = source.stat().st_size
+    entries = json.loads(source.read_text(encoding="utf-8"))
+    if not isinstance(entries, list):
+        raise ValueError("index.json must be a JSON list")
+
+    permalinks = [str(entry.get("permalink") or "") for entry in entries]
+    previous = load_doc_ids(doc_ids_path) if doc_ids_path else {}
+    doc_ids = assign_doc_ids(permalinks, previous)
+
+    # Inverted index: term -> {doc id: score}; freed ids stay null
+    postings: Dict[str, Dict[int, int]] = defaultdict(dict)
+    documents: List[Optional[List[str]]] = [None] * (max(doc_ids, default=-1) + 1)
+    for doc_id, permalink, entry in zip(doc_ids, permalinks, entries):
+        title = str(entry.get("title") or "")
+        documents[doc_id] = [title, permalink, _summary(entry)]
+
+        scores = Counter(tokenize(str(entry.get("content") or "")))
+        for term in tokenize(title):
+            scores[term] += TITLE_WEIGHT
+        for term, score in scores.items():
+            postings[term][doc_id] = score
+
+    # Partition terms by prefix, keeping each term's best documents (ties go
+    # to the higher, usually newer, doc id)
+    shards: Dict[str, Dict[str, List[int]]] = defaultdict(dict)
+    for term in sorted(postings):
+        best = sorted(postings[term].items(), key=lambda item: (-item[1], -item[0]))
+        flat: List[int] = []
+        for doc_id, score in best[:max_postings]:
+            flat.extend((doc_id, score))
+        shards[term[:PREFIX_LENGTH]][term] = flat
+
+    search_dir = public_dir / SEARCH_DIR
+    search_dir.mkdir(parents=True, exist_ok=True)
+    for stale in search_dir.glob("*.json"):
+        stale.unlink()
+
+    bytes_written = 0
+    largest_shard = 0
+    term_shards: Dict[str, str] = {}
+    for prefix, terms in shards.items():
+        term_shards[prefix], size = _write_shard(search_dir, f"terms-{prefix}", terms)
+        bytes_written += size
+        largest_shard = max(largest_shard, size)
+
+    doc_shards: List[str] = []
+    for offset in range(0, len(documents), max(1, doc_shard_size)):
+        digest, size = _write_shard(
+            search_dir,
+            f"docs-{len(doc_shards)}",
+            documents[offset : offset + doc_shard_size],
+        )
+        doc_shards.append(digest)
+        bytes_written += size
+        largest_shard = max(largest_shard, size)
+
+    manifest = _compact_json(
+        {
+            "version": SEARCH_INDEX_VERSION,
+            "documents": len(documents),
+            "docShardSize": doc_shard_size,
+            "prefixLength": PREFIX_LENGTH,
+            "minTermLength": MIN_TERM_LENGTH,
+            "stopwords": sorted(STOPWORDS),
+            "terms": term_shards,
+            "docs": doc_shards,
+        }
+    )
+    (search_dir / "manifest.json").write_bytes(manifest)
+    bytes_written += len(manifest)
+
+    if doc_ids_path:
+        doc_ids_path.parent.mkdir(parents=True, exist_ok=True)
+        doc_ids_path.write_bytes(
+            _compact_json(
+                {
+                    "version": SEARCH_INDEX_VERSION,
+                    "ids": dict(zip(permalinks, doc_ids)),
+                }
+            )
+        )
+
+    if remove_source:
+        source.unlink()
+
+    result = SearchIndexResult(
+        documents=len(entries),
+        terms=len(postings),
+        term_shards=len(term_shards),
+        doc_shards=len(doc_shards),
+        manifest_bytes=len(manifest),
+        largest_shard_bytes=largest_shard,
+        bytes_written=bytes_written,
+        source_bytes=source_bytes,
+        duration_seconds=round(time.perf_counter() - start, 3),
+    )
+    logger.info(
+        f"Search index: {result.documents} documents, {result.terms} terms in "
+        f"{result.term_shards} term shards and {result.doc_shards} doc shards "
+        f"(manifest {result.manifest_bytes} bytes, largest shard "
+        f"{result.largest_shard_bytes} bytes, source {result.source_bytes} bytes) "
+        f"in {result.duration_seconds:.2f}s"
+    )
+    return result
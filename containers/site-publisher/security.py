@@ -6,9 +6,10 @@ All pure functions for validating input and preventing attacks.
 
 import re
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
-from models import ValidationResult
+from models import OutputScan, ValidationResult
+from output_scanner import scan_output
 
 
 def validate_blob_name(blob_name: str) -> ValidationResult:
@@ -138,12 +139,16 @@ def sanitize_error_message(error: Exception) -> str:
     return error_msg
 
 
-def validate_hugo_output(output_dir: Path) -> ValidationResult:
+def validate_hugo_output(
+    output_dir: Path, scan: Optional[OutputScan] = None
+) -> ValidationResult:
     """
     Validate Hugo build output for security and completeness.
 
     Args:
         output_dir: Directory containing Hugo build output
+        scan: Single-pass scan of output_dir (scanned here if not given,
+            so callers can share one scan with deployment)
 
     Returns:
         ValidationResult with errors if invalid
@@ -160,32 +165,32 @@ def validate_hugo_output(output_dir: Path) -> ValidationResult:
     if not (output_dir / "index.html").exists():
         errors.append("Missing index.html")
 
+    try:
+        if scan is None:
+            scan = scan_output(output_dir)
+    except Exception as e:
+        errors.append(f"Failed to scan output: {type(e).__name__}")
+        return ValidationResult(is_valid=False, errors=errors)
+
     # Check for suspicious files
     suspicious_extensions = [".exe", ".sh", ".bat", ".ps1", ".dll", ".so"]
+    found_extensions = scan.extensions
     for ext in suspicious_extensions:
-        if list(output_dir.rglob(f"*{ext}")):
+        if ext in found_extensions:
             errors.append(f"Suspicious file type found: {ext}")
 
     # Check total size (prevent DOS)
-    try:
-        total_size = sum(f.stat().st_size for f in output_dir.rglob("*") if f.is_file())
-        max_size = (
-            200 * 1024 * 1024
-        )  # 200 MB (increased from 100 MB for 4000+ article sites)
-        if total_size > max_size:
-            errors.append(
-                f"Build output too large: {total_size / (1024*1024):.1f} MB (max: {max_size / (1024*1024):.0f} MB)"
-            )
-    except Exception as e:
-        errors.append(f"Failed to check output size: {type(e).__name__}")
+    max_size = (
+        200 * 1024 * 1024
+    )  # 200 MB (increased from 100 MB for 4000+ article sites)
+    if scan.total_size > max_size:
+        errors.append(
+            f"Build output too large: {scan.total_size / (1024*1024):.1f} MB (max: {max_size / (1024*1024):.0f} MB)"
+        )
 
     # Check file count (prevent DOS)
-    try:
-        file_count = len(list(output_dir.rglob("*")))
-        max_files = 10000
-        if file_count > max_files:
-            errors.append(f"Too many files in output: {file_count}")
-    except Exception as e:
-        errors.append(f"Failed to count files: {type(e).__name__}")
+    max_files = 10000
+    if scan.file_count > max_files:
+        errors.append(f"Too many files in output: {scan.file_count}")
 
     return ValidationResult(is_valid=(len(errors) == 0), errors=errors)
@@ -10,9 +10,10 @@ import logging
 import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import Dict, List
 
 from azure.storage.blob.aio import BlobServiceClient
+from cache_policy import load_cache_rules
 from configure_telemetry import configure_hugo_telemetry
 from content_downloader import download_markdown_files, organize_content_for_hugo
 from error_handling import handle_error
@@ -23,155 +24,175 @@ from hugo_builder import (
     rollback_deployment,
 )
 from models import DeploymentResult
+from output_scanner import scan_output
+from search_index import build_search_index
 from security import sanitize_error_message
+from workspace import sync_directory_async, timed_phase
 
 from config import Settings  # type: ignore[attr-defined]
 
 logger = logging.getLogger(__name__)
 
-
-async def _copy_directory_async(src: Path, dst: Path) -> None:
-    """
-    Copy directory recursively (async-safe wrapper around shutil.copytree).
-
-    Args:
-        src: Source directory path
-        dst: Destination directory path
-    """
-    # shutil.copytree is I/O bound but synchronous
-    # For now we'll use it directly since it's fast for small directories
-    # If needed, we can run in executor: await asyncio.get_event_loop().run_in_executor(None, ...)
-    shutil.copytree(src, dst, dirs_exist_ok=True)
+# Theme/config directories synced from hugo-config into the workspace
+HUGO_SITE_DIRECTORIES = ("layouts", "static", "assets")
 
 
 async def build_and_deploy_site(
-    blob_client: BlobServiceClient, config: Settings
+    blob_client: BlobServiceClient, config: Settings, force_rebuild: bool = False
 ) -> DeploymentResult:
     """
     Build and deploy static site (main composition function).
 
-    This orchestrates the complete pipeline:
-    1. Download markdown files from blob storage
-    2. Organize content for Hugo
+    This orchestrates the complete pipeline in a persistent workspace
+    (config.workspace_dir), so the content mirror, synced theme files and
+    Hugo's resources/_gen cache are reused between builds:
+    1. Sync markdown files from blob storage
+    2. Organize content and sync theme/config files for Hugo
     3. Build site with Hugo
     4. Validate build output
     5. Deploy to $web container
 
+    Each phase's duration is reported in DeploymentResult.phase_timings.
+
     Args:
         blob_client: Azure blob service client (injected dependency)
         config: Application configuration (injected dependency)
+        force_rebuild: Discard the workspace first, so every file is
+            downloaded, validated and rendered again
 
     Returns:
-        DeploymentResult with overall metrics and any errors
+        DeploymentResult with overall metrics, phase timings and any errors
+        (fatal=True when the site was not deployed)
     """
     start_time = datetime.now()
     logger.info("Starting build and deploy pipeline")
 
     all_errors: List[str] = []
+    timings: Dict[str, float] = {}
+
+    def _result(
+        files_uploaded: int, errors: List[str], fatal: bool = True, **deploy_stats: int
+    ) -> DeploymentResult:
+        return DeploymentResult(
+            files_uploaded=files_uploaded,
+            duration_seconds=(datetime.now() - start_time).total_seconds(),
+            errors=errors,
+            phase_timings=timings,
+            fatal=fatal,
+            **deploy_stats,
+        )
 
     try:
         # Configure Application Insights telemetry for Hugo
         hugo_config_file = Path(config.hugo_config_path)
         configure_hugo_telemetry(str(hugo_config_file))
 
-        # Step 1: Download markdown files
-        temp_dir = Path("/tmp/site-builder")
-        content_dir = temp_dir / "content"
+        # Step 1: Sync markdown files into the persistent local mirror
+        workspace_dir = Path(config.workspace_dir)
+        if force_rebuild and workspace_dir.exists():
+            logger.info(f"Forced rebuild: clearing workspace {workspace_dir}")
+            await asyncio.to_thread(shutil.rmtree, workspace_dir, ignore_errors=True)
+        content_dir = workspace_dir / "content"
         content_dir.mkdir(parents=True, exist_ok=True)
 
-        download_result = await download_markdown_files(
-            blob_client=blob_client,
-            container_name=config.markdown_container,
-            output_dir=content_dir,
-        )
+        with timed_phase(timings, "sync"):
+            download_result = await download_markdown_files(
+                blob_client=blob_client,
+                container_name=config.markdown_container,
+                output_dir=content_dir,
+                max_files=config.max_markdown_files,
+                max_file_size=config.max_file_size_mb * 1024 * 1024,
+                max_concurrency=config.download_concurrency,
+            )
 
-        if download_result.files_downloaded == 0:
+        files_available = (
+            download_result.files_downloaded + download_result.files_skipped
+        )
+        if files_available == 0:
             logger.error("No files downloaded, aborting pipeline")
-            return DeploymentResult(
-                files_uploaded=0,
-                duration_seconds=(datetime.now() - start_time).total_seconds(),
-                errors=["No markdown files downloaded"] + download_result.errors,
-            )
+            return _result(0, ["No markdown files downloaded"] + download_result.errors)
 
         all_errors.extend(download_result.errors)
-        logger.info(f"Downloaded {download_result.files_downloaded} files")
+        logger.info(
+            f"Synced {files_available} files: {download_result.files_downloaded} "
+            f"downloaded ({download_result.bytes_downloaded} bytes), "
+            f"{download_result.files_skipped} unchanged "
+            f"({download_result.bytes_skipped} bytes), "
+            f"{download_result.files_deleted} deleted"
+        )
 
         # Step 2: Organize content for Hugo
-        hugo_dir = temp_dir / "hugo-site"
+        hugo_dir = workspace_dir / "hugo-site"
         hugo_content_dir = hugo_dir / "content"
 
-        organize_result = await organize_content_for_hugo(
-            content_dir=content_dir,
-            hugo_content_dir=hugo_content_dir,
-        )
+        with timed_phase(timings, "organize"):
+            # Unchanged articles stay linked from the previous build; deleted
+            # ones are removed from hugo-site/content by the organizer
+            organize_result = await organize_content_for_hugo(
+                content_dir=content_dir,
+                hugo_content_dir=hugo_content_dir,
+                max_workers=config.validation_workers or None,
+            )
+
+            if organize_result.is_valid:
+                # Step 2.5: Sync Hugo layouts, static files, and assets
+                # (only changed files are copied into the workspace)
+                hugo_config_base = Path(config.hugo_config_path).parent
+                for name in HUGO_SITE_DIRECTORIES:
+                    src = hugo_config_base / name
+                    if not src.exists():
+                        logger.warning(f"Hugo {name} directory not found: {src}")
+                        continue
+                    sync_result = await sync_directory_async(src, hugo_dir / name)
+                    logger.info(
+                        f"Synced {name}: {sync_result.files_copied} copied, "
+                        f"{sync_result.files_unchanged} unchanged, "
+                        f"{sync_result.files_deleted} removed"
+                    )
 
         if not organize_result.is_valid:
             logger.error("Content organization failed, aborting pipeline")
-            return DeploymentResult(
-                files_uploaded=0,
-                duration_seconds=(datetime.now() - start_time).total_seconds(),
-                errors=["Content organization failed"] + organize_result.errors,
-            )
+            return _result(0, ["Content organization failed"] + organize_result.errors)
 
         all_errors.extend(organize_result.errors)
 
-        # Step 2.5: Copy Hugo layouts, static files, and assets
-        hugo_config_base = Path(config.hugo_config_path).parent
-        logger.info(f"Copying Hugo layouts and static files from {hugo_config_base}")
-
-        # Copy layouts directory (contains partials and overrides)
-        layouts_src = hugo_config_base / "layouts"
-        if layouts_src.exists():
-            layouts_dst = hugo_dir / "layouts"
-            await _copy_directory_async(layouts_src, layouts_dst)
-            logger.info(f"Copied layouts directory: {layouts_src} -> {layouts_dst}")
-        else:
-            logger.warning(f"Layouts directory not found: {layouts_src}")
-
-        # Copy static directory (contains CSS, images, etc.)
-        static_src = hugo_config_base / "static"
-        if static_src.exists():
-            static_dst = hugo_dir / "static"
-            await _copy_directory_async(static_src, static_dst)
-            logger.info(f"Copied static directory: {static_src} -> {static_dst}")
-        else:
-            logger.warning(f"Static directory not found: {static_src}")
-
-        # Copy assets directory if it exists
-        assets_src = hugo_config_base / "assets"
-        if assets_src.exists():
-            assets_dst = hugo_dir / "assets"
-            await _copy_directory_async(assets_src, assets_dst)
-            logger.info(f"Copied assets directory: {assets_src} -> {assets_dst}")
-
-        # Step 3: Build site with Hugo
-        config_file = Path(config.hugo_config_path)
-
-        build_result = await build_site_with_hugo(
-            hugo_dir=hugo_dir,
-            config_file=config_file,
-            base_url=config.hugo_base_url,
-            timeout_seconds=config.build_timeout_seconds,
-        )
+        # Step 3: Build site with Hugo (resources/_gen persists in hugo_dir,
+        # Hugo's file cache in the workspace cache dir)
+        with timed_phase(timings, "hugo"):
+            build_result = await build_site_with_hugo(
+                hugo_dir=hugo_dir,
+                config_file=hugo_config_file,
+                base_url=config.hugo_base_url,
+                timeout_seconds=config.build_timeout_seconds,
+                cache_dir=workspace_dir / "hugo-cache",
+            )
 
         if not build_result.success:
             logger.error("Hugo build failed, aborting pipeline")
-            return DeploymentResult(
-                files_uploaded=0,
-                duration_seconds=(datetime.now() - start_time).total_seconds(),
-                errors=["Hugo build failed"] + build_result.errors,
-            )
+            return _result(0, ["Hugo build failed"] + build_result.errors)
 
         all_errors.extend(build_result.errors)
         logger.info(f"Built site: {build_result.output_files} files")
 
-        # Step 4: Incremental backup (only backs up new/changed files)
-        # This creates cumulative backup over time, much faster than full backup
-        backup_result = await backup_current_site(
-            blob_client=blob_client,
-            source_container=config.output_container,
-            backup_container=config.backup_container,
-        )
+        # Step 3.5: Replace the monolithic index.json with a sharded index
+        # so search only downloads the shards a query needs
+        if config.search_index_enabled:
+            with timed_phase(timings, "search_index"):
+                await asyncio.to_thread(
+                    build_search_index,
+                    hugo_dir / "public",
+                    doc_ids_path=workspace_dir / "search-doc-ids.json",
+                )
+
+        # Step 4: Snapshot the live site (stores only content changed since
+        # the previous snapshot; a no-op when nothing changed)
+        with timed_phase(timings, "backup"):
+            backup_result = await backup_current_site(
+                blob_client=blob_client,
+                source_container=config.output_container,
+                backup_container=config.backup_container,
+                keep_snapshots=config.backup_snapshot_retention,
+            )
 
         # Note: Backup failures are logged but don't stop deployment
         if backup_result.errors:
@@ -179,10 +200,10 @@ async def build_and_deploy_site(
             all_errors.extend(backup_result.errors)
         elif backup_result.files_uploaded > 0:
             logger.info(
-                f"Incremental backup: {backup_result.files_uploaded} new files backed up"
+                f"Snapshot backup: {backup_result.files_uploaded} new objects stored"
             )
         else:
-            logger.info("No new files to backup (all files already backed up)")
+            logger.info("No new content to back up (already in snapshot store)")
 
         # Step 5: Deploy to $web container
         public_dir = hugo_dir / "public"
@@ -190,58 +211,75 @@ async def build_and_deploy_site(
         # Validate before attempting deployment
         from security import validate_hugo_output
 
-        validation = validate_hugo_output(public_dir)
+        # One pass over public/ feeds validation, upload selection and
+        # stale detection
+        with timed_phase(timings, "validate"):
+            scan = await asyncio.to_thread(scan_output, public_dir)
+            validation = validate_hugo_output(public_dir, scan=scan)
         if not validation.is_valid:
             logger.error(f"Hugo output validation failed: {validation.errors}")
-            return DeploymentResult(
-                files_uploaded=0,
-                duration_seconds=(datetime.now() - start_time).total_seconds(),
-                errors=all_errors + validation.errors,
-            )
-
-        deploy_result = await deploy_to_web_container(
-            blob_client=blob_client,
-            source_dir=public_dir,
-            container_name=config.output_container,
-        )
+            return _result(0, all_errors + validation.errors)
 
-        # If deployment failed catastrophically, attempt rollback
-        if deploy_result.files_uploaded == 0:
-            logger.error("Deployment failed completely - attempting rollback")
-
-            rollback_result = await rollback_deployment(
+        with timed_phase(timings, "deploy"):
+            deploy_result = await deploy_to_web_container(
                 blob_client=blob_client,
-                backup_container=config.backup_container,
-                target_container=config.output_container,
+                source_dir=public_dir,
+                container_name=config.output_container,
+                max_concurrency=config.deploy_concurrency,
+                scan=scan,
+                compression=config.deploy_compression,
+                cache_rules=load_cache_rules(config.cache_policy),
+                manifest_container=config.backup_container,
+            )
+
+            # If deployment failed catastrophically, attempt rollback (zero
+            # uploads alone is normal: nothing changed since the last deploy)
+            deploy_failed = deploy_result.files_uploaded == 0 and bool(
+                deploy_result.errors
             )
+            if deploy_failed:
+                logger.error("Deployment failed completely - attempting rollback")
 
-            if rollback_result.files_uploaded > 0:
-                logger.warning(
-                    f"Rollback successful: restored {rollback_result.files_uploaded} files"
+                rollback_result = await rollback_deployment(
+                    blob_client=blob_client,
+                    backup_container=config.backup_container,
+                    target_container=config.output_container,
                 )
-                all_errors.append("Deployment failed - rolled back to previous version")
-            else:
-                logger.error("Rollback failed - site may be in inconsistent state")
-                all_errors.append("Deployment failed and rollback failed")
+
+                # Rollback is incremental too: restoring zero files is success
+                # when the site already matches the snapshot
+                if not rollback_result.errors:
+                    logger.warning(
+                        f"Rollback successful: restored {rollback_result.files_uploaded} files"
+                    )
+                    all_errors.append(
+                        "Deployment failed - rolled back to previous version"
+                    )
+                else:
+                    logger.error("Rollback failed - site may be in inconsistent state")
+                    all_errors.append("Deployment failed and rollback failed")
 
         all_errors.extend(deploy_result.errors)
 
-        duration = (datetime.now() - start_time).total_seconds()
-        logger.info(
-            f"Pipeline complete: {deploy_result.files_uploaded} files deployed in {duration:.2f}s"
+        # Errors from earlier phases (e.g. quarantined articles, backup
+        # problems) are warnings once the site itself has deployed
+        result = _result(
+            deploy_result.files_uploaded,
+            all_errors,
+            fatal=deploy_failed,
+            files_unchanged=deploy_result.files_unchanged,
+            files_deleted=deploy_result.files_deleted,
+            bytes_uploaded=deploy_result.bytes_uploaded,
+            bytes_saved=deploy_result.bytes_saved,
+            bytes_compression_saved=deploy_result.bytes_compression_saved,
         )
-
-        return DeploymentResult(
-            files_uploaded=deploy_result.files_uploaded,
-            duration_seconds=duration,
-            errors=all_errors,
+        logger.info(
+            f"Pipeline complete: {deploy_result.files_uploaded} files deployed "
+            f"({deploy_result.bytes_compression_saved} bytes saved by compression) in "
+            f"{result.duration_seconds:.2f}s (phases: {timings})"
         )
+        return result
 
     except Exception as e:
-        duration = (datetime.now() - start_time).total_seconds()
         error_info = handle_error(e, error_type="pipeline")
-        return DeploymentResult(
-            files_uploaded=0,
-            duration_seconds=duration,
-            errors=all_errors + [sanitize_error_message(e)],
-        )
+        return _result(0, all_errors + [sanitize_error_message(e)])
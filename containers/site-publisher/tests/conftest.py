@@ -4,15 +4,31 @@ Pytest configuration for site-publisher tests.
 Provides shared fixtures and test configuration.
 """
 
+import hashlib
+import os
 import sys
 from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List, Set
 from unittest.mock import AsyncMock, Mock
 
 import pytest
+from azure.core.exceptions import ResourceExistsError, ResourceNotFoundError
 
 # Add parent directory to path so we can import from site-publisher modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+# Word list for synthetic article corpora (benchmarks, search index)
+VOCABULARY = [
+    "kubernetes", "python", "rust", "quantum", "security", "database",
+    "latency", "compiler", "browser", "network", "storage", "container",
+    "serverless", "model", "training", "inference", "privacy", "energy",
+    "battery", "satellite", "robotics", "startup", "funding", "release",
+    "benchmark", "framework", "protocol", "encryption", "cluster", "kernel",
+    "developers", "researchers", "announced", "performance", "open", "source",
+    "platform", "hardware", "regulation", "analysis", "users", "according",
+]  # fmt: skip
+
 
 @pytest.fixture
 def temp_dir(tmp_path):
@@ -83,6 +99,76 @@ def mock_blob_properties():
     return mock_blob
 
 
+class FakeContainer:
+    """Dict-backed async container client recording uploads and deletes."""
+
+    def __init__(self) -> None:
+        self.blobs: Dict[str, bytes] = {}
+        self.uploads: List[str] = []
+        self.deletes: List[str] = []
+        self.listings = 0
+        self.fail_uploads: Set[str] = set()
+        self.content_settings: Dict[str, Any] = {}
+
+    def get_blob_client(self, name: str):
+        container = self
+
+        class _Stream:
+            async def readall(self) -> bytes:
+                return container.blobs[name]
+
+        class _Blob:
+            async def download_blob(self):
+                if name not in container.blobs:
+                    raise ResourceNotFoundError("not found")
+                return _Stream()
+
+            async def upload_blob(self, data, overwrite=False, content_settings=None):
+                if name in container.fail_uploads:
+                    raise RuntimeError("upload failed")
+                if not overwrite and name in container.blobs:
+                    raise ResourceExistsError("exists")
+                payload = data if isinstance(data, bytes) else data.read()
+                container.blobs[name] = payload
+                container.uploads.append(name)
+                container.content_settings[name] = content_settings
+
+        return _Blob()
+
+    async def delete_blob(self, name: str) -> None:
+        if name not in self.blobs:
+            raise ResourceNotFoundError("not found")
+        self.deletes.append(name)
+        del self.blobs[name]
+
+    async def list_blobs(self, name_starts_with: str = ""):
+        self.listings += 1
+        for name in list(self.blobs):
+            if name.startswith(name_starts_with):
+                content = self.blobs[name]
+                yield SimpleNamespace(
+                    name=name,
+                    size=len(content),
+                    etag=f'"{hashlib.md5(content).hexdigest()}"',
+                )
+
+
+class FakeBlobService:
+    """Blob service client handing out FakeContainers by name."""
+
+    def __init__(self) -> None:
+        self.containers: Dict[str, FakeContainer] = {}
+
+    def get_container_client(self, name: str) -> FakeContainer:
+        return self.containers.setdefault(name, FakeContainer())
+
+
+@pytest.fixture
+def fake_blob_service():
+    """Provide an in-memory blob service ($web, $web-backup, ...)."""
+    return FakeBlobService()
+
+
 @pytest.fixture
 def mock_container_client():
     """Provide a mocked container client with common operations."""
@@ -109,3 +195,25 @@ theme = "PaperMod"
 
 # Configure pytest
 pytest_plugins = ["pytest_asyncio"]
+
+
+# Pytest configuration
+def pytest_configure(config):
+    """Configure pytest with custom markers."""
+    config.addinivalue_line(
+        "markers", "performance: marks benchmark tests (timings printed with -s)"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmarks unless selected with -m performance or RUN_PERFORMANCE_TESTS."""
+    if "performance" in (config.getoption("markexpr") or ""):
+        return
+    if os.getenv("RUN_PERFORMANCE_TESTS", "false").lower() == "true":
+        return
+    skip = pytest.mark.skip(
+        reason="benchmark: run with -m performance or RUN_PERFORMANCE_TESTS=true"
+    )
+    for item in items:
+        if "performance" in item.keywords:
+            item.add_marker(skip)
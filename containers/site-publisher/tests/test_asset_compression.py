@@ -0,0 +1,138 @@
+"""
+Unit tests for asset_compression.py and precompressed deploys.
+
+Tests which assets are compressed, that incompressible files are uploaded
+as-is, and that snapshots store uncompressed objects.
+"""
+
+import gzip
+import hashlib
+import os
+from unittest.mock import patch
+
+import pytest
+from asset_compression import (
+    compress_content,
+    compression_for,
+    decompress_content,
+    resolve_encoding,
+)
+from deploy_manifest import object_blob_name
+from hugo_builder import (
+    backup_current_site,
+    deploy_to_web_container,
+    rollback_deployment,
+)
+
+PAGE = "<html><body>" + "<p>Hello compressed world</p>" * 200 + "</body></html>"
+
+
+@pytest.fixture
+def public_dir(temp_dir):
+    public = temp_dir / "public"
+    public.mkdir()
+    (public / "index.html").write_text(PAGE)
+    (public / "tiny.css").write_text("body {}")
+    (public / "random.js").write_bytes(os.urandom(4096))
+    (public / "logo.png").write_bytes(b"\x89PNG" * 1000)
+    return public
+
+
+async def _deploy(blob_client, public_dir, compression):
+    return await deploy_to_web_container(
+        blob_client=blob_client,
+        source_dir=public_dir,
+        container_name="$web",
+        compression=compression,
+    )
+
+
+def test_resolve_encoding():
+    """Setting values map to encodings; brotli falls back to gzip if missing."""
+    assert resolve_encoding("none") is None
+    assert resolve_encoding("") is None
+    assert resolve_encoding("GZIP") == "gzip"
+    with pytest.raises(ValueError):
+        resolve_encoding("zstd")
+    with patch("asset_compression.brotli", None):
+        assert resolve_encoding("br") == "gzip"
+
+
+def test_compression_for_text_assets_only():
+    """Only text content types above the size threshold are compressed."""
+    html = {"size": 4096, "content_type": "text/html"}
+    assert compression_for(html, "gzip") == "gzip"
+    assert compression_for(html, None) is None
+    assert compression_for({"size": 10, "content_type": "text/html"}, "gzip") is None
+    assert compression_for({"size": 4096, "content_type": "image/png"}, "gzip") is None
+
+
+def test_gzip_round_trip_is_deterministic():
+    """Identical input compresses to identical bytes."""
+    data = PAGE.encode()
+    assert compress_content(data, "gzip") == compress_content(data, "gzip")
+    assert decompress_content(compress_content(data, "gzip"), "gzip") == data
+    assert decompress_content(data, None) == data
+
+
+@pytest.mark.asyncio
+async def test_deploy_uploads_compressed_text(fake_blob_service, public_dir):
+    """HTML is stored gzipped with Content-Encoding; other files as-is."""
+    result = await _deploy(fake_blob_service, public_dir, "gzip")
+
+    container = fake_blob_service.get_container_client("$web")
+    settings = container.content_settings
+    assert settings["index.html"].content_encoding == "gzip"
+    assert gzip.decompress(container.blobs["index.html"]).decode() == PAGE
+    # Too small, incompressible, or not text
+    for name in ("tiny.css", "random.js", "logo.png"):
+        assert settings[name].content_encoding is None
+        assert container.blobs[name] == (public_dir / name).read_bytes()
+
+    assert result.files_uploaded == 4
+    compressed_size = len(container.blobs["index.html"])
+    assert result.bytes_compression_saved == len(PAGE) - compressed_size
+    assert result.bytes_uploaded == sum(
+        len(b) for n, b in container.blobs.items() if not n.startswith(".")
+    )
+
+
+@pytest.mark.asyncio
+async def test_changing_compression_reuploads(fake_blob_service, public_dir):
+    """Unchanged files are skipped unless the compression setting changes."""
+    await _deploy(fake_blob_service, public_dir, "gzip")
+
+    unchanged = await _deploy(fake_blob_service, public_dir, "gzip")
+    disabled = await _deploy(fake_blob_service, public_dir, "none")
+
+    container = fake_blob_service.get_container_client("$web")
+    assert unchanged.files_uploaded == 0
+    assert disabled.files_uploaded == 2  # index.html and random.js
+    assert container.blobs["index.html"].decode() == PAGE
+    assert container.content_settings["index.html"].content_encoding is None
+
+
+@pytest.mark.asyncio
+async def test_snapshot_stores_uncompressed_objects(fake_blob_service, public_dir):
+    """Backups decompress, and rollback re-applies compression."""
+    await _deploy(fake_blob_service, public_dir, "gzip")
+    backup = await backup_current_site(fake_blob_service, "$web", "$web-backup")
+    assert not backup.errors
+    objects = fake_blob_service.get_container_client("$web-backup").blobs
+    digest = hashlib.sha256(PAGE.encode()).hexdigest()
+    assert objects[object_blob_name(digest)].decode() == PAGE
+
+    # Break the live page, then roll back
+    (public_dir / "index.html").write_text("<html>broken</html>")
+    await _deploy(fake_blob_service, public_dir, "gzip")
+    rollback = await rollback_deployment(fake_blob_service, "$web-backup", "$web")
+
+    container = fake_blob_service.get_container_client("$web")
+    assert not rollback.errors
+    assert rollback.files_uploaded == 1
+    assert container.content_settings["index.html"].content_encoding == "gzip"
+    assert gzip.decompress(container.blobs["index.html"]).decode() == PAGE
+    # Snapshot of the restored site matches: nothing new to store
+    assert (
+        await backup_current_site(fake_blob_service, "$web", "$web-backup")
+    ).files_uploaded == 0
@@ -0,0 +1,120 @@
+"""
+Unit tests for cache_policy.py
+
+Tests rule matching and that deploys upload blobs with the chosen
+Cache-Control header (checked against the in-memory blob service).
+"""
+
+import json
+
+import pytest
+from cache_policy import (
+    IMMUTABLE,
+    MEDIUM_TTL,
+    SHORT_TTL,
+    STATIC_TTL,
+    cache_control_for,
+    load_cache_rules,
+)
+from hugo_builder import deploy_to_web_container
+
+FINGERPRINT = "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
+
+
+@pytest.mark.parametrize(
+    "path, content_type, expected",
+    [
+        (f"assets/css/stylesheet.{FINGERPRINT}.css", "text/css", IMMUTABLE),
+        (f"assets/js/search.{FINGERPRINT[:32]}.js", "text/javascript", IMMUTABLE),
+        ("index.html", "text/html", SHORT_TTL),
+        ("posts/hello/index.html", "text/html; charset=utf-8", SHORT_TTL),
+        ("index.json", "application/json", MEDIUM_TTL),
+        ("index.xml", "application/xml", MEDIUM_TTL),
+        ("sitemap.xml", "text/xml", MEDIUM_TTL),
+        ("css/custom.css", "text/css", MEDIUM_TTL),
+        ("images/hero.webp", "image/webp", STATIC_TTL),
+        ("robots.txt", "text/plain", None),
+    ],
+)
+def test_default_rules(path, content_type, expected):
+    """Fingerprinted assets immutable, HTML short, feeds medium."""
+    assert cache_control_for(path, content_type) == expected
+
+
+def test_custom_rules_take_precedence():
+    """CACHE_POLICY rules are checked before the defaults."""
+    rules = load_cache_rules(
+        json.dumps(
+            [
+                {"pattern": "^posts/", "cache_control": "no-cache"},
+                {
+                    "content_types": ["text/plain"],
+                    "cache_control": "public, max-age=60",
+                },
+                {
+                    "pattern": r"\.html$",
+                    "content_types": ["text/"],
+                    "cache_control": "",
+                },
+            ]
+        )
+    )
+
+    assert cache_control_for("posts/a/index.html", "text/html", rules) == "no-cache"
+    assert cache_control_for("robots.txt", "text/plain", rules) == "public, max-age=60"
+    assert cache_control_for("index.html", "text/html", rules) is None
+    assert cache_control_for("index.json", "application/json", rules) == MEDIUM_TTL
+
+
+@pytest.mark.parametrize(
+    "policy", ["not json", '{"pattern": "x"}', '[{"pattern": "("}]', "[{}]"]
+)
+def test_invalid_policy_rejected(policy):
+    """Malformed policies fail loudly instead of silently caching wrong."""
+    with pytest.raises(ValueError):
+        load_cache_rules(policy)
+
+
+@pytest.mark.asyncio
+async def test_deploy_sets_cache_control(fake_blob_service, temp_dir):
+    """Each uploaded blob carries the policy's Cache-Control header."""
+    public = temp_dir / "public"
+    (public / "assets" / "css").mkdir(parents=True)
+    (public / "index.html").write_text("<html></html>")
+    (public / "index.json").write_text("[]")
+    (public / "assets" / "css" / f"stylesheet.{FINGERPRINT}.css").write_text("a {}")
+
+    await deploy_to_web_container(
+        blob_client=fake_blob_service, source_dir=public, container_name="$web"
+    )
+
+    settings = fake_blob_service.get_container_client("$web").content_settings
+    assert settings["index.html"].cache_control == SHORT_TTL
+    assert settings["index.json"].cache_control == MEDIUM_TTL
+    assert (
+        settings[f"assets/css/stylesheet.{FINGERPRINT}.css"].cache_control == IMMUTABLE
+    )
+
+
+@pytest.mark.asyncio
+async def test_policy_change_reuploads_affected_files(fake_blob_service, temp_dir):
+    """Changing the policy re-uploads only files whose header changes."""
+    public = temp_dir / "public"
+    public.mkdir()
+    (public / "index.html").write_text("<html></html>")
+    (public / "index.json").write_text("[]")
+
+    await deploy_to_web_container(fake_blob_service, public, "$web")
+    result = await deploy_to_web_container(
+        fake_blob_service,
+        public,
+        "$web",
+        cache_rules=load_cache_rules(
+            '[{"content_types": ["text/html"], "cache_control": "no-cache"}]'
+        ),
+    )
+
+    settings = fake_blob_service.get_container_client("$web").content_settings
+    assert result.files_uploaded == 1
+    assert result.files_unchanged == 1
+    assert settings["index.html"].cache_control == "no-cache"
@@ -4,12 +4,14 @@ Unit tests for content_downloader.py
 Tests download and organization of markdown content.
 """
 
+import threading
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from content_downloader import (
     download_markdown_files,
+    link_or_copy,
     organize_content_for_hugo,
     validate_markdown_frontmatter,
 )
@@ -199,6 +201,31 @@ async def test_organize_content_for_hugo_success(temp_dir, sample_markdown_conte
     assert (hugo_content_dir / "article.md").read_text() == sample_markdown_content
 
 
+@pytest.mark.asyncio
+async def test_organize_content_for_hugo_links_off_event_loop(
+    temp_dir, sample_markdown_content
+):
+    """Test linking and copying run in a worker thread, not the event loop."""
+    content_dir = temp_dir / "content"
+    content_dir.mkdir()
+    (content_dir / "article.md").write_text(sample_markdown_content)
+    loop_thread = threading.get_ident()
+    link_threads = []
+
+    def _record_thread(source, target):
+        link_threads.append(threading.get_ident())
+        return link_or_copy(source, target)
+
+    with patch("content_downloader.link_or_copy", side_effect=_record_thread):
+        result = await organize_content_for_hugo(
+            content_dir=content_dir,
+            hugo_content_dir=temp_dir / "hugo" / "content",
+        )
+
+    assert result.is_valid
+    assert link_threads and loop_thread not in link_threads
+
+
 @pytest.mark.asyncio
 async def test_organize_content_for_hugo_nested_files(
     temp_dir, sample_markdown_content
@@ -0,0 +1,188 @@
+"""
+Unit tests for incremental markdown sync.
+
+Tests that the local mirror only downloads new or changed blobs, deletes
+files whose blobs disappeared, and reports transferred vs skipped bytes.
+"""
+
+import asyncio
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict
+
+import pytest
+from content_downloader import SYNC_MANIFEST_NAME, download_markdown_files
+
+
+class FakeContainer:
+    """In-memory container with ETags and download accounting."""
+
+    def __init__(self, blobs: Dict[str, bytes]) -> None:
+        self.blobs = dict(blobs)
+        self.etags = {name: "0x1" for name in blobs}
+        self.downloads = []
+        self.active = 0
+        self.max_active = 0
+
+    def put(self, name: str, content: bytes) -> None:
+        self.blobs[name] = content
+        self.etags[name] = f"0x{int(self.etags.get(name, '0x0'), 16) + 1:x}"
+
+    async def list_blobs(self):
+        for name, content in self.blobs.items():
+            yield SimpleNamespace(
+                name=name,
+                size=len(content),
+                etag=self.etags[name],
+                last_modified=datetime(2025, 1, 1, tzinfo=timezone.utc),
+            )
+
+    def get_blob_client(self, name: str):
+        container = self
+
+        class _Stream:
+            async def readall(self) -> bytes:
+                return container.blobs[name]
+
+        class _Blob:
+            async def download_blob(self):
+                container.active += 1
+                container.max_active = max(container.max_active, container.active)
+                await asyncio.sleep(0.01)
+                container.active -= 1
+                container.downloads.append(name)
+                return _Stream()
+
+        return _Blob()
+
+
+@pytest.fixture
+def container():
+    return FakeContainer(
+        {f"articles/post-{i}.md": f"---\ntitle: {i}\n---\n".encode() for i in range(5)}
+    )
+
+
+@pytest.fixture
+def blob_client(container):
+    return SimpleNamespace(get_container_client=lambda name: container)
+
+
+async def _sync(blob_client, output_dir: Path, **kwargs):
+    return await download_markdown_files(
+        blob_client=blob_client,
+        container_name="markdown-content",
+        output_dir=output_dir,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_first_sync_downloads_everything(blob_client, container, temp_dir):
+    """A cold mirror downloads every blob and writes the manifest."""
+    result = await _sync(blob_client, temp_dir)
+
+    assert result.files_downloaded == 5
+    assert result.files_skipped == 0
+    assert result.bytes_downloaded == sum(len(c) for c in container.blobs.values())
+    assert (temp_dir / "articles" / "post-0.md").read_bytes() == (
+        container.blobs["articles/post-0.md"]
+    )
+    manifest = json.loads((temp_dir / SYNC_MANIFEST_NAME).read_text())
+    assert manifest["blobs"]["articles/post-0.md"]["etag"] == "0x1"
+
+
+@pytest.mark.asyncio
+async def test_unchanged_blobs_skipped(blob_client, container, temp_dir):
+    """A second sync with no changes transfers nothing."""
+    await _sync(blob_client, temp_dir)
+    container.downloads.clear()
+
+    result = await _sync(blob_client, temp_dir)
+
+    assert container.downloads == []
+    assert result.files_downloaded == 0
+    assert result.files_skipped == 5
+    assert result.bytes_downloaded == 0
+    assert result.bytes_skipped == sum(len(c) for c in container.blobs.values())
+
+
+@pytest.mark.asyncio
+async def test_only_changed_and_new_blobs_downloaded(blob_client, container, temp_dir):
+    """Changed ETags and new blobs are downloaded; the rest are skipped."""
+    await _sync(blob_client, temp_dir)
+    container.downloads.clear()
+    container.put("articles/post-1.md", b"---\ntitle: updated\n---\n")
+    container.put("articles/post-new.md", b"---\ntitle: new\n---\n")
+
+    result = await _sync(blob_client, temp_dir)
+
+    assert sorted(container.downloads) == ["articles/post-1.md", "articles/post-new.md"]
+    assert (result.files_downloaded, result.files_skipped) == (2, 4)
+    assert (
+        (temp_dir / "articles" / "post-1.md").read_bytes().endswith(b"updated\n---\n")
+    )
+
+
+@pytest.mark.asyncio
+async def test_missing_local_file_redownloaded(blob_client, container, temp_dir):
+    """A mirrored file removed from disk is fetched again."""
+    await _sync(blob_client, temp_dir)
+    container.downloads.clear()
+    (temp_dir / "articles" / "post-2.md").unlink()
+
+    result = await _sync(blob_client, temp_dir)
+
+    assert container.downloads == ["articles/post-2.md"]
+    assert result.files_downloaded == 1
+
+
+@pytest.mark.asyncio
+async def test_deleted_blobs_removed_locally(blob_client, container, temp_dir):
+    """Files whose blobs disappeared are deleted from the mirror."""
+    await _sync(blob_client, temp_dir)
+    (temp_dir / "stale-from-old-build.md").write_text("old")
+    del container.blobs["articles/post-3.md"]
+
+    result = await _sync(blob_client, temp_dir)
+
+    assert result.files_deleted == 2
+    assert not (temp_dir / "articles" / "post-3.md").exists()
+    assert not (temp_dir / "stale-from-old-build.md").exists()
+    manifest = json.loads((temp_dir / SYNC_MANIFEST_NAME).read_text())
+    assert "articles/post-3.md" not in manifest["blobs"]
+
+
+@pytest.mark.asyncio
+async def test_truncated_listing_deletes_nothing(blob_client, container, temp_dir):
+    """When max_files truncates the listing, unlisted files are kept."""
+    await _sync(blob_client, temp_dir)
+
+    result = await _sync(blob_client, temp_dir, max_files=2)
+
+    assert result.files_deleted == 0
+    assert len(list((temp_dir / "articles").glob("*.md"))) == 5
+    assert any("Too many files" in error for error in result.errors)
+
+
+@pytest.mark.asyncio
+async def test_downloads_run_concurrently(blob_client, container, temp_dir):
+    """Downloads overlap, bounded by max_concurrency."""
+    await _sync(blob_client, temp_dir, max_concurrency=3)
+
+    assert container.max_active == 3
+
+
+@pytest.mark.asyncio
+async def test_corrupt_manifest_forces_full_sync(blob_client, container, temp_dir):
+    """An unreadable manifest falls back to downloading everything."""
+    await _sync(blob_client, temp_dir)
+    (temp_dir / SYNC_MANIFEST_NAME).write_text("{not json")
+    container.downloads.clear()
+
+    result = await _sync(blob_client, temp_dir)
+
+    assert result.files_downloaded == 5
+    assert len(container.downloads) == 5
@@ -0,0 +1,181 @@
+"""
+Unit tests for deploy_manifest.py and incremental deploys.
+
+Tests content hashing, manifest diffs, and that deploy_to_web_container
+uploads only changed files and deletes removed files without listing
+the container.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+from deploy_manifest import (
+    LEGACY_DEPLOY_MANIFEST_BLOB,
+    deploy_manifest_blob,
+    diff_manifests,
+    snapshots_to_prune,
+)
+from hugo_builder import deploy_to_web_container
+from output_scanner import scan_output
+
+
+@pytest.fixture
+def blob_client(fake_blob_service):
+    return fake_blob_service
+
+
+@pytest.fixture
+def container(fake_blob_service):
+    return fake_blob_service.get_container_client("$web")
+
+
+@pytest.fixture
+def public_dir(temp_dir) -> Path:
+    public = temp_dir / "public"
+    (public / "posts" / "a").mkdir(parents=True)
+    (public / "index.html").write_text("<html>home</html>")
+    (public / "style.css").write_text("body {}")
+    (public / "posts" / "a" / "index.html").write_text("<html>a</html>")
+    return public
+
+
+async def _deploy(blob_client, public_dir):
+    return await deploy_to_web_container(
+        blob_client=blob_client, source_dir=public_dir, container_name="$web"
+    )
+
+
+def test_diff_manifests():
+    """Changed, unchanged and deleted names are separated by hash."""
+    previous = {
+        "a.html": {"sha256": "1", "size": 1},
+        "b.html": {"sha256": "2", "size": 1},
+        "gone.html": {"sha256": "3", "size": 1},
+    }
+    current = {
+        "a.html": {"sha256": "1", "size": 1},
+        "b.html": {"sha256": "changed", "size": 1},
+        "new.html": {"sha256": "4", "size": 1},
+    }
+
+    diff = diff_manifests(previous, current)
+
+    assert diff.changed == ["b.html", "new.html"]
+    assert diff.unchanged == ["a.html"]
+    assert diff.deleted == ["gone.html"]
+    assert diff_manifests(None, current).changed == list(current)
+
+
+def test_snapshots_to_prune():
+    """The newest snapshots and the latest pointer's target are retained."""
+    ids = ["20250103T000000Z", "20250101T000000Z", "20250102T000000Z"]
+
+    assert snapshots_to_prune(ids, keep=2) == ["20250101T000000Z"]
+    assert snapshots_to_prune(ids, keep=1) == ["20250101T000000Z", "20250102T000000Z"]
+    assert snapshots_to_prune(ids, keep=1, latest_id="20250101T000000Z") == [
+        "20250102T000000Z"
+    ]
+    assert snapshots_to_prune(ids, keep=5) == []
+    assert snapshots_to_prune(ids, keep=0) == []
+
+
+def test_scan_manifest_uses_posix_names(public_dir):
+    """Manifest keys are blob names with content hashes, sizes and types."""
+    files = scan_output(public_dir).manifest()
+
+    assert sorted(files) == ["index.html", "posts/a/index.html", "style.css"]
+    assert files["style.css"]["size"] == len("body {}")
+    assert len(files["style.css"]["sha256"]) == 64
+    assert files["style.css"]["content_type"] == "text/css"
+
+
+@pytest.mark.asyncio
+async def test_first_deploy_uploads_all_and_saves_manifest(
+    blob_client, container, public_dir
+):
+    """Without a manifest every file is uploaded and the manifest stored."""
+    result = await _deploy(blob_client, public_dir)
+
+    assert result.files_uploaded == 3
+    assert result.files_unchanged == 0
+    backup = blob_client.get_container_client("$web-backup")
+    manifest = json.loads(backup.blobs[deploy_manifest_blob("$web")])
+    assert set(manifest["files"]) == {"index.html", "style.css", "posts/a/index.html"}
+    # The manifest is never published with the site
+    assert set(container.blobs) == set(manifest["files"])
+
+
+@pytest.mark.asyncio
+async def test_legacy_public_manifest_removed(blob_client, container, public_dir):
+    """A manifest left in $web by older deploys is deleted as a stale file."""
+    container.blobs[LEGACY_DEPLOY_MANIFEST_BLOB] = b'{"version": 1, "files": {}}'
+
+    result = await _deploy(blob_client, public_dir)
+
+    assert result.files_uploaded == 3
+    assert LEGACY_DEPLOY_MANIFEST_BLOB not in container.blobs
+
+
+@pytest.mark.asyncio
+async def test_unchanged_redeploy_uploads_nothing(blob_client, container, public_dir):
+    """A rebuild with identical output skips every upload."""
+    await _deploy(blob_client, public_dir)
+    container.uploads.clear()
+
+    result = await _deploy(blob_client, public_dir)
+
+    assert container.uploads == []
+    assert result.files_uploaded == 0
+    assert result.files_unchanged == 3
+    assert result.bytes_saved == sum(
+        f.stat().st_size for f in public_dir.rglob("*") if f.is_file()
+    )
+    assert result.errors == []
+
+
+@pytest.mark.asyncio
+async def test_only_changed_files_uploaded(blob_client, container, public_dir):
+    """Modified and new files are uploaded; the rest are skipped."""
+    await _deploy(blob_client, public_dir)
+    container.uploads.clear()
+    (public_dir / "index.html").write_text("<html>updated</html>")
+    (public_dir / "new.html").write_text("<html>new</html>")
+
+    result = await _deploy(blob_client, public_dir)
+
+    assert sorted(container.uploads) == ["index.html", "new.html"]
+    assert (result.files_uploaded, result.files_unchanged) == (2, 2)
+    assert container.blobs["index.html"] == b"<html>updated</html>"
+
+
+@pytest.mark.asyncio
+async def test_removed_files_deleted_from_manifest(blob_client, container, public_dir):
+    """Removed files are deleted using the previous manifest, not a listing."""
+    container.blobs["images/abc/800.webp"] = b"variant"
+    await _deploy(blob_client, public_dir)
+    listings = container.listings
+    (public_dir / "posts" / "a" / "index.html").unlink()
+
+    result = await _deploy(blob_client, public_dir)
+
+    assert container.listings == listings
+    assert container.deletes[-1:] == ["posts/a/index.html"]
+    assert result.files_deleted == 1
+    assert "images/abc/800.webp" in container.blobs
+
+
+@pytest.mark.asyncio
+async def test_failed_upload_retried_next_deploy(blob_client, container, public_dir):
+    """A file that failed to upload is not recorded as deployed."""
+    container.fail_uploads.add("style.css")
+
+    first = await _deploy(blob_client, public_dir)
+    container.fail_uploads.clear()
+    container.uploads.clear()
+    second = await _deploy(blob_client, public_dir)
+
+    assert first.files_uploaded == 2
+    assert any("style.css" in error for error in first.errors)
+    assert container.uploads == ["style.css"]
+    assert second.files_unchanged == 2
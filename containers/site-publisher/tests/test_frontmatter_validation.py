@@ -0,0 +1,113 @@
+"""
+Unit tests for frontmatter_validation.py
+
+Tests content-hash caching across builds and the process pool path.
+"""
+
+from pathlib import Path
+from typing import List
+
+import pytest
+from frontmatter_validation import (
+    FRONTMATTER_CACHE_NAME,
+    PROCESS_POOL_MIN_FILES,
+    load_frontmatter_cache,
+    validate_frontmatter_files,
+    validate_frontmatter_text,
+)
+
+VALID = """---
+title: "Article {index}"
+date: "2025-10-10T00:00:00Z"
+---
+
+Body {index}
+"""
+
+
+def _write(directory: Path, count: int) -> List[Path]:
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for index in range(count):
+        path = directory / f"article-{index}.md"
+        path.write_text(VALID.format(index=index))
+        paths.append(path)
+    return paths
+
+
+def test_validate_frontmatter_text():
+    """Pure validation matches the rules used for files."""
+    assert validate_frontmatter_text(VALID.format(index=1)) == (True, [])
+    assert validate_frontmatter_text("no frontmatter")[0] is False
+    is_valid, errors = validate_frontmatter_text('---\ntitle: "x"\n---\n')
+    assert is_valid is False
+    assert "Missing required field: date" in errors
+
+
+@pytest.mark.asyncio
+async def test_results_cached_by_content_hash(temp_dir):
+    """A second run parses only new or changed content."""
+    paths = _write(temp_dir / "content", 3)
+    cache_path = temp_dir / FRONTMATTER_CACHE_NAME
+
+    _, first = await validate_frontmatter_files(paths, cache_path, max_workers=1)
+    paths[0].write_text("---\ntitle: [broken\n---\n")
+    results, second = await validate_frontmatter_files(paths, cache_path, max_workers=1)
+
+    assert (first.cache_hits, first.parsed) == (0, 3)
+    assert (second.cache_hits, second.parsed) == (2, 1)
+    assert results[paths[0]][0] is False
+    assert "Invalid YAML syntax" in results[paths[0]][1][0]
+    assert results[paths[1]] == (True, [])
+    # Cache only keeps content seen in the latest run
+    assert len(load_frontmatter_cache(cache_path)) == 3
+
+
+@pytest.mark.asyncio
+async def test_subset_validation_keeps_other_entries(temp_dir, monkeypatch):
+    """prune=False keeps entries for files not passed, oldest trimmed first."""
+    paths = _write(temp_dir / "content", 4)
+    cache_path = temp_dir / FRONTMATTER_CACHE_NAME
+    await validate_frontmatter_files(paths[:3], cache_path, max_workers=1)
+
+    await validate_frontmatter_files(paths[3:], cache_path, max_workers=1, prune=False)
+    _, stats = await validate_frontmatter_files(paths, cache_path, max_workers=1)
+    assert (stats.cache_hits, stats.parsed) == (4, 0)
+
+    monkeypatch.setattr("frontmatter_validation.FRONTMATTER_CACHE_MAX_ENTRIES", 2)
+    paths[0].write_text(VALID.format(index=99))
+    await validate_frontmatter_files(paths[:1], cache_path, max_workers=1, prune=False)
+    _, stats = await validate_frontmatter_files(paths[:1], cache_path, max_workers=1)
+    assert len(load_frontmatter_cache(cache_path)) == 1
+    assert stats.parsed == 0
+
+
+@pytest.mark.asyncio
+async def test_unreadable_cache_and_files(temp_dir):
+    """A corrupt cache is ignored; unreadable files are reported invalid."""
+    paths = _write(temp_dir / "content", 1)
+    missing = temp_dir / "content" / "missing.md"
+    cache_path = temp_dir / FRONTMATTER_CACHE_NAME
+    cache_path.write_text("{not json")
+
+    results, stats = await validate_frontmatter_files(
+        paths + [missing], cache_path, max_workers=1
+    )
+
+    assert results[paths[0]] == (True, [])
+    assert results[missing][0] is False
+    assert results[missing][1][0].startswith("Failed to read file")
+    assert stats.parsed == 1
+
+
+@pytest.mark.asyncio
+async def test_process_pool_validation(temp_dir):
+    """Large batches are validated in worker processes."""
+    paths = _write(temp_dir / "content", PROCESS_POOL_MIN_FILES + 10)
+    paths[-1].write_text("no frontmatter")
+
+    results, stats = await validate_frontmatter_files(paths, max_workers=2)
+
+    assert stats.parsed == len(paths)
+    assert all(results[path] == (True, []) for path in paths[:-1])
+    assert results[paths[-1]][0] is False
@@ -5,10 +5,12 @@ Tests Hugo build, deployment, backup, and rollback operations.
 """
 
 import asyncio
+import hashlib
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from deploy_manifest import load_deploy_manifest, load_snapshot, same_content
 from hugo_builder import (
     backup_current_site,
     build_site_with_hugo,
@@ -198,6 +200,37 @@ async def test_deploy_to_web_container_success(mock_blob_client, temp_dir):
     assert len(result.errors) == 0
 
 
+@pytest.mark.asyncio
+async def test_deploy_keeps_preserved_prefixes(mock_blob_client, temp_dir):
+    """Stale cleanup never deletes responsive image variants under images/."""
+    source_dir = temp_dir / "public"
+    source_dir.mkdir()
+    (source_dir / "index.html").write_text("<html></html>")
+
+    async def list_blobs():
+        for name in ["index.html", "old-page/index.html", "images/abc/800.webp"]:
+            blob = Mock()
+            blob.name = name
+            yield blob
+
+    mock_container = AsyncMock()
+    mock_container.get_blob_client = Mock(return_value=AsyncMock())
+    mock_container.list_blobs = Mock(side_effect=list_blobs)
+    mock_container.delete_blobs = AsyncMock(return_value=[Mock(status_code=202)])
+    mock_blob_client.get_container_client = Mock(return_value=mock_container)
+
+    result = await deploy_to_web_container(
+        blob_client=mock_blob_client,
+        source_dir=source_dir,
+        container_name="$web",
+    )
+
+    # Stale files are removed with one batch request
+    mock_container.delete_blobs.assert_awaited_once()
+    assert mock_container.delete_blobs.call_args.args == ("old-page/index.html",)
+    assert result.files_deleted == 1
+
+
 @pytest.mark.asyncio
 async def test_deploy_to_web_container_missing_source(mock_blob_client, temp_dir):
     """Test deployment with missing source directory."""
@@ -239,213 +272,222 @@ async def test_deploy_to_web_container_directory_check(mock_blob_client, temp_di
     assert any("not found" in error.lower() for error in result.errors)
 
 
-@pytest.mark.asyncio
-async def test_backup_current_site_success(mock_blob_client):
-    """Test successful incremental backup with new files."""
-    # Setup mock blobs for source
-    mock_blob1 = Mock()
-    mock_blob1.name = "index.html"
-    mock_blob2 = Mock()
-    mock_blob2.name = "style.css"
-    mock_blob3 = Mock()
-    mock_blob3.name = "new.html"  # New file not in backup
-
-    # Setup mock containers
-    mock_source = AsyncMock()
-    mock_backup = AsyncMock()
-
-    async def source_blob_iterator():
-        yield mock_blob1
-        yield mock_blob2
-        yield mock_blob3
-
-    async def existing_backup_iterator():
-        # Only first two files exist in backup
-        yield mock_blob1
-        yield mock_blob2
-
-    mock_source.list_blobs = Mock(return_value=source_blob_iterator())
-    mock_backup.list_blobs = Mock(return_value=existing_backup_iterator())
-
-    # Setup mock blob clients
-    mock_source_blob = AsyncMock()
-    mock_source_blob.url = "https://test.blob.core.windows.net/web/new.html"
-    mock_source.get_blob_client = Mock(return_value=mock_source_blob)
-
-    mock_backup_blob = AsyncMock()
-    mock_backup_blob.start_copy_from_url = AsyncMock()
-    mock_backup.get_blob_client = Mock(return_value=mock_backup_blob)
-
-    # Setup container client routing
-    def get_container(name):
-        if name == "$web":
-            return mock_source
-        return mock_backup
-
-    mock_blob_client.get_container_client = Mock(side_effect=get_container)
+async def _deploy_site(blob_service, public_dir, pages):
+    """Write pages into public_dir and deploy them to $web."""
+    for path in list(public_dir.rglob("*.html")):
+        path.unlink()
+    for name, content in pages.items():
+        (public_dir / name).parent.mkdir(parents=True, exist_ok=True)
+        (public_dir / name).write_text(content)
+    return await deploy_to_web_container(
+        blob_client=blob_service, source_dir=public_dir, container_name="$web"
+    )
 
-    # Execute
-    result = await backup_current_site(
-        blob_client=mock_blob_client,
+
+async def _backup(blob_service):
+    return await backup_current_site(
+        blob_client=blob_service,
         source_container="$web",
         backup_container="$web-backup",
     )
 
-    # Assert - should only backup the 1 new file (incremental)
-    assert result.files_uploaded == 1
-    assert result.duration_seconds > 0
-    assert len(result.errors) == 0
-
 
 @pytest.mark.asyncio
-async def test_backup_current_site_no_new_files(mock_blob_client):
-    """Test incremental backup when all files already backed up."""
-    # Setup mock blobs
-    mock_blob1 = Mock()
-    mock_blob1.name = "index.html"
-    mock_blob2 = Mock()
-    mock_blob2.name = "style.css"
-
-    # Setup mock containers
-    mock_source = AsyncMock()
-    mock_backup = AsyncMock()
-
-    async def source_blob_iterator():
-        yield mock_blob1
-        yield mock_blob2
-
-    async def existing_backup_iterator():
-        # All files already backed up
-        yield mock_blob1
-        yield mock_blob2
-
-    mock_source.list_blobs = Mock(return_value=source_blob_iterator())
-    mock_backup.list_blobs = Mock(return_value=existing_backup_iterator())
-
-    # Setup container client routing
-    def get_container(name):
-        if name == "$web":
-            return mock_source
-        return mock_backup
-
-    mock_blob_client.get_container_client = Mock(side_effect=get_container)
-
-    # Execute
-    result = await backup_current_site(
-        blob_client=mock_blob_client,
-        source_container="$web",
-        backup_container="$web-backup",
+async def test_backup_records_snapshot_with_content_addressed_objects(
+    fake_blob_service, temp_dir
+):
+    """Each snapshot stores a manifest; identical content is stored once."""
+    public_dir = temp_dir / "public"
+    await _deploy_site(
+        fake_blob_service,
+        public_dir,
+        {"index.html": "home", "a/index.html": "same", "b/index.html": "same"},
     )
 
-    # Assert - should skip all files (already backed up)
-    assert result.files_uploaded == 0
-    assert result.duration_seconds > 0
-    assert len(result.errors) == 0
+    result = await _backup(fake_blob_service)
+
+    backup = fake_blob_service.get_container_client("$web-backup")
+    objects = [name for name in backup.blobs if name.startswith("objects/")]
+    assert len(objects) == 2  # "home" and "same"
+    assert result.files_uploaded == 2
+    assert result.errors == []
+    latest = await load_snapshot(backup)
+    assert sorted(latest[1]) == ["a/index.html", "b/index.html", "index.html"]
 
 
 @pytest.mark.asyncio
-async def test_backup_current_site_empty_source(mock_blob_client):
-    """Test backup with empty source container."""
-    # Setup empty source container
-    mock_source = AsyncMock()
+async def test_backup_is_proportional_to_changes(fake_blob_service, temp_dir):
+    """Unchanged sites write nothing; changed files are re-backed-up."""
+    public_dir = temp_dir / "public"
+    pages = {f"p{i}.html": f"page {i}" for i in range(20)}
+    await _deploy_site(fake_blob_service, public_dir, pages)
+    await _backup(fake_blob_service)
+    backup = fake_blob_service.get_container_client("$web-backup")
+    first_id, _ = await load_snapshot(backup)
+
+    unchanged = await _backup(fake_blob_service)
+    assert unchanged.files_uploaded == 0
+    assert (await load_snapshot(backup))[0] == first_id
+
+    # Same name, new content: must be backed up (the old backup missed this)
+    await _deploy_site(fake_blob_service, public_dir, {**pages, "p3.html": "edited"})
+    changed = await _backup(fake_blob_service)
+
+    assert changed.files_uploaded == 1
+    assert changed.files_unchanged == 19
+    second_id, files = await load_snapshot(backup)
+    assert second_id != first_id
+    assert files["p3.html"]["sha256"] == hashlib.sha256(b"edited").hexdigest()
 
-    async def empty_iterator():
-        for _ in []:
-            yield
 
-    mock_source.list_blobs = Mock(return_value=empty_iterator())
-    mock_blob_client.get_container_client = Mock(return_value=mock_source)
+@pytest.mark.asyncio
+async def test_backup_bootstraps_site_without_manifest(fake_blob_service):
+    """A site deployed before manifests existed is hashed once."""
+    web = fake_blob_service.get_container_client("$web")
+    web.blobs.update({"index.html": b"legacy", "images/a/800.webp": b"img"})
 
-    # Execute
-    result = await backup_current_site(
-        blob_client=mock_blob_client,
-        source_container="$web",
-        backup_container="$web-backup",
-    )
+    result = await _backup(fake_blob_service)
 
-    # Assert - empty backup is still successful
-    assert result.files_uploaded == 0
-    assert len(result.errors) == 0
+    _, files = await load_snapshot(
+        fake_blob_service.get_container_client("$web-backup")
+    )
+    assert result.files_uploaded == 1
+    assert list(files) == ["index.html"]
 
 
 @pytest.mark.asyncio
-async def test_rollback_deployment_success(mock_blob_client):
-    """Test successful deployment rollback."""
-    # Setup mock backup blobs
-    mock_blob1 = Mock()
-    mock_blob1.name = "index.html"
-    mock_blob2 = Mock()
-    mock_blob2.name = "style.css"
-
-    # Setup mock target blob (for deletion)
-    mock_target_blob = Mock()
-    mock_target_blob.name = "broken.html"
-
-    # Setup mock containers
-    mock_backup = AsyncMock()
-    mock_target = AsyncMock()
-
-    async def backup_iterator():
-        yield mock_blob1
-        yield mock_blob2
-
-    async def target_iterator():
-        yield mock_target_blob
-
-    mock_backup.list_blobs = Mock(return_value=backup_iterator())
-    mock_target.list_blobs = Mock(return_value=target_iterator())
-    mock_target.delete_blob = AsyncMock()
-
-    # Setup mock blob clients
-    mock_backup_blob = AsyncMock()
-    mock_backup_blob.url = "https://test.blob.core.windows.net/backup/index.html"
-    mock_backup.get_blob_client = Mock(return_value=mock_backup_blob)
-
-    mock_target_blob_client = AsyncMock()
-    mock_target_blob_client.start_copy_from_url = AsyncMock()
-    mock_target.get_blob_client = Mock(return_value=mock_target_blob_client)
-
-    # Setup container client routing
-    def get_container(name):
-        if name == "$web-backup":
-            return mock_backup
-        return mock_target
-
-    mock_blob_client.get_container_client = Mock(side_effect=get_container)
+async def test_rollback_redeploys_snapshot_incrementally(fake_blob_service, temp_dir):
+    """Rollback restores changed files and removes new ones, nothing more."""
+    public_dir = temp_dir / "public"
+    pages = {f"p{i}.html": f"page {i}" for i in range(10)}
+    await _deploy_site(fake_blob_service, public_dir, pages)
+    await _backup(fake_blob_service)
+
+    broken = {**pages, "p1.html": "broken", "extra.html": "new"}
+    await _deploy_site(fake_blob_service, public_dir, broken)
+    web = fake_blob_service.get_container_client("$web")
+    web.uploads.clear()
 
-    # Execute
     result = await rollback_deployment(
-        blob_client=mock_blob_client,
+        blob_client=fake_blob_service,
         backup_container="$web-backup",
         target_container="$web",
     )
 
-    # Assert
-    assert result.files_uploaded == 2
-    assert result.duration_seconds > 0
-    assert len(result.errors) == 0
+    assert result.errors == []
+    assert result.files_uploaded == 1
+    assert result.files_unchanged == 9
+    assert result.files_deleted == 1
+    assert web.blobs["p1.html"] == b"page 1"
+    assert "extra.html" not in web.blobs
+    assert [name for name in web.uploads if name.endswith(".html")] == ["p1.html"]
+    assert same_content(
+        await load_deploy_manifest(
+            fake_blob_service.get_container_client("$web-backup"), "$web"
+        ),
+        (await load_snapshot(fake_blob_service.get_container_client("$web-backup")))[1],
+    )
+
+
+@pytest.mark.asyncio
+async def test_rollback_to_named_snapshot(fake_blob_service, temp_dir):
+    """Any recorded snapshot can be re-deployed by id."""
+    public_dir = temp_dir / "public"
+    await _deploy_site(fake_blob_service, public_dir, {"index.html": "v1"})
+    await _backup(fake_blob_service)
+    backup = fake_blob_service.get_container_client("$web-backup")
+    v1_id, _ = await load_snapshot(backup)
+    await _deploy_site(fake_blob_service, public_dir, {"index.html": "v2"})
+    await _backup(fake_blob_service)
+    await _deploy_site(fake_blob_service, public_dir, {"index.html": "v3"})
+
+    await rollback_deployment(
+        blob_client=fake_blob_service,
+        backup_container="$web-backup",
+        target_container="$web",
+        snapshot_id=v1_id,
+    )
+
+    assert fake_blob_service.get_container_client("$web").blobs["index.html"] == b"v1"
 
 
 @pytest.mark.asyncio
-async def test_rollback_deployment_no_backup(mock_blob_client):
-    """Test rollback with no backup files."""
-    # Setup empty backup container
-    mock_backup = AsyncMock()
+async def test_backup_prunes_old_snapshots_and_unreferenced_objects(
+    fake_blob_service, temp_dir
+):
+    """Only the newest snapshots and the objects they use are retained."""
+    public_dir = temp_dir / "public"
+    backup = fake_blob_service.get_container_client("$web-backup")
+    snapshot_ids = []
+    for version in ("v1", "v2", "v3"):
+        await _deploy_site(
+            fake_blob_service,
+            public_dir,
+            {"index.html": version, "about.html": "shared"},
+        )
+        await backup_current_site(
+            blob_client=fake_blob_service,
+            source_container="$web",
+            backup_container="$web-backup",
+            keep_snapshots=2,
+        )
+        snapshot_ids.append((await load_snapshot(backup))[0])
+
+    snapshots = sorted(name for name in backup.blobs if name.startswith("snapshots/"))
+    assert snapshots == [
+        f"snapshots/{snapshot_ids[1]}.json",
+        f"snapshots/{snapshot_ids[2]}.json",
+        "snapshots/latest.json",
+    ]
+    objects = {name.rsplit("/", 1)[-1] for name in backup.blobs if "objects/" in name}
+    assert objects == {
+        hashlib.sha256(content).hexdigest() for content in (b"v2", b"v3", b"shared")
+    }
+
+    # Retained snapshots still restore completely
+    await rollback_deployment(
+        blob_client=fake_blob_service,
+        backup_container="$web-backup",
+        target_container="$web",
+        snapshot_id=snapshot_ids[1],
+    )
+    assert fake_blob_service.get_container_client("$web").blobs["index.html"] == b"v2"
 
-    async def empty_iterator():
-        for _ in []:
-            yield
 
-    mock_backup.list_blobs = Mock(return_value=empty_iterator())
-    mock_blob_client.get_container_client = Mock(return_value=mock_backup)
+@pytest.mark.asyncio
+async def test_backup_retention_keeps_objects_if_a_snapshot_is_unreadable(
+    fake_blob_service, temp_dir
+):
+    """Objects are not collected unless every retained manifest was read."""
+    public_dir = temp_dir / "public"
+    backup = fake_blob_service.get_container_client("$web-backup")
+    for version in ("v1", "v2"):
+        await _deploy_site(fake_blob_service, public_dir, {"index.html": version})
+        await _backup(fake_blob_service)
+    # The v2 snapshot will be retained but cannot be read
+    v2_id, _ = await load_snapshot(backup)
+    backup.blobs[f"snapshots/{v2_id}.json"] = b"not json"
+    objects_before = {name for name in backup.blobs if name.startswith("objects/")}
+
+    await _deploy_site(fake_blob_service, public_dir, {"index.html": "v3"})
+    await backup_current_site(
+        blob_client=fake_blob_service,
+        source_container="$web",
+        backup_container="$web-backup",
+        keep_snapshots=2,
+    )
 
-    # Execute
+    assert objects_before <= set(backup.blobs)
+
+
+@pytest.mark.asyncio
+async def test_rollback_deployment_no_backup(fake_blob_service):
+    """Test rollback with no snapshot recorded."""
     result = await rollback_deployment(
-        blob_client=mock_blob_client,
+        blob_client=fake_blob_service,
         backup_container="$web-backup",
         target_container="$web",
     )
 
-    # Assert
     assert result.files_uploaded == 0
-    assert any("No backup files" in error for error in result.errors)
+    assert any("No backup snapshot" in error for error in result.errors)
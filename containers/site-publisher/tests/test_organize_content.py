@@ -0,0 +1,160 @@
+"""
+Tests for zero-copy content organization.
+
+organize_content_for_hugo hardlinks mirror files into hugo-site/content,
+leaves files unchanged since the previous build in place, and removes
+articles that are gone from the mirror.
+"""
+
+import hashlib
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from content_downloader import organize_content_for_hugo
+from frontmatter_validation import (
+    FRONTMATTER_CACHE_NAME,
+    load_frontmatter_cache,
+    validate_frontmatter_files,
+)
+
+ARTICLE = """---
+title: "Article {index}"
+date: "2025-10-10T00:00:00Z"
+draft: false
+params:
+  original_url: "https://example.com/{index}"
+  source: "reddit"
+---
+
+# Article {index}
+
+{body}
+"""
+
+
+def _write_articles(content_dir: Path, count: int, body: str = "Content.") -> None:
+    content_dir.mkdir(parents=True, exist_ok=True)
+    for index in range(count):
+        (content_dir / f"article-{index}.md").write_text(
+            ARTICLE.format(index=index, body=body)
+        )
+
+
+def _replace(path: Path, text: str) -> None:
+    """Rewrite a mirror file the way the downloader does (new inode)."""
+    tmp_path = path.with_name(f".{path.name}.download")
+    tmp_path.write_text(text)
+    os.replace(tmp_path, path)
+
+
+@pytest.mark.asyncio
+async def test_organize_hardlinks_files(temp_dir):
+    """Organized files share the mirror's inode instead of being copied."""
+    content_dir = temp_dir / "content"
+    hugo_content_dir = temp_dir / "hugo" / "content"
+    _write_articles(content_dir, 2)
+
+    result = await organize_content_for_hugo(content_dir, hugo_content_dir)
+
+    assert result.is_valid
+    for name in ("article-0.md", "article-1.md"):
+        assert os.path.samefile(content_dir / name, hugo_content_dir / name)
+    assert not list(hugo_content_dir.glob(".*.tmp"))
+
+
+@pytest.mark.asyncio
+async def test_organize_leaves_unchanged_files_in_place(temp_dir):
+    """A second organize skips unchanged files and relinks changed ones."""
+    content_dir = temp_dir / "content"
+    hugo_content_dir = temp_dir / "hugo" / "content"
+    _write_articles(content_dir, 2)
+    await organize_content_for_hugo(content_dir, hugo_content_dir)
+    unchanged_inode = (hugo_content_dir / "article-0.md").stat().st_ino
+
+    _replace(content_dir / "article-1.md", ARTICLE.format(index=1, body="Updated."))
+    with patch(
+        "content_downloader.validate_frontmatter_files",
+        wraps=validate_frontmatter_files,
+    ) as validate:
+        result = await organize_content_for_hugo(content_dir, hugo_content_dir)
+
+    assert result.is_valid
+    assert validate.call_args.args[0] == [content_dir / "article-1.md"]
+    assert (hugo_content_dir / "article-0.md").stat().st_ino == unchanged_inode
+    # Validating only the changed file keeps the unchanged article's entry
+    unchanged_sha = hashlib.sha256((content_dir / "article-0.md").read_bytes())
+    cache = load_frontmatter_cache(temp_dir / FRONTMATTER_CACHE_NAME)
+    assert unchanged_sha.hexdigest() in cache
+    assert "Updated." in (hugo_content_dir / "article-1.md").read_text()
+
+
+@pytest.mark.asyncio
+async def test_organize_removes_stale_files(temp_dir):
+    """Articles deleted from the mirror or now invalid leave the Hugo tree."""
+    content_dir = temp_dir / "content"
+    hugo_content_dir = temp_dir / "hugo" / "content"
+    _write_articles(content_dir, 3)
+    await organize_content_for_hugo(content_dir, hugo_content_dir)
+
+    (content_dir / "article-0.md").unlink()
+    _replace(content_dir / "article-1.md", "no frontmatter")
+    result = await organize_content_for_hugo(content_dir, hugo_content_dir)
+
+    assert result.is_valid
+    assert sorted(p.name for p in hugo_content_dir.rglob("*.md")) == ["article-2.md"]
+    assert (temp_dir / "quarantined" / "article-1.md").exists()
+
+
+@pytest.mark.asyncio
+async def test_organize_copies_when_hardlink_fails(temp_dir):
+    """Falls back to copying when the directories are on different filesystems."""
+    content_dir = temp_dir / "content"
+    hugo_content_dir = temp_dir / "hugo" / "content"
+    _write_articles(content_dir, 1)
+
+    with patch(
+        "content_downloader.os.link", side_effect=OSError(18, "Invalid cross-device")
+    ):
+        result = await organize_content_for_hugo(content_dir, hugo_content_dir)
+
+    target = hugo_content_dir / "article-0.md"
+    assert result.is_valid
+    assert not os.path.samefile(content_dir / "article-0.md", target)
+    assert target.read_text() == (content_dir / "article-0.md").read_text()
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_organize_benchmark(temp_dir):
+    """Organizing 5,000 unchanged articles is metadata-only work."""
+    articles = 5000
+    content_dir = temp_dir / "content"
+    _write_articles(content_dir, articles, body="Lorem ipsum dolor sit amet. " * 100)
+
+    # Previous behaviour: validate and read/write-copy every file
+    start = time.perf_counter()
+    with patch("content_downloader.os.link", side_effect=OSError("no links")):
+        await organize_content_for_hugo(content_dir, temp_dir / "copied")
+    copy_s = time.perf_counter() - start
+    (temp_dir / FRONTMATTER_CACHE_NAME).unlink()
+
+    hugo_content_dir = temp_dir / "hugo" / "content"
+    start = time.perf_counter()
+    await organize_content_for_hugo(content_dir, hugo_content_dir)
+    first_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = await organize_content_for_hugo(content_dir, hugo_content_dir)
+    repeat_s = time.perf_counter() - start
+
+    print(f"\norganize {articles} articles")
+    print(f"copy (validate + copy every file)  {copy_s * 1000:>9.1f}ms")
+    print(f"hardlink (first build)             {first_s * 1000:>9.1f}ms")
+    print(f"hardlink (unchanged rebuild)       {repeat_s * 1000:>9.1f}ms")
+
+    assert result.is_valid
+    assert len(list(hugo_content_dir.glob("*.md"))) == articles
+    assert repeat_s < copy_s
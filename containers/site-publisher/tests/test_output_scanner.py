@@ -0,0 +1,76 @@
+"""
+Unit tests for output_scanner.py
+
+Tests the single-pass scan of Hugo output and that validation and
+deployment share one scan instead of walking public/ again.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from hugo_builder import deploy_to_web_container
+from output_scanner import scan_output
+from security import validate_hugo_output
+
+
+@pytest.fixture
+def public_dir(temp_dir):
+    public = temp_dir / "public"
+    (public / "posts" / "a").mkdir(parents=True)
+    (public / "index.html").write_text("<html></html>")
+    (public / "posts" / "a" / "index.html").write_text("<p>a</p>")
+    (public / "Logo.PNG").write_bytes(b"\x89PNG")
+    return public
+
+
+def test_scan_records_every_file(public_dir):
+    """One entry per file with size, extension, content type and hash."""
+    scan = scan_output(public_dir)
+
+    assert [f.path for f in scan.files] == [
+        "Logo.PNG",
+        "index.html",
+        "posts/a/index.html",
+    ]
+    logo = scan.files[0]
+    assert (logo.size, logo.extension, logo.content_type) == (4, ".png", "image/png")
+    assert len(logo.sha256) == 64
+    assert scan.total_size == sum(f.size for f in scan.files)
+    assert scan.extensions == {".png", ".html"}
+
+
+def test_scan_missing_directory_is_empty(temp_dir):
+    """A missing directory scans as empty; validation reports it."""
+    assert scan_output(temp_dir / "missing").file_count == 0
+
+
+def test_validation_uses_scan(public_dir):
+    """Validation checks the given scan without walking the directory."""
+    scan = scan_output(public_dir)
+    (public_dir / "late.exe").write_text("not in the scan")
+
+    with patch("security.scan_output") as rescan:
+        result = validate_hugo_output(public_dir, scan=scan)
+
+    rescan.assert_not_called()
+    assert result.is_valid
+    assert not validate_hugo_output(public_dir).is_valid
+
+
+@pytest.mark.asyncio
+async def test_deploy_uses_scan(fake_blob_service, public_dir):
+    """Deploy uploads what the scan lists, with the scanned content types."""
+    scan = scan_output(public_dir)
+
+    with patch("hugo_builder.scan_output") as rescan:
+        result = await deploy_to_web_container(
+            blob_client=fake_blob_service,
+            source_dir=public_dir,
+            container_name="$web",
+            scan=scan,
+        )
+
+    rescan.assert_not_called()
+    assert result.files_uploaded == 3
+    container = fake_blob_service.get_container_client("$web")
+    assert container.content_settings["Logo.PNG"].content_type == "image/png"
@@ -0,0 +1,441 @@
+"""
+Synthetic large-site benchmark for the publishing pipeline.
+
+Generates article corpora with realistic frontmatter into the in-memory
+blob service and runs build_and_deploy_site end to end: once cold, then
+again after 1% of the articles changed. Per-stage timings, traced memory
+peaks and file/byte counts are written as JSON for regression tracking.
+
+Environment:
+    PIPELINE_BENCHMARK_SIZES: Comma-separated article counts
+        (default "1000"; CI runs "1000,5000,20000")
+    PIPELINE_BENCHMARK_OUTPUT: Directory for pipeline-benchmark-<n>.json
+        (default: the test's temp directory)
+
+Hugo runs when the binary and the PaperMod theme are installed (the
+container image). Elsewhere a stand-in renderer produces a page per
+article plus home, RSS, sitemap and index.json, and the report marks the
+stage "simulated" so timings from different environments aren't mixed.
+"""
+
+import asyncio
+import hashlib
+import html
+import json
+import os
+import platform
+import random
+import resource
+import shutil
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterator, List
+
+import pytest
+import site_builder
+import yaml
+from models import BuildResult, OutputScan
+from workspace import timed_phase
+
+from config import Settings  # type: ignore[attr-defined]
+from tests.conftest import VOCABULARY
+
+SIZES = [
+    int(size)
+    for size in os.getenv("PIPELINE_BENCHMARK_SIZES", "1000").split(",")
+    if size.strip()
+]
+CHANGED_FRACTION = 0.01  # Articles rewritten before the warm rebuild
+HUGO_CONFIG_DIR = Path(__file__).parent.parent / "hugo-config"
+PAPERMOD_DIR = Path("/app/themes/PaperMod")
+
+# Stage name (site_builder phase) -> site_builder function producing its counts
+STAGE_FUNCTIONS = {
+    "sync": "download_markdown_files",
+    "organize": "organize_content_for_hugo",
+    "hugo": "build_site_with_hugo",
+    "search_index": "build_search_index",
+    "backup": "backup_current_site",
+    "validate": "scan_output",
+    "deploy": "deploy_to_web_container",
+}
+
+SOURCES = ["reddit", "hackernews", "mastodon", "rss"]
+
+# Roughly PaperMod's per-page head/nav/footer markup
+PAGE_CHROME = (
+    '<!doctype html><html lang="en" dir="auto"><head><meta charset="utf-8">'
+    + '<meta name="viewport" content="width=device-width,initial-scale=1">' * 40
+    + "</head><body><header class=header><nav class=nav>"
+    + '<a href="/posts/">Posts</a><a href="/tags/">Tags</a>' * 20
+    + "</nav></header><main class=main>{body}</main><footer class=footer>"
+    + '<span>&copy; AI Content Farm</span><a href="#top">top</a>' * 10
+    + "</footer></body></html>"
+)
+
+
+def _words(rng: random.Random, count: int) -> str:
+    return " ".join(rng.choices(VOCABULARY, k=count))
+
+
+def generate_article(index: int, rng: random.Random, revision: int = 0) -> bytes:
+    """Markdown shaped like markdown-generator output (frontmatter + sections)."""
+    title = _words(rng, rng.randint(5, 10)).capitalize() + f" ({index})"
+    published = datetime(2025, 1, 1, tzinfo=timezone.utc) + timedelta(
+        minutes=index * 37
+    )
+    frontmatter = {
+        "title": title,
+        "date": published.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "draft": False,
+        "description": _words(rng, 25),
+        "keywords": rng.sample(VOCABULARY, 5),
+        "cover": {
+            "image": f"https://images.unsplash.com/photo-{rng.getrandbits(48):x}",
+            "alt": title,
+            "caption": "Photo by Example Photographer on Unsplash",
+        },
+        "params": {
+            "original_url": f"https://example.com/source/{index}",
+            "source": rng.choice(SOURCES),
+            "author": f"author{rng.randint(1, 500)}",
+            "quality_score": round(rng.random(), 3),
+            "word_count": 0,
+            "revision": revision,
+        },
+    }
+    sections = []
+    for _ in range(rng.randint(3, 7)):
+        paragraphs = [
+            _words(rng, rng.randint(40, 110)).capitalize() + "."
+            for _ in range(rng.randint(2, 4))
+        ]
+        sections.append(f"## {_words(rng, 4).title()}\n\n" + "\n\n".join(paragraphs))
+    key_points = "\n".join(f"- {_words(rng, 12)}" for _ in range(4))
+    body = (
+        f"## Summary\n\n{frontmatter['description']}\n\n"
+        + "\n\n".join(sections)
+        + f"\n\n## Key Points\n\n{key_points}\n\n"
+        + f"**Source:** {frontmatter['params']['source']} — "
+        + frontmatter["params"]["original_url"]
+        + "\n"
+    )
+    frontmatter["params"]["word_count"] = len(body.split())
+    return (
+        "---\n"
+        + yaml.safe_dump(frontmatter, sort_keys=False, allow_unicode=True)
+        + "---\n\n"
+        + body
+    ).encode("utf-8")
+
+
+def article_blob_name(index: int) -> str:
+    published = datetime(2025, 1, 1) + timedelta(minutes=index * 37)
+    return f"articles/{published:%Y/%m/%d}/article-{index}.md"
+
+
+def generate_corpus(container: Any, count: int, seed: int = 42) -> Dict[str, int]:
+    """Write count articles into a FakeContainer; returns file/byte counts."""
+    rng = random.Random(seed)
+    total = 0
+    for index in range(count):
+        content = generate_article(index, rng)
+        container.blobs[article_blob_name(index)] = content
+        total += len(content)
+    return {"files": count, "bytes": total}
+
+
+def _markdown_to_html(markdown: str) -> str:
+    blocks = []
+    for block in markdown.split("\n\n"):
+        block = block.strip()
+        if block.startswith("## "):
+            blocks.append(f"<h2>{html.escape(block[3:])}</h2>")
+        elif block.startswith("- "):
+            items = "".join(
+                f"<li>{html.escape(line[2:])}</li>" for line in block.splitlines()
+            )
+            blocks.append(f"<ul>{items}</ul>")
+        elif block:
+            blocks.append(f"<p>{html.escape(block)}</p>")
+    return "".join(blocks)
+
+
+def _render_site(hugo_dir: Path, base_url: str) -> int:
+    """Stand-in for Hugo: page per article plus home, RSS, sitemap, JSON."""
+    public = hugo_dir / "public"
+    if public.exists():
+        shutil.rmtree(public)
+    public.mkdir(parents=True)
+    base_url = base_url.rstrip("/")
+
+    entries: List[Dict[str, str]] = []
+    for md_file in sorted((hugo_dir / "content").rglob("*.md")):
+        _, frontmatter, body = md_file.read_text(encoding="utf-8").split("---\n", 2)
+        meta = yaml.safe_load(frontmatter)
+        rel = md_file.relative_to(hugo_dir / "content").with_suffix("")
+        page_dir = public / rel
+        page_dir.mkdir(parents=True, exist_ok=True)
+        title = html.escape(meta["title"])
+        (page_dir / "index.html").write_text(
+            PAGE_CHROME.format(
+                body=f"<article><h1>{title}</h1>{_markdown_to_html(body)}</article>"
+            ),
+            encoding="utf-8",
+        )
+        entries.append(
+            {
+                "title": meta["title"],
+                "content": " ".join(body.split()),
+                "permalink": f"{base_url}/{rel.as_posix()}/",
+                "summary": meta.get("description", ""),
+            }
+        )
+
+    latest = sorted(entries, key=lambda e: e["permalink"], reverse=True)
+    (public / "index.html").write_text(
+        PAGE_CHROME.format(
+            body="".join(
+                f'<article><a href="{e["permalink"]}">{html.escape(e["title"])}</a>'
+                f"<p>{html.escape(e['summary'])}</p></article>"
+                for e in latest[:12]
+            )
+        ),
+        encoding="utf-8",
+    )
+    (public / "index.xml").write_text(
+        "<rss><channel>"
+        + "".join(
+            f"<item><title>{html.escape(e['title'])}</title><link>{e['permalink']}"
+            f"</link><description>{html.escape(e['summary'])}</description></item>"
+            for e in latest
+        )
+        + "</channel></rss>",
+        encoding="utf-8",
+    )
+    (public / "sitemap.xml").write_text(
+        "<urlset>"
+        + "".join(f"<url><loc>{e['permalink']}</loc></url>" for e in entries)
+        + "</urlset>",
+        encoding="utf-8",
+    )
+    (public / "index.json").write_text(json.dumps(entries), encoding="utf-8")
+
+    stylesheet = ("body{margin:0;font-family:sans-serif}" * 200).encode()
+    css_dir = public / "assets" / "css"
+    css_dir.mkdir(parents=True)
+    (css_dir / f"stylesheet.{hashlib.sha256(stylesheet).hexdigest()}.css").write_bytes(
+        stylesheet
+    )
+    for static_file in (hugo_dir / "static").rglob("*"):
+        if static_file.is_file():
+            target = public / static_file.relative_to(hugo_dir / "static")
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(static_file, target)
+
+    return sum(1 for path in public.rglob("*") if path.is_file())
+
+
+async def _simulated_hugo_build(
+    hugo_dir: Path, config_file: Path, base_url: str, **kwargs: Any
+) -> BuildResult:
+    start = time.perf_counter()
+    output_files = await asyncio.to_thread(_render_site, hugo_dir, base_url)
+    return BuildResult(
+        success=True,
+        output_files=output_files,
+        duration_seconds=time.perf_counter() - start,
+    )
+
+
+def _counts(result: Any) -> Dict[str, int]:
+    """Numeric fields of a stage result (duration comes from the phase timer)."""
+    if isinstance(result, OutputScan):
+        return {"files": result.file_count, "bytes": result.total_size}
+    counts = {
+        key: value
+        for key, value in result.model_dump().items()
+        if isinstance(value, int) and not isinstance(value, bool)
+    }
+    counts["errors"] = len(getattr(result, "errors", []))
+    return counts
+
+
+class PipelineProfiler:
+    """Per-stage wall time, traced memory peak and result counts."""
+
+    def __init__(self) -> None:
+        self.stages: Dict[str, Dict[str, Any]] = {}
+        self.peak_bytes = 0  # Highest traced memory across all phases
+
+    def reset(self) -> None:
+        self.stages = {}
+        self.peak_bytes = 0
+
+    @contextmanager
+    def phase(self, timings: Dict[str, float], phase: str) -> Iterator[None]:
+        baseline, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        with timed_phase(timings, phase):
+            yield
+        _, peak = tracemalloc.get_traced_memory()
+        self.peak_bytes = max(self.peak_bytes, peak)
+        stage = self.stages.setdefault(phase, {})
+        stage["seconds"] = timings[phase]
+        stage["memory_peak_bytes"] = max(0, peak - baseline)
+
+    def capture(self, stage: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        if asyncio.iscoroutinefunction(func):
+
+            async def _async(*args: Any, **kwargs: Any) -> Any:
+                result = await func(*args, **kwargs)
+                self.stages.setdefault(stage, {}).update(_counts(result))
+                return result
+
+            return _async
+
+        def _sync(*args: Any, **kwargs: Any) -> Any:
+            result = func(*args, **kwargs)
+            self.stages.setdefault(stage, {}).update(_counts(result))
+            return result
+
+        return _sync
+
+
+def _tree_size(root: Path, pattern: str = "*") -> Dict[str, int]:
+    files = [path for path in root.rglob(pattern) if path.is_file()]
+    return {"files": len(files), "bytes": sum(path.stat().st_size for path in files)}
+
+
+async def _run_pipeline(
+    blob_service: Any, config: Any, profiler: PipelineProfiler
+) -> Dict[str, Any]:
+    profiler.reset()
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        result = await site_builder.build_and_deploy_site(blob_service, config)
+        seconds = time.perf_counter() - start
+        _, overall_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    workspace = Path(config.workspace_dir)
+    web = blob_service.get_container_client(config.output_container)
+    site_blobs = list(web.blobs.values())
+    return {
+        "seconds": round(seconds, 3),
+        "memory_peak_bytes": max(overall_peak, profiler.peak_bytes),
+        "errors": result.errors,
+        "stages": profiler.stages,
+        "hugo_content": _tree_size(workspace / "hugo-site" / "content", "*.md"),
+        "public": _tree_size(workspace / "hugo-site" / "public"),
+        "deployed": {
+            "files": len(site_blobs),
+            "bytes": sum(len(content) for content in site_blobs),
+            "uploaded": result.files_uploaded,
+            "unchanged": result.files_unchanged,
+            "deleted": result.files_deleted,
+            "bytes_uploaded": result.bytes_uploaded,
+        },
+    }
+
+
+def _write_report(report: Dict[str, Any], temp_dir: Path) -> Path:
+    output_dir = Path(os.getenv("PIPELINE_BENCHMARK_OUTPUT") or temp_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    path = output_dir / f"pipeline-benchmark-{report['articles']}.json"
+    path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return path
+
+
+def _print_summary(report: Dict[str, Any]) -> None:
+    print(f"\n{report['articles']} articles (hugo: {report['hugo']})")
+    print(f"{'stage':<14}{'cold s':>9}{'cold MiB':>10}{'warm s':>9}{'warm MiB':>10}")
+    cold, warm = report["runs"]["cold"], report["runs"]["warm"]
+    for stage in STAGE_FUNCTIONS:
+        before, after = cold["stages"].get(stage, {}), warm["stages"].get(stage, {})
+        print(
+            f"{stage:<14}{before.get('seconds', 0):>9.2f}"
+            f"{before.get('memory_peak_bytes', 0) / 2**20:>10.1f}"
+            f"{after.get('seconds', 0):>9.2f}"
+            f"{after.get('memory_peak_bytes', 0) / 2**20:>10.1f}"
+        )
+    print(
+        f"{'total':<14}{cold['seconds']:>9.2f}"
+        f"{cold['memory_peak_bytes'] / 2**20:>10.1f}"
+        f"{warm['seconds']:>9.2f}{warm['memory_peak_bytes'] / 2**20:>10.1f}"
+    )
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+@pytest.mark.parametrize("articles", SIZES)
+async def test_pipeline_benchmark(fake_blob_service, temp_dir, monkeypatch, articles):
+    """Full pipeline, cold and after a 1% change, reported as JSON."""
+    hugo_config = temp_dir / "hugo-config"
+    shutil.copytree(HUGO_CONFIG_DIR, hugo_config)
+    settings = Settings(  # type: ignore[call-arg]
+        azure_storage_account_name="benchmark",
+        hugo_base_url="https://bench.example.com",
+        workspace_dir=str(temp_dir / "workspace"),
+        max_markdown_files=max(
+            articles, Settings.model_fields["max_markdown_files"].default
+        ),
+    )
+    config = SimpleNamespace(
+        **settings.model_dump(), hugo_config_path=str(hugo_config / "config.toml")
+    )
+
+    real_hugo = bool(shutil.which("hugo")) and PAPERMOD_DIR.exists()
+    if not real_hugo:
+        monkeypatch.setattr(site_builder, "build_site_with_hugo", _simulated_hugo_build)
+    profiler = PipelineProfiler()
+    monkeypatch.setattr(site_builder, "timed_phase", profiler.phase)
+    for stage, name in STAGE_FUNCTIONS.items():
+        monkeypatch.setattr(
+            site_builder, name, profiler.capture(stage, getattr(site_builder, name))
+        )
+
+    markdown = fake_blob_service.get_container_client(config.markdown_container)
+    start = time.perf_counter()
+    corpus = generate_corpus(markdown, articles)
+    corpus["generate_seconds"] = round(time.perf_counter() - start, 3)
+
+    cold = await _run_pipeline(fake_blob_service, config, profiler)
+
+    rng = random.Random(7)
+    changed = rng.sample(range(articles), max(1, int(articles * CHANGED_FRACTION)))
+    for index in changed:
+        markdown.blobs[article_blob_name(index)] = generate_article(
+            index, rng, revision=1
+        )
+    warm = await _run_pipeline(fake_blob_service, config, profiler)
+
+    report = {
+        "benchmark": "site-publisher-pipeline",
+        "articles": articles,
+        "changed_articles": len(changed),
+        "hugo": "binary" if real_hugo else "simulated",
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "cpu_count": os.cpu_count(),
+        "max_rss_bytes": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+        "corpus": corpus,
+        "runs": {"cold": cold, "warm": warm},
+    }
+    path = _write_report(report, temp_dir)
+    _print_summary(report)
+    print(f"Report: {path}")
+
+    assert cold["errors"] == [] and warm["errors"] == []
+    assert cold["hugo_content"]["files"] == articles
+    assert cold["stages"]["sync"]["files_downloaded"] == articles
+    assert warm["stages"]["sync"]["files_downloaded"] == len(changed)
+    assert cold["deployed"]["files"] == cold["public"]["files"]
+    assert warm["deployed"]["uploaded"] < cold["deployed"]["uploaded"]
+    assert set(STAGE_FUNCTIONS) <= set(cold["stages"])
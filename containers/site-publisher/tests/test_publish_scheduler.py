@@ -0,0 +1,169 @@
+"""
+Unit tests for publish_scheduler.py
+
+Tests signal coalescing, debounce windows, and that builds never overlap.
+"""
+
+import asyncio
+from typing import List, Optional
+
+import pytest
+from models import DeploymentResult, PublishSignal
+from publish_scheduler import PublishScheduler
+
+
+class FakeBuild:
+    """Build function that records calls and detects overlapping builds."""
+
+    def __init__(
+        self,
+        duration: float = 0.01,
+        fail: bool = False,
+        warnings: Optional[List[str]] = None,
+    ) -> None:
+        self.duration = duration
+        self.fail = fail
+        self.warnings = warnings or []
+        self.calls = 0
+        self.forced: List[bool] = []
+        self.running = 0
+        self.max_running = 0
+
+    async def __call__(self, force_rebuild: bool) -> DeploymentResult:
+        self.calls += 1
+        self.forced.append(force_rebuild)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.duration)
+            if self.fail:
+                raise RuntimeError("hugo exploded")
+            return DeploymentResult(
+                files_uploaded=10, duration_seconds=self.duration, errors=self.warnings
+            )
+        finally:
+            self.running -= 1
+
+
+def _signal(signal_id: str, files_created: int = 1, force: bool = False):
+    return PublishSignal(
+        signal_id=signal_id, files_created=files_created, force_rebuild=force
+    )
+
+
+@pytest.mark.asyncio
+async def test_burst_coalesced_into_one_build():
+    """Signals arriving within the debounce window share one build."""
+    build = FakeBuild()
+    scheduler = PublishScheduler(build, debounce_seconds=0.05)
+
+    futures = [scheduler.submit(_signal(f"msg-{i}")) for i in range(5)]
+    records = await asyncio.gather(*futures)
+
+    assert build.calls == 1
+    assert all(record is records[0] for record in records)
+    assert records[0].signal_ids == [f"msg-{i}" for i in range(5)]
+    assert records[0].files_created == 5
+    assert scheduler.get_stats()["builds_saved"] == 4
+
+
+@pytest.mark.asyncio
+async def test_signals_during_build_get_next_build():
+    """A signal arriving mid-build is satisfied by exactly one later build."""
+    build = FakeBuild(duration=0.05)
+    scheduler = PublishScheduler(build, debounce_seconds=0)
+
+    first = scheduler.submit(_signal("a"))
+    await asyncio.sleep(0.01)  # build "a" is running
+    second = scheduler.submit(_signal("b"))
+    third = scheduler.submit(_signal("c", force=True))
+
+    first_record, second_record, third_record = await asyncio.gather(
+        first, second, third
+    )
+
+    assert build.calls == 2
+    assert build.max_running == 1
+    assert first_record.signal_ids == ["a"]
+    assert second_record is third_record
+    assert second_record.signal_ids == ["b", "c"]
+    assert second_record.force_rebuild is True
+    assert build.forced == [False, True]
+
+
+@pytest.mark.asyncio
+async def test_at_most_one_build_per_window():
+    """The next build waits until debounce_seconds after the last one started."""
+    sleeps: List[float] = []
+    now = [0.0]
+
+    async def fake_sleep(seconds: float) -> None:
+        sleeps.append(round(seconds, 3))
+        now[0] += seconds
+
+    build = FakeBuild(duration=0)
+    scheduler = PublishScheduler(
+        build, debounce_seconds=30, clock=lambda: now[0], sleep=fake_sleep
+    )
+
+    await scheduler.submit(_signal("a"))
+    now[0] += 5
+    await scheduler.submit(_signal("b"))
+
+    # First waits a full window for more signals; second waits out the
+    # remainder of the window that started with build #1
+    assert sleeps == [30, 30]
+    assert build.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_build_resolves_signals():
+    """Build exceptions are recorded, not raised to submitters."""
+    scheduler = PublishScheduler(FakeBuild(fail=True), debounce_seconds=0)
+
+    record = await scheduler.submit(_signal("a"))
+
+    assert record.success is False
+    assert record.errors == ["hugo exploded"]
+    assert scheduler.idle
+
+
+@pytest.mark.asyncio
+async def test_non_fatal_errors_do_not_fail_build():
+    """A deployed site with warnings (e.g. a quarantined article) succeeded."""
+    warnings = ["Quarantined posts/bad.md: invalid frontmatter"]
+    scheduler = PublishScheduler(FakeBuild(warnings=warnings), debounce_seconds=0)
+
+    record = await scheduler.submit(_signal("a"))
+
+    assert record.success is True
+    assert record.errors == warnings
+
+
+@pytest.mark.asyncio
+async def test_fatal_build_result_fails():
+    """A build that reports fatal=True (nothing deployed) failed."""
+
+    async def build(force_rebuild: bool) -> DeploymentResult:
+        return DeploymentResult(
+            files_uploaded=0, duration_seconds=1.0, errors=["boom"], fatal=True
+        )
+
+    record = await PublishScheduler(build, debounce_seconds=0).submit(_signal("a"))
+
+    assert record.success is False
+
+
+@pytest.mark.asyncio
+async def test_wait_idle_and_history():
+    """wait_idle returns once pending signals are built; history is bounded."""
+    scheduler = PublishScheduler(FakeBuild(), debounce_seconds=0, history_size=2)
+
+    for i in range(3):
+        scheduler.submit(_signal(f"msg-{i}"))
+        await scheduler.wait_idle()
+
+    stats = scheduler.get_stats()
+    assert scheduler.idle
+    assert stats["builds_run"] == 3
+    assert [b["signal_ids"] for b in stats["recent_builds"]] == [["msg-1"], ["msg-2"]]
@@ -0,0 +1,245 @@
+"""
+Unit tests for search_index.py
+
+Tests shard layout, lookups as sharded-search.js performs them, and
+benchmarks index size and build time at 1k/10k articles.
+"""
+
+import json
+import random
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+from search_index import (
+    PREFIX_LENGTH,
+    SEARCH_DIR,
+    build_search_index,
+    tokenize,
+)
+
+from tests.conftest import VOCABULARY
+
+
+def _write_index(public_dir: Path, entries: List[Dict[str, Any]]) -> None:
+    public_dir.mkdir(parents=True, exist_ok=True)
+    (public_dir / "index.json").write_text(json.dumps(entries))
+
+
+def _synthetic_entries(count: int, words: int = 150) -> List[Dict[str, Any]]:
+    rng = random.Random(42)
+    entries = []
+    for index in range(count):
+        title = " ".join(rng.choices(VOCABULARY, k=5)) + f" update{index}"
+        content = " ".join(
+            rng.choice(VOCABULARY) + (str(rng.randint(0, 5000)) if i % 7 == 0 else "")
+            for i in range(words)
+        )
+        entries.append(
+            {
+                "title": title,
+                "content": content,
+                "permalink": f"https://example.com/posts/article-{index}/",
+                "summary": content[:300],
+            }
+        )
+    return entries
+
+
+def _lookup(public_dir: Path, term: str) -> Dict[str, Any]:
+    """Resolve a term the way sharded-search.js does."""
+    search_dir = public_dir / SEARCH_DIR
+    manifest = json.loads((search_dir / "manifest.json").read_text())
+    prefix = term[: manifest["prefixLength"]]
+    digest = manifest["terms"][prefix]
+    shard = json.loads((search_dir / f"terms-{prefix}.{digest}.json").read_text())
+    postings = shard.get(term, [])
+    hits = []
+    for doc_id in postings[::2]:
+        shard_index = doc_id // manifest["docShardSize"]
+        docs = json.loads(
+            (
+                search_dir / f"docs-{shard_index}.{manifest['docs'][shard_index]}.json"
+            ).read_text()
+        )
+        hits.append(docs[doc_id % manifest["docShardSize"]])
+    return {"manifest": manifest, "postings": postings, "hits": hits}
+
+
+def test_tokenize_folds_and_filters():
+    """Terms are ASCII-folded, lower-case, without stopwords."""
+    assert tokenize("The Café's AI-powered Search!") == [
+        "cafe",
+        "ai",
+        "powered",
+        "search",
+    ]
+    assert tokenize("a I of") == []
+
+
+def test_build_search_index_shards_terms_and_docs(temp_dir):
+    """Terms are partitioned by prefix; docs resolve from doc shards."""
+    public = temp_dir / "public"
+    _write_index(
+        public,
+        [
+            {
+                "title": "Rust compiler release",
+                "content": "The rust compiler ships today.",
+                "permalink": "https://example.com/rust/",
+                "summary": "Rust news",
+            },
+            {
+                "title": "Python tips",
+                "content": "Rust bindings for python via a compiler plugin.",
+                "permalink": "https://example.com/python/",
+                "summary": "",
+            },
+        ],
+    )
+
+    result = build_search_index(public, doc_shard_size=1)
+
+    assert result.documents == 2
+    assert result.doc_shards == 2
+    assert not (public / "index.json").exists()
+
+    rust = _lookup(public, "rust")
+    # Title matches outrank body matches
+    assert [hit[1] for hit in rust["hits"]] == [
+        "https://example.com/rust/",
+        "https://example.com/python/",
+    ]
+    assert rust["hits"][1][2].startswith("Rust bindings")  # summary fallback
+    assert all(len(prefix) == PREFIX_LENGTH for prefix in rust["manifest"]["terms"])
+    shard_names = {p.name for p in (public / SEARCH_DIR).iterdir()}
+    assert len(shard_names) == result.term_shards + result.doc_shards + 1
+
+
+def test_rebuild_is_deterministic(temp_dir):
+    """Same input gives identical shard names (unchanged shards not redeployed)."""
+    public = temp_dir / "public"
+    entries = _synthetic_entries(50)
+
+    _write_index(public, entries)
+    build_search_index(public)
+    first = sorted(p.name for p in (public / SEARCH_DIR).iterdir())
+    _write_index(public, entries)
+    build_search_index(public)
+    second = sorted(p.name for p in (public / SEARCH_DIR).iterdir())
+
+    assert first == second
+
+
+def _shard_names(public_dir: Path) -> set:
+    return {p.name for p in (public_dir / SEARCH_DIR).iterdir()}
+
+
+def test_new_article_keeps_most_shard_names(temp_dir):
+    """Prepending one article to index.json doesn't rename existing shards."""
+    public = temp_dir / "public"
+    doc_ids = temp_dir / "search-doc-ids.json"
+    entries = _synthetic_entries(2000)
+
+    _write_index(public, entries)
+    build_search_index(public, doc_ids_path=doc_ids)
+    before = _shard_names(public)
+    new_article = {
+        "title": "Ocean tides explained",
+        "content": "How the moon moves ocean tides.",
+        "permalink": "https://example.com/posts/ocean-tides/",
+        "summary": "",
+    }
+    _write_index(public, [new_article] + entries)
+    result = build_search_index(public, doc_ids_path=doc_ids)
+    after = _shard_names(public)
+
+    assert result.documents == 2001
+    assert {name for name in before if name.startswith("docs-")} <= after
+    assert len(before & after) >= 0.9 * len(before)
+    assert _lookup(public, "tides")["hits"][0][1] == new_article["permalink"]
+
+
+def test_removed_article_frees_its_doc_id(temp_dir):
+    """Other articles keep their ids; the next new article reuses the gap."""
+    public = temp_dir / "public"
+    doc_ids = temp_dir / "search-doc-ids.json"
+    entries = _synthetic_entries(20)
+
+    _write_index(public, entries)
+    build_search_index(public, doc_ids_path=doc_ids, doc_shard_size=5)
+    before = {name for name in _shard_names(public) if name.startswith("docs-")}
+    # index.json is newest first and ids run oldest first: entry 2 has id 17
+    removed = entries.pop(2)
+    _write_index(public, entries)
+    build_search_index(public, doc_ids_path=doc_ids, doc_shard_size=5)
+
+    assert {name[:7] for name in before - _shard_names(public)} == {"docs-3."}
+    assert removed["permalink"] not in json.loads(doc_ids.read_text())["ids"]
+
+    added = dict(removed, permalink="https://example.com/posts/next/")
+    _write_index(public, [added] + entries)
+    build_search_index(public, doc_ids_path=doc_ids, doc_shard_size=5)
+
+    assert json.loads(doc_ids.read_text())["ids"][added["permalink"]] == 17
+
+
+def test_postings_capped_per_term(temp_dir):
+    """Common terms keep only their highest-scoring documents."""
+    public = temp_dir / "public"
+    _write_index(public, _synthetic_entries(30))
+
+    build_search_index(public, max_postings=5)
+
+    assert len(_lookup(public, "kubernetes")["postings"]) == 10  # 5 (id, score)
+
+
+def test_missing_source_skipped(temp_dir):
+    """Without index.json (JSON output disabled) nothing is written."""
+    public = temp_dir / "public"
+    public.mkdir()
+
+    result = build_search_index(public)
+
+    assert result.documents == 0
+    assert not (public / SEARCH_DIR).exists()
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("articles", [1000, 10000])
+def test_search_index_benchmark(temp_dir, articles):
+    """Index size, per-query download and build time at 1k/10k articles."""
+    public = temp_dir / "public"
+    _write_index(public, _synthetic_entries(articles))
+
+    start = time.perf_counter()
+    result = build_search_index(public)
+    build_s = time.perf_counter() - start
+
+    # A two-word query: manifest + two term shards + doc shards of top hits
+    search_dir = public / SEARCH_DIR
+    manifest = json.loads((search_dir / "manifest.json").read_text())
+    query_bytes = result.manifest_bytes
+    for term in ("kubernetes", "security"):
+        prefix = term[:PREFIX_LENGTH]
+        query_bytes += (
+            (search_dir / f"terms-{prefix}.{manifest['terms'][prefix]}.json")
+            .stat()
+            .st_size
+        )
+    query_bytes += (search_dir / f"docs-0.{manifest['docs'][0]}.json").stat().st_size
+
+    print(
+        f"\n{articles} articles: index.json {result.source_bytes / 1024:.0f} KiB, "
+        f"sharded total {result.bytes_written / 1024:.0f} KiB "
+        f"({result.term_shards} term + {result.doc_shards} doc shards), "
+        f"manifest {result.manifest_bytes / 1024:.1f} KiB, "
+        f"largest shard {result.largest_shard_bytes / 1024:.0f} KiB, "
+        f"2-word query downloads {query_bytes / 1024:.0f} KiB, "
+        f"build {build_s * 1000:.0f}ms"
+    )
+
+    assert result.documents == articles
+    assert query_bytes < result.source_bytes / 4
+    assert build_s < articles * 0.005
@@ -8,6 +8,7 @@ from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from models import DeploymentResult
 from site_builder import build_and_deploy_site
 
 
@@ -49,6 +50,7 @@ async def test_build_and_deploy_site_success(
     # Setup mock results - testing the contract
     download_result = Mock()
     download_result.files_downloaded = 5
+    download_result.files_skipped = 0
     download_result.errors = []
     mock_download.return_value = download_result
 
@@ -74,17 +76,18 @@ async def test_build_and_deploy_site_success(
     validation_result.errors = []
     mock_validate.return_value = validation_result
 
-    deploy_result = Mock()
-    deploy_result.files_uploaded = 10
-    deploy_result.errors = []
+    deploy_result = DeploymentResult(files_uploaded=10, duration_seconds=1.0)
     mock_deploy.return_value = deploy_result
 
     # Setup config
     mock_config = Mock()
+    mock_config.workspace_dir = str(temp_dir)
     mock_config.markdown_container = "markdown-content"
     mock_config.hugo_base_url = "https://test.example.com"
     mock_config.hugo_config_path = "/tmp/config.toml"
     mock_config.build_timeout_seconds = 300
+    mock_config.cache_policy = ""
+    mock_config.max_file_size_mb = 10
 
     # Execute
     result = await build_and_deploy_site(
@@ -96,6 +99,10 @@ async def test_build_and_deploy_site_success(
     assert result.files_uploaded == 10, "Should upload expected number of files"
     assert result.duration_seconds > 0, "Should track execution time"
     assert len(result.errors) == 0, "Should have no errors on success"
+    assert not result.fatal
+    assert {"sync", "organize", "hugo", "search_index", "validate", "deploy"} <= set(
+        result.phase_timings
+    ), "Should report a timing for every build phase"
 
     # Assert - verify behavior
     # Should validate Hugo output before deployment
@@ -126,13 +133,17 @@ async def test_build_and_deploy_site_download_failure(
     # Setup failed download
     download_result = Mock()
     download_result.files_downloaded = 0
+    download_result.files_skipped = 0
     download_result.errors = ["Failed to download blobs"]
     mock_download.return_value = download_result
 
     mock_config = Mock()
+    mock_config.workspace_dir = str(temp_dir)
     mock_config.markdown_container = "markdown-content"
     mock_config.hugo_config_path = "/tmp/config.toml"
     mock_config.build_timeout_seconds = 300
+    mock_config.cache_policy = ""
+    mock_config.max_file_size_mb = 10
 
     # Execute
     result = await build_and_deploy_site(
@@ -153,6 +164,43 @@ async def test_build_and_deploy_site_download_failure(
     mock_rollback.assert_not_called()
 
 
+@pytest.mark.asyncio
+@patch("site_builder.download_markdown_files", new_callable=AsyncMock)
+async def test_build_and_deploy_site_force_rebuild_clears_workspace(
+    mock_download, mock_blob_client, temp_dir
+):
+    """Test a forced rebuild starts from an empty workspace."""
+    workspace = Path(temp_dir) / "workspace"
+    stale = workspace / "hugo-site" / "public" / "stale.html"
+    stale.parent.mkdir(parents=True)
+    stale.write_text("old")
+    mirrored = workspace / "content" / "article.md"
+    mirrored.parent.mkdir(parents=True)
+    mirrored.write_text("cached")
+
+    download_result = Mock()
+    download_result.files_downloaded = 0
+    download_result.files_skipped = 0
+    download_result.errors = []
+    mock_download.return_value = download_result
+
+    mock_config = Mock()
+    mock_config.workspace_dir = str(workspace)
+    mock_config.hugo_config_path = "/tmp/config.toml"
+    mock_config.max_file_size_mb = 10
+
+    # Unforced builds keep the workspace
+    await build_and_deploy_site(blob_client=mock_blob_client, config=mock_config)
+    assert stale.exists() and mirrored.exists()
+
+    await build_and_deploy_site(
+        blob_client=mock_blob_client, config=mock_config, force_rebuild=True
+    )
+    assert not stale.exists()
+    assert not mirrored.exists()
+    assert (workspace / "content").is_dir()
+
+
 @pytest.mark.asyncio
 @patch("security.validate_hugo_output")
 @patch("site_builder.download_markdown_files", new_callable=AsyncMock)
@@ -176,6 +224,7 @@ async def test_build_and_deploy_site_build_failure(
     # Setup successful download and organize
     download_result = Mock()
     download_result.files_downloaded = 5
+    download_result.files_skipped = 0
     download_result.errors = []
     mock_download.return_value = download_result
 
@@ -192,10 +241,13 @@ async def test_build_and_deploy_site_build_failure(
     mock_build.return_value = build_result
 
     mock_config = Mock()
+    mock_config.workspace_dir = str(temp_dir)
     mock_config.markdown_container = "markdown-content"
     mock_config.hugo_base_url = "https://test.example.com"
     mock_config.hugo_config_path = "/tmp/config.toml"
     mock_config.build_timeout_seconds = 300
+    mock_config.cache_policy = ""
+    mock_config.max_file_size_mb = 10
 
     # Execute
     result = await build_and_deploy_site(
@@ -207,6 +259,7 @@ async def test_build_and_deploy_site_build_failure(
     assert result.files_uploaded == 0
     assert len(result.errors) > 0
     assert any("build" in error.lower() for error in result.errors)
+    assert result.fatal
 
     # Verify deployment steps were not called
     mock_backup.assert_not_called()
@@ -248,6 +301,7 @@ async def test_build_and_deploy_site_automatic_rollback(
     # Setup successful build
     download_result = Mock()
     download_result.files_downloaded = 5
+    download_result.files_skipped = 0
     download_result.errors = []
     mock_download.return_value = download_result
 
@@ -274,9 +328,9 @@ async def test_build_and_deploy_site_automatic_rollback(
     mock_validate.return_value = validation_result
 
     # Setup deploy with 0 files (triggers rollback)
-    deploy_result = Mock()
-    deploy_result.files_uploaded = 0
-    deploy_result.errors = ["Deployment validation failed"]
+    deploy_result = DeploymentResult(
+        files_uploaded=0, duration_seconds=1.0, errors=["Deployment validation failed"]
+    )
     mock_deploy.return_value = deploy_result
 
     rollback_result = Mock()
@@ -285,10 +339,13 @@ async def test_build_and_deploy_site_automatic_rollback(
     mock_rollback.return_value = rollback_result
 
     mock_config = Mock()
+    mock_config.workspace_dir = str(temp_dir)
     mock_config.markdown_container = "markdown-content"
     mock_config.hugo_base_url = "https://test.example.com"
     mock_config.hugo_config_path = "/tmp/config.toml"
     mock_config.build_timeout_seconds = 300
+    mock_config.cache_policy = ""
+    mock_config.max_file_size_mb = 10
 
     # Execute
     result = await build_and_deploy_site(
@@ -305,6 +362,7 @@ async def test_build_and_deploy_site_automatic_rollback(
         "rollback" in error.lower() or "deploy" in error.lower()
         for error in result.errors
     ), "Should include deployment/rollback error message"
+    assert result.fatal, "Nothing deployed: the publish must be retried"
 
     # Assert - verify behavior
     mock_validate.assert_called_once()  # Should validate before deployment
@@ -345,6 +403,7 @@ async def test_build_and_deploy_site_backup_failure_continues(
     # Setup successful build
     download_result = Mock()
     download_result.files_downloaded = 5
+    download_result.files_skipped = 0
     download_result.errors = []
     mock_download.return_value = download_result
 
@@ -372,16 +431,17 @@ async def test_build_and_deploy_site_backup_failure_continues(
     mock_validate.return_value = validation_result
 
     # Setup successful deploy
-    deploy_result = Mock()
-    deploy_result.files_uploaded = 10
-    deploy_result.errors = []
+    deploy_result = DeploymentResult(files_uploaded=10, duration_seconds=1.0)
     mock_deploy.return_value = deploy_result
 
     mock_config = Mock()
+    mock_config.workspace_dir = str(temp_dir)
     mock_config.markdown_container = "markdown-content"
     mock_config.hugo_base_url = "https://test.example.com"
     mock_config.hugo_config_path = "/tmp/config.toml"
     mock_config.build_timeout_seconds = 300
+    mock_config.cache_policy = ""
+    mock_config.max_file_size_mb = 10
 
     # Execute
     result = await build_and_deploy_site(
@@ -394,7 +454,9 @@ async def test_build_and_deploy_site_backup_failure_continues(
         result.files_uploaded == 10
     ), "Should deploy successfully even with backup failure"
     assert result.duration_seconds > 0, "Should track execution time"
-    # Backup errors should be logged but deployment succeeds
+    # Backup errors are reported as warnings; the deployment succeeded
+    assert result.errors == ["Backup failed"]
+    assert not result.fatal
 
     # Assert - verify behavior
     mock_validate.assert_called_once()  # Should validate before deployment
@@ -0,0 +1,83 @@
+"""
+Unit tests for workspace.py
+
+Tests incremental theme/config sync into the persistent workspace and
+build phase timing.
+"""
+
+import os
+
+from workspace import sync_directory, timed_phase
+
+
+def _make_theme(root):
+    (root / "partials").mkdir(parents=True)
+    (root / "partials" / "head.html").write_text("<head></head>")
+    (root / "index.html").write_text("<main></main>")
+
+
+def test_first_sync_copies_everything(temp_dir):
+    """An empty workspace receives every file."""
+    src, dst = temp_dir / "layouts", temp_dir / "workspace" / "layouts"
+    _make_theme(src)
+
+    result = sync_directory(src, dst)
+
+    assert result.files_copied == 2
+    assert (dst / "partials" / "head.html").read_text() == "<head></head>"
+
+
+def test_unchanged_files_not_copied(temp_dir):
+    """A second sync without changes copies nothing."""
+    src, dst = temp_dir / "layouts", temp_dir / "workspace" / "layouts"
+    _make_theme(src)
+    sync_directory(src, dst)
+
+    result = sync_directory(src, dst)
+
+    assert (result.files_copied, result.files_unchanged) == (0, 2)
+
+
+def test_changed_and_removed_files(temp_dir):
+    """Modified files are re-copied; files gone from the source are removed."""
+    src, dst = temp_dir / "layouts", temp_dir / "workspace" / "layouts"
+    _make_theme(src)
+    sync_directory(src, dst)
+    (src / "index.html").write_text("<main>v2</main>")
+    stat = (src / "index.html").stat()
+    os.utime(src / "index.html", (stat.st_atime, stat.st_mtime + 10))
+    (src / "partials" / "head.html").unlink()
+
+    result = sync_directory(src, dst)
+
+    assert (result.files_copied, result.files_deleted) == (1, 1)
+    assert (dst / "index.html").read_text() == "<main>v2</main>"
+    assert not (dst / "partials" / "head.html").exists()
+
+
+def test_workspace_cache_untouched(temp_dir):
+    """Sync only manages its own directory, leaving resources/_gen alone."""
+    src = temp_dir / "assets"
+    site = temp_dir / "workspace"
+    _make_theme(src)
+    (site / "resources" / "_gen").mkdir(parents=True)
+    (site / "resources" / "_gen" / "img.webp").write_bytes(b"cached")
+
+    sync_directory(src, site / "assets")
+
+    assert (site / "resources" / "_gen" / "img.webp").read_bytes() == b"cached"
+
+
+def test_timed_phase_accumulates():
+    """Repeated phases add up; timing is recorded even on error."""
+    timings = {}
+    with timed_phase(timings, "deploy"):
+        pass
+    try:
+        with timed_phase(timings, "hugo"):
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+
+    assert set(timings) == {"deploy", "hugo"}
+    assert all(value >= 0 for value in timings.values())
@@ -0,0 +1,103 @@
+"""
+Persistent Hugo workspace for site-publisher.
+
+The workspace (content mirror, Hugo site, Hugo caches) survives between
+builds so Hugo can reuse its resources/_gen image and asset cache. Theme
+and config directories are synced into it, copying only files whose size
+or modification time changed.
+"""
+
+import asyncio
+import logging
+import shutil
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator
+
+from models import DirectorySyncResult
+
+logger = logging.getLogger(__name__)
+
+
+def sync_directory(src: Path, dst: Path) -> DirectorySyncResult:
+    """
+    Make dst mirror src, copying only changed files.
+
+    A file is unchanged if size and modification time match (copies keep
+    the source mtime). Files in dst that no longer exist in src are removed.
+
+    Args:
+        src: Source directory (e.g. hugo-config/layouts)
+        dst: Destination directory in the workspace
+
+    Returns:
+        DirectorySyncResult with copied, unchanged and deleted counts
+    """
+    copied = unchanged = deleted = 0
+    dst.mkdir(parents=True, exist_ok=True)
+
+    source_files = set()
+    for src_file in src.rglob("*"):
+        if not src_file.is_file():
+            continue
+        rel_path = src_file.relative_to(src)
+        source_files.add(rel_path)
+        dst_file = dst / rel_path
+
+        src_stat = src_file.stat()
+        try:
+            dst_stat = dst_file.stat()
+            if dst_stat.st_size == src_stat.st_size and int(dst_stat.st_mtime) == int(
+                src_stat.st_mtime
+            ):
+                unchanged += 1
+                continue
+        except FileNotFoundError:
+            pass
+
+        dst_file.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(src_file, dst_file)
+        copied += 1
+
+    for dst_file in list(dst.rglob("*")):
+        if dst_file.is_file() and dst_file.relative_to(dst) not in source_files:
+            dst_file.unlink()
+            deleted += 1
+
+    return DirectorySyncResult(
+        files_copied=copied, files_unchanged=unchanged, files_deleted=deleted
+    )
+
+
+async def sync_directory_async(src: Path, dst: Path) -> DirectorySyncResult:
+    """
+    Sync a directory without blocking the event loop.
+
+    Args:
+        src: Source directory
+        dst: Destination directory in the workspace
+
+    Returns:
+        DirectorySyncResult with copied, unchanged and deleted counts
+    """
+    return await asyncio.to_thread(sync_directory, src, dst)
+
+
+@contextmanager
+def timed_phase(timings: Dict[str, float], phase: str) -> Iterator[None]:
+    """
+    Record how long a build phase takes, in seconds.
+
+    Example:
+        >>> timings = {}
+        >>> with timed_phase(timings, "hugo"):
+        ...     pass
+        >>> "hugo" in timings
+        True
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[phase] = round(timings.get(phase, 0.0) + time.perf_counter() - start, 3)
@@ -110,6 +110,11 @@ resource "azurerm_container_app" "markdown_generator" {
         value = "markdown-content"
       }
 
+      env {
+        name  = "IMAGE_CACHE_CONTAINER"
+        value = azurerm_storage_container.image_cache.name
+      }
+
       env {
         name  = "MARKDOWN_QUEUE_NAME"
         value = azurerm_storage_queue.markdown_generation_requests.name
@@ -166,6 +166,14 @@ resource "azurerm_storage_container" "markdown_content" {
   container_access_type = "private"
 }
 
+# Container for the markdown generator's Unsplash search cache
+resource "azurerm_storage_container" "image_cache" {
+  # checkov:skip=CKV2_AZURE_21: Logging not required for this use case
+  name                  = "image-cache"
+  storage_account_id    = azurerm_storage_account.main.id
+  container_access_type = "private"
+}
+
 # Container for pipeline logs and monitoring
 resource "azurerm_storage_container" "pipeline_logs" {
   # checkov:skip=CKV2_AZURE_21: Logging not required for this use case
@@ -0,0 +1,406 @@
+"""
+Azure Blob Storage SDK-Level Mocks
+
+SDK-shaped clients backed by the shared in-memory store in
+libs.blob_mock.MockBlobStorage, so code written against
+azure.storage.blob (sync) or azure.storage.blob.aio runs unchanged without
+Azure. Companion to azure_queue_mocks.MockQueueClient.
+
+Supported surface (what the containers use):
+- Service: get_container_client, get_blob_client, list_containers
+- Container: get_blob_client, list_blobs(name_starts_with), upload_blob,
+  delete_blob
+- Blob: upload_blob (overwrite, content_settings/content_type, metadata,
+  etag + match_condition), download_blob (offset/length) -> readall(),
+  get_blob_properties, set_blob_metadata, delete_blob, exists
+
+Usage:
+    from libs.azure_blob_mocks import MockAsyncBlobServiceClient, MockBlobServiceClient
+    from libs.simplified_blob_client import SimplifiedBlobClient
+
+    blob_client = SimplifiedBlobClient(blob_service_client=MockBlobServiceClient())
+    aio_client = MockAsyncBlobServiceClient()  # same data as blob_client
+"""
+
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+from azure.core import MatchConditions
+from azure.core.exceptions import (
+    ResourceExistsError,
+    ResourceModifiedError,
+    ResourceNotFoundError,
+)
+from azure.storage.blob import ContentSettings
+from pydantic import BaseModel, ConfigDict, Field
+
+from libs.blob_mock import MockBlobStorage
+
+
+class MockBlobProperties(BaseModel):
+    """Mock implementation of azure.storage.blob.BlobProperties."""
+
+    name: str
+    container: str
+    size: int = 0
+    etag: Optional[str] = None
+    last_modified: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    metadata: Dict[str, str] = Field(default_factory=dict)
+    content_settings: ContentSettings = Field(default_factory=ContentSettings)
+    content_range: Optional[str] = None  # "bytes start-end/total" on ranged reads
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+def _properties(container: str, name: str, data: Dict[str, Any]) -> MockBlobProperties:
+    return MockBlobProperties(
+        name=name,
+        container=container,
+        size=data["size"],
+        etag=data.get("etag"),
+        last_modified=datetime.fromisoformat(data["last_modified"]),
+        metadata=data.get("metadata") or {},
+        content_settings=ContentSettings(content_type=data.get("content_type")),
+    )
+
+
+def _to_bytes(data: Any) -> bytes:
+    if isinstance(data, bytes):
+        return data
+    if isinstance(data, str):
+        return data.encode("utf-8")
+    if hasattr(data, "read"):
+        return _to_bytes(data.read())
+    return bytes(data)
+
+
+class MockStorageStreamDownloader:
+    """Mock implementation of azure.storage.blob.StorageStreamDownloader."""
+
+    def __init__(self, content: bytes, properties: MockBlobProperties):
+        self._content = content
+        self.properties = properties
+        self.size = len(content)
+
+    def readall(self) -> bytes:
+        """Read the (ranged) blob content."""
+        return self._content
+
+    def content_as_text(self, encoding: str = "UTF-8") -> str:
+        """Read the content as text."""
+        return self._content.decode(encoding)
+
+    def chunks(self) -> Iterator[bytes]:
+        """Iterate over the content (a single chunk)."""
+        yield self._content
+
+
+class MockBlobClient:
+    """
+    Mock implementation of azure.storage.blob.BlobClient.
+
+    Conditional requests follow the service: ``overwrite=False`` fails with
+    ResourceExistsError if the blob exists (If-None-Match: *), and
+    ``etag`` + ``MatchConditions.IfNotModified`` fails with
+    ResourceModifiedError once the blob has changed (If-Match).
+    """
+
+    def __init__(self, container_name: str, blob_name: str):
+        self.container_name = container_name
+        self.blob_name = blob_name
+        self._storage = MockBlobStorage()
+
+    def _current(self) -> Optional[Dict[str, Any]]:
+        return self._storage.get_blob_properties(self.container_name, self.blob_name)
+
+    def _check_condition(
+        self,
+        current: Optional[Dict[str, Any]],
+        etag: Optional[str],
+        match_condition: Optional[MatchConditions],
+    ) -> None:
+        if etag is None or match_condition is None:
+            return
+        if match_condition == MatchConditions.IfNotModified and (
+            current is None or current["etag"] != etag
+        ):
+            raise ResourceModifiedError("The condition specified was not met")
+        if match_condition == MatchConditions.IfModified and (
+            current is not None and current["etag"] == etag
+        ):
+            raise ResourceModifiedError("The condition specified was not met")
+
+    def _require(self) -> Dict[str, Any]:
+        current = self._current()
+        if current is None:
+            raise ResourceNotFoundError(
+                f"The specified blob does not exist: {self.blob_name}"
+            )
+        return current
+
+    def upload_blob(
+        self,
+        data: Any,
+        overwrite: bool = False,
+        *,
+        content_settings: Optional[ContentSettings] = None,
+        content_type: Optional[str] = None,
+        metadata: Optional[Dict[str, str]] = None,
+        etag: Optional[str] = None,
+        match_condition: Optional[MatchConditions] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Upload a blob - matches Azure SDK signature."""
+        current = self._current()
+        if current is not None and not overwrite:
+            raise ResourceExistsError(
+                f"The specified blob already exists: {self.blob_name}"
+            )
+        self._check_condition(current, etag, match_condition)
+
+        content_type = (
+            content_settings.content_type if content_settings else None
+        ) or content_type
+        self._storage.upload_data(
+            self.container_name,
+            self.blob_name,
+            _to_bytes(data),
+            content_type or "application/octet-stream",
+            metadata=metadata,
+        )
+        stored = self._require()
+        return {"etag": stored["etag"], "last_modified": stored["last_modified"]}
+
+    def download_blob(
+        self, offset: Optional[int] = None, length: Optional[int] = None, **kwargs: Any
+    ) -> MockStorageStreamDownloader:
+        """
+        Download a blob (optionally a byte range) - matches Azure SDK signature.
+
+        As in Azure, a ranged download reports the range length as size and
+        the full blob size in content_range.
+        """
+        current = self._require()
+        content = self._storage.download_bytes(self.container_name, self.blob_name)
+        content = content or b""
+        properties = _properties(self.container_name, self.blob_name, current)
+        if offset is None and length is None:
+            return MockStorageStreamDownloader(content, properties)
+
+        start = offset or 0
+        end = len(content) if length is None else start + length
+        chunk = content[start:end]
+        properties.size = len(chunk)
+        properties.content_range = (
+            f"bytes {start}-{start + len(chunk) - 1}/{len(content)}"
+        )
+        return MockStorageStreamDownloader(chunk, properties)
+
+    def get_blob_properties(self, **kwargs: Any) -> MockBlobProperties:
+        """Get blob properties - matches Azure SDK signature."""
+        return _properties(self.container_name, self.blob_name, self._require())
+
+    def set_blob_metadata(
+        self,
+        metadata: Optional[Dict[str, str]] = None,
+        *,
+        etag: Optional[str] = None,
+        match_condition: Optional[MatchConditions] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Replace blob metadata - matches Azure SDK signature."""
+        self._check_condition(self._require(), etag, match_condition)
+        new_etag = self._storage.set_blob_metadata(
+            self.container_name, self.blob_name, metadata or {}
+        )
+        return {"etag": new_etag}
+
+    def delete_blob(self, **kwargs: Any) -> None:
+        """Delete a blob - matches Azure SDK signature."""
+        self._require()
+        self._storage.delete_blob(self.container_name, self.blob_name)
+
+    def exists(self, **kwargs: Any) -> bool:
+        """Whether the blob exists - matches Azure SDK signature."""
+        return self._current() is not None
+
+
+class MockContainerClient:
+    """Mock implementation of azure.storage.blob.ContainerClient."""
+
+    def __init__(self, container_name: str):
+        self.container_name = container_name
+        self._storage = MockBlobStorage()
+
+    def get_blob_client(self, blob: str) -> MockBlobClient:
+        """Get a client for one blob in this container."""
+        return MockBlobClient(self.container_name, blob)
+
+    def list_blobs(
+        self, name_starts_with: Optional[str] = None, **kwargs: Any
+    ) -> Iterator[MockBlobProperties]:
+        """List blobs by name prefix - matches Azure SDK signature."""
+        for blob in self._storage.list_blobs(
+            self.container_name, name_starts_with or ""
+        ):
+            current = self._storage.get_blob_properties(
+                self.container_name, blob["name"]
+            )
+            if current is not None:
+                yield _properties(self.container_name, blob["name"], current)
+
+    def upload_blob(self, name: str, data: Any, **kwargs: Any) -> MockBlobClient:
+        """Upload a blob and return its client - matches Azure SDK signature."""
+        blob_client = self.get_blob_client(name)
+        blob_client.upload_blob(data, **kwargs)
+        return blob_client
+
+    def delete_blob(self, blob: str, **kwargs: Any) -> None:
+        """Delete a blob - matches Azure SDK signature."""
+        self.get_blob_client(blob).delete_blob()
+
+
+class MockBlobServiceClient:
+    """
+    Mock implementation of azure.storage.blob.BlobServiceClient.
+
+    All instances share the MockBlobStorage data, like clients for the same
+    storage account.
+    """
+
+    def __init__(self, account_url: str = "mock://storage", credential=None, **kwargs):
+        self.account_url = account_url
+        self.credential = credential
+
+    def get_container_client(self, container: str) -> MockContainerClient:
+        """Get a client for a container."""
+        return MockContainerClient(container)
+
+    def get_blob_client(self, container: str, blob: str) -> MockBlobClient:
+        """Get a client for a blob."""
+        return MockBlobClient(container, blob)
+
+    def list_containers(self, **kwargs: Any) -> List[Dict[str, str]]:
+        """List containers that have been written to."""
+        return [{"name": name} for name in MockBlobStorage().list_containers()]
+
+    def close(self) -> None:
+        """Close client (no-op)."""
+
+
+# ============================================================================
+# azure.storage.blob.aio equivalents (same storage, awaitable methods)
+# ============================================================================
+
+
+class MockAsyncStorageStreamDownloader:
+    """Mock implementation of azure.storage.blob.aio.StorageStreamDownloader."""
+
+    def __init__(self, downloader: MockStorageStreamDownloader):
+        self._downloader = downloader
+        self.properties = downloader.properties
+        self.size = downloader.size
+
+    async def readall(self) -> bytes:
+        """Read the (ranged) blob content."""
+        return self._downloader.readall()
+
+    async def content_as_text(self, encoding: str = "UTF-8") -> str:
+        """Read the content as text."""
+        return self._downloader.content_as_text(encoding)
+
+
+class MockAsyncBlobClient:
+    """Mock implementation of azure.storage.blob.aio.BlobClient."""
+
+    def __init__(self, container_name: str, blob_name: str):
+        self._sync = MockBlobClient(container_name, blob_name)
+        self.container_name = container_name
+        self.blob_name = blob_name
+
+    async def upload_blob(self, data: Any, overwrite: bool = False, **kwargs: Any):
+        """Upload a blob - matches Azure SDK signature."""
+        return self._sync.upload_blob(data, overwrite, **kwargs)
+
+    async def download_blob(
+        self, offset: Optional[int] = None, length: Optional[int] = None, **kwargs: Any
+    ) -> MockAsyncStorageStreamDownloader:
+        """Download a blob - matches Azure SDK signature."""
+        return MockAsyncStorageStreamDownloader(
+            self._sync.download_blob(offset, length)
+        )
+
+    async def get_blob_properties(self, **kwargs: Any) -> MockBlobProperties:
+        """Get blob properties - matches Azure SDK signature."""
+        return self._sync.get_blob_properties()
+
+    async def set_blob_metadata(
+        self, metadata: Optional[Dict[str, str]] = None, **kwargs: Any
+    ) -> Dict[str, Any]:
+        """Replace blob metadata - matches Azure SDK signature."""
+        return self._sync.set_blob_metadata(metadata, **kwargs)
+
+    async def delete_blob(self, **kwargs: Any) -> None:
+        """Delete a blob - matches Azure SDK signature."""
+        self._sync.delete_blob()
+
+    async def exists(self, **kwargs: Any) -> bool:
+        """Whether the blob exists - matches Azure SDK signature."""
+        return self._sync.exists()
+
+
+class MockAsyncContainerClient:
+    """Mock implementation of azure.storage.blob.aio.ContainerClient."""
+
+    def __init__(self, container_name: str):
+        self._sync = MockContainerClient(container_name)
+        self.container_name = container_name
+
+    def get_blob_client(self, blob: str) -> MockAsyncBlobClient:
+        """Get a client for one blob in this container."""
+        return MockAsyncBlobClient(self.container_name, blob)
+
+    async def list_blobs(
+        self, name_starts_with: Optional[str] = None, **kwargs: Any
+    ) -> AsyncIterator[MockBlobProperties]:
+        """List blobs by name prefix - matches Azure SDK signature."""
+        for blob in self._sync.list_blobs(name_starts_with):
+            yield blob
+
+    async def upload_blob(
+        self, name: str, data: Any, **kwargs: Any
+    ) -> MockAsyncBlobClient:
+        """Upload a blob and return its client - matches Azure SDK signature."""
+        self._sync.upload_blob(name, data, **kwargs)
+        return self.get_blob_client(name)
+
+    async def delete_blob(self, blob: str, **kwargs: Any) -> None:
+        """Delete a blob - matches Azure SDK signature."""
+        self._sync.delete_blob(blob)
+
+
+class MockAsyncBlobServiceClient:
+    """Mock implementation of azure.storage.blob.aio.BlobServiceClient."""
+
+    def __init__(self, account_url: str = "mock://storage", credential=None, **kwargs):
+        self.account_url = account_url
+        self.credential = credential
+
+    def get_container_client(self, container: str) -> MockAsyncContainerClient:
+        """Get a client for a container."""
+        return MockAsyncContainerClient(container)
+
+    def get_blob_client(self, container: str, blob: str) -> MockAsyncBlobClient:
+        """Get a client for a blob."""
+        return MockAsyncBlobClient(container, blob)
+
+    async def close(self) -> None:
+        """Close client (no-op)."""
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
@@ -0,0 +1,239 @@
+"""
+Batch Blob Deletion
+
+Deletes many blobs using Blob Batch requests (up to 256 sub-requests per
+HTTP call) instead of one request per blob. Batches run in parallel with
+a bounded concurrency, and every blob's outcome is reported individually.
+
+If a batch request itself fails (e.g. a storage emulator without batch
+support), that batch and the rest of the run fall back to per-blob
+deletes, so callers always get a complete result.
+
+Usage:
+    from libs.blob_batch import delete_blobs_batched
+
+    container = blob_service_client.get_container_client("$web")
+    result = await delete_blobs_batched(container, stale_names)
+    logger.info(f"Deleted {result.deleted}, failed {len(result.failed)}")
+
+    # Synchronous ContainerClient (e.g. BlobUtils)
+    result = delete_blobs_batched_sync(container, names)
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List
+
+from azure.core.exceptions import ResourceNotFoundError
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "BLOB_BATCH_LIMIT",
+    "BatchDeleteResult",
+    "delete_blobs_batched",
+    "delete_blobs_batched_sync",
+]
+
+BLOB_BATCH_LIMIT = 256  # Azure maximum sub-requests per batch
+DEFAULT_BATCH_CONCURRENCY = 4
+
+_STATUS_DELETED = 202
+_STATUS_NOT_FOUND = 404
+
+
+@dataclass
+class BatchDeleteResult:
+    """Per-blob outcome of a batched delete."""
+
+    deleted: int = 0
+    not_found: int = 0  # Already gone; not an error
+    failed: Dict[str, str] = field(default_factory=dict)  # blob name -> error
+    batches: int = 0  # Batch requests sent (excluding per-blob fallback)
+
+    @property
+    def errors(self) -> List[str]:
+        """Failure messages, one per blob."""
+        return [
+            f"Failed to delete {name}: {error}" for name, error in self.failed.items()
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary for logs and API responses."""
+        return {
+            "deleted": self.deleted,
+            "not_found": self.not_found,
+            "failed": len(self.failed),
+            "batches": self.batches,
+            "errors": self.errors,
+        }
+
+
+def _chunks(names: List[str], size: int) -> List[List[str]]:
+    size = max(1, min(size, BLOB_BATCH_LIMIT))
+    return [names[i : i + size] for i in range(0, len(names), size)]
+
+
+def _record_responses(
+    result: BatchDeleteResult, chunk: List[str], responses: List[Any]
+) -> None:
+    """Map batch sub-responses (returned in request order) to blob names."""
+    for index, name in enumerate(chunk):
+        if index >= len(responses):
+            result.failed[name] = "No response in batch"
+            continue
+        status = getattr(responses[index], "status_code", None)
+        if status == _STATUS_DELETED:
+            result.deleted += 1
+        elif status == _STATUS_NOT_FOUND:
+            result.not_found += 1
+        else:
+            result.failed[name] = f"HTTP {status}"
+
+
+def _record_single(result: BatchDeleteResult, name: str, error: Any) -> None:
+    if error is None:
+        result.deleted += 1
+    elif isinstance(error, ResourceNotFoundError):
+        result.not_found += 1
+    else:
+        result.failed[name] = str(error)
+
+
+async def delete_blobs_batched(
+    container_client: Any,
+    blob_names: Iterable[str],
+    batch_size: int = BLOB_BATCH_LIMIT,
+    max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+) -> BatchDeleteResult:
+    """
+    Delete blobs with parallel Blob Batch requests (async client).
+
+    Args:
+        container_client: azure.storage.blob.aio.ContainerClient
+        blob_names: Names of blobs to delete
+        batch_size: Blobs per batch request (capped at 256)
+        max_concurrency: Maximum batch requests in flight
+
+    Returns:
+        BatchDeleteResult with per-blob failures
+
+    Examples:
+        >>> result = await delete_blobs_batched(container, ["a.html", "b.html"])
+        >>> result.deleted
+        2
+    """
+    names = list(dict.fromkeys(blob_names))
+    result = BatchDeleteResult()
+    if not names:
+        return result
+
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    batch_supported = True
+
+    async def _delete_one(name: str) -> None:
+        try:
+            await container_client.delete_blob(name)
+            _record_single(result, name, None)
+        except Exception as e:
+            _record_single(result, name, e)
+
+    async def _delete_chunk(chunk: List[str]) -> None:
+        nonlocal batch_supported
+        async with semaphore:
+            if batch_supported:
+                try:
+                    responses = await container_client.delete_blobs(
+                        *chunk, raise_on_any_failure=False
+                    )
+                    if hasattr(responses, "__aiter__"):
+                        collected = [response async for response in responses]
+                    else:
+                        collected = list(responses)
+                    result.batches += 1
+                    _record_responses(result, chunk, collected)
+                    return
+                except Exception as e:
+                    logger.warning(
+                        f"Batch delete failed ({e}), falling back to per-blob deletes"
+                    )
+                    batch_supported = False
+
+            for name in chunk:
+                await _delete_one(name)
+
+    await asyncio.gather(
+        *(_delete_chunk(chunk) for chunk in _chunks(names, batch_size))
+    )
+
+    logger.info(
+        f"Batch deleted {result.deleted} blobs ({result.not_found} already gone, "
+        f"{len(result.failed)} failed) in {result.batches} batch requests"
+    )
+    return result
+
+
+def delete_blobs_batched_sync(
+    container_client: Any,
+    blob_names: Iterable[str],
+    batch_size: int = BLOB_BATCH_LIMIT,
+    max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+) -> BatchDeleteResult:
+    """
+    Delete blobs with parallel Blob Batch requests (sync client).
+
+    Args:
+        container_client: azure.storage.blob.ContainerClient
+        blob_names: Names of blobs to delete
+        batch_size: Blobs per batch request (capped at 256)
+        max_concurrency: Maximum batch requests in flight (threads)
+
+    Returns:
+        BatchDeleteResult with per-blob failures
+    """
+    names = list(dict.fromkeys(blob_names))
+    result = BatchDeleteResult()
+    if not names:
+        return result
+
+    batch_supported = True
+
+    def _delete_chunk(chunk: List[str]) -> BatchDeleteResult:
+        nonlocal batch_supported
+        chunk_result = BatchDeleteResult()
+        if batch_supported:
+            try:
+                responses = list(
+                    container_client.delete_blobs(*chunk, raise_on_any_failure=False)
+                )
+                chunk_result.batches = 1
+                _record_responses(chunk_result, chunk, responses)
+                return chunk_result
+            except Exception as e:
+                logger.warning(
+                    f"Batch delete failed ({e}), falling back to per-blob deletes"
+                )
+                batch_supported = False
+
+        for name in chunk:
+            try:
+                container_client.delete_blob(name)
+                _record_single(chunk_result, name, None)
+            except Exception as e:
+                _record_single(chunk_result, name, e)
+        return chunk_result
+
+    with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+        for chunk_result in executor.map(_delete_chunk, _chunks(names, batch_size)):
+            result.deleted += chunk_result.deleted
+            result.not_found += chunk_result.not_found
+            result.failed.update(chunk_result.failed)
+            result.batches += chunk_result.batches
+
+    logger.info(
+        f"Batch deleted {result.deleted} blobs ({result.not_found} already gone, "
+        f"{len(result.failed)} failed) in {result.batches} batch requests"
+    )
+    return result
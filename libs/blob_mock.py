@@ -5,6 +5,7 @@ Provides in-memory mock storage for testing and development.
 Maintains compatibility with real blob storage API.
 """
 
+import itertools
 import json
 import logging
 from datetime import datetime, timezone
@@ -16,6 +17,13 @@ logger = logging.getLogger(__name__)
 _MOCK_CONTAINERS: Dict[str, Dict[str, Any]] = {}
 _MOCK_BLOBS: Dict[str, Dict[str, Any]] = {}
 
+# Like Azure, every write gets a new ETag (even with identical content)
+_ETAG_SEQUENCE = itertools.count(1)
+
+
+def _new_etag() -> str:
+    return f'"0x{next(_ETAG_SEQUENCE):016X}"'
+
 
 class MockBlobStorage:
     """In-memory blob storage mock for testing."""
@@ -36,28 +44,37 @@ class MockBlobStorage:
         return True
 
     def upload_data(
-        self, container_name: str, blob_name: str, data: Any, content_type: str
+        self,
+        container_name: str,
+        blob_name: str,
+        data: Any,
+        content_type: str,
+        metadata: Optional[Dict[str, str]] = None,
     ) -> bool:
-        """Upload data to mock storage."""
+        """Upload data to mock storage (replaces metadata, assigns a new ETag)."""
         try:
             self.ensure_container(container_name)
 
             # Store data based on content type
-            if content_type == "application/json":
-                stored_data = json.dumps(data) if not isinstance(data, str) else data
-            elif isinstance(data, bytes):
+            if isinstance(data, bytes):
                 stored_data = data.decode("utf-8", errors="ignore")
+            elif content_type == "application/json":
+                stored_data = json.dumps(data) if not isinstance(data, str) else data
             else:
                 stored_data = str(data)
+            raw = data if isinstance(data, bytes) else stored_data.encode("utf-8")
 
             blob_key = f"{container_name}/{blob_name}"
             _MOCK_BLOBS[blob_key] = {
                 "data": stored_data,
+                "raw": raw,
                 "content_type": content_type,
-                "size": len(str(stored_data)),
+                "size": len(raw),
                 "last_modified": datetime.now(timezone.utc).isoformat(),
                 "container": container_name,
                 "name": blob_name,
+                "etag": _new_etag(),
+                "metadata": dict(metadata or {}),
             }
 
             logger.debug(f"Mock blob uploaded: {blob_key}")
@@ -81,6 +98,42 @@ class MockBlobStorage:
             logger.error(f"Mock download failed for {container_name}/{blob_name}: {e}")
             return None
 
+    def download_bytes(self, container_name: str, blob_name: str) -> Optional[bytes]:
+        """Download raw blob content (binary uploads are returned unchanged)."""
+        blob = _MOCK_BLOBS.get(f"{container_name}/{blob_name}")
+        if blob is None:
+            return None
+        raw = blob.get("raw")
+        return raw if raw is not None else str(blob["data"]).encode("utf-8")
+
+    def get_blob_properties(
+        self, container_name: str, blob_name: str
+    ) -> Optional[Dict[str, Any]]:
+        """Get blob properties (name, size, etag, metadata, ...) or None."""
+        blob = _MOCK_BLOBS.get(f"{container_name}/{blob_name}")
+        if blob is None:
+            return None
+        return {
+            "name": blob_name,
+            "size": blob["size"],
+            "last_modified": blob["last_modified"],
+            "content_type": blob["content_type"],
+            "etag": blob.get("etag"),
+            "metadata": dict(blob.get("metadata") or {}),
+        }
+
+    def set_blob_metadata(
+        self, container_name: str, blob_name: str, metadata: Dict[str, str]
+    ) -> Optional[str]:
+        """Replace blob metadata; returns the new ETag, or None if missing."""
+        blob = _MOCK_BLOBS.get(f"{container_name}/{blob_name}")
+        if blob is None:
+            return None
+        blob["metadata"] = dict(metadata)
+        blob["etag"] = _new_etag()
+        blob["last_modified"] = datetime.now(timezone.utc).isoformat()
+        return blob["etag"]
+
     def list_blobs(self, container_name: str, prefix: str = "") -> List[Dict[str, Any]]:
         """List blobs in mock storage."""
         try:
@@ -94,6 +147,7 @@ class MockBlobStorage:
                             "size": blob_data["size"],
                             "last_modified": blob_data["last_modified"],
                             "content_type": blob_data["content_type"],
+                            "etag": blob_data.get("etag"),
                         }
                     )
 
@@ -12,6 +12,8 @@ from typing import Any, Dict, List, Optional
 from azure.core.exceptions import ResourceNotFoundError
 from azure.storage.blob import BlobServiceClient
 
+from .blob_batch import delete_blobs_batched_sync
+
 logger = logging.getLogger(__name__)
 
 
@@ -154,17 +156,20 @@ class BlobUtils:
     def delete_blobs_by_prefix(
         self, container_name: str, prefix: str
     ) -> Dict[str, Any]:
-        """Delete all blobs with a given prefix."""
+        """Delete all blobs with a given prefix using batch requests."""
         try:
             blobs = self.list_blobs(container_name, prefix)
-            results = {"deleted": 0, "failed": 0, "errors": []}
-
-            for blob in blobs:
-                if self.delete_blob(container_name, blob["name"]):
-                    results["deleted"] += 1
-                else:
-                    results["failed"] += 1
-                    results["errors"].append(f"Failed to delete {blob['name']}")
+            container_client = self.blob_service_client.get_container_client(
+                container_name
+            )
+            batch = delete_blobs_batched_sync(
+                container_client, [blob["name"] for blob in blobs]
+            )
+            results = {
+                "deleted": batch.deleted + batch.not_found,
+                "failed": len(batch.failed),
+                "errors": batch.errors,
+            }
 
             logger.info(
                 f"Deleted {results['deleted']} blobs with prefix '{prefix}' from {container_name}"
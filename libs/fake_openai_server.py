@@ -0,0 +1,586 @@
+"""
+Fake Azure OpenAI Server
+
+Local HTTP stand-in for the Azure OpenAI chat-completions API, for tests,
+rate limiter tuning and load runs of the content pipeline without Azure.
+
+Implements the endpoint behind generate_article_content,
+generate_completion and generate_clean_title:
+
+    POST /openai/deployments/{deployment}/chat/completions   (Azure)
+    POST /v1/chat/completions                                 (OpenAI)
+
+with:
+- Deterministic content per prompt (article markdown, concise title or
+  the metadata JSON, depending on the prompt)
+- ``usage`` token accounting (about four characters per token)
+- Configurable latency: fixed, uniform, normal or lognormal time to first
+  token plus a per-completion-token generation cost
+- Streaming (``stream=true``, server-sent events, optional usage chunk)
+- Per-deployment TPM/RPM quotas: 429 with Retry-After / retry-after-ms
+  like Azure, where ``max_tokens`` counts towards the token estimate
+
+Test hooks: GET /fake/stats (per-deployment counters), POST /fake/reset.
+
+Usage:
+    async with FakeOpenAIServer(FakeOpenAIConfig(requests_per_minute=60)) as server:
+        client = server.create_client()
+        response = await client.chat.completions.create(
+            model="gpt-4o", messages=[{"role": "user", "content": "Hello"}]
+        )
+
+    # Standalone (e.g. for AZURE_OPENAI_ENDPOINT=http://localhost:8089)
+    python -m libs.fake_openai_server --port 8089 --latency-ms 800 --rpm 60
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import random
+import time
+import uuid
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from aiohttp import web
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_API_VERSION = "2024-07-01-preview"
+
+VOCABULARY = [
+    "latency", "throughput", "cluster", "compiler", "runtime", "security",
+    "database", "network", "storage", "container", "release", "benchmark",
+    "framework", "protocol", "encryption", "scheduler", "memory", "developer",
+]  # fmt: skip
+
+
+def approx_tokens(text: str) -> int:
+    """
+    Estimate token count (about four characters per token for English).
+
+    Examples:
+        >>> approx_tokens("Hello world!")
+        3
+    """
+    return max(1, math.ceil(len(text) / 4))
+
+
+def generate_content(prompt: str, article_words: int = 600, seed: int = 42) -> str:
+    """
+    Deterministic completion shaped like the processor's call sites expect.
+
+    Args:
+        prompt: All message contents joined
+        article_words: Length of article completions
+        seed: Varies content between runs with the same prompts
+
+    Returns:
+        Metadata JSON for "Return ONLY valid JSON" prompts, a shortened
+        title for "Generate a concise title" prompts, otherwise markdown
+        with ``article_words`` words under ## headings
+    """
+    rng = random.Random(f"{seed}:{hashlib.sha256(prompt.encode()).hexdigest()}")
+    if "Return ONLY valid JSON" in prompt:
+        title = " ".join(word.capitalize() for word in rng.sample(VOCABULARY, 5))
+        return json.dumps(
+            {
+                "title": title,
+                "description": f"{title}: what changed and why it matters "
+                "for teams shipping software.",
+                "language": "en",
+            }
+        )
+    if "Generate a concise title" in prompt:
+        original = next(
+            (
+                line.split(":", 1)[1].strip()
+                for line in prompt.splitlines()
+                if line.startswith("Original:")
+            ),
+            "Technology update",
+        )
+        return original[:60].rsplit(" ", 1)[0].rstrip(":,.") or "Technology update"
+
+    sections = []
+    words_left = article_words
+    while words_left > 0:
+        heading = " ".join(rng.sample(VOCABULARY, 3)).capitalize()
+        count = min(words_left, 120)
+        body = " ".join(rng.choices(VOCABULARY, k=count))
+        sections.append(f"## {heading}\n\n{body.capitalize()}.")
+        words_left -= count
+    return "\n\n".join(sections)
+
+
+@dataclass
+class LatencyProfile:
+    """
+    Response latency: time to first token plus generation time.
+
+    ``distribution`` shapes the time to first token around ``base_ms``:
+    "fixed"; "uniform" (± ``spread`` ms); "normal" (stddev ``spread`` ms);
+    "lognormal" (median ``base_ms``, sigma ``spread``). Each completion
+    token then adds ``per_token_ms``.
+    """
+
+    distribution: str = "fixed"
+    base_ms: float = 0.0
+    spread: float = 0.0
+    per_token_ms: float = 0.0
+
+    def __post_init__(self) -> None:
+        if self.distribution not in ("fixed", "uniform", "normal", "lognormal"):
+            raise ValueError(f"Unknown latency distribution: {self.distribution}")
+
+    def first_token_seconds(self, rng: random.Random) -> float:
+        """Sample the time to first token."""
+        if self.base_ms <= 0:
+            return 0.0
+        if self.distribution == "uniform":
+            ms = rng.uniform(self.base_ms - self.spread, self.base_ms + self.spread)
+        elif self.distribution == "normal":
+            ms = rng.gauss(self.base_ms, self.spread)
+        elif self.distribution == "lognormal":
+            ms = rng.lognormvariate(math.log(self.base_ms), self.spread)
+        else:
+            ms = self.base_ms
+        return max(0.0, ms) / 1000
+
+    def generation_seconds(self, completion_tokens: int) -> float:
+        """Time to generate ``completion_tokens`` after the first token."""
+        return max(0.0, self.per_token_ms) * completion_tokens / 1000
+
+
+@dataclass
+class FakeOpenAIConfig:
+    """Server behaviour; quotas apply per deployment like Azure."""
+
+    latency: LatencyProfile = field(default_factory=LatencyProfile)
+    tokens_per_minute: Optional[int] = None
+    requests_per_minute: Optional[int] = None
+    quota_window_seconds: float = 60.0  # Shorten for fast quota tests
+    article_words: int = 600
+    stream_chunk_tokens: int = 8
+    api_key: Optional[str] = None  # Require this api-key/bearer token if set
+    seed: int = 42
+
+
+class QuotaWindow:
+    """
+    Sliding-window TPM/RPM quota for one deployment.
+
+    Rejected requests do not consume quota (as with Azure).
+    """
+
+    def __init__(
+        self,
+        tokens_per_window: Optional[int],
+        requests_per_window: Optional[int],
+        window_seconds: float,
+    ):
+        self.tokens_per_window = tokens_per_window
+        self.requests_per_window = requests_per_window
+        self.window_seconds = window_seconds
+        self._entries: Deque[Tuple[float, int]] = deque()
+        self._tokens = 0
+
+    def _expire(self, now: float) -> None:
+        while self._entries and self._entries[0][0] <= now - self.window_seconds:
+            self._tokens -= self._entries.popleft()[1]
+
+    def try_acquire(self, tokens: int, now: float) -> Optional[float]:
+        """
+        Admit a request estimated at ``tokens``.
+
+        Returns:
+            None if admitted, else seconds until it would fit
+        """
+        self._expire(now)
+        over_requests = (
+            self.requests_per_window is not None
+            and len(self._entries) >= self.requests_per_window
+        )
+        over_tokens = (
+            self.tokens_per_window is not None
+            and self._tokens + tokens > self.tokens_per_window
+        )
+        if not over_requests and not over_tokens:
+            self._entries.append((now, tokens))
+            self._tokens += tokens
+            return None
+
+        # Walk the window until enough requests/tokens have expired
+        freed_tokens = 0
+        for index, (timestamp, entry_tokens) in enumerate(self._entries):
+            freed_tokens += entry_tokens
+            requests_ok = (
+                not over_requests
+                or len(self._entries) - (index + 1) < self.requests_per_window
+            )
+            tokens_ok = (
+                not over_tokens
+                or self._tokens - freed_tokens + tokens <= self.tokens_per_window
+            )
+            if requests_ok and tokens_ok:
+                return max(0.0, timestamp + self.window_seconds - now)
+        return self.window_seconds  # Larger than the whole token quota
+
+    def remaining(self, now: float) -> Dict[str, Optional[int]]:
+        """Remaining requests/tokens in the current window."""
+        self._expire(now)
+        return {
+            "requests": (
+                None
+                if self.requests_per_window is None
+                else max(0, self.requests_per_window - len(self._entries))
+            ),
+            "tokens": (
+                None
+                if self.tokens_per_window is None
+                else max(0, self.tokens_per_window - self._tokens)
+            ),
+        }
+
+
+def _error(status: int, code: str, message: str, **headers: str) -> web.Response:
+    return web.json_response(
+        {"error": {"code": code, "message": message}}, status=status, headers=headers
+    )
+
+
+class FakeOpenAIServer:
+    """
+    aiohttp server implementing the chat-completions API.
+
+    Examples:
+        >>> async with FakeOpenAIServer() as server:  # doctest: +SKIP
+        ...     client = server.create_client()
+        ...     stats = server.get_stats()
+    """
+
+    def __init__(self, config: Optional[FakeOpenAIConfig] = None):
+        self.config = config or FakeOpenAIConfig()
+        self._rng = random.Random(self.config.seed)
+        self._quotas: Dict[str, QuotaWindow] = {}
+        self._stats: Dict[str, Dict[str, Any]] = defaultdict(self._empty_stats)
+        self._runner: Optional[web.AppRunner] = None
+        self.url: Optional[str] = None
+
+        self.app = web.Application()
+        self.app.router.add_post(
+            "/openai/deployments/{deployment}/chat/completions", self._handle_chat
+        )
+        self.app.router.add_post("/v1/chat/completions", self._handle_chat)
+        self.app.router.add_get("/fake/stats", self._handle_stats)
+        self.app.router.add_post("/fake/reset", self._handle_reset)
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, Any]:
+        return {
+            "requests": 0,
+            "throttled": 0,
+            "streamed": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "latency_seconds": 0.0,
+        }
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """
+        Start serving (port 0 picks a free port).
+
+        Returns:
+            Base URL, usable as the Azure OpenAI endpoint
+        """
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_port = self._runner.addresses[0][1]
+        self.url = f"http://{host}:{bound_port}"
+        logger.info(f"Fake OpenAI server listening on {self.url}")
+        return self.url
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "FakeOpenAIServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.stop()
+
+    def create_client(self, api_version: str = DEFAULT_API_VERSION, **kwargs: Any):
+        """
+        AsyncAzureOpenAI client for this server.
+
+        Args:
+            api_version: Azure OpenAI API version query parameter
+            **kwargs: Passed to AsyncAzureOpenAI (e.g. max_retries=0)
+        """
+        from openai import AsyncAzureOpenAI
+
+        if self.url is None:
+            raise RuntimeError("Server not started")
+        return AsyncAzureOpenAI(
+            azure_endpoint=self.url,
+            api_key=self.config.api_key or "fake-key",
+            api_version=api_version,
+            **kwargs,
+        )
+
+    # ------------------------------------------------------------------
+    # Accounting
+    # ------------------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-deployment counters (requests, throttled, tokens, latency)."""
+        return {name: dict(stats) for name, stats in self._stats.items()}
+
+    def reset(self) -> None:
+        """Clear counters and quota windows."""
+        self._stats.clear()
+        self._quotas.clear()
+
+    def _quota(self, deployment: str) -> QuotaWindow:
+        if deployment not in self._quotas:
+            self._quotas[deployment] = QuotaWindow(
+                self.config.tokens_per_minute,
+                self.config.requests_per_minute,
+                self.config.quota_window_seconds,
+            )
+        return self._quotas[deployment]
+
+    def _ratelimit_headers(self, deployment: str, now: float) -> Dict[str, str]:
+        headers = {}
+        for kind, value in self._quota(deployment).remaining(now).items():
+            if value is not None:
+                headers[f"x-ratelimit-remaining-{kind}"] = str(value)
+        return headers
+
+    # ------------------------------------------------------------------
+    # Handlers
+    # ------------------------------------------------------------------
+
+    def _authorized(self, request: web.Request) -> bool:
+        if not self.config.api_key:
+            return True
+        bearer = request.headers.get("Authorization", "").removeprefix("Bearer ")
+        return self.config.api_key in (request.headers.get("api-key"), bearer)
+
+    async def _handle_chat(self, request: web.Request) -> web.StreamResponse:
+        if not self._authorized(request):
+            return _error(401, "401", "Access denied due to invalid subscription key.")
+        try:
+            body = await request.json()
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return _error(400, "invalid_request_error", "Request body is not JSON")
+
+        messages = body.get("messages")
+        if not isinstance(messages, list) or not messages:
+            return _error(
+                400, "invalid_request_error", "'messages' must be a non-empty array"
+            )
+        deployment = request.match_info.get("deployment") or str(
+            body.get("model") or "default"
+        )
+        max_tokens = body.get("max_tokens") or body.get("max_completion_tokens")
+        prompt = "\n".join(str(message.get("content", "")) for message in messages)
+        prompt_tokens = approx_tokens(prompt)
+        stats = self._stats[deployment]
+
+        # Quota check before any work; Azure estimates with max_tokens
+        now = time.monotonic()
+        estimate = prompt_tokens + int(max_tokens or 0)
+        retry_after = self._quota(deployment).try_acquire(estimate, now)
+        if retry_after is not None:
+            stats["throttled"] += 1
+            seconds = max(1, math.ceil(retry_after))
+            return _error(
+                429,
+                "429",
+                "Requests to the ChatCompletions_Create Operation under Azure "
+                f"OpenAI API version {request.query.get('api-version', 'v1')} "
+                "have exceeded the rate limit of your current deployment. "
+                f"Please retry after {seconds} seconds.",
+                **{
+                    "Retry-After": str(seconds),
+                    "retry-after-ms": str(math.ceil(retry_after * 1000)),
+                    **self._ratelimit_headers(deployment, now),
+                },
+            )
+
+        content = generate_content(prompt, self.config.article_words, self.config.seed)
+        finish_reason = "stop"
+        if max_tokens and approx_tokens(content) > int(max_tokens):
+            content = content[: int(max_tokens) * 4]
+            finish_reason = "length"
+        completion_tokens = approx_tokens(content)
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+        stats["requests"] += 1
+        stats["prompt_tokens"] += prompt_tokens
+        stats["completion_tokens"] += completion_tokens
+
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        headers = self._ratelimit_headers(deployment, now)
+        started = time.monotonic()
+        if body.get("stream"):
+            stats["streamed"] += 1
+            include_usage = bool(
+                (body.get("stream_options") or {}).get("include_usage")
+            )
+            response = await self._stream(
+                request,
+                completion_id,
+                deployment,
+                content,
+                finish_reason,
+                usage if include_usage else None,
+                headers,
+            )
+        else:
+            await asyncio.sleep(
+                self.config.latency.first_token_seconds(self._rng)
+                + self.config.latency.generation_seconds(completion_tokens)
+            )
+            response = web.json_response(
+                {
+                    "id": completion_id,
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": deployment,
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {"role": "assistant", "content": content},
+                            "finish_reason": finish_reason,
+                        }
+                    ],
+                    "usage": usage,
+                },
+                headers=headers,
+            )
+        stats["latency_seconds"] += time.monotonic() - started
+        return response
+
+    async def _stream(
+        self,
+        request: web.Request,
+        completion_id: str,
+        deployment: str,
+        content: str,
+        finish_reason: str,
+        usage: Optional[Dict[str, int]],
+        headers: Dict[str, str],
+    ) -> web.StreamResponse:
+        """Send the completion as chat.completion.chunk server-sent events."""
+        response = web.StreamResponse(
+            headers={"Content-Type": "text/event-stream", **headers}
+        )
+        await response.prepare(request)
+
+        def chunk(
+            delta: Dict[str, str], finish: Optional[str] = None
+        ) -> Dict[str, Any]:
+            return {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": deployment,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish}],
+            }
+
+        async def send(data: Any) -> None:
+            payload = data if isinstance(data, str) else json.dumps(data)
+            await response.write(f"data: {payload}\n\n".encode("utf-8"))
+
+        await asyncio.sleep(self.config.latency.first_token_seconds(self._rng))
+        await send(chunk({"role": "assistant", "content": ""}))
+        step = max(1, self.config.stream_chunk_tokens) * 4
+        for offset in range(0, len(content), step):
+            piece = content[offset : offset + step]
+            await asyncio.sleep(
+                self.config.latency.generation_seconds(approx_tokens(piece))
+            )
+            await send(chunk({"content": piece}))
+        await send(chunk({}, finish_reason))
+        if usage is not None:
+            await send({**chunk({}), "choices": [], "usage": usage})
+        await send("[DONE]")
+        await response.write_eof()
+        return response
+
+    async def _handle_stats(self, request: web.Request) -> web.Response:
+        return web.json_response(self.get_stats())
+
+    async def _handle_reset(self, request: web.Request) -> web.Response:
+        self.reset()
+        return web.json_response({"status": "reset"})
+
+
+async def _serve(config: FakeOpenAIConfig, host: str, port: int) -> None:
+    server = FakeOpenAIServer(config)
+    await server.start(host, port)
+    print(f"Fake Azure OpenAI server on {server.url} (Ctrl+C to stop)")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Fake Azure OpenAI server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument(
+        "--latency-distribution",
+        default="fixed",
+        choices=["fixed", "uniform", "normal", "lognormal"],
+    )
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--latency-spread", type=float, default=0.0)
+    parser.add_argument("--per-token-ms", type=float, default=0.0)
+    parser.add_argument("--tpm", type=int, help="Tokens per minute per deployment")
+    parser.add_argument("--rpm", type=int, help="Requests per minute per deployment")
+    parser.add_argument("--article-words", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    config = FakeOpenAIConfig(
+        latency=LatencyProfile(
+            distribution=args.latency_distribution,
+            base_ms=args.latency_ms,
+            spread=args.latency_spread,
+            per_token_ms=args.per_token_ms,
+        ),
+        tokens_per_minute=args.tpm,
+        requests_per_minute=args.rpm,
+        article_words=args.article_words,
+        seed=args.seed,
+    )
+    try:
+        asyncio.run(_serve(config, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
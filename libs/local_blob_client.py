@@ -0,0 +1,548 @@
+"""
+Local Filesystem Blob Client
+
+Disk-backed implementation of the SimplifiedBlobClient async API, so a
+container can run (and be profiled) against local storage with real I/O
+costs instead of Azure or the in-memory libs.blob_mock.
+
+Selected with BLOB_STORAGE_BACKEND=local (see
+libs.simplified_blob_client.create_blob_client); BLOB_STORAGE_LOCAL_PATH
+sets the root directory.
+
+Layout under the root:
+    {container}/{blob name}                   blob content
+    .blobmeta/{container}/{blob name}.json    content type, ETag, metadata
+    .blobmeta/.locks/{n}.lock                 striped flock locks
+    .blobmeta/.tmp/                           staging for atomic replace
+
+Writes are staged and renamed into place under an exclusive lock, reads
+take a shared lock, so ETag conditions and appends hold across threads
+and processes sharing the directory. File I/O runs in worker threads.
+
+Unlike Azure, a name cannot be both a blob and a "directory" prefix of
+other blobs (``a`` and ``a/b``); pipeline paths never do this.
+"""
+
+import asyncio
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import re
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path, PurePosixPath
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
+
+from libs.blob_paths import BlobPathManager
+from libs.simplified_blob_client import (
+    DEFAULT_STREAM_CHUNK_SIZE,
+    BlobStreamError,
+    detect_text_content_type,
+    serialize_datetime,
+)
+
+logger = logging.getLogger(__name__)
+
+META_DIR = ".blobmeta"
+LOCK_STRIPES = 64
+
+# Azure container names, plus the static website ($web) and root containers
+_CONTAINER_NAME = re.compile(
+    r"^(\$web|\$root|[a-z0-9](?!.*--)[a-z0-9-]{1,61}[a-z0-9])$"
+)
+
+
+class BlobPreconditionFailed(Exception):
+    """Blob exists (create-only write) or its ETag changed."""
+
+
+def _new_etag() -> str:
+    return f'"0x{uuid.uuid4().hex[:16].upper()}"'
+
+
+class LocalBlobClient:
+    """Filesystem blob client with the SimplifiedBlobClient async API."""
+
+    def __init__(self, root: Union[str, Path], fsync: Optional[bool] = None):
+        """
+        Args:
+            root: Directory holding one subdirectory per container
+            fsync: Flush writes to disk before renaming (default from
+                BLOB_STORAGE_LOCAL_FSYNC, off)
+        """
+        self.root = Path(root).resolve()
+        self.fsync = (
+            fsync
+            if fsync is not None
+            else os.getenv("BLOB_STORAGE_LOCAL_FSYNC", "false").lower() == "true"
+        )
+        self._meta_root = self.root / META_DIR
+        for directory in (self._meta_root / ".locks", self._meta_root / ".tmp"):
+            directory.mkdir(parents=True, exist_ok=True)
+        self.path_manager = BlobPathManager()
+        logger.info(f"LocalBlobClient initialized at {self.root}")
+
+    # ------------------------------------------------------------------
+    # Paths and locking
+    # ------------------------------------------------------------------
+
+    def _paths(self, container: str, blob_name: str) -> Tuple[Path, Path]:
+        """Content and metadata paths; rejects names escaping the container."""
+        if not _CONTAINER_NAME.match(container):
+            raise ValueError(f"Invalid container name: {container}")
+        parts = PurePosixPath(blob_name).parts
+        if (
+            not parts
+            or blob_name.startswith("/")
+            or any(part in ("", ".", "..") for part in parts)
+        ):
+            raise ValueError(f"Invalid blob name: {blob_name}")
+        relative = Path(*parts)
+        return (
+            self.root / container / relative,
+            self._meta_root / container / relative.with_name(relative.name + ".json"),
+        )
+
+    @contextmanager
+    def _locked(
+        self, container: str, blob_name: str, exclusive: bool
+    ) -> Iterator[None]:
+        stripe = int(hashlib.md5(f"{container}/{blob_name}".encode()).hexdigest(), 16)
+        lock_path = self._meta_root / ".locks" / f"{stripe % LOCK_STRIPES}.lock"
+        with open(lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _replace(self, path: Path, data: bytes) -> None:
+        """Write via a staged file and rename, so readers never see partial data."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        staged = self._meta_root / ".tmp" / uuid.uuid4().hex
+        with open(staged, "wb") as handle:
+            handle.write(data)
+            if self.fsync:
+                handle.flush()
+                os.fsync(handle.fileno())
+        os.replace(staged, path)
+
+    @staticmethod
+    def _read_meta(meta_path: Path) -> Dict[str, Any]:
+        try:
+            return json.loads(meta_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+
+    # ------------------------------------------------------------------
+    # Blocking operations (run in worker threads)
+    # ------------------------------------------------------------------
+
+    def _write(
+        self,
+        container: str,
+        blob_name: str,
+        data: bytes,
+        content_type: str,
+        overwrite: bool,
+        metadata: Optional[Dict[str, str]],
+        etag: Optional[str],
+        append: bool = False,
+    ) -> str:
+        path, meta_path = self._paths(container, blob_name)
+        with self._locked(container, blob_name, exclusive=True):
+            meta = self._read_meta(meta_path)
+            exists = path.exists()
+            if exists and not overwrite and not append:
+                raise BlobPreconditionFailed("The specified blob already exists")
+            if etag is not None and (not exists or meta.get("etag") != etag):
+                raise BlobPreconditionFailed("The condition specified was not met")
+
+            if append and exists:
+                with open(path, "ab") as handle:
+                    handle.write(data)
+                    if self.fsync:
+                        handle.flush()
+                        os.fsync(handle.fileno())
+            else:
+                self._replace(path, data)
+
+            if append:
+                # Appends keep the blob's content type and metadata
+                content_type = meta.get("content_type", content_type)
+                metadata = meta.get("metadata") if metadata is None else metadata
+            new_meta = {
+                "content_type": content_type,
+                "etag": _new_etag(),
+                "metadata": dict(metadata or {}),
+            }
+            self._replace(meta_path, json.dumps(new_meta).encode("utf-8"))
+            return new_meta["etag"]
+
+    def _read(self, container: str, blob_name: str) -> Tuple[bytes, Dict[str, Any]]:
+        path, meta_path = self._paths(container, blob_name)
+        with self._locked(container, blob_name, exclusive=False):
+            return path.read_bytes(), self._read_meta(meta_path)
+
+    def _read_range(self, path: Path, offset: int, length: int) -> bytes:
+        with open(path, "rb") as handle:
+            handle.seek(offset)
+            return handle.read(length)
+
+    def _properties(self, container: str, blob_name: str) -> Dict[str, Any]:
+        path, meta_path = self._paths(container, blob_name)
+        with self._locked(container, blob_name, exclusive=False):
+            stat = path.stat()
+            meta = self._read_meta(meta_path)
+        return {
+            "name": blob_name,
+            "size": stat.st_size,
+            "last_modified": datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
+            "content_type": meta.get("content_type"),
+            "etag": meta.get("etag"),
+            "metadata": dict(meta.get("metadata", {})),
+        }
+
+    def _set_metadata(
+        self,
+        container: str,
+        blob_name: str,
+        metadata: Dict[str, str],
+        etag: Optional[str],
+    ) -> None:
+        path, meta_path = self._paths(container, blob_name)
+        with self._locked(container, blob_name, exclusive=True):
+            if not path.exists():
+                raise FileNotFoundError(blob_name)
+            meta = self._read_meta(meta_path)
+            if etag is not None and meta.get("etag") != etag:
+                raise BlobPreconditionFailed("The condition specified was not met")
+            meta.update({"etag": _new_etag(), "metadata": dict(metadata)})
+            self._replace(meta_path, json.dumps(meta).encode("utf-8"))
+
+    def _list(self, container: str, prefix: str) -> List[Dict[str, Any]]:
+        container_dir = self.root / container
+        if not container_dir.is_dir():
+            return []
+        # Walk only the directory the prefix points into
+        prefix_parts = PurePosixPath(prefix).parts
+        if not prefix.endswith("/"):
+            prefix_parts = prefix_parts[:-1]
+        prefix_dir = container_dir.joinpath(*prefix_parts)
+        if not prefix_dir.is_dir():
+            return []
+
+        blobs = []
+        for dirpath, _, filenames in os.walk(prefix_dir):
+            for filename in filenames:
+                name = (Path(dirpath) / filename).relative_to(container_dir).as_posix()
+                if not name.startswith(prefix):
+                    continue
+                try:
+                    properties = self._properties(container, name)
+                except FileNotFoundError:
+                    continue  # Deleted while listing
+                properties.pop("metadata")
+                blobs.append(properties)
+        return sorted(blobs, key=lambda blob: blob["name"])
+
+    def _delete(self, container: str, blob_name: str) -> None:
+        path, meta_path = self._paths(container, blob_name)
+        with self._locked(container, blob_name, exclusive=True):
+            path.unlink()
+            meta_path.unlink(missing_ok=True)
+
+    # ------------------------------------------------------------------
+    # SimplifiedBlobClient API
+    # ------------------------------------------------------------------
+
+    def test_connection(
+        self, timeout_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Test local storage (root directory writable)."""
+        if os.access(self.root, os.W_OK):
+            containers = [
+                entry.name
+                for entry in self.root.iterdir()
+                if entry.is_dir() and entry.name != META_DIR
+            ]
+            return {
+                "status": "healthy",
+                "connection_type": "local",
+                "message": f"Local blob storage at {self.root}. "
+                f"Found {len(containers)} containers.",
+            }
+        return {
+            "status": "error",
+            "connection_type": "local",
+            "message": f"Local blob storage at {self.root} is not writable",
+        }
+
+    async def _upload(
+        self,
+        container: str,
+        blob_name: str,
+        data: bytes,
+        content_type: str,
+        overwrite: bool,
+        metadata: Optional[Dict[str, str]],
+        etag: Optional[str],
+        kind: str,
+    ) -> bool:
+        try:
+            await asyncio.to_thread(
+                self._write,
+                container,
+                blob_name,
+                data,
+                content_type,
+                overwrite,
+                metadata,
+                etag,
+            )
+            logger.info(f"Uploaded {kind} to {container}/{blob_name}")
+            return True
+        except BlobPreconditionFailed as e:
+            logger.warning(f"Not uploading {container}/{blob_name}: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"Failed to upload {kind} to {container}/{blob_name}: {e}")
+            return False
+
+    async def upload_json(
+        self,
+        container: str,
+        blob_name: str,
+        data: Dict[str, Any],
+        overwrite: bool = True,
+        metadata: Optional[Dict[str, str]] = None,
+        etag: Optional[str] = None,
+    ) -> bool:
+        """Upload JSON with automatic datetime serialization."""
+        json_bytes = json.dumps(serialize_datetime(data), indent=2).encode("utf-8")
+        return await self._upload(
+            container,
+            blob_name,
+            json_bytes,
+            "application/json",
+            overwrite,
+            metadata,
+            etag,
+            "JSON",
+        )
+
+    async def download_json(
+        self, container: str, blob_name: str
+    ) -> Optional[Dict[str, Any]]:
+        """Download and parse JSON."""
+        try:
+            content, _ = await asyncio.to_thread(self._read, container, blob_name)
+            return json.loads(content.decode("utf-8"))
+        except Exception as e:
+            logger.error(f"Failed to download JSON from {container}/{blob_name}: {e}")
+            return None
+
+    async def download_stream(
+        self,
+        container: str,
+        blob_name: str,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Stream blob content in ``chunk_size`` reads (nothing if missing).
+
+        Raises BlobStreamError if a read fails after data was yielded.
+        """
+        yielded = False
+        try:
+            path, _ = self._paths(container, blob_name)
+            offset = 0
+            while True:
+                data = await asyncio.to_thread(
+                    self._read_range, path, offset, chunk_size
+                )
+                if not data:
+                    break
+                offset += len(data)
+                yielded = True
+                yield data
+        except Exception as e:
+            if yielded:
+                raise BlobStreamError(
+                    f"Stream of {container}/{blob_name} interrupted: {e}"
+                ) from e
+            logger.error(f"Failed to stream {container}/{blob_name}: {e}")
+
+    async def upload_text(
+        self,
+        container: str,
+        blob_name: str,
+        text: str,
+        overwrite: bool = True,
+        content_type: Optional[str] = None,
+        metadata: Optional[Dict[str, str]] = None,
+        etag: Optional[str] = None,
+    ) -> bool:
+        """Upload text content with automatic content type detection."""
+        return await self._upload(
+            container,
+            blob_name,
+            text.encode("utf-8"),
+            content_type or detect_text_content_type(blob_name),
+            overwrite,
+            metadata,
+            etag,
+            "text",
+        )
+
+    async def download_text(self, container: str, blob_name: str) -> Optional[str]:
+        """Download text content."""
+        try:
+            content, _ = await asyncio.to_thread(self._read, container, blob_name)
+            return content.decode("utf-8")
+        except Exception as e:
+            logger.error(f"Failed to download text from {container}/{blob_name}: {e}")
+            return None
+
+    async def upload_binary(
+        self,
+        container: str,
+        blob_name: str,
+        data: bytes,
+        content_type: str,
+        overwrite: bool = True,
+        metadata: Optional[Dict[str, str]] = None,
+        etag: Optional[str] = None,
+    ) -> bool:
+        """Upload binary content."""
+        return await self._upload(
+            container,
+            blob_name,
+            data,
+            content_type,
+            overwrite,
+            metadata,
+            etag,
+            "binary",
+        )
+
+    async def download_binary(self, container: str, blob_name: str) -> Optional[bytes]:
+        """Download binary content."""
+        try:
+            content, _ = await asyncio.to_thread(self._read, container, blob_name)
+            return content
+        except Exception as e:
+            logger.error(f"Failed to download binary from {container}/{blob_name}: {e}")
+            return None
+
+    async def list_blobs(
+        self, container: str, prefix: str = ""
+    ) -> List[Dict[str, Any]]:
+        """List blobs with metadata."""
+        try:
+            return await asyncio.to_thread(self._list, container, prefix)
+        except Exception as e:
+            logger.error(f"Failed to list blobs in {container}: {e}")
+            return []
+
+    async def download_with_etag(
+        self, container: str, blob_name: str
+    ) -> Optional[Tuple[bytes, str]]:
+        """Download content and its ETag, for conditional read-modify-write."""
+        try:
+            content, meta = await asyncio.to_thread(self._read, container, blob_name)
+            return content, meta.get("etag", "")
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Failed to download {container}/{blob_name}: {e}")
+            return None
+
+    async def get_blob_properties(
+        self, container: str, blob_name: str
+    ) -> Optional[Dict[str, Any]]:
+        """Blob name, size, last_modified, content_type, etag and metadata."""
+        try:
+            return await asyncio.to_thread(self._properties, container, blob_name)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Failed to get properties of {container}/{blob_name}: {e}")
+            return None
+
+    async def set_blob_metadata(
+        self,
+        container: str,
+        blob_name: str,
+        metadata: Dict[str, str],
+        etag: Optional[str] = None,
+    ) -> bool:
+        """Replace blob metadata (conditional on ``etag`` if given)."""
+        try:
+            await asyncio.to_thread(
+                self._set_metadata, container, blob_name, metadata, etag
+            )
+            return True
+        except BlobPreconditionFailed as e:
+            logger.warning(f"Not updating {container}/{blob_name}: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"Failed to set metadata on {container}/{blob_name}: {e}")
+            return False
+
+    async def append_binary(
+        self,
+        container: str,
+        blob_name: str,
+        data: bytes,
+        content_type: str = "application/octet-stream",
+    ) -> bool:
+        """Append to a blob, creating it if missing (atomic under the lock)."""
+        try:
+            await asyncio.to_thread(
+                self._write,
+                container,
+                blob_name,
+                data,
+                content_type,
+                True,
+                None,
+                None,
+                True,
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Failed to append to {container}/{blob_name}: {e}")
+            return False
+
+    async def append_text(
+        self,
+        container: str,
+        blob_name: str,
+        text: str,
+        content_type: str = "text/plain",
+    ) -> bool:
+        """Append text to a blob (see append_binary)."""
+        return await self.append_binary(
+            container, blob_name, text.encode("utf-8"), content_type
+        )
+
+    async def delete_blob(self, container: str, blob_name: str) -> bool:
+        """Delete a blob."""
+        try:
+            await asyncio.to_thread(self._delete, container, blob_name)
+            logger.info(f"Deleted {container}/{blob_name}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to delete {container}/{blob_name}: {e}")
+            return False
+
+    async def delete_blobs(self, container: str, blob_names: List[str]) -> int:
+        """Delete many blobs; returns the number deleted (see SimplifiedBlobClient)."""
+        deleted = 0
+        for blob_name in blob_names:
+            if await self.delete_blob(container, blob_name):
+                deleted += 1
+        return deleted
@@ -0,0 +1,366 @@
+"""
+Fixed-Memory Processing Metrics
+
+Streaming latency quantiles, throughput and error rate for status
+endpoints. Replaces per-container lists of processing times, which grow
+with uptime and are re-summed on every status request.
+
+Latencies go into a log-bucketed quantile sketch (DDSketch-style): each
+bucket covers a range of values within a fixed relative accuracy, so
+P50/P90/P99 are accurate to ~1% using at most ``max_buckets`` counters,
+regardless of how many samples are recorded. Throughput and error rate
+are computed over a sliding window of coarse time slots.
+
+Usage:
+    from libs.processing_metrics import get_processing_metrics
+
+    metrics = get_processing_metrics("markdown-generator")
+
+    with metrics.track():
+        await process_article(...)
+
+    # Or record explicitly
+    metrics.record(duration_ms=125.0, success=True)
+
+    metrics.snapshot()
+    # {"count": 1, "p50_ms": 125.0, "throughput_per_minute": ..., ...}
+"""
+
+import math
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Sequence
+
+__all__ = [
+    "QuantileSketch",
+    "ProcessingMetrics",
+    "get_processing_metrics",
+    "reset_processing_metrics",
+]
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+DEFAULT_MAX_BUCKETS = 2048
+DEFAULT_WINDOW_SECONDS = 300.0
+DEFAULT_SLOT_SECONDS = 10.0
+
+# Values at or below this are counted in a dedicated zero bucket
+_MIN_TRACKABLE_VALUE = 1e-9
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch with bounded relative error.
+
+    Values are mapped to buckets ``ceil(log_gamma(value))`` where
+    ``gamma = (1 + a) / (1 - a)`` for relative accuracy ``a``. If the number
+    of buckets exceeds ``max_buckets`` the lowest buckets are collapsed, so
+    memory stays fixed and only the smallest values lose accuracy.
+    """
+
+    def __init__(
+        self,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        max_buckets: int = DEFAULT_MAX_BUCKETS,
+    ):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of quantile estimates
+            max_buckets: Upper bound on the number of stored buckets
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max(2, max_buckets)
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: Dict[int, int] = {}
+        self._zero_count = 0
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def _key(self, value: float) -> int:
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _value(self, key: int) -> float:
+        # Midpoint of the bucket (gamma^(k-1), gamma^k] in relative terms
+        return 2 * self._gamma**key / (self._gamma + 1)
+
+    def _collapse(self) -> None:
+        """Merge the lowest buckets until the bucket bound holds."""
+        keys = sorted(self._buckets)
+        excess = len(keys) - self.max_buckets
+        if excess <= 0:
+            return
+        target = keys[excess]
+        for key in keys[:excess]:
+            self._buckets[target] += self._buckets.pop(key)
+
+    def add(self, value: float) -> None:
+        """
+        Add a non-negative value to the sketch.
+
+        Args:
+            value: Observed value (e.g. latency in milliseconds)
+        """
+        if value < 0 or math.isnan(value):
+            raise ValueError("QuantileSketch only accepts non-negative values")
+
+        if value <= _MIN_TRACKABLE_VALUE:
+            self._zero_count += 1
+        else:
+            key = self._key(value)
+            self._buckets[key] = self._buckets.get(key, 0) + 1
+            if len(self._buckets) > self.max_buckets:
+                self._collapse()
+
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """
+        Merge another sketch with the same accuracy into this one.
+
+        Args:
+            other: Sketch to merge
+
+        Raises:
+            ValueError: If the sketches use different accuracies
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different accuracy")
+        if other.count == 0:
+            return
+
+        for key, count in other._buckets.items():
+            self._buckets[key] = self._buckets.get(key, 0) + count
+        self._zero_count += other._zero_count
+        self.count += other.count
+        self.total += other.total
+        self.min = other.min if self.min is None else min(self.min, other.min)  # type: ignore[type-var]
+        self.max = other.max if self.max is None else max(self.max, other.max)  # type: ignore[type-var]
+        self._collapse()
+
+    def quantiles(self, qs: Sequence[float]) -> List[Optional[float]]:
+        """
+        Estimate several quantiles in one pass over the buckets.
+
+        Args:
+            qs: Quantiles in [0, 1] (e.g. 0.5, 0.9, 0.99)
+
+        Returns:
+            Estimates in the same order (None if the sketch is empty)
+        """
+        if self.count == 0:
+            return [None for _ in qs]
+
+        ranks = sorted((q * (self.count - 1), i) for i, q in enumerate(qs))
+        results: List[Optional[float]] = [None] * len(qs)
+        pending = iter(ranks)
+        rank, index = next(pending)
+
+        cumulative = self._zero_count
+        while cumulative > rank:
+            results[index] = 0.0
+            try:
+                rank, index = next(pending)
+            except StopIteration:
+                return results
+
+        for key in sorted(self._buckets):
+            cumulative += self._buckets[key]
+            estimate = min(max(self._value(key), self.min), self.max)  # type: ignore[type-var]
+            while cumulative > rank:
+                results[index] = estimate
+                try:
+                    rank, index = next(pending)
+                except StopIteration:
+                    return results
+
+        return results
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a single quantile.
+
+        Args:
+            q: Quantile in [0, 1]
+
+        Returns:
+            Estimated value, or None if the sketch is empty
+        """
+        return self.quantiles([q])[0]
+
+    @property
+    def bucket_count(self) -> int:
+        """Number of stored buckets (bounded by max_buckets)."""
+        return len(self._buckets) + (1 if self._zero_count else 0)
+
+
+class ProcessingMetrics:
+    """
+    Latency quantiles, throughput and error rate for a unit of work.
+
+    Memory is fixed: one QuantileSketch plus at most
+    ``window_seconds / slot_seconds`` time slots.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = DEFAULT_WINDOW_SECONDS,
+        slot_seconds: float = DEFAULT_SLOT_SECONDS,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize metrics.
+
+        Args:
+            window_seconds: Sliding window for throughput and recent error rate
+            slot_seconds: Granularity of the sliding window
+            relative_accuracy: Latency quantile accuracy
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.window_seconds = window_seconds
+        self.slot_seconds = max(1e-3, min(slot_seconds, window_seconds))
+        self._clock = clock
+        self._started = clock()
+        self.latency = QuantileSketch(relative_accuracy=relative_accuracy)
+        self.successes = 0
+        self.failures = 0
+        # (slot index, successes, failures), oldest first
+        self._slots: Deque[List[int]] = deque()
+
+    def _prune(self, now: float) -> None:
+        oldest = math.floor((now - self.window_seconds) / self.slot_seconds)
+        while self._slots and self._slots[0][0] <= oldest:
+            self._slots.popleft()
+
+    def record(self, duration_ms: Optional[float] = None, success: bool = True) -> None:
+        """
+        Record one completed operation.
+
+        Args:
+            duration_ms: Operation duration in milliseconds (None if unknown)
+            success: Whether the operation succeeded
+        """
+        now = self._clock()
+        if duration_ms is not None:
+            self.latency.add(max(0.0, duration_ms))
+
+        if success:
+            self.successes += 1
+        else:
+            self.failures += 1
+
+        slot = math.floor(now / self.slot_seconds)
+        if not self._slots or self._slots[-1][0] != slot:
+            self._slots.append([slot, 0, 0])
+        self._slots[-1][1 if success else 2] += 1
+        self._prune(now)
+
+    @contextmanager
+    def track(self) -> Iterator[None]:
+        """
+        Time a block of work and record it (as a failure if it raises).
+
+        Example:
+            >>> metrics = ProcessingMetrics()
+            >>> with metrics.track():
+            ...     pass
+            >>> metrics.successes
+            1
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            self.record((time.perf_counter() - start) * 1000, success=False)
+            raise
+        self.record((time.perf_counter() - start) * 1000, success=True)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Summarize metrics for a status endpoint.
+
+        Cost is bounded by the sketch size, not by the number of samples.
+
+        Returns:
+            Dict with counts, error rates, latency quantiles (ms) and
+            throughput per minute over the sliding window
+        """
+        now = self._clock()
+        self._prune(now)
+
+        window_successes = sum(slot[1] for slot in self._slots)
+        window_failures = sum(slot[2] for slot in self._slots)
+        window_total = window_successes + window_failures
+        # Before the window fills, rate is relative to time since start
+        span = min(self.window_seconds, max(now - self._started, self.slot_seconds))
+
+        total = self.successes + self.failures
+        p50, p90, p99 = self.latency.quantiles([0.5, 0.9, 0.99])
+
+        def _ms(value: Optional[float]) -> Optional[float]:
+            return round(value, 2) if value is not None else None
+
+        return {
+            "count": total,
+            "successes": self.successes,
+            "failures": self.failures,
+            "error_rate": round(self.failures / total, 4) if total else 0.0,
+            "window_error_rate": (
+                round(window_failures / window_total, 4) if window_total else 0.0
+            ),
+            "mean_ms": (
+                _ms(self.latency.total / self.latency.count)
+                if self.latency.count
+                else None
+            ),
+            "p50_ms": _ms(p50),
+            "p90_ms": _ms(p90),
+            "p99_ms": _ms(p99),
+            "max_ms": _ms(self.latency.max),
+            "throughput_per_minute": round(window_total * 60 / span, 2),
+            "window_seconds": self.window_seconds,
+        }
+
+
+# Named metrics instances (one per container or unit of work)
+_registry: Dict[str, ProcessingMetrics] = {}
+
+
+def get_processing_metrics(name: str = "default") -> ProcessingMetrics:
+    """
+    Get or create a named ProcessingMetrics instance.
+
+    Args:
+        name: Metrics name (e.g. container or operation name)
+
+    Returns:
+        Shared ProcessingMetrics instance for the name
+    """
+    metrics = _registry.get(name)
+    if metrics is None:
+        metrics = _registry[name] = ProcessingMetrics()
+    return metrics
+
+
+def reset_processing_metrics(name: Optional[str] = None) -> None:
+    """
+    Drop named metrics (all if name is None). Intended for tests.
+
+    Args:
+        name: Metrics name to reset
+    """
+    if name is None:
+        _registry.clear()
+    else:
+        _registry.pop(name, None)
@@ -75,7 +75,11 @@ class QueueClientInterface(ABC):
         pass
 
     @abstractmethod
-    async def receive_messages(self, max_messages: Optional[int] = None) -> List[Any]:
+    async def receive_messages(
+        self,
+        max_messages: Optional[int] = None,
+        visibility_timeout: Optional[int] = None,
+    ) -> List[Any]:
         """Receive messages from the queue."""
         pass
 
@@ -206,11 +210,17 @@ class StorageQueueClient(QueueClientInterface):
             logger.error(f"Failed to send message to queue '{self.queue_name}': {e}")
             raise
 
-    async def receive_messages(self, max_messages: Optional[int] = None) -> List[Any]:
+    async def receive_messages(
+        self,
+        max_messages: Optional[int] = None,
+        visibility_timeout: Optional[int] = None,
+    ) -> List[Any]:
         """Receive messages from the Storage Queue.
 
         Functional approach with proper async iterator cleanup to prevent
         unclosed client session warnings and ensure messages are received.
+        Messages stay invisible to other consumers for ``visibility_timeout``
+        seconds (default 60); handlers must finish within it.
         """
         if not self._queue_client:
             await self.connect()
@@ -226,7 +236,8 @@ class StorageQueueClient(QueueClientInterface):
             # Get the async iterator - this is the Azure SDK AsyncItemPaged object
             message_pager = self._queue_client.receive_messages(
                 messages_per_page=max_msgs,
-                visibility_timeout=60,  # 60 seconds - reasonable for message processing and deletion
+                # 60 seconds by default - reasonable for message processing and deletion
+                visibility_timeout=visibility_timeout or 60,
             )
 
             # Azure AsyncItemPaged auto-closes when iteration ends
@@ -377,8 +388,27 @@ async def send_wake_up_message(
         return await client.send_message(message)
 
 
+async def _move_to_poison_queue(poison_queue_name: str, message, error: str) -> None:
+    """Copy a failing message to the poison queue with failure details."""
+    poison_content = {
+        "original_message": message.content,
+        "original_id": message.id,
+        "dequeue_count": message.dequeue_count,
+        "error": error,
+        "moved_at": datetime.now(timezone.utc).isoformat(),
+    }
+    async with get_queue_client(poison_queue_name) as poison_client:
+        await poison_client.send_message(json.dumps(poison_content))
+
+
 async def process_queue_messages(
-    queue_name: str, message_handler, max_messages: int = 10
+    queue_name: str,
+    message_handler,
+    max_messages: int = 10,
+    max_concurrency: int = 1,
+    visibility_timeout: Optional[int] = None,
+    max_dequeue_count: Optional[int] = None,
+    poison_queue_name: Optional[str] = None,
 ) -> int:
     """
     Process messages from a queue using a handler function.
@@ -387,38 +417,76 @@ async def process_queue_messages(
         queue_name: Name of the queue
         message_handler: Async function to process each message
         max_messages: Maximum messages to process
+        max_concurrency: Maximum messages handled at the same time
+            (1 = sequential, the default)
+        visibility_timeout: Seconds received messages stay hidden from
+            other consumers (None = client default); must cover the handler
+        max_dequeue_count: Deliveries after which a failing message is
+            moved to the poison queue and deleted (None = retry forever)
+        poison_queue_name: Queue for such messages
+            (default ``<queue_name>-poison``)
 
     Returns:
-        Number of messages processed
+        Number of messages processed (poisoned messages are not counted)
     """
     processed_count = 0
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    poison_queue_name = poison_queue_name or f"{queue_name}-poison"
 
     async with get_queue_client(queue_name) as client:
-        messages = await client.receive_messages(max_messages=max_messages)
+        messages = await client.receive_messages(
+            max_messages=max_messages, visibility_timeout=visibility_timeout
+        )
 
-        for message in messages:
+        async def poison(message, error: str) -> None:
             try:
-                # Parse message content
-                try:
-                    message_data = json.loads(message.content)
-                    queue_message = QueueMessageModel(**message_data)
-                except (json.JSONDecodeError, ValueError) as e:
-                    logger.warning(f"Failed to parse message: {e}")
-                    queue_message = QueueMessageModel(
-                        service_name="unknown",
-                        operation="parse_error",
-                        payload={"raw_content": message.content, "error": str(e)},
-                    )
-
-                # Process message
-                await message_handler(queue_message, message)
-
-                # Complete message
+                await _move_to_poison_queue(poison_queue_name, message, error)
                 await client.complete_message(message)
-                processed_count += 1
-
+                logger.warning(
+                    f"Moved message {message.id} to {poison_queue_name} after "
+                    f"{message.dequeue_count} deliveries: {error}"
+                )
             except Exception as e:
-                logger.error(f"Failed to process message: {e}")
-                # Message will become visible again for retry
+                logger.error(f"Failed to move message to poison queue: {e}")
+
+        async def handle(message) -> None:
+            nonlocal processed_count
+            dequeue_count = getattr(message, "dequeue_count", None) or 0
+            async with semaphore:
+                if max_dequeue_count and dequeue_count > max_dequeue_count:
+                    # A previous delivery crashed before it could poison it
+                    await poison(message, "Max dequeue count exceeded")
+                    return
+                try:
+                    # Parse message content
+                    try:
+                        message_data = json.loads(message.content)
+                        queue_message = QueueMessageModel(**message_data)
+                    except (json.JSONDecodeError, ValueError) as e:
+                        logger.warning(f"Failed to parse message: {e}")
+                        queue_message = QueueMessageModel(
+                            service_name="unknown",
+                            operation="parse_error",
+                            payload={"raw_content": message.content, "error": str(e)},
+                        )
+
+                    # Process message
+                    await message_handler(queue_message, message)
+
+                    # Complete message
+                    await client.complete_message(message)
+                    processed_count += 1
+
+                except Exception as e:
+                    logger.error(f"Failed to process message: {e}")
+                    if max_dequeue_count and dequeue_count >= max_dequeue_count:
+                        await poison(message, str(e))
+                    # Otherwise it becomes visible again for retry
+
+        if max_concurrency <= 1:
+            for message in messages:
+                await handle(message)
+        else:
+            await asyncio.gather(*(handle(message) for message in messages))
 
     return processed_count
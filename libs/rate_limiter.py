@@ -105,6 +105,10 @@ class RateLimiter:
             tokens_needed = tokens - self.tokens
             wait_time = tokens_needed / (self.rate / self.per_seconds)
 
+            # Reserve now (balance goes negative) so concurrent waiters
+            # queue behind this one instead of all waking at once
+            self.tokens -= tokens
+            self.total_requests += 1
             self.total_wait_time += wait_time
             self.throttled_requests += 1
 
@@ -115,13 +119,7 @@ class RateLimiter:
 
         # Wait outside the lock so other requests can check
         await asyncio.sleep(wait_time)
-
-        # Acquire again after waiting
-        async with self._lock:
-            self._refill_tokens()
-            self.tokens -= tokens
-            self.total_requests += 1
-            return wait_time
+        return wait_time
 
     async def __aenter__(self):
         """Async context manager entry."""
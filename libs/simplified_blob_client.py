@@ -5,18 +5,34 @@ Focused blob storage operations with functional datetime serialization.
 Uses pure functions internally for predictability and testability.
 """
 
+import asyncio
 import json
 import logging
+import os
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 
+from azure.core import MatchConditions
+from azure.core.exceptions import ResourceModifiedError, ResourceNotFoundError
 from azure.storage.blob import BlobServiceClient
 
 from libs.blob_auth import BlobAuthManager
+from libs.blob_batch import delete_blobs_batched_sync
 from libs.blob_paths import BlobPathManager
 
 logger = logging.getLogger(__name__)
 
+# Range size for streamed downloads - small enough that the first bytes
+# arrive quickly, large enough to keep the request count reasonable.
+DEFAULT_STREAM_CHUNK_SIZE = 256 * 1024
+
+# Conditional append (read-modify-write) attempts before giving up
+APPEND_MAX_ATTEMPTS = 5
+
+
+class BlobStreamError(IOError):
+    """Raised when a blob stream fails after some chunks were yielded."""
+
 
 # ============================================================================
 # FUNCTIONAL DATETIME SERIALIZATION (Internal Helper)
@@ -47,6 +63,89 @@ def serialize_datetime(obj: Any) -> Any:
         return obj
 
 
+def detect_text_content_type(blob_name: str) -> str:
+    """
+    Content type for a text blob from its extension.
+
+    Examples:
+        >>> detect_text_content_type("posts/index.html")
+        'text/html'
+        >>> detect_text_content_type("notes.txt")
+        'text/plain'
+    """
+    if blob_name.endswith(".html"):
+        return "text/html"
+    elif blob_name.endswith(".xml"):
+        return "application/xml"
+    elif blob_name.endswith(".json"):
+        return "application/json"
+    elif blob_name.endswith(".css"):
+        return "text/css"
+    elif blob_name.endswith(".js"):
+        return "application/javascript"
+    elif blob_name.endswith(".md"):
+        return "text/markdown"
+    else:
+        return "text/plain"
+
+
+def _write_options(
+    metadata: Optional[Dict[str, str]], etag: Optional[str]
+) -> Dict[str, Any]:
+    """Azure SDK keyword arguments for metadata and an If-Match condition."""
+    options: Dict[str, Any] = {}
+    if metadata is not None:
+        options["metadata"] = metadata
+    if etag is not None:
+        options["etag"] = etag
+        options["match_condition"] = MatchConditions.IfNotModified
+    return options
+
+
+def _blob_size_from_range(properties: Any) -> Optional[int]:
+    """
+    Total blob size from a ranged download's properties.
+
+    On ranged reads the SDK sets ``properties.size`` to the range length;
+    the blob size is only in ``content_range`` ("bytes 0-N/TOTAL").
+
+    Returns:
+        Total size, or None if the response carries no usable range
+    """
+    content_range = getattr(properties, "content_range", None)
+    if isinstance(content_range, str) and "/" in content_range:
+        total = content_range.rsplit("/", 1)[1]
+        if total.isdigit():
+            return int(total)
+    return None
+
+
+def create_blob_client(
+    blob_service_client: Optional[BlobServiceClient] = None,
+) -> Union["SimplifiedBlobClient", Any]:
+    """
+    Create the blob client selected by environment.
+
+    BLOB_STORAGE_BACKEND=local returns a LocalBlobClient (same async API)
+    rooted at BLOB_STORAGE_LOCAL_PATH (default ./.local-blob-storage);
+    anything else returns SimplifiedBlobClient for Azure.
+
+    Args:
+        blob_service_client: Azure client to wrap (Azure backend only)
+
+    Returns:
+        SimplifiedBlobClient or LocalBlobClient
+    """
+    backend = os.getenv("BLOB_STORAGE_BACKEND", "azure").lower()
+    if backend == "local":
+        from libs.local_blob_client import LocalBlobClient
+
+        return LocalBlobClient(
+            os.getenv("BLOB_STORAGE_LOCAL_PATH", ".local-blob-storage")
+        )
+    return SimplifiedBlobClient(blob_service_client)
+
+
 class SimplifiedBlobClient:
     """Simplified blob storage client with automatic datetime serialization."""
 
@@ -93,8 +192,15 @@ class SimplifiedBlobClient:
         blob_name: str,
         data: Dict[str, Any],
         overwrite: bool = True,
+        metadata: Optional[Dict[str, str]] = None,
+        etag: Optional[str] = None,
     ) -> bool:
-        """Upload JSON with automatic datetime serialization."""
+        """
+        Upload JSON with automatic datetime serialization.
+
+        ``etag`` makes the write conditional on the blob being unchanged;
+        ``overwrite=False`` makes it create-only. Either failing returns False.
+        """
         try:
             blob_client = self.blob_service_client.get_blob_client(
                 container=container, blob=blob_name
@@ -103,10 +209,16 @@ class SimplifiedBlobClient:
             serializable_data = serialize_datetime(data)
             json_bytes = json.dumps(serializable_data, indent=2).encode("utf-8")
             blob_client.upload_blob(
-                json_bytes, overwrite=overwrite, content_type="application/json"
+                json_bytes,
+                overwrite=overwrite,
+                content_type="application/json",
+                **_write_options(metadata, etag),
             )
             logger.info(f"Uploaded JSON to {container}/{blob_name}")
             return True
+        except ResourceModifiedError:
+            logger.warning(f"ETag mismatch, not uploading {container}/{blob_name}")
+            return False
         except Exception as e:
             logger.error(f"Failed to upload JSON to {container}/{blob_name}: {e}")
             return False
@@ -127,6 +239,49 @@ class SimplifiedBlobClient:
             logger.error(f"Failed to download JSON from {container}/{blob_name}: {e}")
             return None
 
+    async def download_stream(
+        self,
+        container: str,
+        blob_name: str,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream blob content as a sequence of byte chunks.
+
+        Issues ranged reads so callers can start work on the first chunk
+        while the rest of the blob is still being fetched. Yields nothing
+        if the blob is missing or cannot be read (errors are logged).
+
+        Raises:
+            BlobStreamError: If a read fails after data was yielded, so a
+                truncated stream is never mistaken for the end of the blob
+        """
+        yielded = False
+        try:
+            blob_client = self.blob_service_client.get_blob_client(
+                container=container, blob=blob_name
+            )
+            offset = 0
+            total_size: Optional[int] = None
+            while total_size is None or offset < total_size:
+                downloader = blob_client.download_blob(offset=offset, length=chunk_size)
+                if total_size is None:
+                    total_size = _blob_size_from_range(downloader.properties)
+                data = downloader.readall()
+                if not data:
+                    break
+                offset += len(data)
+                yielded = True
+                yield data
+                if total_size is None and len(data) < chunk_size:
+                    break
+        except Exception as e:
+            if yielded:
+                raise BlobStreamError(
+                    f"Stream of {container}/{blob_name} interrupted: {e}"
+                ) from e
+            logger.error(f"Failed to stream {container}/{blob_name}: {e}")
+
     async def upload_text(
         self,
         container: str,
@@ -134,36 +289,31 @@ class SimplifiedBlobClient:
         text: str,
         overwrite: bool = True,
         content_type: Optional[str] = None,
+        metadata: Optional[Dict[str, str]] = None,
+        etag: Optional[str] = None,
     ) -> bool:
         """Upload text content with automatic content type detection."""
         try:
             # Auto-detect content type based on file extension if not provided
             if content_type is None:
-                if blob_name.endswith(".html"):
-                    content_type = "text/html"
-                elif blob_name.endswith(".xml"):
-                    content_type = "application/xml"
-                elif blob_name.endswith(".json"):
-                    content_type = "application/json"
-                elif blob_name.endswith(".css"):
-                    content_type = "text/css"
-                elif blob_name.endswith(".js"):
-                    content_type = "application/javascript"
-                elif blob_name.endswith(".md"):
-                    content_type = "text/markdown"
-                else:
-                    content_type = "text/plain"
+                content_type = detect_text_content_type(blob_name)
 
             blob_client = self.blob_service_client.get_blob_client(
                 container=container, blob=blob_name
             )
             blob_client.upload_blob(
-                text.encode("utf-8"), overwrite=overwrite, content_type=content_type
+                text.encode("utf-8"),
+                overwrite=overwrite,
+                content_type=content_type,
+                **_write_options(metadata, etag),
             )
             logger.info(
                 f"Uploaded text to {container}/{blob_name} (content_type={content_type})"
             )
             return True
+        except ResourceModifiedError:
+            logger.warning(f"ETag mismatch, not uploading {container}/{blob_name}")
+            return False
         except Exception as e:
             logger.error(f"Failed to upload text to {container}/{blob_name}: {e}")
             return False
@@ -189,6 +339,8 @@ class SimplifiedBlobClient:
         data: bytes,
         content_type: str,
         overwrite: bool = True,
+        metadata: Optional[Dict[str, str]] = None,
+        etag: Optional[str] = None,
     ) -> bool:
         """Upload binary content."""
         try:
@@ -196,10 +348,16 @@ class SimplifiedBlobClient:
                 container=container, blob=blob_name
             )
             blob_client.upload_blob(
-                data, overwrite=overwrite, content_type=content_type
+                data,
+                overwrite=overwrite,
+                content_type=content_type,
+                **_write_options(metadata, etag),
             )
             logger.info(f"Uploaded binary to {container}/{blob_name} ({content_type})")
             return True
+        except ResourceModifiedError:
+            logger.warning(f"ETag mismatch, not uploading {container}/{blob_name}")
+            return False
         except Exception as e:
             logger.error(f"Failed to upload binary to {container}/{blob_name}: {e}")
             return False
@@ -231,6 +389,7 @@ class SimplifiedBlobClient:
                         if blob.content_settings
                         else None
                     ),
+                    "etag": blob.etag,
                 }
                 for blob in container_client.list_blobs(name_starts_with=prefix)
             ]
@@ -238,6 +397,114 @@ class SimplifiedBlobClient:
             logger.error(f"Failed to list blobs in {container}: {e}")
             return []
 
+    async def download_with_etag(
+        self, container: str, blob_name: str
+    ) -> Optional[Tuple[bytes, str]]:
+        """Download content and its ETag, for conditional read-modify-write."""
+        try:
+            blob_client = self.blob_service_client.get_blob_client(
+                container=container, blob=blob_name
+            )
+            downloader = blob_client.download_blob()
+            return downloader.readall(), downloader.properties.etag
+        except ResourceNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Failed to download {container}/{blob_name}: {e}")
+            return None
+
+    async def get_blob_properties(
+        self, container: str, blob_name: str
+    ) -> Optional[Dict[str, Any]]:
+        """Blob name, size, last_modified, content_type, etag and metadata."""
+        try:
+            blob_client = self.blob_service_client.get_blob_client(
+                container=container, blob=blob_name
+            )
+            properties = blob_client.get_blob_properties()
+            return {
+                "name": blob_name,
+                "size": properties.size,
+                "last_modified": properties.last_modified,
+                "content_type": (
+                    properties.content_settings.content_type
+                    if properties.content_settings
+                    else None
+                ),
+                "etag": properties.etag,
+                "metadata": dict(properties.metadata or {}),
+            }
+        except ResourceNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Failed to get properties of {container}/{blob_name}: {e}")
+            return None
+
+    async def set_blob_metadata(
+        self,
+        container: str,
+        blob_name: str,
+        metadata: Dict[str, str],
+        etag: Optional[str] = None,
+    ) -> bool:
+        """Replace blob metadata (conditional on ``etag`` if given)."""
+        try:
+            blob_client = self.blob_service_client.get_blob_client(
+                container=container, blob=blob_name
+            )
+            blob_client.set_blob_metadata(metadata, **_write_options(None, etag))
+            return True
+        except ResourceModifiedError:
+            logger.warning(f"ETag mismatch, not updating {container}/{blob_name}")
+            return False
+        except Exception as e:
+            logger.error(f"Failed to set metadata on {container}/{blob_name}: {e}")
+            return False
+
+    async def append_binary(
+        self,
+        container: str,
+        blob_name: str,
+        data: bytes,
+        content_type: str = "application/octet-stream",
+    ) -> bool:
+        """
+        Append to a blob, creating it if missing.
+
+        Read-modify-write guarded by the ETag (create-only for new blobs),
+        retried on conflicts, so concurrent appenders don't lose writes.
+        """
+        for _ in range(APPEND_MAX_ATTEMPTS):
+            current = await self.download_with_etag(container, blob_name)
+            if current is None:
+                written = await self.upload_binary(
+                    container, blob_name, data, content_type, overwrite=False
+                )
+            else:
+                existing, etag = current
+                written = await self.upload_binary(
+                    container, blob_name, existing + data, content_type, etag=etag
+                )
+            if written:
+                return True
+        logger.error(
+            f"Failed to append to {container}/{blob_name} after "
+            f"{APPEND_MAX_ATTEMPTS} attempts"
+        )
+        return False
+
+    async def append_text(
+        self,
+        container: str,
+        blob_name: str,
+        text: str,
+        content_type: str = "text/plain",
+    ) -> bool:
+        """Append text to a blob (see append_binary)."""
+        return await self.append_binary(
+            container, blob_name, text.encode("utf-8"), content_type
+        )
+
     async def delete_blob(self, container: str, blob_name: str) -> bool:
         """Delete a blob."""
         try:
@@ -251,6 +518,31 @@ class SimplifiedBlobClient:
             logger.error(f"Failed to delete {container}/{blob_name}: {e}")
             return False
 
+    async def delete_blobs(self, container: str, blob_names: List[str]) -> int:
+        """
+        Delete many blobs with Blob Batch requests (256 per HTTP call).
+
+        Args:
+            container: Container name
+            blob_names: Names of blobs to delete
+
+        Returns:
+            Number of blobs deleted (including ones already gone)
+        """
+        if not blob_names:
+            return 0
+        try:
+            container_client = self.blob_service_client.get_container_client(container)
+            result = await asyncio.to_thread(
+                delete_blobs_batched_sync, container_client, blob_names
+            )
+        except Exception as e:
+            logger.error(f"Failed to batch delete from {container}: {e}")
+            return 0
+        for name, error in result.failed.items():
+            logger.warning(f"Failed to delete {container}/{name}: {error}")
+        return result.deleted + result.not_found
+
 
 class BlobClientAdapter:
     """Adapter that adds standardized path management to SimplifiedBlobClient."""
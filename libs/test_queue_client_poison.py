@@ -0,0 +1,116 @@
+"""
+Tests for process_queue_messages dequeue-count handling.
+
+Messages that keep failing are moved to the poison queue instead of being
+redelivered forever.
+"""
+
+import json
+from types import SimpleNamespace
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import pytest
+
+from libs.queue_client import process_queue_messages
+
+
+class FakeQueue:
+    """Minimal queue client: returns fixed messages, records deletes and sends."""
+
+    def __init__(self, messages: List[Any]):
+        self.messages = messages
+        self.completed: List[str] = []
+        self.sent: List[str] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return None
+
+    async def receive_messages(self, **kwargs: Any) -> List[Any]:
+        return self.messages
+
+    async def complete_message(self, message: Any) -> None:
+        self.completed.append(message.id)
+
+    async def send_message(self, message: Any) -> Dict[str, Any]:
+        self.sent.append(message)
+        return {"message_id": "poison-1"}
+
+
+def _message(message_id: str, dequeue_count: int) -> SimpleNamespace:
+    content = json.dumps(
+        {"service_name": "test", "operation": "markdown_generated", "payload": {}}
+    )
+    return SimpleNamespace(id=message_id, content=content, dequeue_count=dequeue_count)
+
+
+def _queues(messages: List[Any]) -> Dict[str, FakeQueue]:
+    return {"work": FakeQueue(messages), "work-poison": FakeQueue([])}
+
+
+async def _failing_handler(queue_message, message) -> None:
+    raise RuntimeError("build failed")
+
+
+@pytest.mark.asyncio
+async def test_failure_below_cap_is_retried():
+    """A failing message under the cap stays on the queue."""
+    queues = _queues([_message("m1", dequeue_count=2)])
+
+    with patch("libs.queue_client.get_queue_client", side_effect=queues.get):
+        processed = await process_queue_messages(
+            "work", _failing_handler, max_dequeue_count=3
+        )
+
+    assert processed == 0
+    assert queues["work"].completed == []
+    assert queues["work-poison"].sent == []
+
+
+@pytest.mark.asyncio
+async def test_failure_at_cap_moves_to_poison_queue():
+    """The last allowed delivery failing poisons and deletes the message."""
+    queues = _queues([_message("m1", dequeue_count=3)])
+
+    with patch("libs.queue_client.get_queue_client", side_effect=queues.get):
+        processed = await process_queue_messages(
+            "work", _failing_handler, max_dequeue_count=3
+        )
+
+    assert processed == 0
+    assert queues["work"].completed == ["m1"]
+    poisoned = json.loads(queues["work-poison"].sent[0])
+    assert poisoned["original_id"] == "m1"
+    assert poisoned["error"] == "build failed"
+
+
+@pytest.mark.asyncio
+async def test_over_cap_is_poisoned_without_handling():
+    """Messages already past the cap are not handled again."""
+    queues = _queues([_message("m1", dequeue_count=4)])
+    handled: List[str] = []
+
+    async def handler(queue_message, message) -> None:
+        handled.append(message.id)
+
+    with patch("libs.queue_client.get_queue_client", side_effect=queues.get):
+        await process_queue_messages("work", handler, max_dequeue_count=3)
+
+    assert handled == []
+    assert queues["work"].completed == ["m1"]
+    assert len(queues["work-poison"].sent) == 1
+
+
+@pytest.mark.asyncio
+async def test_no_cap_retries_forever():
+    """Without max_dequeue_count nothing is poisoned."""
+    queues = _queues([_message("m1", dequeue_count=50)])
+
+    with patch("libs.queue_client.get_queue_client", side_effect=queues.get):
+        await process_queue_messages("work", _failing_handler)
+
+    assert queues["work"].completed == []
+    assert queues["work-poison"].sent == []
@@ -0,0 +1,1195 @@
+#!/usr/bin/env python3
+"""
+Pipeline Load Harness
+Runs collector → processor → markdown-generator → site-publisher in one
+process against local stand-ins, pushes N synthetic topics through and
+reports throughput, per-stage queue wait, per-hop latency and OpenAI cost.
+
+Stand-ins:
+- Queues: libs.azure_queue_mocks.MockQueueClient per pipeline queue
+- Blobs: libs.blob_mock.MockBlobStorage (via libs.azure_blob_mocks)
+- Mastodon: FakeMastodon, N public-timeline statuses
+- Azure OpenAI: FakeOpenAI, chat.completions.create with usage accounting
+  and configurable latency; or, with --openai-server, an AsyncAzureOpenAI
+  client against libs.fake_openai_server (HTTP, 429s on --openai-rpm /
+  --openai-tpm); or --openai-url for any compatible endpoint
+- Hugo: a minimal page-per-article renderer unless hugo and the PaperMod
+  theme are installed
+
+Each stage runs the container's own code (stream_collection,
+process_storage_queue_message with a MarkdownTriggerBatcher, the markdown
+message handler and signal_site_publisher, build_and_deploy_site through
+PublishScheduler); only the queue polling loops are replaced, with
+``--*-replicas`` concurrent consumers per stage standing in for KEDA
+replicas.
+
+Usage:
+    python scripts/pipeline_harness.py --topics 200
+    python scripts/pipeline_harness.py --topics 1000 --processor-replicas 8 \\
+        --openai-latency-ms 1500 --output pipeline-load.json
+    python scripts/pipeline_harness.py --topics 500 --processor-replicas 8 \\
+        --openai-server --openai-rpm 60 --openai-tpm 120000
+"""
+
+import argparse
+import asyncio
+import hashlib
+import html
+import importlib
+import json
+import logging
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from contextlib import ExitStack, contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import ModuleType, SimpleNamespace
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional
+from unittest.mock import patch
+
+import aiohttp
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CONTAINERS_DIR = REPO_ROOT / "containers"
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import libs.blob_mock as blob_mock  # noqa: E402
+from libs.azure_blob_mocks import (  # noqa: E402
+    MockAsyncBlobServiceClient,
+    MockBlobServiceClient,
+)
+from libs.azure_queue_mocks import MockQueueClient  # noqa: E402
+from libs.fake_openai_server import (  # noqa: E402
+    VOCABULARY,
+    FakeOpenAIConfig,
+    FakeOpenAIServer,
+    LatencyProfile,
+    approx_tokens,
+    generate_content,
+)
+from libs.processing_metrics import QuantileSketch  # noqa: E402
+from libs.queue_client import QueueMessageModel, StorageQueueClient  # noqa: E402
+from libs.simplified_blob_client import SimplifiedBlobClient  # noqa: E402
+
+logger = logging.getLogger("pipeline_harness")
+
+PROCESSOR_QUEUE = "content-processor-requests"
+MARKDOWN_QUEUE = "markdown-generation-requests"
+PUBLISHER_QUEUE = "site-publishing-requests"
+
+# Top-level module names defined by more than one container
+SHARED_MODULE_NAMES = ("config", "models", "main", "endpoints")
+
+# Modules imported per container; lazily imported ones are listed so they
+# resolve to the right container after the others are loaded
+CONTAINER_MODULES = {
+    "content-collector": [
+        "collectors.collect",
+        "collectors.standardize",
+        "pipeline.dedup",
+        "pipeline.stream",
+        "quality.review",
+    ],
+    "markdown-generator": [
+        "config",
+        "markdown_generator",
+        "queue_processor",
+        "render_pool",
+    ],
+    "site-publisher": [
+        "config",
+        "models",
+        "publish_scheduler",
+        "security",
+        "site_builder",
+    ],
+    # Loaded last: the router imports processor models at call time
+    "content-processor": [
+        "core.processor_context",
+        "endpoints.storage_queue_router",
+        "models",
+        "queue_operations_pkg.markdown_trigger_batcher",
+        "utils.cost_utils",
+    ],
+}
+
+SUBJECTS = [
+    "Python", "Kubernetes", "Rust", "PostgreSQL", "TypeScript", "WebAssembly",
+    "Linux kernel", "Terraform", "SQLite", "Go", "Redis", "OpenTelemetry",
+]  # fmt: skip
+
+QUANTILES = (0.5, 0.9, 0.99)
+
+
+@dataclass
+class HarnessConfig:
+    """Load and sizing parameters for one harness run."""
+
+    topics: int = 100
+    processor_replicas: int = 1
+    markdown_replicas: int = 1
+    openai_latency_ms: float = 0.0
+    openai_jitter: float = 0.0
+    openai_server: bool = False  # Serve OpenAI over HTTP (fake_openai_server)
+    openai_url: Optional[str] = None  # External OpenAI-compatible endpoint
+    openai_rpm: Optional[int] = None  # --openai-server quotas per deployment
+    openai_tpm: Optional[int] = None
+    article_words: int = 600
+    markdown_batch_size: int = 10
+    markdown_batch_wait_seconds: float = 0.5
+    stable_empty_seconds: float = 0.5
+    publish_debounce_seconds: float = 1.0
+    poll_interval_seconds: float = 0.05
+    receive_batch_size: int = 1
+    visibility_timeout_seconds: int = 300
+    seed: int = 42
+
+
+# ============================================================================
+# External service stand-ins
+# ============================================================================
+
+
+class FakeMastodon:
+    """
+    Mastodon public-timeline stand-in.
+
+    Serves ``count`` deterministic statuses that pass the collector's
+    quality review (technical keywords, readable length) and dedup (unique
+    text per status). Installed in place of collectors.collect.rate_limited_get.
+    """
+
+    def __init__(self, count: int, instance: str = "fake.social", seed: int = 42):
+        self.instance = instance
+        self.requests = 0
+        rng = random.Random(seed)
+        now = datetime.now(timezone.utc)
+        self.statuses = [self._status(i, rng, now) for i in range(count)]
+
+    def _status(self, index: int, rng: random.Random, now: datetime) -> Dict:
+        status_id = str(110000000 + index)
+        subject = SUBJECTS[index % len(SUBJECTS)]
+        text = (
+            f"{subject} update {index}: what changed for developers building "
+            f"cloud software this week. The release improves {subject} tooling, "
+            f"API stability and security defaults, with {rng.choice(VOCABULARY)} "
+            f"and {rng.choice(VOCABULARY)} benchmarks for teams running it in "
+            f"production."
+        )
+        return {
+            "id": status_id,
+            "content": f"<p>{html.escape(text)}</p>",
+            "url": f"https://{self.instance}/@dev{index % 50}/{status_id}",
+            "created_at": (now - timedelta(minutes=index)).isoformat(),
+            "reblogs_count": rng.randint(3, 40),
+            "favourites_count": rng.randint(10, 120),
+            "replies_count": rng.randint(0, 15),
+            "in_reply_to_id": None,
+            "account": {"username": f"dev{index % 50}"},
+        }
+
+    def rate_limited_get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        delay: float = 0.0,
+    ) -> Any:
+        """Same contract as collectors.collect.rate_limited_get."""
+        from collectors.collect import AsyncContextManagerHelper, _Response
+
+        async def respond() -> Any:
+            self.requests += 1
+            if "/api/v1/timelines/" not in url and "/api/v1/trends/" not in url:
+                return _Response(404, {"error": "Record not found"})
+            limit = int((params or {}).get("limit", 40))
+            return _Response(200, self.statuses[:limit])
+
+        return AsyncContextManagerHelper(respond())
+
+
+class FakeOpenAI:
+    """
+    In-process AsyncAzureOpenAI stand-in for the processor's chat-completions
+    calls (no HTTP; see --openai-server for libs.fake_openai_server).
+
+    Returns the fake server's deterministic content with ``usage`` token
+    counts, after ``latency_ms`` (± ``jitter`` fraction). Token totals are
+    kept per model for cost reporting.
+    """
+
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        jitter: float = 0.0,
+        article_words: int = 600,
+        seed: int = 42,
+    ):
+        self.latency_ms = latency_ms
+        self.jitter = jitter
+        self.article_words = article_words
+        self.seed = seed
+        self._rng = random.Random(seed)
+        self.usage: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"calls": 0, "prompt_tokens": 0, "completion_tokens": 0}
+        )
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Same contract as client.chat.completions.create (non-streaming)."""
+        if self.latency_ms > 0:
+            spread = self.latency_ms * self.jitter
+            delay_ms = max(0.0, self._rng.uniform(-spread, spread) + self.latency_ms)
+            await asyncio.sleep(delay_ms / 1000)
+
+        prompt = "\n".join(str(message.get("content", "")) for message in messages)
+        content = generate_content(prompt, self.article_words, self.seed)
+        prompt_tokens = approx_tokens(prompt)
+        completion_tokens = min(approx_tokens(content), max_tokens or 1 << 30)
+
+        usage = self.usage[model]
+        usage["calls"] += 1
+        usage["prompt_tokens"] += prompt_tokens
+        usage["completion_tokens"] += completion_tokens
+
+        return SimpleNamespace(
+            id=f"chatcmpl-{hashlib.md5(prompt.encode()).hexdigest()[:12]}",
+            model=model,
+            choices=[
+                SimpleNamespace(
+                    index=0,
+                    finish_reason="stop",
+                    message=SimpleNamespace(role="assistant", content=content),
+                )
+            ],
+            usage=SimpleNamespace(
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                total_tokens=prompt_tokens + completion_tokens,
+            ),
+        )
+
+    async def close(self) -> None:
+        """Close client (no-op)."""
+
+
+class CollectorBlobStore:
+    """
+    Blob contract used by the collector's stream_collection and dedup:
+    download_json/upload_json by blob name and append_item per collection
+    (missing blobs raise, which dedup treats as "not seen").
+    """
+
+    def __init__(self, service_client: Any, container: str = "collected-content"):
+        self._service = service_client
+        self.container = container
+
+    async def download_json(self, blob_name: str) -> Any:
+        blob = self._service.get_blob_client(container=self.container, blob=blob_name)
+        return json.loads(blob.download_blob().readall())
+
+    async def upload_json(self, blob_name: str, data: Any) -> bool:
+        blob = self._service.get_blob_client(container=self.container, blob=blob_name)
+        blob.upload_blob(
+            json.dumps(data).encode("utf-8"),
+            overwrite=True,
+            content_type="application/json",
+        )
+        return True
+
+    async def append_item(self, collection_id: str, item: Dict[str, Any]) -> bool:
+        blob_name = f"collections/{collection_id}.json"
+        try:
+            collection = await self.download_json(blob_name)
+        except Exception:
+            collection = {"collection_id": collection_id, "items": []}
+        collection["items"].append(item)
+        return await self.upload_json(blob_name, collection)
+
+
+class HarnessQueueClient(StorageQueueClient):
+    """
+    StorageQueueClient over a MockQueueClient, so senders keep the real
+    QueueMessageModel conversion without Azure credentials.
+    """
+
+    def __init__(self, queue: MockQueueClient):
+        super().__init__(queue.queue_name, storage_account_name="harness")
+        self._queue_client = queue
+
+    async def connect(self) -> None:
+        """Already connected to the mock queue."""
+
+    async def close(self) -> None:
+        """The mock queue is shared by the harness; leave it open."""
+
+
+def _render_site(hugo_dir: Path, base_url: str) -> int:
+    """Hugo stand-in: a page per article plus home page and index.json."""
+    public = hugo_dir / "public"
+    shutil.rmtree(public, ignore_errors=True)
+    public.mkdir(parents=True)
+    base_url = base_url.rstrip("/")
+
+    entries = []
+    for md_file in sorted((hugo_dir / "content").rglob("*.md")):
+        text = md_file.read_text(encoding="utf-8")
+        title = next(
+            (
+                line.split(":", 1)[1].strip().strip("\"'")
+                for line in text.splitlines()
+                if line.startswith("title:")
+            ),
+            md_file.stem,
+        )
+        rel = md_file.relative_to(hugo_dir / "content").with_suffix("")
+        page = public / rel / "index.html"
+        page.parent.mkdir(parents=True, exist_ok=True)
+        body = html.escape(text.split("---", 2)[-1])
+        page.write_text(
+            f"<html><head><title>{html.escape(title)}</title></head>"
+            f"<body><article><pre>{body}</pre></article></body></html>",
+            encoding="utf-8",
+        )
+        entries.append(
+            {
+                "title": title,
+                "content": " ".join(body.split())[:2000],
+                "permalink": f"{base_url}/{rel.as_posix()}/",
+                "summary": "",
+            }
+        )
+
+    links = "".join(
+        f'<li><a href="{e["permalink"]}">{html.escape(e["title"])}</a></li>'
+        for e in entries[:20]
+    )
+    (public / "index.html").write_text(
+        f"<html><body><ul>{links}</ul></body></html>", encoding="utf-8"
+    )
+    (public / "index.json").write_text(json.dumps(entries), encoding="utf-8")
+    return sum(1 for path in public.rglob("*") if path.is_file())
+
+
+# ============================================================================
+# Container loading
+# ============================================================================
+
+
+@contextmanager
+def container_modules() -> Iterator[Dict[str, Dict[str, ModuleType]]]:
+    """
+    Import each container's modules into this process.
+
+    Containers are flat source trees sharing top-level names (config,
+    models, ...), so those are dropped from sys.modules before each
+    container is imported and restored on exit.
+
+    Yields:
+        {container: {module name: module}}
+    """
+    saved_path = list(sys.path)
+    saved = {
+        name: module
+        for name, module in sys.modules.items()
+        if name.split(".")[0] in SHARED_MODULE_NAMES
+    }
+    loaded: Dict[str, Dict[str, ModuleType]] = {}
+    try:
+        for container, modules in CONTAINER_MODULES.items():
+            for name in [
+                n for n in sys.modules if n.split(".")[0] in SHARED_MODULE_NAMES
+            ]:
+                del sys.modules[name]
+            sys.path.insert(0, str(CONTAINERS_DIR / container))
+            loaded[container] = {
+                name: importlib.import_module(name) for name in modules
+            }
+            sys.path.pop(0)
+        yield loaded
+    finally:
+        sys.path[:] = saved_path
+        for name in [n for n in sys.modules if n.split(".")[0] in SHARED_MODULE_NAMES]:
+            del sys.modules[name]
+        sys.modules.update(saved)
+
+
+# ============================================================================
+# Metrics
+# ============================================================================
+
+
+def _summary_ms(sketch: QuantileSketch) -> Dict[str, Any]:
+    """Count, mean, quantiles and max of a sketch of seconds, in ms."""
+    if sketch.count == 0:
+        return {"count": 0}
+    p50, p90, p99 = sketch.quantiles(QUANTILES)
+    return {
+        "count": sketch.count,
+        "mean_ms": round(sketch.total / sketch.count * 1000, 1),
+        "p50_ms": round((p50 or 0) * 1000, 1),
+        "p90_ms": round((p90 or 0) * 1000, 1),
+        "p99_ms": round((p99 or 0) * 1000, 1),
+        "max_ms": round((sketch.max or 0) * 1000, 1),
+    }
+
+
+@dataclass
+class StageMetrics:
+    """Queue wait (enqueue → handler start) and service time for one stage."""
+
+    name: str
+    queue_wait: QuantileSketch = field(default_factory=QuantileSketch)
+    service: QuantileSketch = field(default_factory=QuantileSketch)
+    messages: int = 0
+    failures: int = 0
+    in_flight: int = 0
+    max_queue_depth: int = 0
+    first_start: Optional[float] = None
+    last_end: Optional[float] = None
+
+    def report(self) -> Dict[str, Any]:
+        active = (
+            self.last_end - self.first_start
+            if self.first_start is not None and self.last_end is not None
+            else 0.0
+        )
+        return {
+            "messages": self.messages,
+            "failures": self.failures,
+            "max_queue_depth": self.max_queue_depth,
+            "active_seconds": round(active, 3),
+            "messages_per_second": round(self.messages / active, 2) if active else None,
+            "queue_wait": _summary_ms(self.queue_wait),
+            "service_time": _summary_ms(self.service),
+        }
+
+
+# ============================================================================
+# Harness
+# ============================================================================
+
+
+class PipelineHarness:
+    """Runs the four containers end to end against the local stand-ins."""
+
+    def __init__(self, config: HarnessConfig, workdir: Path):
+        self.config = config
+        self.workdir = workdir
+        self.queues = {
+            name: MockQueueClient(
+                account_url="https://harness.queue.core.windows.net",
+                queue_name=name,
+            )
+            for name in (PROCESSOR_QUEUE, MARKDOWN_QUEUE, PUBLISHER_QUEUE)
+        }
+        self.stages = {
+            name: StageMetrics(name) for name in ("processor", "markdown", "publisher")
+        }
+        self.mastodon = FakeMastodon(config.topics, seed=config.seed)
+        self.openai = FakeOpenAI(
+            latency_ms=config.openai_latency_ms,
+            jitter=config.openai_jitter,
+            article_words=config.article_words,
+            seed=config.seed,
+        )
+        self.openai_server: Optional[FakeOpenAIServer] = None
+        self.openai_client: Any = self.openai
+        self.collected: Dict[str, Any] = {}
+        self.queued_at: Dict[str, float] = {}
+        self.processed_at: Dict[str, float] = {}
+        self.rendered_at: Dict[str, float] = {}
+        self.builds: List[Dict[str, Any]] = []
+        self.signals_sent = 0
+
+    def _storage_queue_client(self, queue_name: str, *args: Any) -> Any:
+        """libs.queue_client.get_queue_client backed by the harness queues."""
+        return HarnessQueueClient(self.queues[queue_name])
+
+    async def _consume(
+        self,
+        stage: StageMetrics,
+        queue: MockQueueClient,
+        handle: Callable[[QueueMessageModel, Any], Awaitable[bool]],
+        upstream_done: asyncio.Event,
+    ) -> None:
+        """One replica: receive, handle and delete until upstream is drained."""
+        while True:
+            messages = await queue.receive_messages(
+                max_messages=self.config.receive_batch_size,
+                visibility_timeout=self.config.visibility_timeout_seconds,
+            )
+            if not messages:
+                if upstream_done.is_set():
+                    properties = await queue.get_queue_properties()
+                    if properties.approximate_message_count == 0:
+                        return
+                await asyncio.sleep(self.config.poll_interval_seconds)
+                continue
+
+            for message in messages:
+                started = time.time()
+                if stage.first_start is None:
+                    stage.first_start = started
+                if message.inserted_on is not None:
+                    stage.queue_wait.add(
+                        max(0.0, started - message.inserted_on.timestamp())
+                    )
+                stage.in_flight += 1
+                try:
+                    queue_message = QueueMessageModel(**json.loads(message.content))
+                    ok = await handle(queue_message, message)
+                except Exception as e:
+                    logger.error(f"{stage.name} handler failed: {e}", exc_info=True)
+                    ok = False
+                finally:
+                    stage.in_flight -= 1
+                stage.service.add(time.time() - started)
+                stage.messages += 1
+                stage.failures += 0 if ok else 1
+                stage.last_end = time.time()
+                await queue.delete_message(message)
+
+    async def _run_replicas(
+        self,
+        stage: StageMetrics,
+        queue: MockQueueClient,
+        handle: Callable[[QueueMessageModel, Any], Awaitable[bool]],
+        replicas: int,
+        upstream_done: asyncio.Event,
+    ) -> None:
+        await asyncio.gather(
+            *(
+                self._consume(stage, queue, handle, upstream_done)
+                for _ in range(max(1, replicas))
+            )
+        )
+
+    async def _sample_queue_depths(self, done: asyncio.Event) -> None:
+        stage_queues = {
+            "processor": PROCESSOR_QUEUE,
+            "markdown": MARKDOWN_QUEUE,
+            "publisher": PUBLISHER_QUEUE,
+        }
+        while not done.is_set():
+            for stage, queue_name in stage_queues.items():
+                properties = await self.queues[queue_name].get_queue_properties()
+                self.stages[stage].max_queue_depth = max(
+                    self.stages[stage].max_queue_depth,
+                    properties.approximate_message_count,
+                )
+            await asyncio.sleep(self.config.poll_interval_seconds)
+
+    async def run(self) -> Dict[str, Any]:
+        """Push config.topics topics through the pipeline and report."""
+        blob_mock._MOCK_BLOBS.clear()
+        blob_mock._MOCK_CONTAINERS.clear()
+        for queue in self.queues.values():
+            await queue.create_queue()
+
+        with container_modules() as modules, ExitStack() as patches:
+            collector = modules["content-collector"]
+            markdown = modules["markdown-generator"]
+            publisher = modules["site-publisher"]
+            processor = modules["content-processor"]
+
+            patches.enter_context(
+                patch.object(
+                    collector["collectors.collect"],
+                    "rate_limited_get",
+                    self.mastodon.rate_limited_get,
+                )
+            )
+            patches.enter_context(
+                patch.object(
+                    markdown["queue_processor"],
+                    "get_queue_client",
+                    self._storage_queue_client,
+                )
+            )
+            hugo_available = (
+                shutil.which("hugo") is not None
+                and Path("/app/themes/PaperMod").exists()
+            )
+            if not hugo_available:
+                patches.enter_context(
+                    patch.object(
+                        publisher["site_builder"],
+                        "build_site_with_hugo",
+                        self._simulated_hugo_build(publisher["models"]),
+                    )
+                )
+
+            await self._open_openai()
+            try:
+                start = time.time()
+                report = await self._run_pipeline(
+                    collector, markdown, publisher, processor
+                )
+                wall = time.time() - start
+                usage = await self._openai_usage()
+            finally:
+                await self._close_openai()
+
+        report.update(self._hop_report())
+        published = report["hops"]["end_to_end"].get("count", 0)
+        report.update(
+            {
+                "topics": self.config.topics,
+                "published": published,
+                "wall_seconds": round(wall, 3),
+                "throughput_per_minute": round(published / wall * 60, 1) if wall else 0,
+                "hugo": "binary" if hugo_available else "simulated",
+                "config": asdict(self.config),
+            }
+        )
+        report["openai"] = self._cost_report(
+            usage, processor["utils.cost_utils"].calculate_openai_cost
+        )
+        return report
+
+    async def _open_openai(self) -> None:
+        """Pick the OpenAI backend: in-process fake, fake server or URL."""
+        config = self.config
+        if config.openai_server:
+            self.openai_server = FakeOpenAIServer(
+                FakeOpenAIConfig(
+                    latency=LatencyProfile(
+                        distribution="uniform",
+                        base_ms=config.openai_latency_ms,
+                        spread=config.openai_latency_ms * config.openai_jitter,
+                    ),
+                    requests_per_minute=config.openai_rpm,
+                    tokens_per_minute=config.openai_tpm,
+                    article_words=config.article_words,
+                    seed=config.seed,
+                )
+            )
+            await self.openai_server.start()
+            self.openai_client = self.openai_server.create_client()
+        elif config.openai_url:
+            from openai import AsyncAzureOpenAI
+
+            self.openai_client = AsyncAzureOpenAI(
+                azure_endpoint=config.openai_url,
+                api_key=os.getenv("AZURE_OPENAI_API_KEY", "fake-key"),
+                api_version=os.getenv("AZURE_OPENAI_API_VERSION", "2024-07-01-preview"),
+            )
+
+    async def _openai_usage(self) -> Dict[str, Dict[str, int]]:
+        """Calls, throttled calls and tokens per model from the backend."""
+        if self.openai_client is self.openai:
+            return {model: dict(usage) for model, usage in self.openai.usage.items()}
+        if self.openai_server is not None:
+            stats = self.openai_server.get_stats()
+        else:
+            # libs.fake_openai_server exposes /fake/stats; other servers don't
+            try:
+                async with aiohttp.ClientSession() as session:
+                    async with session.get(
+                        f"{self.config.openai_url.rstrip('/')}/fake/stats"
+                    ) as response:
+                        stats = await response.json() if response.status == 200 else {}
+            except aiohttp.ClientError:
+                stats = {}
+        return {
+            model: {
+                "calls": counters["requests"],
+                "throttled": counters["throttled"],
+                "prompt_tokens": counters["prompt_tokens"],
+                "completion_tokens": counters["completion_tokens"],
+            }
+            for model, counters in stats.items()
+        }
+
+    async def _close_openai(self) -> None:
+        if self.openai_client is not self.openai:
+            await self.openai_client.close()
+        if self.openai_server is not None:
+            await self.openai_server.stop()
+
+    async def _run_pipeline(
+        self,
+        collector: Dict[str, ModuleType],
+        markdown: Dict[str, ModuleType],
+        publisher: Dict[str, ModuleType],
+        processor: Dict[str, ModuleType],
+    ) -> Dict[str, Any]:
+        collector_done = asyncio.Event()
+        processor_done = asyncio.Event()
+        markdown_done = asyncio.Event()
+        signals_done = asyncio.Event()
+        all_done = asyncio.Event()
+
+        # content-collector: one collection run over the fake timeline
+        async def collect() -> None:
+            try:
+                collection_id = "harness"
+                self.collected = await collector["pipeline.stream"].stream_collection(
+                    collector_fn=collector["collectors.collect"].collect_mastodon(
+                        instance=self.mastodon.instance,
+                        max_items=self.config.topics,
+                        delay=0,
+                    ),
+                    collection_id=collection_id,
+                    collection_blob=f"collections/{collection_id}.json",
+                    blob_client=CollectorBlobStore(MockBlobServiceClient()),
+                    queue_client=self._storage_queue_client(PROCESSOR_QUEUE),
+                )
+            finally:
+                collector_done.set()
+
+        # content-processor: process_topic messages → processed-content
+        router = processor["endpoints.storage_queue_router"]
+        trigger = processor[
+            "queue_operations_pkg.markdown_trigger_batcher"
+        ].MarkdownTriggerBatcher(
+            self.queues[MARKDOWN_QUEUE],
+            correlation_id="harness",
+            max_batch_size=self.config.markdown_batch_size,
+            max_wait_seconds=self.config.markdown_batch_wait_seconds,
+        )
+        context = processor["core.processor_context"].create_processor_context(
+            blob_client=SimplifiedBlobClient(
+                blob_service_client=MockBlobServiceClient()
+            ),
+            queue_client=self.queues[MARKDOWN_QUEUE],
+            rate_limiter=None,
+            openai_client=self.openai_client,
+            processor_id="harness",
+            markdown_trigger=trigger,
+        )
+
+        async def handle_topic(queue_message: QueueMessageModel, message: Any) -> bool:
+            topic_id = queue_message.payload.get("topic_id")
+            if topic_id and message.inserted_on is not None:
+                self.queued_at[topic_id] = message.inserted_on.timestamp()
+            result = await router.process_storage_queue_message(queue_message)
+            if result.get("status") == "success" and topic_id:
+                self.processed_at[topic_id] = time.time()
+            return result.get("status") in ("success", "skipped")
+
+        async def process() -> None:
+            with patch.object(router, "_processor_context", context):
+                await self._run_replicas(
+                    self.stages["processor"],
+                    self.queues[PROCESSOR_QUEUE],
+                    handle_topic,
+                    self.config.processor_replicas,
+                    collector_done,
+                )
+                await trigger.close()
+            processor_done.set()
+
+        # markdown-generator: processed-content → markdown-content
+        md_settings = markdown["config"].Settings(
+            _env_file=None,
+            azure_storage_account_name="harness",
+            enable_stock_images=False,
+            enable_responsive_images=False,
+            azure_key_vault_url=None,
+        )
+        app_state: Dict[str, Any] = {
+            "total_processed": 0,
+            "total_files_generated": 0,
+            "total_failed": 0,
+        }
+        md_handler = await markdown["queue_processor"].create_message_handler(
+            blob_service_client=MockAsyncBlobServiceClient(),
+            settings=md_settings,
+            jinja_env=markdown["markdown_generator"].create_jinja_environment(),
+            unsplash_key=None,
+            app_state=app_state,
+            render_pool=markdown["render_pool"].RenderPool.from_settings(md_settings),
+        )
+
+        async def handle_markdown(
+            queue_message: QueueMessageModel, message: Any
+        ) -> bool:
+            response = await md_handler(queue_message, message)
+            for result in response.get("results", []):
+                self.rendered_at[result["blob_name"]] = time.time()
+            return response.get("status") == "success"
+
+        async def render() -> None:
+            await self._run_replicas(
+                self.stages["markdown"],
+                self.queues[MARKDOWN_QUEUE],
+                handle_markdown,
+                self.config.markdown_replicas,
+                processor_done,
+            )
+            markdown_done.set()
+
+        # Signal site-publisher once the markdown queue has been empty for
+        # stable_empty_seconds and new files exist (startup_queue_processor)
+        async def signal() -> None:
+            signalled = 0
+            empty_since: Optional[float] = None
+            stage = self.stages["markdown"]
+            while True:
+                properties = await self.queues[MARKDOWN_QUEUE].get_queue_properties()
+                idle = (
+                    properties.approximate_message_count == 0 and stage.in_flight == 0
+                )
+                now = time.monotonic()
+                empty_since = (empty_since or now) if idle else None
+                new_files = app_state["total_files_generated"] - signalled
+                stable = (
+                    empty_since is not None
+                    and now - empty_since >= self.config.stable_empty_seconds
+                )
+                if new_files > 0 and (stable or markdown_done.is_set()):
+                    await markdown["queue_processor"].signal_site_publisher(
+                        new_files, md_settings.output_container
+                    )
+                    self.signals_sent += 1
+                    signalled += new_files
+                    empty_since = None
+                elif markdown_done.is_set():
+                    break
+                await asyncio.sleep(self.config.poll_interval_seconds)
+            signals_done.set()
+
+        # site-publisher: coalesced builds of markdown-content → $web
+        site_settings = publisher["config"].Settings(
+            _env_file=None,
+            azure_storage_account_name="harness",
+            workspace_dir=str(self.workdir / "site-publisher"),
+            hugo_base_url="https://harness.example.com",
+            max_markdown_files=max(
+                self.config.topics,
+                publisher["config"].Settings.model_fields["max_markdown_files"].default,
+            ),
+        )
+        hugo_config = self.workdir / "hugo-config"
+        shutil.copytree(
+            CONTAINERS_DIR / "site-publisher" / "hugo-config",
+            hugo_config,
+            dirs_exist_ok=True,
+        )
+        site_config = SimpleNamespace(
+            **site_settings.model_dump(),
+            hugo_config_path=str(hugo_config / "config.toml"),
+        )
+
+        async def build(force_rebuild: bool) -> Any:
+            started = time.time()
+            result = await publisher["site_builder"].build_and_deploy_site(
+                MockAsyncBlobServiceClient(), site_config, force_rebuild=force_rebuild
+            )
+            self.builds.append(
+                {
+                    "started": started,
+                    "finished": time.time(),
+                    "success": not result.errors,
+                    "files_uploaded": result.files_uploaded,
+                    "errors": result.errors[:5],
+                    "phase_timings": result.phase_timings,
+                }
+            )
+            return result
+
+        scheduler = publisher["publish_scheduler"].PublishScheduler(
+            build=build, debounce_seconds=self.config.publish_debounce_seconds
+        )
+        publish_signal = publisher["models"].PublishSignal
+
+        # Same filtering as site-publisher app.py's queue message handler
+        async def handle_publish(
+            queue_message: QueueMessageModel, message: Any
+        ) -> bool:
+            payload = queue_message.payload
+            summary = payload.get("content_summary", {})
+            if payload.get("operation") != "markdown_generated":
+                return False
+            if not summary.get("files_created") and not summary.get("force_rebuild"):
+                return True
+            scheduler.submit(
+                publish_signal(
+                    signal_id=str(queue_message.message_id),
+                    source=queue_message.service_name,
+                    files_created=summary.get("files_created", 0),
+                    force_rebuild=summary.get("force_rebuild", False),
+                )
+            )
+            return True
+
+        async def publish() -> None:
+            await self._run_replicas(
+                self.stages["publisher"],
+                self.queues[PUBLISHER_QUEUE],
+                handle_publish,
+                1,
+                signals_done,
+            )
+            await scheduler.wait_idle()
+
+        sampler = asyncio.create_task(self._sample_queue_depths(all_done))
+        try:
+            await asyncio.gather(collect(), process(), render(), signal(), publish())
+        finally:
+            all_done.set()
+            await sampler
+
+        return {
+            "collector": {
+                key: value
+                for key, value in self.collected.items()
+                if key != "rejection_reasons"
+            },
+            "stages": {name: stage.report() for name, stage in self.stages.items()},
+            "markdown_triggers": trigger.get_stats(),
+            "publish": {
+                "signals_sent": self.signals_sent,
+                "scheduler": scheduler.get_stats(),
+                "builds": [
+                    {
+                        "duration_seconds": round(b["finished"] - b["started"], 3),
+                        **{
+                            k: v
+                            for k, v in b.items()
+                            if k not in ("started", "finished")
+                        },
+                    }
+                    for b in self.builds
+                ],
+            },
+        }
+
+    @staticmethod
+    def _simulated_hugo_build(models: ModuleType) -> Callable[..., Awaitable[Any]]:
+        async def build_site_with_hugo(
+            hugo_dir: Path, config_file: Path, base_url: str, **kwargs: Any
+        ) -> Any:
+            start = time.perf_counter()
+            output_files = await asyncio.to_thread(_render_site, hugo_dir, base_url)
+            return models.BuildResult(
+                success=True,
+                output_files=output_files,
+                duration_seconds=time.perf_counter() - start,
+            )
+
+        return build_site_with_hugo
+
+    def _hop_report(self) -> Dict[str, Any]:
+        """Per-topic hop latencies, joined through the processed articles."""
+        storage = blob_mock.MockBlobStorage()
+        hops = {
+            name: QuantileSketch()
+            for name in (
+                "collected_to_processed",
+                "processed_to_markdown",
+                "markdown_to_published",
+                "end_to_end",
+            )
+        }
+        builds = sorted(
+            (b for b in self.builds if b["success"]), key=lambda b: b["started"]
+        )
+        article_cost = 0.0
+        articles = 0
+        for blob in storage.list_blobs("processed-content", "articles/"):
+            data = storage.download_data("processed-content", blob["name"])
+            article = json.loads(data) if data else {}
+            articles += 1
+            article_cost += article.get("processing_metadata", {}).get("cost_usd", 0.0)
+
+            queued = self.queued_at.get(article.get("topic_id", ""))
+            processed = self.processed_at.get(article.get("topic_id", ""))
+            rendered = self.rendered_at.get(blob["name"])
+            published = next(
+                (
+                    b["finished"]
+                    for b in builds
+                    if rendered and b["started"] >= rendered
+                ),
+                None,
+            )
+            for name, begin, end in (
+                ("collected_to_processed", queued, processed),
+                ("processed_to_markdown", processed, rendered),
+                ("markdown_to_published", rendered, published),
+                ("end_to_end", queued, published),
+            ):
+                if begin is not None and end is not None:
+                    hops[name].add(max(0.0, end - begin))
+
+        return {
+            "articles": articles,
+            "articles_cost_usd": round(article_cost, 6),
+            "hops": {name: _summary_ms(sketch) for name, sketch in hops.items()},
+        }
+
+    @staticmethod
+    def _cost_report(
+        usage_by_model: Dict[str, Dict[str, int]], calculate_cost: Callable[..., float]
+    ) -> Dict[str, Any]:
+        """Calls, tokens and cost per model as seen by the OpenAI backend."""
+        models = {}
+        for model, usage in sorted(usage_by_model.items()):
+            models[model] = {
+                **usage,
+                "cost_usd": round(
+                    calculate_cost(
+                        model_name=model,
+                        prompt_tokens=usage["prompt_tokens"],
+                        completion_tokens=usage["completion_tokens"],
+                    ),
+                    6,
+                ),
+            }
+        return {
+            "models": models,
+            "calls": sum(m["calls"] for m in models.values()),
+            "throttled": sum(m.get("throttled", 0) for m in models.values()),
+            "tokens": sum(
+                m["prompt_tokens"] + m["completion_tokens"] for m in models.values()
+            ),
+            "cost_usd": round(sum(m["cost_usd"] for m in models.values()), 6),
+        }
+
+
+async def run_harness(
+    config: HarnessConfig, workdir: Optional[Path] = None
+) -> Dict[str, Any]:
+    """
+    Run the harness once.
+
+    Args:
+        config: Load and sizing parameters
+        workdir: Directory for the site-publisher workspace (temporary if None)
+
+    Returns:
+        Report dict (throughput, stages, hops, publish, openai, ...)
+    """
+    if workdir is not None:
+        workdir.mkdir(parents=True, exist_ok=True)
+        return await PipelineHarness(config, workdir).run()
+    with tempfile.TemporaryDirectory(prefix="pipeline-harness-") as tmp:
+        return await PipelineHarness(config, Path(tmp)).run()
+
+
+def print_summary(report: Dict[str, Any]) -> None:
+    """Print the headline numbers of a report."""
+    print(
+        f"\n{report['published']}/{report['topics']} topics published in "
+        f"{report['wall_seconds']:.1f}s ({report['throughput_per_minute']} per minute, "
+        f"hugo: {report['hugo']})"
+    )
+    print(f"{'stage':<12}{'msgs':>7}{'fail':>6}{'depth':>7}"
+          f"{'wait p50':>11}{'wait p99':>11}{'svc p50':>10}{'svc p99':>10}")  # fmt: skip
+    for name, stage in report["stages"].items():
+        wait, service = stage["queue_wait"], stage["service_time"]
+        print(
+            f"{name:<12}{stage['messages']:>7}{stage['failures']:>6}"
+            f"{stage['max_queue_depth']:>7}"
+            f"{wait.get('p50_ms', 0):>9.0f}ms{wait.get('p99_ms', 0):>9.0f}ms"
+            f"{service.get('p50_ms', 0):>8.0f}ms{service.get('p99_ms', 0):>8.0f}ms"
+        )
+    for name, hop in report["hops"].items():
+        if hop.get("count"):
+            print(
+                f"hop {name:<24} p50 {hop['p50_ms']:>8.0f}ms  "
+                f"p99 {hop['p99_ms']:>8.0f}ms  (n={hop['count']})"
+            )
+    openai = report["openai"]
+    print(
+        f"openai: {openai['calls']} calls ({openai['throttled']} throttled), "
+        f"{openai['tokens']} tokens, "
+        f"${openai['cost_usd']:.4f} (articles record ${report['articles_cost_usd']:.4f}); "
+        f"{len(report['publish']['builds'])} builds"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    defaults = HarnessConfig()
+    parser.add_argument("--topics", type=int, default=defaults.topics)
+    parser.add_argument(
+        "--processor-replicas", type=int, default=defaults.processor_replicas
+    )
+    parser.add_argument(
+        "--markdown-replicas", type=int, default=defaults.markdown_replicas
+    )
+    parser.add_argument(
+        "--openai-latency-ms", type=float, default=defaults.openai_latency_ms
+    )
+    parser.add_argument(
+        "--openai-jitter",
+        type=float,
+        default=defaults.openai_jitter,
+        help="Latency spread as a fraction of --openai-latency-ms",
+    )
+    parser.add_argument(
+        "--openai-server",
+        action="store_true",
+        help="Serve OpenAI over HTTP with libs.fake_openai_server",
+    )
+    parser.add_argument(
+        "--openai-url", help="Use this Azure OpenAI-compatible endpoint instead"
+    )
+    parser.add_argument(
+        "--openai-rpm", type=int, help="--openai-server requests/minute quota"
+    )
+    parser.add_argument(
+        "--openai-tpm", type=int, help="--openai-server tokens/minute quota"
+    )
+    parser.add_argument("--article-words", type=int, default=defaults.article_words)
+    parser.add_argument(
+        "--markdown-batch-size", type=int, default=defaults.markdown_batch_size
+    )
+    parser.add_argument(
+        "--publish-debounce-seconds",
+        type=float,
+        default=defaults.publish_debounce_seconds,
+    )
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--workdir", type=Path, help="Keep the site workspace here")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here")
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=getattr(logging, args.log_level.upper(), logging.WARNING),
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+    config = HarnessConfig(
+        topics=args.topics,
+        processor_replicas=args.processor_replicas,
+        markdown_replicas=args.markdown_replicas,
+        openai_latency_ms=args.openai_latency_ms,
+        openai_jitter=args.openai_jitter,
+        openai_server=args.openai_server,
+        openai_url=args.openai_url,
+        openai_rpm=args.openai_rpm,
+        openai_tpm=args.openai_tpm,
+        article_words=args.article_words,
+        markdown_batch_size=args.markdown_batch_size,
+        publish_debounce_seconds=args.publish_debounce_seconds,
+        seed=args.seed,
+    )
+    report = asyncio.run(run_harness(config, args.workdir))
+    print_summary(report)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2, default=str))
+        print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -22,6 +22,11 @@ from azure.identity.aio import DefaultAzureCredential
 from azure.storage.blob.aio import BlobServiceClient
 from azure.storage.queue.aio import QueueClient
 
+# Add repository root to path for shared libs
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from libs.blob_batch import delete_blobs_batched  # noqa: E402
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
@@ -43,17 +48,16 @@ async def clear_web_container(blob_service_client: BlobServiceClient) -> int:
 
     container_client = blob_service_client.get_container_client("$web")
 
-    blobs_deleted = 0
-    try:
-        async for blob in container_client.list_blobs():
-            await container_client.delete_blob(blob.name)
-            blobs_deleted += 1
-            if blobs_deleted % 100 == 0:
-                logger.info(f"  Deleted {blobs_deleted} blobs...")
-    except Exception as e:
-        logger.error(f"Error deleting blob: {e}")
-        raise
+    blob_names = [blob.name async for blob in container_client.list_blobs()]
+    logger.info(f"  Found {len(blob_names)} blobs, deleting in batches...")
+
+    result = await delete_blobs_batched(container_client, blob_names)
+    if result.failed:
+        for error in result.errors[:10]:
+            logger.error(f"  {error}")
+        raise RuntimeError(f"Failed to delete {len(result.failed)} blobs from $web")
 
+    blobs_deleted = result.deleted + result.not_found
     logger.info(f"✅ Cleared $web container: {blobs_deleted} blobs deleted")
     return blobs_deleted
 
@@ -2,7 +2,7 @@
 """
 Trigger markdown rebuild for recent articles.
 
-Scans processed-content container for JSON articles and queues the latest N
+Scans processed-content articles/ for JSON articles and queues the latest N
 for markdown regeneration. Defaults to 25 articles to avoid rate limiting
 on image fetching and focus on quality content.
 
@@ -50,7 +50,10 @@ async def list_processed_articles(
 
     articles = []
     try:
-        async for blob in container_client.list_blobs(results_per_page=1000):
+        # Only articles: other prefixes in the container aren't markdown input
+        async for blob in container_client.list_blobs(
+            name_starts_with="articles/", results_per_page=1000
+        ):
             if blob.name.endswith(".json"):
                 # Use getattr with fallback for compatibility with different Azure SDK versions
                 timestamp = getattr(blob, "creation_time", None) or getattr(
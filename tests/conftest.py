@@ -43,6 +43,29 @@ def sample_datetime():
     return datetime(2023, 10, 22, 12, 0, 0)
 
 
+@pytest.fixture
+async def fake_openai_server():
+    """
+    Start libs.fake_openai_server instances on free ports.
+
+    Yields a factory taking an optional FakeOpenAIConfig; servers are
+    stopped after the test.
+    """
+    from libs.fake_openai_server import FakeOpenAIServer
+
+    servers = []
+
+    async def start(config=None):
+        server = FakeOpenAIServer(config)
+        await server.start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        await server.stop()
+
+
 # Configure async test timeout
 pytest_timeout = 300  # 5 minutes for all tests
 
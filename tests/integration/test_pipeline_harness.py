@@ -0,0 +1,78 @@
+"""
+Integration test for scripts/pipeline_harness.py
+
+Runs a small load through all four containers against the local
+stand-ins and checks every topic is published with stage, hop and cost
+figures in the report.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+from pipeline_harness import HarnessConfig, run_harness  # noqa: E402
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_harness_publishes_every_topic(tmp_path):
+    """N topics flow collector → processor → markdown → site-publisher."""
+    config = HarnessConfig(
+        topics=12,
+        processor_replicas=2,
+        markdown_batch_size=5,
+        markdown_batch_wait_seconds=0.1,
+        stable_empty_seconds=0.2,
+        publish_debounce_seconds=0.2,
+        poll_interval_seconds=0.01,
+    )
+
+    report = await run_harness(config, tmp_path)
+
+    assert report["collector"]["published"] == 12
+    assert report["articles"] == 12
+    assert report["published"] == 12
+    assert report["throughput_per_minute"] > 0
+
+    stages = report["stages"]
+    assert stages["processor"]["messages"] == 12
+    assert stages["markdown"]["messages"] == 3  # 12 files in batches of 5
+    assert all(stage["failures"] == 0 for stage in stages.values())
+    assert stages["processor"]["queue_wait"]["count"] == 12
+
+    assert report["publish"]["builds"]
+    assert all(build["success"] for build in report["publish"]["builds"])
+    assert report["hops"]["end_to_end"]["count"] == 12
+
+    # Article + title call per topic (long Mastodon-derived titles)
+    assert report["openai"]["calls"] >= 12
+    assert report["openai"]["cost_usd"] > 0
+    assert report["openai"]["cost_usd"] == pytest.approx(
+        report["articles_cost_usd"], rel=0.01
+    )
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_harness_over_fake_openai_server(tmp_path):
+    """--openai-server: the processor's real AsyncAzureOpenAI client over HTTP."""
+    config = HarnessConfig(
+        topics=4,
+        openai_server=True,
+        markdown_batch_wait_seconds=0.1,
+        stable_empty_seconds=0.2,
+        publish_debounce_seconds=0.2,
+        poll_interval_seconds=0.01,
+    )
+
+    report = await run_harness(config, tmp_path)
+
+    assert report["published"] == 4
+    assert report["openai"]["calls"] >= 4
+    assert report["openai"]["throttled"] == 0
+    assert report["openai"]["cost_usd"] == pytest.approx(
+        report["articles_cost_usd"], rel=0.01
+    )
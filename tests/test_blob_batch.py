@@ -0,0 +1,175 @@
+"""
+Test batched blob deletion helpers.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+from azure.core.exceptions import ResourceNotFoundError
+
+from libs.blob_batch import (
+    BLOB_BATCH_LIMIT,
+    delete_blobs_batched,
+    delete_blobs_batched_sync,
+)
+from libs.blob_utils import BlobUtils
+
+
+class _AsyncResponses:
+    """Async iterator like azure.core AsyncList."""
+
+    def __init__(self, items):
+        self._items = iter(items)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._items)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class FakeBatchContainer:
+    """Container stand-in answering batch deletes per blob."""
+
+    def __init__(self, names, fail=(), batch_supported=True):
+        self.blobs = set(names)
+        self.fail = set(fail)
+        self.batch_supported = batch_supported
+        self.batch_sizes = []
+        self.single_deletes = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def _status(self, name):
+        if name in self.fail:
+            return 403
+        if name not in self.blobs:
+            return 404
+        self.blobs.discard(name)
+        return 202
+
+    async def delete_blobs(self, *names, raise_on_any_failure=True):
+        if not self.batch_supported:
+            raise RuntimeError("batch not supported")
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        self.batch_sizes.append(len(names))
+        return _AsyncResponses(
+            SimpleNamespace(status_code=self._status(name)) for name in names
+        )
+
+    async def delete_blob(self, name):
+        self.single_deletes += 1
+        if name in self.fail:
+            raise RuntimeError("forbidden")
+        if name not in self.blobs:
+            raise ResourceNotFoundError("gone")
+        self.blobs.discard(name)
+
+
+class FakeSyncBatchContainer(FakeBatchContainer):
+    """Synchronous variant (azure.storage.blob.ContainerClient)."""
+
+    def delete_blobs(self, *names, raise_on_any_failure=True):
+        self.batch_sizes.append(len(names))
+        return iter([SimpleNamespace(status_code=self._status(n)) for n in names])
+
+
+class TestDeleteBlobsBatched:
+    """Test the async helper."""
+
+    @pytest.mark.asyncio
+    async def test_splits_into_batches_of_256(self):
+        """Thousands of blobs go out in 256-blob batch requests."""
+        names = [f"page-{i}/index.html" for i in range(1000)]
+        container = FakeBatchContainer(names)
+
+        result = await delete_blobs_batched(container, names, max_concurrency=2)
+
+        assert container.batch_sizes == [256, 256, 256, 232]
+        assert result.deleted == 1000
+        assert result.batches == 4
+        assert container.single_deletes == 0
+        assert container.max_in_flight == 2
+        assert not container.blobs
+
+    @pytest.mark.asyncio
+    async def test_per_blob_errors(self):
+        """Failures and already-deleted blobs are reported per blob."""
+        container = FakeBatchContainer(["a", "b"], fail=["b"])
+
+        result = await delete_blobs_batched(container, ["a", "b", "missing"])
+
+        assert result.deleted == 1
+        assert result.not_found == 1
+        assert result.failed == {"b": "HTTP 403"}
+        assert result.errors == ["Failed to delete b: HTTP 403"]
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_single_deletes(self):
+        """Without batch support, every blob is still deleted and reported."""
+        container = FakeBatchContainer(
+            ["a", "b", "c"], fail=["c"], batch_supported=False
+        )
+
+        result = await delete_blobs_batched(container, ["a", "b", "c"], batch_size=2)
+
+        assert result.deleted == 2
+        assert list(result.failed) == ["c"]
+        assert result.batches == 0
+
+    @pytest.mark.asyncio
+    async def test_empty_and_duplicate_names(self):
+        """No requests for an empty list; duplicates are deleted once."""
+        container = FakeBatchContainer(["a"])
+
+        assert (await delete_blobs_batched(container, [])).to_dict()["deleted"] == 0
+        result = await delete_blobs_batched(container, ["a", "a"])
+
+        assert container.batch_sizes == [1]
+        assert result.deleted == 1
+
+    def test_batch_limit(self):
+        """Batch size is capped at the Azure limit."""
+        assert BLOB_BATCH_LIMIT == 256
+
+
+class TestDeleteBlobsBatchedSync:
+    """Test the sync helper and BlobUtils integration."""
+
+    def test_sync_batches(self):
+        """The sync helper batches like the async one."""
+        names = [f"blob-{i}" for i in range(300)]
+        container = FakeSyncBatchContainer(names, fail=["blob-7"])
+
+        result = delete_blobs_batched_sync(container, names)
+
+        assert sorted(container.batch_sizes) == [44, 256]
+        assert result.deleted == 299
+        assert list(result.failed) == ["blob-7"]
+
+    def test_blob_utils_delete_by_prefix(self):
+        """BlobUtils.delete_blobs_by_prefix uses batch deletes."""
+        container = FakeSyncBatchContainer(["logs/a", "logs/b"])
+        container.list_blobs = Mock(
+            return_value=[
+                SimpleNamespace(
+                    name=name, size=1, last_modified=None, etag="x", content_settings={}
+                )
+                for name in ["logs/a", "logs/b"]
+            ]
+        )
+        service = Mock()
+        service.get_container_client.return_value = container
+
+        results = BlobUtils(service).delete_blobs_by_prefix("data", "logs/")
+
+        assert results == {"deleted": 2, "failed": 0, "errors": []}
+        assert container.batch_sizes == [2]
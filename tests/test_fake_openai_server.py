@@ -0,0 +1,259 @@
+"""
+Tests for libs/fake_openai_server.py
+
+Covers the processor's chat-completions call shapes, streaming, usage
+accounting and TPM/RPM 429s, and uses the server to check that
+libs/openai_rate_limiter and libs/rate_limiter keep clients under quota.
+"""
+
+import asyncio
+import json
+import random
+import time
+
+import pytest
+from openai import RateLimitError
+
+from libs.fake_openai_server import (
+    FakeOpenAIConfig,
+    LatencyProfile,
+    QuotaWindow,
+    approx_tokens,
+)
+from libs.openai_rate_limiter import call_with_rate_limit, create_rate_limiter
+from libs.rate_limiter import MultiRegionRateLimiter
+
+ARTICLE_MESSAGES = [
+    {"role": "system", "content": "You are an expert writer."},
+    {"role": "user", "content": "Write an article about Python 3.13."},
+]
+
+
+async def _chat(client, **kwargs):
+    return await client.chat.completions.create(
+        model=kwargs.pop("model", "gpt-4o"),
+        messages=kwargs.pop("messages", ARTICLE_MESSAGES),
+        **kwargs,
+    )
+
+
+async def test_call_shapes_and_usage(fake_openai_server):
+    """Article, title and metadata prompts get matching content and usage."""
+    server = await fake_openai_server(FakeOpenAIConfig(article_words=300))
+    client = server.create_client()
+
+    article = await _chat(client, max_tokens=4000, temperature=0.7)
+    title = await _chat(
+        client,
+        model="gpt-4o-mini",
+        messages=[
+            {
+                "role": "user",
+                "content": "Generate a concise title (max 80 characters):\n\n"
+                "Original: Python 3.13 release notes: what changed for "
+                "developers building cloud software",
+            }
+        ],
+        max_tokens=50,
+    )
+    metadata = await _chat(
+        client,
+        messages=[{"role": "user", "content": "Title: x\nReturn ONLY valid JSON:"}],
+        max_tokens=200,
+    )
+
+    text = article.choices[0].message.content
+    assert text.startswith("## ") and len(text.split()) >= 300
+    assert article.usage.completion_tokens == approx_tokens(text)
+    assert title.choices[0].message.content.startswith("Python 3.13 release notes")
+    assert set(json.loads(metadata.choices[0].message.content)) == {
+        "title",
+        "description",
+        "language",
+    }
+
+    stats = server.get_stats()
+    assert stats["gpt-4o"]["requests"] == 2
+    assert stats["gpt-4o-mini"]["requests"] == 1
+    assert stats["gpt-4o"]["completion_tokens"] == (
+        article.usage.completion_tokens + metadata.usage.completion_tokens
+    )
+    await client.close()
+
+
+async def test_content_is_deterministic(fake_openai_server):
+    """Same prompt and seed give the same completion; max_tokens truncates."""
+    server = await fake_openai_server()
+    client = server.create_client()
+
+    first = await _chat(client)
+    second = await _chat(client)
+    truncated = await _chat(client, max_tokens=10)
+
+    assert first.choices[0].message.content == second.choices[0].message.content
+    assert truncated.choices[0].finish_reason == "length"
+    assert truncated.usage.completion_tokens <= 10
+    await client.close()
+
+
+async def test_streaming_matches_non_streaming(fake_openai_server):
+    """Streamed deltas join to the same content; usage arrives last."""
+    server = await fake_openai_server()
+    client = server.create_client()
+
+    expected = await _chat(client)
+    stream = await _chat(client, stream=True, stream_options={"include_usage": True})
+    parts, usage, finish = [], None, None
+    async for chunk in stream:
+        if chunk.choices:
+            parts.append(chunk.choices[0].delta.content or "")
+            finish = chunk.choices[0].finish_reason or finish
+        if chunk.usage:
+            usage = chunk.usage
+
+    assert "".join(parts) == expected.choices[0].message.content
+    assert finish == "stop"
+    assert usage.total_tokens == expected.usage.total_tokens
+    assert server.get_stats()["gpt-4o"]["streamed"] == 1
+    await client.close()
+
+
+async def test_latency_profile_applied(fake_openai_server):
+    """Time to first token plus per-token generation time."""
+    server = await fake_openai_server(
+        FakeOpenAIConfig(
+            latency=LatencyProfile(base_ms=100, per_token_ms=0.1),
+            article_words=200,
+        )
+    )
+    client = server.create_client()
+
+    start = time.perf_counter()
+    response = await _chat(client)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed >= 0.1 + response.usage.completion_tokens * 0.0001
+    await client.close()
+
+
+def test_latency_distributions_sample_around_base():
+    """Each distribution's median is close to base_ms."""
+    rng = random.Random(1)
+    for distribution, spread in (("uniform", 50), ("normal", 20), ("lognormal", 0.3)):
+        profile = LatencyProfile(distribution, base_ms=200, spread=spread)
+        samples = sorted(profile.first_token_seconds(rng) for _ in range(2000))
+        assert samples[1000] == pytest.approx(0.2, rel=0.1)
+
+    with pytest.raises(ValueError):
+        LatencyProfile("pareto")
+
+
+async def test_rpm_quota_returns_retry_after(fake_openai_server):
+    """Over-quota requests get 429 with Retry-After and don't consume quota."""
+    server = await fake_openai_server(FakeOpenAIConfig(requests_per_minute=2))
+    client = server.create_client(max_retries=0)
+
+    await _chat(client)
+    await _chat(client)
+    with pytest.raises(RateLimitError) as error:
+        await _chat(client)
+
+    headers = error.value.response.headers
+    assert 1 <= int(headers["retry-after"]) <= 60
+    assert headers["x-ratelimit-remaining-requests"] == "0"
+    # Quotas are per deployment
+    await _chat(client, model="gpt-4o-mini")
+    assert server.get_stats()["gpt-4o"] == pytest.approx(
+        {**server.get_stats()["gpt-4o"], "requests": 2, "throttled": 1}
+    )
+    await client.close()
+
+
+def test_tpm_quota_counts_max_tokens():
+    """Token estimate includes max_tokens; retry time tracks expiry."""
+    window = QuotaWindow(
+        tokens_per_window=1000, requests_per_window=None, window_seconds=60
+    )
+
+    assert window.try_acquire(600, now=0.0) is None
+    assert window.try_acquire(300, now=10.0) is None
+    assert window.try_acquire(200, now=20.0) == pytest.approx(40.0)  # First expires
+    assert window.try_acquire(800, now=20.0) == pytest.approx(50.0)  # Both expire
+    assert window.try_acquire(200, now=60.0) is None
+    assert window.remaining(now=60.0) == {"requests": None, "tokens": 500}
+
+
+async def test_sdk_retries_honour_retry_after(fake_openai_server):
+    """The OpenAI SDK waits for retry-after-ms and then succeeds."""
+    server = await fake_openai_server(
+        FakeOpenAIConfig(requests_per_minute=1, quota_window_seconds=0.5)
+    )
+    client = server.create_client(max_retries=3)
+
+    await _chat(client)
+    start = time.perf_counter()
+    await _chat(client)
+
+    assert time.perf_counter() - start >= 0.3
+    assert server.get_stats()["gpt-4o"]["throttled"] >= 1
+    await client.close()
+
+
+async def test_openai_rate_limiter_avoids_429s(fake_openai_server):
+    """create_rate_limiter at half the server quota never triggers 429s."""
+    server = await fake_openai_server(
+        FakeOpenAIConfig(requests_per_minute=10, quota_window_seconds=1.0)
+    )
+    client = server.create_client(max_retries=0)
+    limiter = create_rate_limiter(max_requests_per_minute=5, time_period_seconds=1)
+
+    # A full bucket bursts 5 and then refills continuously, so up to twice
+    # the configured rate can land in one quota window
+    await asyncio.gather(
+        *(
+            call_with_rate_limit(
+                limiter,
+                client.chat.completions.create,
+                model="gpt-4o",
+                messages=ARTICLE_MESSAGES,
+            )
+            for _ in range(12)
+        )
+    )
+
+    assert server.get_stats()["gpt-4o"] == pytest.approx(
+        {**server.get_stats()["gpt-4o"], "requests": 12, "throttled": 0}
+    )
+    await client.close()
+
+
+async def test_multi_region_rate_limiter_spreads_load(fake_openai_server):
+    """MultiRegionRateLimiter keeps each regional deployment under quota."""
+    config = FakeOpenAIConfig(requests_per_minute=10, quota_window_seconds=1.0)
+    regions = {"uksouth": await fake_openai_server(config)}
+    regions["westeurope"] = await fake_openai_server(config)
+    clients = {
+        name: server.create_client(max_retries=0) for name, server in regions.items()
+    }
+    limiter = MultiRegionRateLimiter({"uksouth": (5, 1), "westeurope": (5, 1)})
+
+    async def call() -> None:
+        region, _ = await limiter.acquire()
+        await _chat(clients[region])
+
+    await asyncio.gather(*(call() for _ in range(20)))
+
+    stats = {name: server.get_stats()["gpt-4o"] for name, server in regions.items()}
+    assert sum(s["requests"] for s in stats.values()) == 20
+    assert all(s["requests"] >= 5 for s in stats.values())
+    assert all(s["throttled"] == 0 for s in stats.values())
+
+    # Without the limiter the same burst is throttled
+    for server in regions.values():
+        server.reset()
+    results = await asyncio.gather(
+        *(_chat(clients["uksouth"]) for _ in range(12)), return_exceptions=True
+    )
+    assert sum(isinstance(r, RateLimitError) for r in results) == 2
+    for client in clients.values():
+        await client.close()
@@ -0,0 +1,217 @@
+"""
+Tests for libs/local_blob_client.py
+
+Runs the same contract against LocalBlobClient and SimplifiedBlobClient
+(over the SDK-shaped mock) so the local backend stays a drop-in
+replacement, then covers local-only behaviour and the env factory.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from libs import blob_mock
+from libs.azure_blob_mocks import MockBlobServiceClient
+from libs.local_blob_client import LocalBlobClient
+from libs.simplified_blob_client import SimplifiedBlobClient, create_blob_client
+
+CONTAINER = "collected-content"
+
+
+@pytest.fixture(params=["local", "azure-mock"])
+def blob_client(request, tmp_path):
+    """Each contract test runs against both backends."""
+    if request.param == "local":
+        yield LocalBlobClient(tmp_path)
+        return
+    blob_mock._MOCK_CONTAINERS.clear()
+    blob_mock._MOCK_BLOBS.clear()
+    yield SimplifiedBlobClient(blob_service_client=MockBlobServiceClient())
+    blob_mock._MOCK_CONTAINERS.clear()
+    blob_mock._MOCK_BLOBS.clear()
+
+
+async def test_round_trips(blob_client):
+    """JSON, text and binary content come back as written."""
+    data = {"items": [{"id": 1, "title": "Café"}], "count": 1}
+
+    assert await blob_client.upload_json(CONTAINER, "a/data.json", data)
+    assert await blob_client.upload_text(CONTAINER, "a/page.html", "<p>hi</p>")
+    assert await blob_client.upload_binary(
+        CONTAINER, "a/image.png", b"\x89PNG\x00", "image/png"
+    )
+
+    assert await blob_client.download_json(CONTAINER, "a/data.json") == data
+    assert await blob_client.download_text(CONTAINER, "a/page.html") == "<p>hi</p>"
+    assert await blob_client.download_binary(CONTAINER, "a/image.png") == (
+        b"\x89PNG\x00"
+    )
+    assert await blob_client.download_json(CONTAINER, "missing.json") is None
+    assert await blob_client.download_binary(CONTAINER, "missing.bin") is None
+
+    properties = await blob_client.get_blob_properties(CONTAINER, "a/page.html")
+    assert properties["content_type"] == "text/html"
+    assert properties["size"] == len("<p>hi</p>")
+
+
+async def test_download_stream(blob_client):
+    """Streamed chunks join to the stored content."""
+    content = json.dumps({"items": list(range(500))}).encode()
+    await blob_client.upload_binary(CONTAINER, "big.json", content, "application/json")
+
+    chunks = [
+        chunk async for chunk in blob_client.download_stream(CONTAINER, "big.json")
+    ]
+
+    assert b"".join(chunks) == content
+
+    small = [
+        chunk
+        async for chunk in blob_client.download_stream(
+            CONTAINER, "big.json", chunk_size=1000
+        )
+    ]
+    assert [len(chunk) for chunk in small[:-1]] == [1000] * (len(small) - 1)
+    assert b"".join(small) == content
+
+
+def test_mock_ranged_download_reports_range():
+    """As in Azure, size is the range length; content_range has the total."""
+    blob_mock._MOCK_CONTAINERS.clear()
+    blob_mock._MOCK_BLOBS.clear()
+    container = MockBlobServiceClient().get_container_client(CONTAINER)
+    container.upload_blob("a.bin", b"0123456789")
+    blob = container.get_blob_client("a.bin")
+
+    ranged = blob.download_blob(offset=4, length=4)
+    whole = blob.download_blob()
+
+    assert ranged.readall() == b"4567"
+    assert ranged.properties.size == 4
+    assert ranged.properties.content_range == "bytes 4-7/10"
+    assert whole.properties.size == 10
+    assert whole.properties.content_range is None
+    blob_mock._MOCK_CONTAINERS.clear()
+    blob_mock._MOCK_BLOBS.clear()
+
+
+async def test_list_blobs_with_prefix(blob_client):
+    """Only blobs under the prefix are listed, each with an etag."""
+    await blob_client.upload_text(CONTAINER, "2026/10/a.json", "{}")
+    await blob_client.upload_text(CONTAINER, "2026/10/b.json", "{}")
+    await blob_client.upload_text(CONTAINER, "2026/11/c.json", "{}")
+
+    blobs = await blob_client.list_blobs(CONTAINER, prefix="2026/10/")
+
+    assert sorted(blob["name"] for blob in blobs) == [
+        "2026/10/a.json",
+        "2026/10/b.json",
+    ]
+    assert all(blob["etag"] for blob in blobs)
+    assert len(await blob_client.list_blobs(CONTAINER)) == 3
+    assert await blob_client.list_blobs("empty-container") == []
+
+
+async def test_conditional_write_with_etag(blob_client):
+    """A stale ETag loses; the current one wins and changes the ETag."""
+    await blob_client.upload_json(CONTAINER, "state.json", {"version": 1})
+    _, etag = await blob_client.download_with_etag(CONTAINER, "state.json")
+
+    assert await blob_client.upload_json(
+        CONTAINER, "state.json", {"version": 2}, etag=etag
+    )
+    assert not await blob_client.upload_json(
+        CONTAINER, "state.json", {"version": 3}, etag=etag
+    )
+
+    content, new_etag = await blob_client.download_with_etag(CONTAINER, "state.json")
+    assert json.loads(content) == {"version": 2}
+    assert new_etag != etag
+
+
+async def test_create_only(blob_client):
+    """overwrite=False refuses to replace an existing blob."""
+    assert await blob_client.upload_binary(
+        CONTAINER, "lock", b"one", "text/plain", overwrite=False
+    )
+    assert not await blob_client.upload_binary(
+        CONTAINER, "lock", b"two", "text/plain", overwrite=False
+    )
+    assert await blob_client.download_binary(CONTAINER, "lock") == b"one"
+
+
+async def test_metadata(blob_client):
+    """Metadata is stored on upload and replaced conditionally."""
+    await blob_client.upload_text(
+        CONTAINER, "article.md", "# Title", metadata={"source": "reddit"}
+    )
+    properties = await blob_client.get_blob_properties(CONTAINER, "article.md")
+    assert properties["metadata"] == {"source": "reddit"}
+
+    assert await blob_client.set_blob_metadata(
+        CONTAINER, "article.md", {"status": "published"}, etag=properties["etag"]
+    )
+    assert not await blob_client.set_blob_metadata(
+        CONTAINER, "article.md", {"status": "stale"}, etag=properties["etag"]
+    )
+
+    updated = await blob_client.get_blob_properties(CONTAINER, "article.md")
+    assert updated["metadata"] == {"status": "published"}
+    assert updated["etag"] != properties["etag"]
+    assert await blob_client.download_text(CONTAINER, "article.md") == "# Title"
+
+
+async def test_concurrent_appends_keep_every_line(blob_client):
+    """Parallel appenders don't lose writes."""
+    lines = [f"line-{i}\n" for i in range(20)]
+
+    results = await asyncio.gather(
+        *(
+            blob_client.append_text(
+                CONTAINER, "log.jsonl", line, "application/x-ndjson"
+            )
+            for line in lines
+        )
+    )
+
+    assert all(results)
+    text = await blob_client.download_text(CONTAINER, "log.jsonl")
+    assert sorted(text.splitlines(keepends=True)) == sorted(lines)
+
+
+async def test_delete_blob(blob_client):
+    """Deleted blobs are gone from downloads and listings."""
+    await blob_client.upload_text(CONTAINER, "tmp.txt", "x")
+
+    assert await blob_client.delete_blob(CONTAINER, "tmp.txt")
+    assert await blob_client.download_text(CONTAINER, "tmp.txt") is None
+    assert await blob_client.list_blobs(CONTAINER) == []
+
+
+async def test_local_layout_and_name_validation(tmp_path):
+    """Blobs land under root/container/name; bad names are rejected."""
+    client = LocalBlobClient(tmp_path)
+
+    await client.upload_text("$web", "articles/index.html", "<html/>")
+
+    assert (tmp_path / "$web" / "articles" / "index.html").read_text() == "<html/>"
+    assert client.test_connection()["connection_type"] == "local"
+    assert not await client.upload_text(CONTAINER, "../escape.txt", "x")
+    assert not await client.upload_text("Bad_Container", "a.txt", "x")
+    assert not (tmp_path.parent / "escape.txt").exists()
+
+
+def test_factory_selects_backend(monkeypatch, tmp_path):
+    """BLOB_STORAGE_BACKEND=local swaps in LocalBlobClient."""
+    monkeypatch.setenv("BLOB_STORAGE_BACKEND", "local")
+    monkeypatch.setenv("BLOB_STORAGE_LOCAL_PATH", str(tmp_path))
+
+    client = create_blob_client()
+
+    assert isinstance(client, LocalBlobClient)
+    assert client.root == tmp_path
+
+    monkeypatch.setenv("BLOB_STORAGE_BACKEND", "azure")
+    mock_service = MockBlobServiceClient()
+    assert isinstance(create_blob_client(mock_service), SimplifiedBlobClient)
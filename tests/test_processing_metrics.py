@@ -0,0 +1,166 @@
+"""
+Test the fixed-memory quantile sketch and processing metrics.
+"""
+
+import random
+
+import pytest
+
+from libs.processing_metrics import (
+    ProcessingMetrics,
+    QuantileSketch,
+    get_processing_metrics,
+    reset_processing_metrics,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestQuantileSketch:
+    """Test quantile accuracy and bounded memory."""
+
+    def test_empty_sketch(self):
+        """Quantiles of an empty sketch are None."""
+        assert QuantileSketch().quantiles([0.5, 0.99]) == [None, None]
+
+    def test_quantiles_within_relative_accuracy(self):
+        """P50/P90/P99 stay within the configured relative error."""
+        rng = random.Random(42)
+        values = [rng.lognormvariate(5, 1) for _ in range(50_000)]
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        values.sort()
+        for q in (0.5, 0.9, 0.99):
+            exact = values[int(q * (len(values) - 1))]
+            assert sketch.quantile(q) == pytest.approx(exact, rel=0.02)
+        assert sketch.quantile(1.0) == values[-1]
+        assert sketch.quantile(0.0) == pytest.approx(values[0], rel=0.02)
+
+    def test_memory_bounded(self):
+        """Bucket count never exceeds max_buckets, whatever the value range."""
+        sketch = QuantileSketch(max_buckets=64)
+        for exponent in range(-6, 9):
+            for mantissa in range(1, 100):
+                sketch.add(mantissa * 10.0**exponent)
+
+        assert sketch.bucket_count <= 64
+        assert sketch.count == 15 * 99
+        # Collapsing only affects the low end
+        assert sketch.quantile(0.99) == pytest.approx(8.4e9, rel=0.02)
+
+    def test_zero_values(self):
+        """Zero durations are counted in the zero bucket."""
+        sketch = QuantileSketch()
+        for value in (0.0, 0.0, 0.0, 10.0):
+            sketch.add(value)
+
+        assert sketch.quantile(0.5) == 0.0
+        assert sketch.quantile(1.0) == 10.0
+
+    def test_negative_rejected(self):
+        """Negative values are not accepted."""
+        with pytest.raises(ValueError):
+            QuantileSketch().add(-1.0)
+
+    def test_merge(self):
+        """Merging sketches equals adding all values to one."""
+        left, right, combined = QuantileSketch(), QuantileSketch(), QuantileSketch()
+        for value in range(1, 1001):
+            (left if value % 2 else right).add(value)
+            combined.add(value)
+
+        left.merge(right)
+
+        assert left.count == combined.count
+        assert left.quantiles([0.5, 0.9]) == combined.quantiles([0.5, 0.9])
+
+
+class TestProcessingMetrics:
+    """Test throughput, error rate and snapshots."""
+
+    def test_snapshot(self):
+        """Snapshot reports counts, percentiles and error rate."""
+        metrics = ProcessingMetrics(clock=FakeClock())
+        for duration in range(1, 101):
+            metrics.record(float(duration))
+        metrics.record(success=False)
+
+        snapshot = metrics.snapshot()
+
+        assert snapshot["count"] == 101
+        assert snapshot["failures"] == 1
+        assert snapshot["error_rate"] == pytest.approx(1 / 101, abs=1e-4)
+        assert snapshot["mean_ms"] == 50.5
+        assert snapshot["p50_ms"] == pytest.approx(50, rel=0.02)
+        assert snapshot["p99_ms"] == pytest.approx(99, rel=0.02)
+        assert snapshot["max_ms"] == 100
+
+    def test_throughput_sliding_window(self):
+        """Throughput counts only events inside the window."""
+        clock = FakeClock()
+        metrics = ProcessingMetrics(window_seconds=60, slot_seconds=10, clock=clock)
+        clock.now += 60
+        for _ in range(30):
+            metrics.record(5.0)
+
+        assert metrics.snapshot()["throughput_per_minute"] == 30
+
+        clock.now += 61
+        snapshot = metrics.snapshot()
+        assert snapshot["throughput_per_minute"] == 0
+        assert snapshot["count"] == 30
+
+    def test_window_error_rate(self):
+        """Recent error rate recovers once failures leave the window."""
+        clock = FakeClock()
+        metrics = ProcessingMetrics(window_seconds=60, slot_seconds=10, clock=clock)
+        metrics.record(success=False)
+        clock.now += 70
+        metrics.record(1.0)
+
+        snapshot = metrics.snapshot()
+
+        assert snapshot["window_error_rate"] == 0.0
+        assert snapshot["error_rate"] == 0.5
+
+    def test_slots_bounded(self):
+        """Time slots are pruned, so memory stays fixed."""
+        clock = FakeClock()
+        metrics = ProcessingMetrics(window_seconds=60, slot_seconds=10, clock=clock)
+        for _ in range(1000):
+            clock.now += 1
+            metrics.record(1.0)
+
+        assert len(metrics._slots) <= 7
+
+    def test_track_records_failure_and_reraises(self):
+        """track() records exceptions as failures."""
+        metrics = ProcessingMetrics()
+
+        with pytest.raises(RuntimeError):
+            with metrics.track():
+                raise RuntimeError("boom")
+        with metrics.track():
+            pass
+
+        assert (metrics.successes, metrics.failures) == (1, 1)
+        assert metrics.latency.count == 2
+
+    def test_named_registry(self):
+        """Named instances are shared until reset."""
+        reset_processing_metrics("test-service")
+        metrics = get_processing_metrics("test-service")
+
+        assert get_processing_metrics("test-service") is metrics
+        reset_processing_metrics("test-service")
+        assert get_processing_metrics("test-service") is not metrics
@@ -12,7 +12,7 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from azure.storage.blob import BlobServiceClient
-from simplified_blob_client import SimplifiedBlobClient
+from simplified_blob_client import BlobStreamError, SimplifiedBlobClient
 
 # Add the libs directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "libs"))
@@ -174,6 +174,113 @@ class TestSimplifiedBlobClient:
         # Verify
         assert result == audio_bytes
 
+    @pytest.mark.asyncio
+    async def test_download_stream_ranged_chunks(
+        self, simplified_client, mock_blob_service_client, mock_blob_client
+    ):
+        """Test streamed download issues ranged reads until the blob is consumed."""
+        # Setup
+        content = b'{"items": [{"id": 1}, {"id": 2}]}'
+
+        def ranged_download(offset, length):
+            chunk = content[offset : offset + length]
+            download = Mock()
+            # Ranged reads report the range length as size; total is in content_range
+            download.properties.size = len(chunk)
+            download.properties.content_range = (
+                f"bytes {offset}-{offset + len(chunk) - 1}/{len(content)}"
+            )
+            download.readall.return_value = chunk
+            return download
+
+        mock_blob_client.download_blob.side_effect = ranged_download
+        mock_blob_service_client.get_blob_client.return_value = mock_blob_client
+
+        # Execute
+        chunks = [
+            chunk
+            async for chunk in simplified_client.download_stream(
+                "collected-content", "collection.json", chunk_size=10
+            )
+        ]
+
+        # Verify
+        assert b"".join(chunks) == content
+        assert len(chunks) == 4
+        assert mock_blob_client.download_blob.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_download_stream_without_content_range(
+        self, simplified_client, mock_blob_service_client, mock_blob_client
+    ):
+        """Test streamed download reads until a short chunk if no range is given."""
+        # Setup
+        content = b"x" * 25
+
+        def ranged_download(offset, length):
+            download = Mock()
+            download.properties.size = min(length, len(content) - offset)
+            download.properties.content_range = None
+            download.readall.return_value = content[offset : offset + length]
+            return download
+
+        mock_blob_client.download_blob.side_effect = ranged_download
+        mock_blob_service_client.get_blob_client.return_value = mock_blob_client
+
+        # Execute
+        chunks = [
+            chunk
+            async for chunk in simplified_client.download_stream(
+                "collected-content", "collection.json", chunk_size=10
+            )
+        ]
+
+        # Verify
+        assert b"".join(chunks) == content
+        assert mock_blob_client.download_blob.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_download_stream_missing_blob(
+        self, simplified_client, mock_blob_service_client, mock_blob_client
+    ):
+        """Test streamed download of a missing blob yields nothing."""
+        # Setup
+        mock_blob_client.download_blob.side_effect = Exception("Blob not found")
+        mock_blob_service_client.get_blob_client.return_value = mock_blob_client
+
+        # Execute
+        chunks = [
+            chunk
+            async for chunk in simplified_client.download_stream("missing", "x.json")
+        ]
+
+        # Verify
+        assert chunks == []
+
+    @pytest.mark.asyncio
+    async def test_download_stream_error_after_data_raises(
+        self, simplified_client, mock_blob_service_client, mock_blob_client
+    ):
+        """Test a read failing mid-stream raises instead of ending cleanly."""
+        # Setup
+        first = Mock()
+        first.properties.content_range = "bytes 0-9/30"
+        first.readall.return_value = b"x" * 10
+        mock_blob_client.download_blob.side_effect = [
+            first,
+            Exception("Connection reset"),
+        ]
+        mock_blob_service_client.get_blob_client.return_value = mock_blob_client
+
+        # Execute / Verify
+        chunks = []
+        with pytest.raises(BlobStreamError, match="Connection reset"):
+            async for chunk in simplified_client.download_stream(
+                "collected-content", "collection.json", chunk_size=10
+            ):
+                chunks.append(chunk)
+        assert chunks == [b"x" * 10]
+
     @pytest.mark.asyncio
     async def test_list_blobs_success(
         self, simplified_client, mock_blob_service_client, mock_container_client
@@ -214,6 +321,30 @@ class TestSimplifiedBlobClient:
         assert result is True
         mock_blob_client.delete_blob.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_delete_blobs_uses_batch_request(
+        self, simplified_client, mock_blob_service_client, mock_container_client
+    ):
+        """Test many blobs are deleted in one batch request."""
+        # Setup
+        mock_blob_service_client.get_container_client.return_value = (
+            mock_container_client
+        )
+        mock_container_client.delete_blobs.return_value = [
+            Mock(status_code=202),
+            Mock(status_code=404),
+            Mock(status_code=500),
+        ]
+
+        # Execute
+        result = await simplified_client.delete_blobs("jobs", ["a", "b", "c"])
+
+        # Verify
+        assert result == 2
+        mock_container_client.delete_blobs.assert_called_once_with(
+            "a", "b", "c", raise_on_any_failure=False
+        )
+
     # Error handling tests
     @pytest.mark.asyncio
     async def test_upload_json_failure(